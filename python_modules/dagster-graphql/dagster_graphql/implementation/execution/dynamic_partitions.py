@@ -41,7 +41,7 @@ def _is_matching_partitions_def(partitions_def_data: ExternalPartitionsDefinitio
             repository = repo_loc.get_repository(repository_selector.repository_name)
             found_partitions_defs = [
                 asset_node.partitions_def_data
-                for asset_node in repository.external_repository_data.external_asset_graph_data
+                for asset_node in repository.get_external_asset_nodes()
                 if asset_node.partitions_def_data
             ]
             return any(
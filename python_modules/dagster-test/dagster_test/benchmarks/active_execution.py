@@ -0,0 +1,131 @@
+# ruff: noqa: T201
+
+import argparse
+import time
+
+from dagster import DynamicOut, DynamicOutput, job, op
+from dagster._core.events import DagsterEvent, DagsterEventType, StepOutputData
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.active import ActiveExecution
+from dagster._core.execution.plan.objects import StepSuccessData
+from dagster._core.execution.plan.outputs import StepOutputHandle
+from dagster._core.execution.plan.step import ExecutionStep
+from dagster._core.execution.retries import RetryMode
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure the time it takes an ActiveExecution to orchestrate a dynamic plan with `--num-steps`
+steps. An op fans out to `--num-steps / 2` dynamic outputs, each of which is mapped over a chain of
+two ops, and the results are collected by a final op. Steps are vended `--max-concurrent` at a time
+and are immediately reported as having produced their outputs and succeeded, so that the time
+measured is spent orchestrating the steps rather than executing them.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="active_execution",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-steps",
+    type=int,
+    default=100_000,
+    help="Set the number of mapped steps in the plan.",
+)
+
+parser.add_argument(
+    "--max-concurrent",
+    type=int,
+    default=16,
+    help="Set the maximum number of steps in flight at once.",
+)
+
+
+def build_job(num_mapping_keys: int):
+    @op(out=DynamicOut())
+    def fan_out():
+        for i in range(num_mapping_keys):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def first(x):
+        return x
+
+    @op
+    def second(x):
+        return x
+
+    @op
+    def collect(xs):
+        return len(xs)
+
+    @job
+    def dynamic_job():
+        collect(fan_out().map(first).map(second).collect())
+
+    return dynamic_job
+
+
+def complete_step(
+    active_execution: ActiveExecution, job_name: str, step: ExecutionStep, num_mapping_keys: int
+) -> None:
+    for step_output in step.step_outputs:
+        mapping_keys = (
+            [str(i) for i in range(num_mapping_keys)] if step_output.is_dynamic else [None]
+        )
+        for mapping_key in mapping_keys:
+            active_execution.handle_event(
+                DagsterEvent(
+                    DagsterEventType.STEP_OUTPUT.value,
+                    job_name,
+                    step_key=step.key,
+                    event_specific_data=StepOutputData(
+                        StepOutputHandle(step.key, step_output.name, mapping_key)
+                    ),
+                )
+            )
+    active_execution.handle_event(
+        DagsterEvent(
+            DagsterEventType.STEP_SUCCESS.value,
+            job_name,
+            step_key=step.key,
+            event_specific_data=StepSuccessData(duration_ms=0.0),
+        )
+    )
+
+
+def main(num_steps: int, max_concurrent: int) -> None:
+    num_mapping_keys = num_steps // 2
+    session = ProfilingSession(
+        name="Active execution",
+        experiment_settings={"num_steps": num_steps, "max_concurrent": max_concurrent},
+    ).start()
+    session.log_start_message()
+
+    with session.logged_execution_time("Build plan"):
+        dynamic_job = build_job(num_mapping_keys)
+        plan = create_execution_plan(dynamic_job)
+
+    with session.logged_execution_time("Orchestrate plan"):
+        num_completed = 0
+        start = time.time()
+        with plan.start(RetryMode.DISABLED, max_concurrent=max_concurrent) as active_execution:
+            while not active_execution.is_complete:
+                for step in active_execution.get_steps_to_execute():
+                    complete_step(active_execution, dynamic_job.name, step, num_mapping_keys)
+                    num_completed += 1
+                # like the executors, check for steps to skip after steps complete, which also
+                # resolves the steps mapped over any dynamic outputs
+                assert not active_execution.get_steps_to_skip()
+        elapsed = time.time() - start
+
+    assert num_completed == num_steps + 2
+    print(f"{num_completed} steps completed, {elapsed / num_completed * 10**6:.1f} us per step")
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_steps, args.max_concurrent)
@@ -0,0 +1,154 @@
+# ruff: noqa: T201
+
+import argparse
+import tracemalloc
+from typing import Callable, Sequence, TypeVar
+from unittest.mock import MagicMock
+
+import pendulum
+from dagster import AssetsDefinition, HourlyPartitionsDefinition, asset, repository
+from dagster._core.definitions.asset_graph_subset import AssetGraphSubset
+from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
+from dagster._core.execution.asset_backfill import (
+    AssetBackfillData,
+    get_asset_partitions_to_request,
+)
+from dagster._core.host_representation.external_data import external_asset_graph_from_defs
+from dagster._core.test_utils import instance_for_test
+from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure the time and memory it takes to plan the first iteration of an asset backfill that targets
+every partition of a graph of hourly-partitioned assets. The graph has `--num-assets` assets, where
+each asset depends on the two assets before it, and one partition per hour over `--years` years.
+
+The asset partitions to request are planned with a partitions subset per asset, which propagates
+ranges of partitions through the partition mappings of the graph. As a baseline, they are also
+planned by visiting every asset partition one at a time.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="asset_backfill_planning",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--years",
+    type=int,
+    default=1,
+    help="Set the number of years of hourly partitions.",
+)
+
+parser.add_argument(
+    "--num-assets",
+    type=int,
+    default=20,
+    help="Set the number of assets in the graph.",
+)
+
+parser.add_argument(
+    "--skip-baseline",
+    action="store_true",
+    help="Skip planning the backfill by visiting asset partitions one at a time.",
+)
+
+T = TypeVar("T")
+
+
+def build_assets(
+    num_assets: int, years: int, current_time: pendulum.DateTime
+) -> Sequence[AssetsDefinition]:
+    partitions_def = HourlyPartitionsDefinition(
+        start_date=current_time.subtract(years=years).strftime("%Y-%m-%d-%H:00")
+    )
+    assets = []
+    for i in range(num_assets):
+
+        @asset(
+            name=f"asset_{i}",
+            partitions_def=partitions_def,
+            deps=[f"asset_{j}" for j in range(max(0, i - 2), i)],
+        )
+        def _asset():
+            ...
+
+        assets.append(_asset)
+    return assets
+
+
+def build_external_asset_graph(assets: Sequence[AssetsDefinition]) -> ExternalAssetGraph:
+    @repository
+    def repo():
+        return assets
+
+    external_asset_nodes = external_asset_graph_from_defs(
+        repo.get_all_jobs(), source_assets_by_key={}
+    )
+    # all assets are in the same code location, so they can be materialized in the same runs
+    repository_handle = MagicMock()
+    return ExternalAssetGraph.from_repository_handles_and_external_asset_nodes(
+        [(repository_handle, asset_node) for asset_node in external_asset_nodes]
+    )
+
+
+def measure_peak_memory(fn: Callable[[], T]) -> T:
+    tracemalloc.start()
+    try:
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    print(f"Peak memory: {peak / 2**10:.1f} KiB")
+    return result
+
+
+def main(years: int, num_assets: int, skip_baseline: bool) -> None:
+    current_time = pendulum.now("UTC")
+    session = ProfilingSession(
+        name="Asset backfill planning",
+        experiment_settings={"years": years, "num_assets": num_assets},
+    ).start()
+    session.log_start_message()
+
+    with session.logged_execution_time("Build asset graph"):
+        asset_graph = build_external_asset_graph(build_assets(num_assets, years, current_time))
+
+    with instance_for_test() as instance:
+        instance_queryer = CachingInstanceQueryer(instance, asset_graph, current_time)
+
+        with session.logged_execution_time("Build backfill target"):
+            target_subset = AssetGraphSubset.all(asset_graph, dynamic_partitions_store=instance)
+            backfill_data = AssetBackfillData.empty(target_subset, current_time)
+        print(
+            f"{target_subset.num_partitions_and_non_partitioned_assets} targeted asset partitions"
+        )
+
+        def plan(plan_with_partitions_subsets: bool) -> AssetGraphSubset:
+            return get_asset_partitions_to_request(
+                asset_graph=asset_graph,
+                initial_candidates=backfill_data.get_target_root_subset(),
+                target_subset=target_subset,
+                materialized_subset=AssetGraphSubset(asset_graph),
+                failed_and_downstream_subset=AssetGraphSubset(asset_graph),
+                instance_queryer=instance_queryer,
+                backfill_start_time=current_time,
+                plan_with_partitions_subsets=plan_with_partitions_subsets,
+            )
+
+        with session.logged_execution_time("Plan with a partitions subset per asset"):
+            result = measure_peak_memory(lambda: plan(True))
+        assert result == target_subset
+
+        if not skip_baseline:
+            with session.logged_execution_time("Plan by visiting asset partitions one at a time"):
+                baseline_result = measure_peak_memory(lambda: plan(False))
+            assert baseline_result == result
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.years, args.num_assets, args.skip_baseline)
@@ -0,0 +1,152 @@
+# ruff: noqa: T201
+
+import argparse
+import multiprocessing
+import random
+import statistics
+import time
+from typing import Dict, Iterator, List, Optional
+
+from dagster._core.executor.child_process_executor import (
+    ChildProcessCommand,
+    ChildProcessEvent,
+    ChildProcessEventSelector,
+    execute_child_process_command,
+)
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure how quickly a parent process receives the events of many concurrent child processes, the
+way the multiprocess executor does for concurrent steps. Each of `--num-processes` child processes
+sends `--num-events` timestamped events, sleeping about `--interval` seconds between events.
+
+Events are received by waiting on all child processes at once with a `ChildProcessEventSelector`.
+As a baseline, they are also received by polling each child process in turn, blocking for up to
+20ms on each one. For both, the script reports the latency between an event being sent and being
+received, and the CPU time spent in the parent process.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="child_process_events",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-processes",
+    type=int,
+    default=32,
+    help="Set the number of concurrent child processes.",
+)
+
+parser.add_argument(
+    "--num-events",
+    type=int,
+    default=20,
+    help="Set the number of events sent by each child process.",
+)
+
+parser.add_argument(
+    "--interval",
+    type=float,
+    default=0.1,
+    help="Set the average number of seconds each child process sleeps between events.",
+)
+
+parser.add_argument(
+    "--skip-baseline",
+    action="store_true",
+    help="Skip receiving events by polling each child process in turn.",
+)
+
+
+class SendTimestampsCommand(ChildProcessCommand):
+    def __init__(self, num_events: int, interval: float, seed: int):
+        self.num_events = num_events
+        self.interval = interval
+        self.seed = seed
+
+    def execute(self) -> Iterator[float]:  # type: ignore  # (timestamps instead of events)
+        rng = random.Random(self.seed)
+        for _ in range(self.num_events):
+            time.sleep(rng.uniform(0, 2 * self.interval))
+            yield time.time()
+
+
+def receive_events(
+    num_processes: int,
+    num_events: int,
+    interval: float,
+    event_selector: Optional[ChildProcessEventSelector],
+) -> List[float]:
+    multiproc_ctx = multiprocessing.get_context("fork")
+    active_iters: Dict[int, Iterator] = {
+        i: execute_child_process_command(
+            multiproc_ctx, SendTimestampsCommand(num_events, interval, seed=i), event_selector
+        )
+        for i in range(num_processes)
+    }
+    latencies = []
+    while active_iters:
+        received_events = False
+        for i, step_iter in list(active_iters.items()):
+            try:
+                event = next(step_iter)
+            except StopIteration:
+                del active_iters[i]
+                continue
+
+            if event is None:
+                continue
+
+            received_events = True
+            if not isinstance(event, ChildProcessEvent):
+                latencies.append(time.time() - event)
+
+        if event_selector and active_iters and not received_events:
+            event_selector.wait()
+
+    return latencies
+
+
+def log_latencies(latencies: List[float], cpu_time: float) -> None:
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    print(
+        f"{len(latencies_ms)} events received. Latency (ms):"
+        f" mean {statistics.mean(latencies_ms):.1f},"
+        f" p50 {latencies_ms[len(latencies_ms) // 2]:.1f},"
+        f" p99 {latencies_ms[int(len(latencies_ms) * 0.99)]:.1f},"
+        f" max {latencies_ms[-1]:.1f}"
+    )
+    print(f"Parent CPU time: {cpu_time:.3f} seconds")
+
+
+def main(num_processes: int, num_events: int, interval: float, skip_baseline: bool) -> None:
+    session = ProfilingSession(
+        name="Child process events",
+        experiment_settings={
+            "num_processes": num_processes,
+            "num_events": num_events,
+            "interval": interval,
+        },
+    ).start()
+    session.log_start_message()
+
+    with session.logged_execution_time("Receive events with a selector"):
+        cpu_start = time.process_time()
+        with ChildProcessEventSelector() as event_selector:
+            latencies = receive_events(num_processes, num_events, interval, event_selector)
+        log_latencies(latencies, time.process_time() - cpu_start)
+
+    if not skip_baseline:
+        with session.logged_execution_time("Receive events by polling each child process"):
+            cpu_start = time.process_time()
+            latencies = receive_events(num_processes, num_events, interval, None)
+            log_latencies(latencies, time.process_time() - cpu_start)
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_processes, args.num_events, args.interval, args.skip_baseline)
@@ -0,0 +1,187 @@
+# ruff: noqa: T201
+
+import argparse
+import time
+from typing import Callable, List, Sequence
+
+from dagster import (
+    AssetKey,
+    AssetMaterialization,
+    AssetsDefinition,
+    DailyPartitionsDefinition,
+    Definitions,
+    MetadataValue,
+    asset,
+    define_asset_job,
+)
+from dagster._core.definitions.events import AssetLineageInfo
+from dagster._core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.host_representation.external_data import external_repository_data_from_def
+from dagster._serdes import deserialize_value, serialize_value, serialize_value_to_bytes
+from dagster._serdes.serdes import PackableValue, is_binary_serdes_available
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the compiled and generic serdes code paths on large payloads. Two payloads are measured:
+
+    * an `ExternalRepositoryData` for a repository of N partitioned assets in a linear chain, with
+      one asset job per 10 assets
+    * a list of N asset materialization `EventLogEntry` objects carrying metadata and lineage
+
+Each payload is serialized and deserialized `--iterations` times with compiled serdes disabled, and
+then with it enabled. The script checks that both paths produce byte-identical JSON, and logs the
+execution time of each step. If `msgpack` is installed, the payloads are also round-tripped through
+the binary encoding and its size is reported next to the JSON size.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="serdes",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-assets",
+    type=int,
+    default=500,
+    help="Set the number of assets in the repository and of events in the event list.",
+)
+
+parser.add_argument(
+    "--iterations",
+    type=int,
+    default=5,
+    help="Set the number of times each payload is serialized and deserialized per code path.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def build_assets(num_assets: int) -> Sequence[AssetsDefinition]:
+    partitions_def = DailyPartitionsDefinition(start_date="2020-01-01")
+    assets: List[AssetsDefinition] = []
+    for i in range(num_assets):
+        deps = {f"asset_{i - 1}"} if i > 0 else set()
+
+        @asset(
+            name=f"asset_{i}",
+            non_argument_deps=deps,
+            partitions_def=partitions_def,
+            group_name=f"group_{i % 10}",
+            metadata={"owner": f"team_{i % 7}", "index": i},
+            code_version=str(i),
+        )
+        def _asset() -> None:
+            ...
+
+        assets.append(_asset)
+    return assets
+
+
+def build_events(num_events: int) -> Sequence[EventLogEntry]:
+    return [
+        EventLogEntry(
+            error_info=None,
+            level="debug",
+            user_message="",
+            run_id="a7c3f0e4-1c2f-4a8e-9d6a-0b6e8c3a2f11",
+            timestamp=time.time(),
+            step_key=f"asset_{i}",
+            job_name="benchmark_job",
+            dagster_event=DagsterEvent(
+                DagsterEventType.ASSET_MATERIALIZATION.value,
+                "benchmark_job",
+                event_specific_data=StepMaterializationData(
+                    AssetMaterialization(
+                        asset_key=AssetKey(["prefix", f"asset_{i}"]),
+                        partition="2020-01-01",
+                        metadata={
+                            "rows": MetadataValue.int(i),
+                            "path": MetadataValue.path(f"/tmp/asset_{i}"),
+                            "preview": MetadataValue.md("| a | b |\n|---|---|\n| 1 | 2 |"),
+                        },
+                        tags={"dagster/code_version": str(i)},
+                    ),
+                    asset_lineage=[AssetLineageInfo(AssetKey(["prefix", f"asset_{i - 1}"]))],
+                ),
+            ),
+        )
+        for i in range(num_events)
+    ]
+
+
+def set_compiled_serdes_enabled(enabled: bool) -> None:
+    import dagster._serdes.serdes
+
+    setattr(dagster._serdes.serdes, "_COMPILED_SERDES_ENABLED", enabled)  # noqa: SLF001
+
+
+def run_round_trips(payload: PackableValue, iterations: int) -> str:
+    serialized = ""
+    for _ in range(iterations):
+        serialized = serialize_value(payload)
+        deserialize_value(serialized)
+    return serialized
+
+
+def run_binary_round_trips(payload: PackableValue, iterations: int) -> bytes:
+    serialized = b""
+    for _ in range(iterations):
+        serialized = serialize_value_to_bytes(payload)
+        deserialize_value(serialized)
+    return serialized
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_assets: int, iterations: int) -> None:
+    assets = build_assets(num_assets)
+    jobs = [
+        define_asset_job(f"job_{i}", selection=[f"asset_{j}" for j in range(i, i + 10)])
+        for i in range(0, num_assets, 10)
+    ]
+    repository_def = Definitions(assets=assets, jobs=jobs).get_repository_def()
+
+    payloads: Sequence[Callable[[], PackableValue]] = [
+        lambda: external_repository_data_from_def(repository_def),
+        lambda: list(build_events(num_assets)),
+    ]
+
+    session = ProfilingSession(
+        name="Serdes",
+        experiment_settings={"num_assets": num_assets, "iterations": iterations},
+    ).start()
+    session.log_start_message()
+
+    for name, build_payload in zip(["ExternalRepositoryData", "EventLogEntry list"], payloads):
+        with session.logged_execution_time(f"Build {name}"):
+            payload = build_payload()
+
+        set_compiled_serdes_enabled(False)
+        with session.logged_execution_time(f"Round-trip {name} (generic)"):
+            generic_serialized = run_round_trips(payload, iterations)
+
+        set_compiled_serdes_enabled(True)
+        with session.logged_execution_time(f"Round-trip {name} (compiled)"):
+            compiled_serialized = run_round_trips(payload, iterations)
+
+        assert compiled_serialized == generic_serialized
+        print(f"{name}: {len(compiled_serialized)} bytes, compiled output is identical")
+
+        if is_binary_serdes_available():
+            with session.logged_execution_time(f"Round-trip {name} (binary)"):
+                binary_serialized = run_binary_round_trips(payload, iterations)
+            print(f"{name}: {len(binary_serialized)} bytes with binary encoding")
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.iterations)
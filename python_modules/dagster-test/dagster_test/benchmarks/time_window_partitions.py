@@ -0,0 +1,98 @@
+# ruff: noqa: T201
+
+import argparse
+
+import pendulum
+from dagster import TimeWindowPartitionsDefinition
+from dagster._core.definitions.time_window_partitions import TimeWindow
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure the cost of computing partitions for a time window partitions definition with a large number
+of partitions. The definition has one partition every `--minutes` minutes over `--years` years, in a
+fixed-offset timezone so that the schedule has a fixed period.
+
+The partition count, the last partition window, and the partition keys in a time window are computed
+by index arithmetic on the schedule period. As a baseline, the partition count is also computed by
+walking every tick of the cron schedule, which is what definitions without a fixed period fall back
+to.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="time_window_partitions",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--years",
+    type=int,
+    default=5,
+    help="Set the number of years between the start of the partitions and the current time.",
+)
+
+parser.add_argument(
+    "--minutes",
+    type=int,
+    default=1,
+    help="Set the number of minutes per partition. Must evenly divide an hour.",
+)
+
+parser.add_argument(
+    "--skip-baseline",
+    action="store_true",
+    help="Skip computing the partition count by walking the cron schedule.",
+)
+
+
+def main(years: int, minutes: int, skip_baseline: bool) -> None:
+    cron_schedule = "* * * * *" if minutes == 1 else f"*/{minutes} * * * *"
+    partitions_def = TimeWindowPartitionsDefinition(
+        start="2018-01-01-00:00",
+        fmt="%Y-%m-%d-%H:%M",
+        cron_schedule=cron_schedule,
+        timezone="Etc/GMT+5",
+    )
+    current_time = pendulum.datetime(2018 + years, 1, 1, tz="Etc/GMT+5")
+
+    session = ProfilingSession(
+        name="Time window partitions",
+        experiment_settings={"years": years, "minutes": minutes},
+    ).start()
+    session.log_start_message()
+
+    with session.logged_execution_time("Count partitions"):
+        num_partitions = partitions_def.get_num_partitions(current_time=current_time)
+    print(f"{num_partitions} partitions")
+
+    with session.logged_execution_time("Get last partition window"):
+        last_window = partitions_def.get_last_partition_window(current_time=current_time)
+    print(f"Last partition window: {last_window}")
+
+    with session.logged_execution_time("Get partition keys in the last 30 days"):
+        keys = partitions_def.get_partition_keys_in_time_window(
+            TimeWindow(current_time.subtract(days=30), current_time)
+        )
+    print(f"{len(keys)} partition keys in the last 30 days")
+
+    with session.logged_execution_time("Get all partition keys"):
+        all_keys = partitions_def.get_partition_keys(current_time=current_time)
+    assert len(all_keys) == num_partitions
+
+    if not skip_baseline:
+        with session.logged_execution_time("Count partitions by walking the cron schedule"):
+            baseline_num_partitions = 0
+            for window in partitions_def._iterate_time_windows(  # noqa: SLF001
+                partitions_def.start
+            ):
+                if window.end > current_time:
+                    break
+                baseline_num_partitions += 1
+        assert baseline_num_partitions == num_partitions
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.years, args.minutes, args.skip_baseline)
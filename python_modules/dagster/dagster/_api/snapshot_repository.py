@@ -1,7 +1,11 @@
-from typing import TYPE_CHECKING, Mapping
+from typing import TYPE_CHECKING, Dict, Mapping, Union
 
 import dagster._check as check
 from dagster._core.errors import DagsterUserCodeProcessError
+from dagster._core.host_representation.deferred_external_data import (
+    DeferredExternalRepositoryData,
+    can_defer_external_repository_data,
+)
 from dagster._core.host_representation.external_data import (
     ExternalRepositoryData,
     ExternalRepositoryErrorData,
@@ -15,12 +19,12 @@
 
 def sync_get_streaming_external_repositories_data_grpc(
     api_client: "DagsterGrpcClient", code_location: "CodeLocation"
-) -> Mapping[str, ExternalRepositoryData]:
+) -> Mapping[str, Union[ExternalRepositoryData, DeferredExternalRepositoryData]]:
     from dagster._core.host_representation import CodeLocation, ExternalRepositoryOrigin
 
     check.inst_param(code_location, "code_location", CodeLocation)
 
-    repo_datas = {}
+    repo_datas: Dict[str, Union[ExternalRepositoryData, DeferredExternalRepositoryData]] = {}
     for repository_name in code_location.repository_names:  # type: ignore
         external_repository_chunks = list(
             api_client.streaming_external_repository(
@@ -31,13 +35,17 @@ def sync_get_streaming_external_repositories_data_grpc(
             )
         )
 
+        serialized = "".join(
+            [chunk["serialized_external_repository_chunk"] for chunk in external_repository_chunks]
+        )
+
+        # Job snapshots and asset nodes are only unpacked when first accessed
+        if can_defer_external_repository_data(serialized):
+            repo_datas[repository_name] = DeferredExternalRepositoryData(serialized)
+            continue
+
         result = deserialize_value(
-            "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
-            ),
+            serialized,
             (ExternalRepositoryData, ExternalRepositoryErrorData),
         )
 
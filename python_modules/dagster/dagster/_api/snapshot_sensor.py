@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional, Sequence, Union
 
 import dagster._check as check
 from dagster._core.definitions.sensor_definition import SensorExecutionData
@@ -6,7 +6,11 @@
 from dagster._core.host_representation.external_data import ExternalSensorExecutionErrorData
 from dagster._core.host_representation.handle import RepositoryHandle
 from dagster._grpc.client import DEFAULT_GRPC_TIMEOUT
-from dagster._grpc.types import SensorExecutionArgs
+from dagster._grpc.types import (
+    MAX_SENSOR_EXECUTION_BATCH_SIZE,
+    SensorExecutionArgs,
+    SensorExecutionBatchArgs,
+)
 from dagster._serdes import deserialize_value
 
 if TYPE_CHECKING:
@@ -78,3 +82,37 @@ def sync_get_external_sensor_execution_data_grpc(
         raise DagsterUserCodeProcessError.from_error_info(result.error)
 
     return result
+
+
+# Extra time given to a batch request beyond the per-sensor timeout, for the results to be
+# serialized and streamed back
+SENSOR_BATCH_TIMEOUT_GRACE_SECONDS = 10
+
+
+def sync_get_external_sensor_execution_data_batch_grpc(
+    api_client: "DagsterGrpcClient",
+    sensor_execution_args: Sequence[SensorExecutionArgs],
+    timeout: Optional[int] = DEFAULT_GRPC_TIMEOUT,
+) -> Iterator[Union[SensorExecutionData, ExternalSensorExecutionErrorData]]:
+    check.sequence_param(
+        sensor_execution_args, "sensor_execution_args", of_type=SensorExecutionArgs
+    )
+    check.invariant(
+        len(sensor_execution_args) <= MAX_SENSOR_EXECUTION_BATCH_SIZE,
+        f"Cannot evaluate more than {MAX_SENSOR_EXECUTION_BATCH_SIZE} sensors in a batch",
+    )
+
+    if not sensor_execution_args:
+        return
+
+    # The code server applies the timeout to each sensor in the batch, which are all evaluated
+    # concurrently, so the whole stream only needs a little longer than a single sensor would.
+    for serialized_result in api_client.external_sensor_execution_batch(
+        sensor_execution_batch_args=SensorExecutionBatchArgs(
+            sensor_execution_args=sensor_execution_args, timeout=timeout
+        ),
+        timeout=timeout + SENSOR_BATCH_TIMEOUT_GRACE_SECONDS if timeout else timeout,
+    ):
+        yield deserialize_value(
+            serialized_result, (SensorExecutionData, ExternalSensorExecutionErrorData)
+        )
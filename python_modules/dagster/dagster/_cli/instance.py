@@ -1,6 +1,8 @@
 import os
+from datetime import timedelta
 
 import click
+import pendulum
 
 import dagster._check as check
 from dagster._core.instance import DagsterInstance
@@ -83,6 +85,47 @@ def reindex_command():
         instance.reindex(click.echo)
 
 
+@instance_cli.command(
+    name="archive-event-logs",
+    help=(
+        "Move the event logs of completed runs from the event log storage to the event log archive"
+        " configured on the instance. Asset events and run status events are kept in the event log"
+        " storage."
+    ),
+)
+@click.option(
+    "--older-than-days",
+    type=click.INT,
+    required=True,
+    help="Only archive the event logs of runs that completed more than this many days ago.",
+)
+@click.option(
+    "--limit",
+    type=click.INT,
+    required=False,
+    help="The maximum number of runs to archive.",
+)
+def archive_event_logs_command(older_than_days, limit):
+    from dagster._core.storage.event_log.archive import archive_event_logs
+
+    with get_instance_for_cli() as instance:
+        if not instance.event_log_archive:
+            raise click.ClickException(
+                "No event log archive is configured. Set `event_log_archive` in your dagster.yaml"
+                " to archive event logs."
+            )
+        if not instance.event_log_storage.supports_event_log_archival:
+            raise click.ClickException(
+                "The configured event log storage does not support archiving event logs."
+            )
+
+        updated_before = pendulum.now("UTC") - timedelta(days=older_than_days)
+        archived_run_ids = archive_event_logs(
+            instance, updated_before=updated_before, limit=limit, print_fn=click.echo
+        )
+        click.echo(f"Archived event logs for {len(archived_run_ids)} runs.")
+
+
 @instance_cli.group(name="concurrency")
 def concurrency_cli():
     """Commands for working with the instance-wide op concurrency (Experimental)."""
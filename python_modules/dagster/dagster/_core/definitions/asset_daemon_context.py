@@ -1,10 +1,14 @@
 import datetime
 import itertools
+import threading
+import time
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
     Any,
+    Callable,
     Dict,
     FrozenSet,
     Iterable,
@@ -20,7 +24,7 @@
 
 import dagster._check as check
 from dagster._core.definitions.auto_materialize_policy import AutoMaterializePolicy
-from dagster._core.definitions.data_time import CachingDataTimeResolver
+from dagster._core.definitions.data_time import CachingDataTimeResolver, DataTimeCache
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
 from dagster._core.definitions.run_request import RunRequest
 from dagster._core.definitions.time_window_partitions import (
@@ -39,6 +43,9 @@
 )
 from .auto_materialize_rule import (
     AutoMaterializeRule,
+    MaterializeOnMissingRule,
+    MaterializeOnParentUpdatedRule,
+    MaterializeOnRequiredForFreshnessRule,
     RuleEvaluationContext,
 )
 from .backfill_policy import BackfillPolicy, BackfillPolicyType
@@ -52,6 +59,76 @@
     from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
     from dagster._utils.caching_instance_queryer import CachingInstanceQueryer  # expensive import
 
+# when more events than this have happened since the last tick, the updated assets are found by
+# checking the asset record of each asset instead of by reading the events
+UPDATED_ASSET_KEYS_EVENT_LIMIT = 1000
+
+
+class IncrementalEvaluationState:
+    """Stores the per-asset state of incremental evaluations that only depends on the asset graph,
+    so that it can be shared between AssetDaemonContexts across ticks of the asset daemon instead of
+    being recomputed for every asset on every tick.
+
+    The state is cleared whenever it is used with a different asset graph or set of target asset
+    keys, except for the set of asset keys whose candidates were skipped on the previous tick, which
+    is replaced at the end of every tick.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._asset_graph: Optional[AssetGraph] = None
+        self._target_asset_keys: FrozenSet[AssetKey] = frozenset()
+        self._target_asset_keys_and_parents: FrozenSet[AssetKey] = frozenset()
+        self._time_dependent_asset_keys: Optional[FrozenSet[AssetKey]] = None
+        self._skipped_asset_keys: FrozenSet[AssetKey] = frozenset()
+
+    def _ensure_asset_graph(
+        self, asset_graph: AssetGraph, target_asset_keys: AbstractSet[AssetKey]
+    ) -> None:
+        if asset_graph is not self._asset_graph or target_asset_keys != self._target_asset_keys:
+            self._asset_graph = asset_graph
+            self._target_asset_keys = frozenset(target_asset_keys)
+            self._target_asset_keys_and_parents = frozenset(
+                {
+                    parent
+                    for asset_key in target_asset_keys
+                    for parent in asset_graph.get_parents(asset_key)
+                }
+                | target_asset_keys
+            )
+            self._time_dependent_asset_keys = None
+
+    def get_target_asset_keys_and_parents(
+        self, asset_graph: AssetGraph, target_asset_keys: AbstractSet[AssetKey]
+    ) -> AbstractSet[AssetKey]:
+        with self._lock:
+            self._ensure_asset_graph(asset_graph, target_asset_keys)
+            return self._target_asset_keys_and_parents
+
+    def get_time_dependent_asset_keys(
+        self,
+        asset_graph: AssetGraph,
+        target_asset_keys: AbstractSet[AssetKey],
+        compute_fn: Callable[[], AbstractSet[AssetKey]],
+    ) -> AbstractSet[AssetKey]:
+        """Returns the target asset keys whose policies must be evaluated on every tick, computing
+        them with `compute_fn` if they have not been computed for this asset graph yet.
+        """
+        with self._lock:
+            self._ensure_asset_graph(asset_graph, target_asset_keys)
+            if self._time_dependent_asset_keys is None:
+                self._time_dependent_asset_keys = frozenset(compute_fn())
+            return self._time_dependent_asset_keys
+
+    def get_skipped_asset_keys(self) -> AbstractSet[AssetKey]:
+        """Returns the asset keys which had candidates that were skipped on the previous tick."""
+        with self._lock:
+            return self._skipped_asset_keys
+
+    def set_skipped_asset_keys(self, skipped_asset_keys: AbstractSet[AssetKey]) -> None:
+        with self._lock:
+            self._skipped_asset_keys = frozenset(skipped_asset_keys)
+
 
 class AssetDaemonContext:
     def __init__(
@@ -64,11 +141,17 @@ def __init__(
         auto_observe: bool,
         target_asset_keys: Optional[AbstractSet[AssetKey]],
         respect_materialization_data_versions: bool,
+        evaluate_incrementally: bool = False,
+        threadpool_executor: Optional[ThreadPoolExecutor] = None,
+        data_time_cache: Optional[DataTimeCache] = None,
+        incremental_evaluation_state: Optional[IncrementalEvaluationState] = None,
     ):
         from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
         self._instance_queryer = CachingInstanceQueryer(instance, asset_graph)
-        self._data_time_resolver = CachingDataTimeResolver(self.instance_queryer)
+        self._data_time_resolver = CachingDataTimeResolver(
+            self.instance_queryer, data_time_cache=data_time_cache
+        )
         self._cursor = cursor
         self._target_asset_keys = target_asset_keys or {
             key
@@ -79,24 +162,20 @@ def __init__(
         self._observe_run_tags = observe_run_tags
         self._auto_observe = auto_observe
         self._respect_materialization_data_versions = respect_materialization_data_versions
-
-        # fetch some data in advance to batch some queries
-        self.instance_queryer.prefetch_asset_records(
-            [
-                key
-                for key in self.target_asset_keys_and_parents
-                if not self.asset_graph.is_source(key)
-            ]
-        )
-        self.instance_queryer.prefetch_asset_partition_counts(
-            [
-                key
-                for key in self.target_asset_keys_and_parents
-                if self.asset_graph.is_partitioned(key) and not self.asset_graph.is_source(key)
-            ],
-            after_cursor=cursor.latest_storage_id,
+        self._evaluate_incrementally = evaluate_incrementally
+        self._threadpool_executor = threadpool_executor
+        self._incremental_evaluation_state = (
+            incremental_evaluation_state or IncrementalEvaluationState()
         )
 
+        self._rule_evaluation_seconds_lock = threading.Lock()
+        self._rule_evaluation_seconds: Dict[str, float] = defaultdict(float)
+
+        self._skipped_asset_keys_lock = threading.Lock()
+        self._skipped_asset_keys: Set[AssetKey] = set()
+
+        self.prefetch()
+
     @property
     def instance_queryer(self) -> "CachingInstanceQueryer":
         return self._instance_queryer
@@ -123,16 +202,204 @@ def target_asset_keys(self) -> AbstractSet[AssetKey]:
 
     @property
     def target_asset_keys_and_parents(self) -> AbstractSet[AssetKey]:
-        return {
-            parent
-            for asset_key in self.target_asset_keys
-            for parent in self.asset_graph.get_parents(asset_key)
-        } | self.target_asset_keys
+        return self._incremental_evaluation_state.get_target_asset_keys_and_parents(
+            self.asset_graph, self.target_asset_keys
+        )
 
     @property
     def respect_materialization_data_versions(self) -> bool:
         return self._respect_materialization_data_versions
 
+    @property
+    def evaluate_incrementally(self) -> bool:
+        return self._evaluate_incrementally
+
+    def prefetch(self) -> None:
+        """Fetches the data that evaluating policies requires with as few queries as possible, so
+        that the evaluation of each individual policy mostly reads from the instance queryer's
+        caches.
+        """
+        if not self.evaluate_incrementally:
+            self.instance_queryer.prefetch_asset_records(
+                [
+                    key
+                    for key in self.target_asset_keys_and_parents
+                    if not self.asset_graph.is_source(key)
+                ]
+            )
+        self.instance_queryer.prefetch_asset_partition_counts(
+            [
+                key
+                for key in (
+                    self.get_updated_asset_keys()
+                    if self.evaluate_incrementally
+                    else self.target_asset_keys_and_parents
+                )
+                if self.asset_graph.is_partitioned(key) and not self.asset_graph.is_source(key)
+            ],
+            after_cursor=self.latest_storage_id,
+        )
+
+        asset_keys_to_evaluate_and_parents = {
+            key
+            for asset_key in self.get_asset_keys_to_evaluate()
+            for key in itertools.chain([asset_key], self.asset_graph.get_parents(asset_key))
+        }
+        if self.evaluate_incrementally:
+            self.instance_queryer.prefetch_asset_records(
+                [
+                    key
+                    for key in asset_keys_to_evaluate_and_parents | self.get_updated_asset_keys()
+                    if not self.asset_graph.is_source(key)
+                ]
+            )
+        self.instance_queryer.prefetch_latest_storage_ids_by_partition(
+            [
+                key
+                for key in asset_keys_to_evaluate_and_parents
+                if self.asset_graph.is_partitioned(key) and not self.asset_graph.is_source(key)
+            ]
+        )
+        self.instance_queryer.prefetch_dynamic_partitions(
+            [self.asset_graph.get_partitions_def(key) for key in asset_keys_to_evaluate_and_parents]
+        )
+        # freshness rules need the current data times of these assets and their parents
+        self.data_time_resolver.prefetch_current_data_times(
+            [
+                key
+                for key in asset_keys_to_evaluate_and_parents
+                if not self.asset_graph.is_source(key)
+                and self.asset_graph.get_downstream_freshness_policies(asset_key=key)
+            ],
+            current_time=self.instance_queryer.evaluation_time,
+        )
+        # the runs that produced the latest materializations of updated assets are checked for
+        # which assets they planned to materialize
+        if self.latest_storage_id is not None:
+            latest_materialization_records = [
+                asset_record.asset_entry.last_materialization_record
+                for asset_record in (
+                    self.instance_queryer.get_asset_record(key)
+                    for key in (
+                        self.get_updated_asset_keys()
+                        if self.evaluate_incrementally
+                        else self.target_asset_keys_and_parents
+                    )
+                    if not self.asset_graph.is_source(key)
+                )
+                if asset_record is not None
+                and asset_record.asset_entry.last_materialization_record is not None
+            ]
+            self.instance_queryer.prefetch_run_records(
+                {
+                    record.run_id
+                    for record in latest_materialization_records
+                    if record.storage_id > self.latest_storage_id
+                }
+            )
+
+    @cached_method
+    def get_updated_asset_keys(self) -> AbstractSet[AssetKey]:
+        """Returns the set of target asset keys and parents which have been materialized or observed
+        since the last tick.
+        """
+        if self.evaluate_incrementally and self.latest_storage_id is not None:
+            # read the events since the last tick instead of checking every asset, so that the
+            # cost of a tick tracks the number of events rather than the size of the graph
+            updated_asset_keys = self.instance_queryer.get_asset_keys_updated_after_cursor(
+                after_cursor=self.latest_storage_id, limit=UPDATED_ASSET_KEYS_EVENT_LIMIT
+            )
+            if updated_asset_keys is not None:
+                target_asset_keys_and_parents = self.target_asset_keys_and_parents
+                return {
+                    asset_key
+                    for asset_key in updated_asset_keys
+                    if asset_key in target_asset_keys_and_parents
+                    and (
+                        not self.asset_graph.is_source(asset_key)
+                        or self.asset_graph.is_observable(asset_key)
+                    )
+                }
+
+        return {
+            asset_key
+            for asset_key in self.target_asset_keys_and_parents
+            if (
+                not self.asset_graph.is_source(asset_key)
+                or self.asset_graph.is_observable(asset_key)
+            )
+            and self.instance_queryer.asset_partition_has_materialization_or_observation(
+                AssetKeyPartitionKey(asset_key), after_cursor=self.latest_storage_id
+            )
+        }
+
+    def _is_time_dependent(self, asset_key: AssetKey) -> bool:
+        """Returns True if the policy of the given asset key may request materializations even if
+        no events have happened for the asset or its parents since the last tick, e.g. because it
+        depends on the passage of time. Only depends on the asset graph, so the result is shared
+        across ticks.
+        """
+        if asset_key in self.asset_graph.root_materializable_or_observable_asset_keys and (
+            # new partitions of root assets may come into existence
+            self.asset_graph.is_partitioned(asset_key)
+        ):
+            return True
+
+        auto_materialize_policy = check.not_none(
+            self.get_implicit_auto_materialize_policy(asset_key)
+        )
+        for rule in auto_materialize_policy.materialize_rules:
+            if isinstance(rule, MaterializeOnRequiredForFreshnessRule):
+                if self.asset_graph.get_downstream_freshness_policies(asset_key=asset_key):
+                    return True
+            elif not isinstance(rule, (MaterializeOnParentUpdatedRule, MaterializeOnMissingRule)):
+                return True
+        return False
+
+    @cached_method
+    def get_asset_keys_to_evaluate(self) -> AbstractSet[AssetKey]:
+        """Returns the set of target asset keys whose policies must be evaluated on this tick. All
+        target asset keys are evaluated, unless evaluating incrementally, in which case the policies
+        of target asset keys are only evaluated if the asset or one of its parents has been updated
+        since the last tick, if the policy must be evaluated on every tick, or if candidates of the
+        asset were skipped on the previous tick, as the reason for skipping them may have cleared
+        without the asset or its parents being updated.
+
+        Target asset keys with a parent that will be materialized on this tick are also evaluated,
+        which is determined while evaluating in topological order.
+        """
+        if not self.evaluate_incrementally:
+            return self.target_asset_keys
+
+        updated_asset_keys = self.get_updated_asset_keys()
+        updated_asset_keys_and_children = {
+            key
+            for asset_key in updated_asset_keys
+            for key in itertools.chain([asset_key], self.asset_graph.get_children(asset_key))
+        }
+        time_dependent_asset_keys = (
+            self._incremental_evaluation_state.get_time_dependent_asset_keys(
+                self.asset_graph,
+                self.target_asset_keys,
+                lambda: {
+                    asset_key
+                    for asset_key in self.target_asset_keys
+                    if self._is_time_dependent(asset_key)
+                },
+            )
+        )
+        # root assets are evaluated until they have been handled once
+        unhandled_root_asset_keys = {
+            asset_key
+            for asset_key in self.asset_graph.root_materializable_or_observable_asset_keys
+            if not self.cursor.was_previously_handled(asset_key)
+        }
+        skipped_asset_keys = self._incremental_evaluation_state.get_skipped_asset_keys()
+        return (
+            (updated_asset_keys_and_children | unhandled_root_asset_keys | skipped_asset_keys)
+            & self.target_asset_keys
+        ) | time_dependent_asset_keys
+
     def get_implicit_auto_materialize_policy(
         self, asset_key: AssetKey
     ) -> Optional[AutoMaterializePolicy]:
@@ -254,7 +521,13 @@ def _get_asset_partitions_with_newly_updated_parents_by_key_and_new_latest_stora
         ) = self.instance_queryer.asset_partitions_with_newly_updated_parents_and_new_latest_storage_id(
             latest_storage_id=self.latest_storage_id,
             target_asset_keys=frozenset(self.target_asset_keys),
-            target_asset_keys_and_parents=frozenset(self.target_asset_keys_and_parents),
+            # assets that have not been updated since the last tick have no updated children, and
+            # their latest storage ids are not after the cursor, so they can be skipped
+            target_asset_keys_and_parents=frozenset(
+                self.get_updated_asset_keys()
+                if self.evaluate_incrementally
+                else self.target_asset_keys_and_parents
+            ),
             map_old_time_partitions=False,
         )
         ret = defaultdict(set)
@@ -297,6 +570,23 @@ def get_max_materializations_exceeded_conditions_for_key(
             MaxMaterializationsExceededAutoMaterializeCondition(): rate_limited_asset_partitions
         }
 
+    def _evaluate_rule(
+        self, rule: AutoMaterializeRule, context: RuleEvaluationContext
+    ) -> Mapping[AutoMaterializeCondition, AbstractSet[AssetKeyPartitionKey]]:
+        start = time.perf_counter()
+        result = rule.evaluate_for_asset(context)
+        elapsed = time.perf_counter() - start
+        with self._rule_evaluation_seconds_lock:
+            self._rule_evaluation_seconds[type(rule).__name__] += elapsed
+        return result
+
+    def get_rule_evaluation_seconds(self) -> Mapping[str, float]:
+        """Returns a mapping from the name of each rule type to the total number of seconds spent
+        evaluating rules of that type, across all assets.
+        """
+        with self._rule_evaluation_seconds_lock:
+            return dict(self._rule_evaluation_seconds)
+
     def get_auto_materialize_conditions_for_asset(
         self,
         asset_key: AssetKey,
@@ -343,12 +633,16 @@ def get_auto_materialize_conditions_for_asset(
         )
 
         for materialize_rule in auto_materialize_policy.materialize_rules:
-            for condition, asset_partitions in materialize_rule.evaluate_for_asset(
-                materialize_context
+            for condition, asset_partitions in self._evaluate_rule(
+                materialize_rule, materialize_context
             ).items():
                 conditions[condition].update(asset_partitions)
                 candidates.update(asset_partitions)
 
+        # whether any candidate was skipped, in which case the asset is evaluated again on the next
+        # tick when evaluating incrementally
+        skipped = False
+
         # These should be conditions, but aren't currently, so we just manually strip out things
         # from our materialization set
         for candidate in list(candidates):
@@ -367,6 +661,7 @@ def get_auto_materialize_conditions_for_asset(
                 > 0
             ):
                 candidates.remove(candidate)
+                skipped = True
                 for condition, asset_partitions in conditions.items():
                     if candidate in asset_partitions:
                         conditions[condition].remove(candidate)
@@ -374,10 +669,16 @@ def get_auto_materialize_conditions_for_asset(
         skip_context = materialize_context._replace(candidates=candidates)
 
         for skip_rule in auto_materialize_policy.skip_rules:
-            for condition, asset_partitions in skip_rule.evaluate_for_asset(skip_context).items():
+            for condition, asset_partitions in self._evaluate_rule(skip_rule, skip_context).items():
                 conditions[condition].update(asset_partitions)
+                if not candidates.isdisjoint(asset_partitions):
+                    skipped = True
                 candidates.difference_update(asset_partitions)
 
+        if skipped:
+            with self._skipped_asset_keys_lock:
+                self._skipped_asset_keys.add(asset_key)
+
         # MaxMaterializationsExceededAutoMaterializeCondition
         if auto_materialize_policy.max_materializations_per_minute is not None:
             for (
@@ -391,6 +692,34 @@ def get_auto_materialize_conditions_for_asset(
 
         return conditions, candidates
 
+    def _submit_auto_materialize_conditions_for_assets(
+        self,
+        asset_keys: Sequence[AssetKey],
+        will_materialize_mapping: Mapping[AssetKey, AbstractSet[AssetKeyPartitionKey]],
+        expected_data_time_mapping: Mapping[AssetKey, Optional[datetime.datetime]],
+    ) -> Mapping[AssetKey, Future]:
+        """Submits the evaluation of the policies of a set of assets which don't depend on each
+        other to the threadpool executor. If there is no executor, or there is nothing to
+        parallelize, returns an empty mapping and the policies are evaluated on the calling thread.
+
+        The workers are handed a snapshot of the mappings for the levels evaluated so far, since the
+        calling thread keeps writing to the mappings while it collects the results of this level.
+        """
+        if self._threadpool_executor is None or len(asset_keys) <= 1:
+            return {}
+
+        will_materialize_snapshot = dict(will_materialize_mapping)
+        expected_data_time_snapshot = dict(expected_data_time_mapping)
+        return {
+            asset_key: self._threadpool_executor.submit(
+                self.get_auto_materialize_conditions_for_asset,
+                asset_key,
+                will_materialize_snapshot,
+                expected_data_time_snapshot,
+            )
+            for asset_key in asset_keys
+        }
+
     def get_auto_materialize_conditions(
         self,
     ) -> Tuple[
@@ -409,41 +738,76 @@ def get_auto_materialize_conditions(
         )
         expected_data_time_mapping: Dict[AssetKey, Optional[datetime.datetime]] = defaultdict()
         visited_multi_asset_keys = set()
-        for asset_key in itertools.chain(*self.asset_graph.toposort_asset_keys()):
-            # an asset may have already been visited if it was part of a non-subsettable multi-asset
-            if asset_key not in self.target_asset_keys or asset_key in visited_multi_asset_keys:
-                continue
-            (
-                conditions_for_key,
-                to_materialize,
-            ) = self.get_auto_materialize_conditions_for_asset(
-                asset_key, will_materialize_mapping, expected_data_time_mapping
-            )
-            condition_mapping[asset_key] = conditions_for_key
-            will_materialize_mapping[asset_key] = to_materialize
-            expected_data_time = get_expected_data_time_for_asset_key(
-                self.asset_graph,
-                asset_key,
-                will_materialize_mapping=will_materialize_mapping,
-                expected_data_time_mapping=expected_data_time_mapping,
-                data_time_resolver=self.data_time_resolver,
-                current_time=self.instance_queryer.evaluation_time,
-                will_materialize=bool(to_materialize),
+        asset_keys_to_evaluate = self.get_asset_keys_to_evaluate()
+
+        if self._threadpool_executor is not None:
+            # compute the state shared by all policies up front, rather than in each worker
+            self._get_never_handled_and_newly_handled_root_asset_partitions()
+            self._get_asset_partitions_with_newly_updated_parents_by_key_and_new_latest_storage_id()
+            self.instance_queryer.get_active_backfill_target_asset_graph_subset()
+
+        # assets within a level of the toposort don't depend on each other, so their policies can
+        # be evaluated concurrently
+        for level in self.asset_graph.toposort_asset_keys():
+            level_asset_keys = [
+                asset_key
+                for asset_key in level
+                # an asset may have already been visited if it was part of a non-subsettable
+                # multi-asset
+                if asset_key in self.target_asset_keys and asset_key not in visited_multi_asset_keys
+                # the policy of an asset that is not evaluated would not produce any conditions,
+                # and its expected data time defaults to its current data time
+                and (
+                    asset_key in asset_keys_to_evaluate
+                    or any(
+                        will_materialize_mapping.get(parent_key)
+                        for parent_key in self.asset_graph.get_parents(asset_key)
+                    )
+                )
+            ]
+            futures_by_asset_key = self._submit_auto_materialize_conditions_for_assets(
+                level_asset_keys, will_materialize_mapping, expected_data_time_mapping
             )
-            expected_data_time_mapping[asset_key] = expected_data_time
-            # if we need to materialize any partitions of a non-subsettable multi-asset, just copy
-            # over conditions to any required neighbor key
-            if to_materialize:
-                for neighbor_key in self.asset_graph.get_required_multi_asset_keys(asset_key):
-                    condition_mapping[neighbor_key] = {
-                        condition: {ap._replace(asset_key=neighbor_key) for ap in asset_partitions}
-                        for condition, asset_partitions in conditions_for_key.items()
-                    }
-                    will_materialize_mapping[neighbor_key] = {
-                        ap._replace(asset_key=neighbor_key) for ap in to_materialize
-                    }
-                    expected_data_time_mapping[neighbor_key] = expected_data_time
-                    visited_multi_asset_keys.add(neighbor_key)
+            for asset_key in level_asset_keys:
+                # a neighbor in the same level may have been visited while processing this level
+                if asset_key in visited_multi_asset_keys:
+                    continue
+                if asset_key in futures_by_asset_key:
+                    conditions_for_key, to_materialize = futures_by_asset_key[asset_key].result()
+                else:
+                    (
+                        conditions_for_key,
+                        to_materialize,
+                    ) = self.get_auto_materialize_conditions_for_asset(
+                        asset_key, will_materialize_mapping, expected_data_time_mapping
+                    )
+                condition_mapping[asset_key] = conditions_for_key
+                will_materialize_mapping[asset_key] = to_materialize
+                expected_data_time = get_expected_data_time_for_asset_key(
+                    self.asset_graph,
+                    asset_key,
+                    will_materialize_mapping=will_materialize_mapping,
+                    expected_data_time_mapping=expected_data_time_mapping,
+                    data_time_resolver=self.data_time_resolver,
+                    current_time=self.instance_queryer.evaluation_time,
+                    will_materialize=bool(to_materialize),
+                )
+                expected_data_time_mapping[asset_key] = expected_data_time
+                # if we need to materialize any partitions of a non-subsettable multi-asset, just
+                # copy over conditions to any required neighbor key
+                if to_materialize:
+                    for neighbor_key in self.asset_graph.get_required_multi_asset_keys(asset_key):
+                        condition_mapping[neighbor_key] = {
+                            condition: {
+                                ap._replace(asset_key=neighbor_key) for ap in asset_partitions
+                            }
+                            for condition, asset_partitions in conditions_for_key.items()
+                        }
+                        will_materialize_mapping[neighbor_key] = {
+                            ap._replace(asset_key=neighbor_key) for ap in to_materialize
+                        }
+                        expected_data_time_mapping[neighbor_key] = expected_data_time
+                        visited_multi_asset_keys.add(neighbor_key)
 
         return condition_mapping, set().union(*will_materialize_mapping.values())
 
@@ -463,6 +827,8 @@ def evaluate(
         )
 
         condition_mapping, to_materialize = self.get_auto_materialize_conditions()
+        with self._skipped_asset_keys_lock:
+            self._incremental_evaluation_state.set_skipped_asset_keys(self._skipped_asset_keys)
 
         # here, we reorganize / flatten this into a mapping from asset partition to conditions
         conditions_by_asset_partition = defaultdict(set)
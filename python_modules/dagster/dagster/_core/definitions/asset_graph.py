@@ -232,6 +232,12 @@ def get_asset_partitions_in_range(
 
     def get_partition_mapping(
         self, asset_key: AssetKey, in_asset_key: AssetKey
+    ) -> PartitionMapping:
+        return self._get_partition_mapping(asset_key=asset_key, in_asset_key=in_asset_key)
+
+    @cached_method
+    def _get_partition_mapping(
+        self, *, asset_key: AssetKey, in_asset_key: AssetKey
     ) -> PartitionMapping:
         partition_mappings = self._partition_mappings_by_key.get(asset_key) or {}
         return infer_partition_mapping(
@@ -273,10 +279,14 @@ def get_ancestors(
         self, asset_key: AssetKey, include_self: bool = False
     ) -> AbstractSet[AssetKey]:
         """Returns all nth-order dependencies of an asset."""
-        ancestors = {asset_key} if include_self else set()
+        ancestors = self._get_ancestors(asset_key=asset_key)
+        return ancestors | {asset_key} if include_self else ancestors
+
+    @cached_method
+    def _get_ancestors(self, *, asset_key: AssetKey) -> AbstractSet[AssetKey]:
         parents = self.get_parents(asset_key) - {asset_key}  # remove self-dependencies
-        return ancestors.union(
-            *[self.get_ancestors(parent, include_self=True) for parent in parents]
+        return frozenset(
+            set(parents).union(*[self._get_ancestors(asset_key=parent) for parent in parents])
         )
 
     def get_children_partitions(
@@ -354,6 +364,40 @@ def get_child_partition_keys_of_parent(
 
         return list(child_partitions_subset.get_partition_keys())
 
+    def get_child_partitions_subset(
+        self,
+        dynamic_partitions_store: DynamicPartitionsStore,
+        current_time: datetime,
+        parent_asset_key: AssetKey,
+        parent_partitions_subset: Optional[PartitionsSubset],
+        child_asset_key: AssetKey,
+    ) -> PartitionsSubset:
+        """Returns the partitions of a partitioned child asset that depend on any of the given
+        partitions of its parent. parent_partitions_subset is None if the parent is unpartitioned.
+        """
+        from .partition_mapping import AllPartitionMapping
+
+        child_partitions_def = self.get_partitions_def(child_asset_key)
+        if child_partitions_def is None:
+            raise DagsterInvalidInvocationError(
+                f"Asset key {child_asset_key} is not partitioned. Cannot get partitions subset."
+            )
+
+        partition_mapping = self.get_partition_mapping(child_asset_key, parent_asset_key)
+        if parent_partitions_subset is None or isinstance(partition_mapping, AllPartitionMapping):
+            if parent_partitions_subset is not None and len(parent_partitions_subset) == 0:
+                return child_partitions_def.empty_subset()
+            return child_partitions_def.subset_with_all_partitions(
+                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+            )
+
+        return partition_mapping.get_downstream_partitions_for_partitions(
+            parent_partitions_subset,
+            downstream_partitions_def=child_partitions_def,
+            dynamic_partitions_store=dynamic_partitions_store,
+            current_time=current_time,
+        )
+
     def get_parents_partitions(
         self,
         dynamic_partitions_store: DynamicPartitionsStore,
@@ -502,6 +546,28 @@ def toposort_asset_keys(self) -> Sequence[AbstractSet[AssetKey]]:
             {key for key in level} for level in toposort.toposort(self._asset_dep_graph["upstream"])
         ]
 
+    @cached_method
+    def toposort_asset_key_units(self) -> Sequence[AbstractSet[AssetKey]]:
+        """Groups each asset key with the keys that must be materialized along with it, and orders
+        the groups so that every group comes after the groups of its parents.
+        """
+        level_by_asset_key = {
+            asset_key: i
+            for i, asset_keys in enumerate(self.toposort_asset_keys())
+            for asset_key in asset_keys
+        }
+        units = {
+            frozenset(self.get_required_multi_asset_keys(asset_key) | {asset_key})
+            for asset_key in level_by_asset_key
+        }
+        return sorted(
+            units,
+            key=lambda unit: (
+                max(level_by_asset_key[asset_key] for asset_key in unit),
+                sorted(unit),
+            ),
+        )
+
     def get_auto_materialize_policy(self, asset_key: AssetKey) -> Optional[AutoMaterializePolicy]:
         return self.auto_materialize_policies_by_key.get(asset_key)
 
@@ -654,6 +720,129 @@ def bfs_filter_asset_partitions(
 
         return result
 
+    def can_map_partitions_subsets(self, asset_keys: AbstractSet[AssetKey]) -> bool:
+        """Returns whether the dependencies of the given assets on their parents can be followed a
+        partitions subset at a time, such that the partitions mapped from a subset are exactly the
+        partitions mapped from any of its partitions.
+
+        This holds when none of the assets depend on themselves, partitioned assets depend on
+        partitioned parents through identity or unshifted time window partition mappings, and
+        unpartitioned assets depend on all partitions of their partitioned parents.
+        """
+        from .partition_mapping import AllPartitionMapping, IdentityPartitionMapping
+        from .time_window_partition_mapping import TimeWindowPartitionMapping
+        from .time_window_partitions import TimeWindowPartitionsDefinition
+
+        for asset_key in asset_keys:
+            if self.has_self_dependency(asset_key):
+                return False
+
+            partitions_def = self.get_partitions_def(asset_key)
+            for parent_asset_key in self.get_parents(asset_key):
+                parent_partitions_def = self.get_partitions_def(parent_asset_key)
+                if parent_partitions_def is None:
+                    continue
+
+                partition_mapping = self.get_partition_mapping(asset_key, parent_asset_key)
+                if partitions_def is None:
+                    if not isinstance(partition_mapping, AllPartitionMapping):
+                        return False
+                elif isinstance(partition_mapping, TimeWindowPartitionMapping):
+                    if (
+                        partition_mapping.start_offset != 0
+                        or partition_mapping.end_offset != 0
+                        or not isinstance(partitions_def, TimeWindowPartitionsDefinition)
+                        or not isinstance(parent_partitions_def, TimeWindowPartitionsDefinition)
+                    ):
+                        return False
+                elif not isinstance(partition_mapping, IdentityPartitionMapping):
+                    return False
+
+        return True
+
+    def toposort_filter_subsets(
+        self,
+        dynamic_partitions_store: DynamicPartitionsStore,
+        filter_fn: Callable[["AssetGraphSubset", "AssetGraphSubset"], "AssetGraphSubset"],
+        initial_subset: "AssetGraphSubset",
+        current_time: datetime,
+    ) -> "AssetGraphSubset":
+        """Counterpart of bfs_filter_asset_partitions that operates on a partitions subset per
+        asset, rather than on individual asset partitions.
+
+        Visits assets in topological order, parents before children. The candidates for an asset
+        are its partitions in initial_subset, plus the partitions that depend on any partition
+        accepted for one of its parents. filter_fn is provided the candidates and the asset
+        partitions accepted so far, and returns the candidates to accept.
+
+        When assets are part of the same non-subsettable multi-asset, they're provided all at once
+        to the filter_fn, with the same candidate partitions.
+
+        Only valid for assets for which can_map_partitions_subsets holds.
+        """
+        from .asset_graph_subset import AssetGraphSubset
+
+        candidate_subsets_by_asset_key: Dict[AssetKey, PartitionsSubset] = dict(
+            initial_subset.partitions_subsets_by_asset_key
+        )
+        candidate_non_partitioned_asset_keys = set(initial_subset.non_partitioned_asset_keys)
+        result = AssetGraphSubset(self)
+
+        for unit in self.toposort_asset_key_units():
+            unit_subsets = [
+                candidate_subsets_by_asset_key.pop(asset_key)
+                for asset_key in unit
+                if asset_key in candidate_subsets_by_asset_key
+            ]
+            unit_has_non_partitioned_candidates = bool(unit & candidate_non_partitioned_asset_keys)
+            if not unit_subsets and not unit_has_non_partitioned_candidates:
+                continue
+
+            if unit_subsets:
+                unit_partitions_subset = functools.reduce(lambda a, b: a | b, unit_subsets)
+                candidates = AssetGraphSubset(
+                    self, {asset_key: unit_partitions_subset for asset_key in unit}
+                )
+            else:
+                candidates = AssetGraphSubset(self, non_partitioned_asset_keys=set(unit))
+
+            accepted = filter_fn(candidates, result)
+            accepted = AssetGraphSubset(
+                self,
+                {
+                    asset_key: partitions_subset
+                    for asset_key, partitions_subset in accepted.partitions_subsets_by_asset_key.items()
+                    if len(partitions_subset) > 0
+                },
+                accepted.non_partitioned_asset_keys,
+            )
+            result |= accepted
+
+            for asset_key in accepted.asset_keys:
+                partitions_subset = accepted.partitions_subsets_by_asset_key.get(asset_key)
+                for child_asset_key in self.get_children(asset_key):
+                    if self.get_partitions_def(child_asset_key) is None:
+                        candidate_non_partitioned_asset_keys.add(child_asset_key)
+                        continue
+
+                    child_partitions_subset = self.get_child_partitions_subset(
+                        dynamic_partitions_store,
+                        current_time,
+                        asset_key,
+                        partitions_subset,
+                        child_asset_key,
+                    )
+                    prior_child_partitions_subset = candidate_subsets_by_asset_key.get(
+                        child_asset_key
+                    )
+                    candidate_subsets_by_asset_key[child_asset_key] = (
+                        child_partitions_subset
+                        if prior_child_partitions_subset is None
+                        else prior_child_partitions_subset | child_partitions_subset
+                    )
+
+        return result
+
     def split_asset_keys_by_repository(
         self, asset_keys: AbstractSet[AssetKey]
     ) -> Sequence[AbstractSet[AssetKey]]:
@@ -121,6 +121,31 @@ def __or__(
             result_non_partitioned_asset_keys,
         )
 
+    def __and__(self, other: "AssetGraphSubset") -> "AssetGraphSubset":
+        return AssetGraphSubset(
+            self.asset_graph,
+            {
+                asset_key: subset & other.partitions_subsets_by_asset_key[asset_key]
+                for asset_key, subset in self.partitions_subsets_by_asset_key.items()
+                if asset_key in other.partitions_subsets_by_asset_key
+            },
+            self._non_partitioned_asset_keys & other.non_partitioned_asset_keys,
+        )
+
+    def __sub__(self, other: "AssetGraphSubset") -> "AssetGraphSubset":
+        return AssetGraphSubset(
+            self.asset_graph,
+            {
+                asset_key: (
+                    subset - other.partitions_subsets_by_asset_key[asset_key]
+                    if asset_key in other.partitions_subsets_by_asset_key
+                    else subset
+                )
+                for asset_key, subset in self.partitions_subsets_by_asset_key.items()
+            },
+            self._non_partitioned_asset_keys - other.non_partitioned_asset_keys,
+        )
+
     def filter_asset_keys(self, asset_keys: AbstractSet[AssetKey]) -> "AssetGraphSubset":
         return AssetGraphSubset(
             self.asset_graph,
@@ -253,10 +278,8 @@ def from_asset_keys(
         for asset_key in asset_keys:
             partitions_def = asset_graph.get_partitions_def(asset_key)
             if partitions_def:
-                partitions_subsets_by_asset_key[
-                    asset_key
-                ] = partitions_def.empty_subset().with_partition_keys(
-                    partitions_def.get_partition_keys(
+                partitions_subsets_by_asset_key[asset_key] = (
+                    partitions_def.subset_with_all_partitions(
                         dynamic_partitions_store=dynamic_partitions_store
                     )
                 )
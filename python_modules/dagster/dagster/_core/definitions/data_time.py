@@ -13,7 +13,9 @@
 """
 
 import datetime
-from typing import AbstractSet, Dict, Mapping, Optional, Sequence, Tuple, cast
+import threading
+from collections import OrderedDict
+from typing import AbstractSet, Dict, Iterable, Mapping, Optional, Sequence, Tuple, cast
 
 import pendulum
 
@@ -39,12 +41,63 @@
 from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
 
+class DataTimeCache:
+    """Stores the data times of records so that they can be shared between CachingDataTimeResolvers
+    across evaluations (e.g. across ticks of the asset daemon).
+
+    A record's data times are only stored if they can never change once the record exists, which is
+    the case when none of the asset's lineage is time-partitioned or an observable source asset. The
+    cache is cleared whenever it is used with a different asset graph, as the lineage of a record
+    depends on the graph.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._asset_graph: Optional[AssetGraph] = None
+        self._data_time_by_key_by_record: "OrderedDict[Tuple[AssetKey, int], Mapping[AssetKey, Optional[datetime.datetime]]]" = (
+            OrderedDict()
+        )
+
+    def get(
+        self, asset_graph: AssetGraph, asset_key: AssetKey, record_id: int
+    ) -> Optional[Mapping[AssetKey, Optional[datetime.datetime]]]:
+        with self._lock:
+            if asset_graph is not self._asset_graph:
+                return None
+            data_time_by_key = self._data_time_by_key_by_record.get((asset_key, record_id))
+            if data_time_by_key is not None:
+                self._data_time_by_key_by_record.move_to_end((asset_key, record_id))
+            return data_time_by_key
+
+    def set(
+        self,
+        asset_graph: AssetGraph,
+        asset_key: AssetKey,
+        record_id: int,
+        data_time_by_key: Mapping[AssetKey, Optional[datetime.datetime]],
+    ) -> None:
+        with self._lock:
+            if asset_graph is not self._asset_graph:
+                self._asset_graph = asset_graph
+                self._data_time_by_key_by_record.clear()
+            self._data_time_by_key_by_record[(asset_key, record_id)] = data_time_by_key
+            self._data_time_by_key_by_record.move_to_end((asset_key, record_id))
+            while len(self._data_time_by_key_by_record) > self._max_size:
+                self._data_time_by_key_by_record.popitem(last=False)
+
+
 class CachingDataTimeResolver:
     _instance_queryer: CachingInstanceQueryer
     _asset_graph: AssetGraph
 
-    def __init__(self, instance_queryer: CachingInstanceQueryer):
+    def __init__(
+        self,
+        instance_queryer: CachingInstanceQueryer,
+        data_time_cache: Optional[DataTimeCache] = None,
+    ):
         self._instance_queryer = instance_queryer
+        self._data_time_cache = data_time_cache
 
     @property
     def instance_queryer(self) -> CachingInstanceQueryer:
@@ -296,6 +349,17 @@ def _calculate_data_time_by_key_observable_source(
     # CORE DATA TIME
     ####################
 
+    @cached_method
+    def _has_immutable_data_time(self, *, asset_key: AssetKey) -> bool:
+        """Returns True if the data times of a record of this asset can never change once the record
+        exists, in which case they can be shared across evaluations.
+        """
+        return not any(
+            self.asset_graph.is_observable(key)
+            or isinstance(self.asset_graph.get_partitions_def(key), TimeWindowPartitionsDefinition)
+            for key in self.asset_graph.get_ancestors(asset_key, include_self=True)
+        )
+
     @cached_method
     def _calculate_data_time_by_key(
         self,
@@ -310,6 +374,36 @@ def _calculate_data_time_by_key(
             return {key: None for key in self.asset_graph.get_non_source_roots(asset_key)}
         record_timestamp = check.not_none(record_timestamp)
 
+        if self._data_time_cache is None or not self._has_immutable_data_time(asset_key=asset_key):
+            return self._calculate_data_time_by_key_for_record(
+                asset_key=asset_key,
+                record_id=record_id,
+                record_timestamp=record_timestamp,
+                record_tags=record_tags,
+                current_time=current_time,
+            )
+
+        data_time_by_key = self._data_time_cache.get(self.asset_graph, asset_key, record_id)
+        if data_time_by_key is None:
+            data_time_by_key = self._calculate_data_time_by_key_for_record(
+                asset_key=asset_key,
+                record_id=record_id,
+                record_timestamp=record_timestamp,
+                record_tags=record_tags,
+                current_time=current_time,
+            )
+            self._data_time_cache.set(self.asset_graph, asset_key, record_id, data_time_by_key)
+        return data_time_by_key
+
+    def _calculate_data_time_by_key_for_record(
+        self,
+        *,
+        asset_key: AssetKey,
+        record_id: int,
+        record_timestamp: float,
+        record_tags: Tuple[Tuple[str, str]],
+        current_time: datetime.datetime,
+    ) -> Mapping[AssetKey, Optional[datetime.datetime]]:
         partitions_def = self.asset_graph.get_partitions_def(asset_key)
         if isinstance(partitions_def, TimeWindowPartitionsDefinition):
             return self._calculate_data_time_by_key_time_partitioned(
@@ -339,19 +433,17 @@ def _calculate_data_time_by_key(
 
     @cached_method
     def _get_in_progress_run_ids(self, current_time: datetime.datetime) -> Sequence[str]:
-        return [
-            record.dagster_run.run_id
-            for record in self.instance_queryer.instance.get_run_records(
-                filters=RunsFilter(
-                    statuses=[
-                        status for status in DagsterRunStatus if status not in FINISHED_STATUSES
-                    ],
-                    # ignore old runs that may be stuck in an unfinished state
-                    created_after=current_time - datetime.timedelta(days=1),
-                ),
-                limit=25,
-            )
-        ]
+        run_records = self.instance_queryer.instance.get_run_records(
+            filters=RunsFilter(
+                statuses=[status for status in DagsterRunStatus if status not in FINISHED_STATUSES],
+                # ignore old runs that may be stuck in an unfinished state
+                created_after=current_time - datetime.timedelta(days=1),
+            ),
+            limit=25,
+        )
+        # the runs are looked up again to check which assets they plan to materialize
+        self.instance_queryer.cache_run_records(run_records)
+        return [record.dagster_run.run_id for record in run_records]
 
     @cached_method
     def _get_in_progress_data_time_in_run(
@@ -502,6 +594,26 @@ def get_current_data_time(
 
         return min(cast(AbstractSet[datetime.datetime], data_times), default=None)
 
+    def prefetch_current_data_times(
+        self, asset_keys: Iterable[AssetKey], current_time: datetime.datetime
+    ) -> None:
+        """For performance, computes the current data times of the given assets and all of their
+        ancestors in a single topological pass over the asset graph. Each record's data times are
+        then resolved after those of its parents, which are already cached, rather than through a
+        separate walk up the lineage for every asset.
+        """
+        asset_keys_to_resolve = {
+            key
+            for asset_key in asset_keys
+            for key in self.asset_graph.get_ancestors(asset_key, include_self=True)
+            if not self.asset_graph.is_source(key)
+        }
+        self.instance_queryer.prefetch_asset_records(asset_keys_to_resolve)
+        for level in self.asset_graph.toposort_asset_keys():
+            for asset_key in level:
+                if asset_key in asset_keys_to_resolve:
+                    self.get_current_data_time(asset_key, current_time=current_time)
+
     def get_minutes_overdue(
         self,
         asset_key: AssetKey,
@@ -1,4 +1,6 @@
-from collections import defaultdict
+import threading
+import weakref
+from collections import OrderedDict, defaultdict
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
@@ -12,6 +14,7 @@
     Tuple,
 )
 
+import dagster._check as check
 from dagster._core.definitions.assets_job import ASSET_BASE_JOB_PREFIX
 from dagster._core.definitions.auto_materialize_policy import AutoMaterializePolicy
 from dagster._core.host_representation.external import ExternalRepository
@@ -27,8 +30,24 @@
 from .partition_mapping import PartitionMapping
 
 if TYPE_CHECKING:
+    from dagster._core.host_representation.code_location import CodeLocation
     from dagster._core.host_representation.external_data import ExternalAssetNode
 
+# Asset graphs built from a workspace are cached per process, keyed by the code location snapshots
+# they were built from. Daemons and webserver requests see the same snapshot until a code location
+# is reloaded, at which point the location's entry gets a new update timestamp and code location
+# object, so the key changes and the graph is rebuilt. Graphs built from a single repository live as
+# long as the ExternalRepository they were built from.
+_ASSET_GRAPH_CACHE_MAX_SIZE = 8
+_CachedAssetGraph = Tuple[Sequence["CodeLocation"], "ExternalAssetGraph"]
+_asset_graph_cache_lock = threading.Lock()
+_asset_graph_cache: "OrderedDict[AbstractSet[Tuple[str, float, int]], _CachedAssetGraph]" = (
+    OrderedDict()
+)
+_asset_graphs_by_repository: "weakref.WeakKeyDictionary[ExternalRepository, ExternalAssetGraph]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 class ExternalAssetGraph(AssetGraph):
     def __init__(
@@ -72,11 +91,47 @@ def __init__(
 
     @classmethod
     def from_workspace(cls, context: IWorkspace) -> "ExternalAssetGraph":
-        code_locations = (
-            location_entry.code_location
+        location_entries = [
+            location_entry
             for location_entry in context.get_workspace_snapshot().values()
             if location_entry.code_location
+        ]
+        # the code location objects are held by the cache entry alongside the graph, so their ids
+        # can't be reused by a different code location while the entry is alive
+        cache_key = frozenset(
+            (
+                location_entry.origin.location_name,
+                location_entry.update_timestamp,
+                id(location_entry.code_location),
+            )
+            for location_entry in location_entries
         )
+        with _asset_graph_cache_lock:
+            cached = _asset_graph_cache.get(cache_key)
+            if cached is not None:
+                _asset_graph_cache.move_to_end(cache_key)
+                return cached[1]
+
+        code_locations = [
+            check.not_none(location_entry.code_location) for location_entry in location_entries
+        ]
+        asset_graph = cls._from_code_locations(code_locations)
+
+        with _asset_graph_cache_lock:
+            _asset_graph_cache[cache_key] = (code_locations, asset_graph)
+            while len(_asset_graph_cache) > _ASSET_GRAPH_CACHE_MAX_SIZE:
+                _asset_graph_cache.popitem(last=False)
+        return asset_graph
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drops all asset graphs cached by `from_workspace`."""
+        with _asset_graph_cache_lock:
+            _asset_graph_cache.clear()
+            _asset_graphs_by_repository.clear()
+
+    @classmethod
+    def _from_code_locations(cls, code_locations: Sequence["CodeLocation"]) -> "ExternalAssetGraph":
         repos = (
             repo
             for code_location in code_locations
@@ -96,12 +151,18 @@ def from_workspace(cls, context: IWorkspace) -> "ExternalAssetGraph":
     def from_external_repository(
         cls, external_repository: ExternalRepository
     ) -> "ExternalAssetGraph":
-        return cls.from_repository_handles_and_external_asset_nodes(
-            [
-                (external_repository.handle, asset_node)
-                for asset_node in external_repository.get_external_asset_nodes()
-            ]
-        )
+        with _asset_graph_cache_lock:
+            asset_graph = _asset_graphs_by_repository.get(external_repository)
+        if asset_graph is None:
+            asset_graph = cls.from_repository_handles_and_external_asset_nodes(
+                [
+                    (external_repository.handle, asset_node)
+                    for asset_node in external_repository.get_external_asset_nodes()
+                ]
+            )
+            with _asset_graph_cache_lock:
+                _asset_graphs_by_repository[external_repository] = asset_graph
+        return asset_graph
 
     @classmethod
     def from_repository_handles_and_external_asset_nodes(
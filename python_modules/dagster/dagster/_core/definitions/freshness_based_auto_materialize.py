@@ -126,10 +126,9 @@ def get_expected_data_time_for_asset_key(
         for parent_key in asset_graph.get_parents(asset_key):
             # if the parent will be materialized on this tick, and it's not in the same repo, then
             # we must wait for this asset to be materialized
-            if (
-                isinstance(asset_graph, ExternalAssetGraph)
-                and AssetKeyPartitionKey(parent_key) in will_materialize_mapping[parent_key]
-            ):
+            if isinstance(asset_graph, ExternalAssetGraph) and AssetKeyPartitionKey(
+                parent_key
+            ) in will_materialize_mapping.get(parent_key, set()):
                 parent_repo = asset_graph.get_repository_handle(parent_key)
                 if parent_repo != asset_graph.get_repository_handle(asset_key):
                     return data_time_resolver.get_current_data_time(asset_key, current_time)
@@ -529,10 +529,16 @@ def __init__(
         super(MultiPartitionsSubset, self).__init__(partitions_def, subset)
 
     def with_partition_keys(self, partition_keys: Iterable[str]) -> "MultiPartitionsSubset":
-        return MultiPartitionsSubset(
-            cast(MultiPartitionsDefinition, self._partitions_def),
-            self._subset | set(partition_keys),
-        )
+        partitions_def = cast(MultiPartitionsDefinition, self._partitions_def)
+        multi_partition_keys = []
+        for key in partition_keys:
+            if MULTIPARTITION_KEY_DELIMITER not in key:
+                raise DagsterInvalidInvocationError(
+                    f"Partition key {key} is not a multi-partition key, which join the keys of each"
+                    f" dimension with '{MULTIPARTITION_KEY_DELIMITER}'."
+                )
+            multi_partition_keys.append(partitions_def.get_partition_key_from_str(key))
+        return cast(MultiPartitionsSubset, super().with_partition_keys(multi_partition_keys))
 
 
 def get_tags_from_multi_partition_key(multi_partition_key: MultiPartitionKey) -> Mapping[str, str]:
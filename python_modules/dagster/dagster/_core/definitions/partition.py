@@ -1,6 +1,10 @@
+import base64
 import copy
 import hashlib
 import json
+import os
+import threading
+import zlib
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from datetime import (
@@ -9,11 +13,13 @@
 )
 from enum import Enum
 from typing import (
+    AbstractSet,
     Any,
     Callable,
     Dict,
     Generic,
     Iterable,
+    List,
     Mapping,
     NamedTuple,
     Optional,
@@ -38,6 +44,7 @@
 from dagster._core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
 from dagster._serdes import whitelist_for_serdes
 from dagster._utils import xor
+from dagster._utils.cache import LRUCache
 from dagster._utils.cached_method import cached_method
 from dagster._utils.warnings import (
     normalize_renamed_param,
@@ -217,6 +224,13 @@ def get_partition_keys_in_range(
             + 1
         ]
 
+    @cached_method
+    def get_partition_key_index(self) -> "PartitionKeyIndex":
+        """The index used to map this definition's partition keys to bitmap positions in a
+        DefaultPartitionsSubset.
+        """
+        return PartitionKeyIndex()
+
     def empty_subset(self) -> "PartitionsSubset[T_str]":
         return self.partitions_subset_class.empty_subset(self)
 
@@ -366,6 +380,11 @@ def get_partition_keys(
         """
         return self._partition_keys
 
+    @cached_method
+    def get_partition_key_index(self) -> "PartitionKeyIndex":
+        # seed the index with the definition's keys, so that bitmap positions follow key order
+        return PartitionKeyIndex(self._partition_keys)
+
     def __hash__(self):
         return hash(self.__repr__())
 
@@ -565,6 +584,11 @@ def has_partition_key(
                 partitions_def_name=self._validated_name(), partition_key=partition_key
             )
 
+    def get_partition_key_index(self) -> "PartitionKeyIndex":
+        if self.name:
+            return _get_dynamic_partition_key_index(self.name)
+        return super().get_partition_key_index()
+
     def build_add_request(self, partition_keys: Sequence[str]) -> AddDynamicPartitionsRequest:
         check.sequence_param(partition_keys, "partition_keys", of_type=str)
         validated_name = self._validated_name()
@@ -987,6 +1011,20 @@ def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_str]":
             return self
         return self.with_partition_keys(other.get_partition_keys())
 
+    def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_str]":
+        if self is other:
+            return self
+        return self.partitions_def.empty_subset().with_partition_keys(
+            key for key in self.get_partition_keys() if key in other
+        )
+
+    def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_str]":
+        if self is other:
+            return self.partitions_def.empty_subset()
+        return self.partitions_def.empty_subset().with_partition_keys(
+            key for key in self.get_partition_keys() if key not in other
+        )
+
     @abstractmethod
     def serialize(self) -> str:
         ...
@@ -1064,34 +1102,179 @@ def deserialize(self, partitions_def: PartitionsDefinition) -> PartitionsSubset:
         return partitions_def.deserialize_subset(self.serialized_subset)
 
 
+class PartitionKeyIndex:
+    """An append-only mapping from partition keys to consecutive integer indices.
+
+    Subsets of a partitions definition that share an index represent their membership as a bitmap
+    over these indices, so that unions, intersections and differences are computed in bulk with
+    integer operations instead of set algebra over strings. Keys are assigned an index the first time
+    they are seen, and indices are never reused, so bitmaps remain valid as the index grows.
+    """
+
+    def __init__(self, partition_keys: Sequence[str] = ()):
+        self._lock = threading.Lock()
+        self._keys: List[str] = list(partition_keys)
+        self._indices: Dict[str, int] = {key: idx for idx, key in enumerate(self._keys)}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getstate__(self) -> Sequence[str]:
+        return self._keys
+
+    def __setstate__(self, state: Sequence[str]) -> None:
+        self.__init__(state)
+
+    def get_index(self, partition_key: str) -> Optional[int]:
+        return self._indices.get(partition_key)
+
+    def get_bitmap(self, partition_keys: Iterable[str]) -> int:
+        """Returns the bitmap of the given keys, assigning indices to any keys not yet seen."""
+        indices = []
+        unseen_keys = []
+        for partition_key in partition_keys:
+            idx = self._indices.get(partition_key)
+            if idx is None:
+                unseen_keys.append(partition_key)
+            else:
+                indices.append(idx)
+
+        if unseen_keys:
+            with self._lock:
+                for partition_key in unseen_keys:
+                    idx = self._indices.get(partition_key)
+                    if idx is None:
+                        idx = len(self._keys)
+                        self._keys.append(partition_key)
+                        self._indices[partition_key] = idx
+                    indices.append(idx)
+
+        return _bitmap_from_indices(indices)
+
+    def get_bitmap_of_all_keys(self) -> int:
+        return (1 << len(self._keys)) - 1
+
+    def get_partition_keys(self, bitmap: int) -> List[str]:
+        """Returns the keys in the bitmap, in index order."""
+        # reversed binary representation, so that the character at position i is the i-th bit
+        bits = bin(bitmap)[:1:-1]
+        keys = self._keys
+        result = []
+        idx = bits.find("1")
+        while idx != -1:
+            result.append(keys[idx])
+            idx = bits.find("1", idx + 1)
+        return result
+
+
+# Bitmaps built from fewer indices than this are built with shifts, larger ones with a bytearray
+_BITMAP_BYTEARRAY_THRESHOLD = 64
+
+
+def _bitmap_from_indices(indices: Sequence[int]) -> int:
+    if len(indices) < _BITMAP_BYTEARRAY_THRESHOLD:
+        bitmap = 0
+        for idx in indices:
+            bitmap |= 1 << idx
+        return bitmap
+
+    buffer = bytearray((max(indices) >> 3) + 1)
+    for idx in indices:
+        buffer[idx >> 3] |= 1 << (idx & 7)
+    return int.from_bytes(buffer, "little")
+
+
+# Key indexes of dynamic partitions definitions, by definition name. Indexes only ever grow, so they
+# are bounded both in number and in size: an index that has grown past the maximum number of keys is
+# replaced by an empty one. Subsets keep the index they were created with, and subsets of different
+# indexes are combined by key rather than by bitmap.
+_DYNAMIC_PARTITION_KEY_INDEXES_MAX_SIZE = 64
+_DYNAMIC_PARTITION_KEY_INDEX_MAX_KEYS = 1_000_000
+_dynamic_partition_key_indexes: LRUCache[str, PartitionKeyIndex] = LRUCache(
+    _DYNAMIC_PARTITION_KEY_INDEXES_MAX_SIZE
+)
+
+
+def _get_dynamic_partition_key_index(partitions_def_name: str) -> PartitionKeyIndex:
+    # shared across all definitions with the same name, so that subsets created from different
+    # instances of the definition can be combined in bulk
+    index = _dynamic_partition_key_indexes.get_or_create(partitions_def_name, PartitionKeyIndex)
+    if len(index) > _DYNAMIC_PARTITION_KEY_INDEX_MAX_KEYS:
+        index = PartitionKeyIndex()
+        _dynamic_partition_key_indexes.set(partitions_def_name, index)
+    return index
+
+
+# Subsets are serialized in the compressed format only when enabled, since releases before the
+# format was added can't read it. Enable it once every process reading subsets has been upgraded.
+_COMPRESS_SERIALIZED_SUBSETS = (
+    os.getenv("DAGSTER_COMPRESS_SERIALIZED_PARTITIONS_SUBSETS") is not None
+)
+
+
 class DefaultPartitionsSubset(PartitionsSubset[T_str]):
+    """A subset of the partitions of a partitions definition, stored as a bitmap over the partitions
+    definition's `PartitionKeyIndex`.
+    """
+
     # Every time we change the serialization format, we should increment the version number.
     # This will ensure that we can gracefully degrade when deserializing old data.
     SERIALIZATION_VERSION = 1
 
+    # Stores the keys zlib-compressed. Always readable, but only written when enabled.
+    COMPRESSED_SERIALIZATION_VERSION = 2
+
     def __init__(
         self, partitions_def: PartitionsDefinition[T_str], subset: Optional[Set[T_str]] = None
     ):
         check.opt_set_param(subset, "subset")
         self._partitions_def = partitions_def
-        self._subset = subset or set()
+        self._index = partitions_def.get_partition_key_index()
+        self._bitmap = self._index.get_bitmap(subset) if subset else 0
+
+    def _with_bitmap(self, bitmap: int) -> "DefaultPartitionsSubset[T_str]":
+        subset = self.__class__.__new__(self.__class__)
+        subset._partitions_def = self._partitions_def  # noqa: SLF001
+        subset._index = self._index  # noqa: SLF001
+        subset._bitmap = bitmap  # noqa: SLF001
+        return subset
+
+    def _get_bitmap_of(self, other: "PartitionsSubset") -> int:
+        """Returns the bitmap of another subset of the same partitions definition, relative to
+        this subset's index.
+        """
+        if isinstance(other, DefaultPartitionsSubset) and other.has_same_index(self):
+            return other._bitmap  # noqa: SLF001
+        return self._index.get_bitmap(other.get_partition_keys())
+
+    def has_same_index(self, other: "DefaultPartitionsSubset") -> bool:
+        """Whether this subset's bitmap can be combined directly with the other subset's."""
+        return self._index is other._index  # noqa: SLF001
+
+    @property
+    @cached_method
+    def _partition_keys(self) -> AbstractSet[str]:
+        return set(self._index.get_partition_keys(self._bitmap))
+
+    @property
+    @cached_method
+    def _bitmap_bytes(self) -> bytes:
+        return self._bitmap.to_bytes((self._bitmap.bit_length() + 7) >> 3, "little")
 
     def get_partition_keys_not_in_subset(
         self,
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Iterable[str]:
-        return (
-            set(
-                self._partitions_def.get_partition_keys(
-                    current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
-                )
+        all_keys_bitmap = self._index.get_bitmap(
+            self._partitions_def.get_partition_keys(
+                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
             )
-            - self._subset
         )
+        return set(self._index.get_partition_keys(all_keys_bitmap & ~self._bitmap))
 
     def get_partition_keys(self, current_time: Optional[datetime] = None) -> Iterable[str]:
-        return self._subset
+        return self._partition_keys
 
     def get_partition_key_ranges(
         self,
@@ -1105,7 +1288,7 @@ def get_partition_key_ranges(
         cur_range_end = None
         result = []
         for partition_key in partition_keys:
-            if partition_key in self._subset:
+            if partition_key in self:
                 if cur_range_start is None:
                     cur_range_start = partition_key
                 cur_range_end = partition_key
@@ -1122,15 +1305,47 @@ def get_partition_key_ranges(
     def with_partition_keys(
         self, partition_keys: Iterable[T_str]
     ) -> "DefaultPartitionsSubset[T_str]":
-        return DefaultPartitionsSubset(
-            self._partitions_def,
-            self._subset | set(partition_keys),
-        )
+        return self._with_bitmap(self._bitmap | self._index.get_bitmap(partition_keys))
+
+    def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_str]":
+        if self is other:
+            return self
+        return self._with_bitmap(self._bitmap | self._get_bitmap_of(other))
+
+    def __and__(self, other: "PartitionsSubset") -> "DefaultPartitionsSubset[T_str]":
+        return self._with_bitmap(self._bitmap & self._get_bitmap_of(other))
+
+    def __sub__(self, other: "PartitionsSubset") -> "DefaultPartitionsSubset[T_str]":
+        return self._with_bitmap(self._bitmap & ~self._get_bitmap_of(other))
 
     def serialize(self) -> str:
         # Serialize version number, so attempting to deserialize old versions can be handled gracefully.
         # Any time the serialization format changes, we should increment the version number.
-        return json.dumps({"version": self.SERIALIZATION_VERSION, "subset": list(self._subset)})
+        #
+        # Keys are serialized rather than the bitmap itself, since indices are only stable within
+        # a process. Keys are written in index order, which for dynamic partitions is roughly
+        # insertion order, and compress well.
+        partition_keys = self._index.get_partition_keys(self._bitmap)
+        if not _COMPRESS_SERIALIZED_SUBSETS:
+            return json.dumps({"version": self.SERIALIZATION_VERSION, "subset": partition_keys})
+
+        compressed_subset = zlib.compress(json.dumps(partition_keys).encode("utf-8"))
+        return json.dumps(
+            {
+                "version": self.COMPRESSED_SERIALIZATION_VERSION,
+                "compressed_subset": base64.b64encode(compressed_subset).decode("utf-8"),
+            }
+        )
+
+    @classmethod
+    def _readable_serialization_versions(cls) -> AbstractSet[int]:
+        return {cls.SERIALIZATION_VERSION, cls.COMPRESSED_SERIALIZATION_VERSION}
+
+    @classmethod
+    def _deserialize_partition_keys(cls, data: Mapping[str, Any]) -> Sequence[str]:
+        if data.get("compressed_subset") is not None:
+            return json.loads(zlib.decompress(base64.b64decode(data["compressed_subset"])))
+        return data.get("subset") or []
 
     @classmethod
     def from_serialized(
@@ -1143,12 +1358,17 @@ def from_serialized(
             # backwards compatibility
             return cls(subset=set(data), partitions_def=partitions_def)
         else:
-            if data.get("version") != cls.SERIALIZATION_VERSION:
+            version = data.get("version")
+            readable_versions = cls._readable_serialization_versions()
+            if version not in readable_versions:
                 raise DagsterInvalidDeserializationVersionError(
-                    f"Attempted to deserialize partition subset with version {data.get('version')},"
-                    f" but only version {cls.SERIALIZATION_VERSION} is supported."
+                    f"Attempted to deserialize partition subset with version {version}, but only"
+                    f" versions {', '.join(str(v) for v in sorted(readable_versions))} are"
+                    " supported."
                 )
-            return cls(subset=set(data.get("subset")), partitions_def=partitions_def)
+            return cls(
+                subset=set(cls._deserialize_partition_keys(data)), partitions_def=partitions_def
+            )
 
     @classmethod
     def can_deserialize(
@@ -1163,7 +1383,8 @@ def can_deserialize(
 
         data = json.loads(serialized)
         return isinstance(data, list) or (
-            data.get("subset") is not None and data.get("version") == cls.SERIALIZATION_VERSION
+            (data.get("subset") is not None or data.get("compressed_subset") is not None)
+            and data.get("version") in cls._readable_serialization_versions()
         )
 
     @property
@@ -1171,21 +1392,29 @@ def partitions_def(self) -> PartitionsDefinition[T_str]:
         return self._partitions_def
 
     def __eq__(self, other: object) -> bool:
-        return (
+        if not (
             isinstance(other, DefaultPartitionsSubset)
             and self._partitions_def == other._partitions_def
-            and self._subset == other._subset
-        )
+        ):
+            return False
+        if self._index is other._index:
+            return self._bitmap == other._bitmap
+        return self._partition_keys == other._partition_keys
 
     def __len__(self) -> int:
-        return len(self._subset)
+        return bin(self._bitmap).count("1")
 
     def __contains__(self, value) -> bool:
-        return value in self._subset
+        idx = self._index.get_index(value)
+        if idx is None:
+            return False
+        bitmap_bytes = self._bitmap_bytes
+        return (idx >> 3) < len(bitmap_bytes) and bool(bitmap_bytes[idx >> 3] & (1 << (idx & 7)))
 
     def __repr__(self) -> str:
         return (
-            f"DefaultPartitionsSubset(subset={self._subset}, partitions_def={self._partitions_def})"
+            f"DefaultPartitionsSubset(subset={self._partition_keys},"
+            f" partitions_def={self._partitions_def})"
         )
 
     @classmethod
@@ -275,7 +275,7 @@ def _map_partitions(
             TimeWindowPartitionsSubset(
                 to_partitions_def,
                 num_partitions=sum(
-                    len(to_partitions_def.get_partition_keys_in_time_window(time_window))
+                    to_partitions_def.get_num_partitions_in_time_window(time_window)
                     for time_window in filtered_time_windows
                 ),
                 included_time_windows=filtered_time_windows,
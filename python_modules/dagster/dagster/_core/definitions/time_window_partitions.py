@@ -1,6 +1,7 @@
 import functools
 import hashlib
 import json
+import math
 import re
 from datetime import datetime
 from enum import Enum
@@ -21,13 +22,19 @@
 )
 
 import pendulum
+import pytz
 
 import dagster._check as check
 from dagster._annotations import PublicAttr, public
 from dagster._core.instance import DynamicPartitionsStore
+from dagster._seven.compat.pendulum import PendulumDateTime
+from dagster._utils.cached_method import cached_method
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 from dagster._utils.schedules import (
+    ABSOLUTE_PERIOD_UNIT,
+    SchedulePeriod,
     cron_string_iterator,
+    get_schedule_period,
     is_valid_cron_schedule,
     reverse_cron_string_iterator,
 )
@@ -173,6 +180,10 @@ def get_num_partitions(
         # string format datetimes.
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        if self._schedule_period:
+            num_partitions = self._get_num_windows_before_offset(current_timestamp)
+            return num_partitions + self.end_offset if self.end_offset < 0 else num_partitions
+
         partitions_past_current_time = 0
 
         num_partitions = 0
@@ -204,6 +215,14 @@ def get_partition_keys_between_indexes(
         # partition keys included within the indices.
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        if self._schedule_period:
+            num_partitions = self._get_num_windows_before_offset(current_timestamp)
+            if self.end_offset < 0:
+                num_partitions += self.end_offset
+            return self._get_partition_keys_for_tick_range(
+                max(start_idx, 0), min(end_idx, num_partitions)
+            )
+
         partitions_past_current_time = 0
         partition_keys = []
         reached_end = False
@@ -238,6 +257,12 @@ def get_partition_keys(
     ) -> Sequence[str]:
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        if self._schedule_period:
+            num_partitions = self._get_num_windows_before_offset(current_timestamp)
+            if self.end_offset < 0:
+                num_partitions += self.end_offset
+            return self._get_partition_keys_for_tick_range(0, num_partitions)
+
         partitions_past_current_time = 0
         partition_keys: List[str] = []
         for time_window in self._iterate_time_windows(self.start):
@@ -326,25 +351,36 @@ def time_windows_for_partition_keys(
             return []
 
         sorted_pks = sorted(partition_keys, key=lambda pk: datetime.strptime(pk, self.fmt))
-        cur_windows_iterator = iter(
-            self._iterate_time_windows(
-                pendulum.instance(datetime.strptime(sorted_pks[0], self.fmt), tz=self.timezone)
-            )
-        )
         partition_key_time_windows: List[TimeWindow] = []
-        for partition_key in sorted_pks:
-            next_window = next(cur_windows_iterator)
-            if next_window.start.strftime(self.fmt) == partition_key:
-                partition_key_time_windows.append(next_window)
-            else:
-                cur_windows_iterator = iter(
-                    self._iterate_time_windows(
-                        pendulum.instance(
-                            datetime.strptime(partition_key, self.fmt), tz=self.timezone
-                        )
+        if self._schedule_period:
+            for partition_key in sorted_pks:
+                partition_key_dt = pendulum.instance(
+                    datetime.strptime(partition_key, self.fmt), tz=self.timezone
+                )
+                partition_key_time_windows.append(
+                    self._get_time_window_for_tick_idx(
+                        self._get_tick_idx_at_or_after(partition_key_dt.timestamp())
                     )
                 )
-                partition_key_time_windows.append(next(cur_windows_iterator))
+        else:
+            cur_windows_iterator = iter(
+                self._iterate_time_windows(
+                    pendulum.instance(datetime.strptime(sorted_pks[0], self.fmt), tz=self.timezone)
+                )
+            )
+            for partition_key in sorted_pks:
+                next_window = next(cur_windows_iterator)
+                if next_window.start.strftime(self.fmt) == partition_key:
+                    partition_key_time_windows.append(next_window)
+                else:
+                    cur_windows_iterator = iter(
+                        self._iterate_time_windows(
+                            pendulum.instance(
+                                datetime.strptime(partition_key, self.fmt), tz=self.timezone
+                            )
+                        )
+                    )
+                    partition_key_time_windows.append(next(cur_windows_iterator))
 
         if validate:
             start_time_window = self.get_first_partition_window()
@@ -474,6 +510,15 @@ def _get_last_partition_window(self, *, current_time: datetime) -> Optional[Time
 
         if self.end_offset == 0:
             return next(iter(self._reverse_iterate_time_windows(current_time)))
+        elif self._schedule_period:
+            num_partitions = self._get_num_windows_before_offset(current_time.timestamp())
+            if self.end_offset < 0:
+                num_partitions += self.end_offset
+            return (
+                self._get_time_window_for_tick_idx(num_partitions - 1)
+                if num_partitions > 0
+                else None
+            )
         else:
             # TODO: make this efficient
             last_partition_key = super().get_last_partition_key(current_time)
@@ -522,6 +567,12 @@ def end_time_for_partition_key(self, partition_key: str) -> datetime:
         return self.time_window_for_partition_key(partition_key).end
 
     def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence[str]:
+        if self._schedule_period:
+            return self._get_partition_keys_for_tick_range(
+                self._get_tick_idx_at_or_after(time_window.start.timestamp()),
+                self._get_tick_idx_at_or_after(time_window.end.timestamp()),
+            )
+
         result: List[str] = []
         for partition_time_window in self._iterate_time_windows(time_window.start):
             if partition_time_window.start < time_window.end:
@@ -530,6 +581,15 @@ def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence
                 break
         return result
 
+    def get_num_partitions_in_time_window(self, time_window: TimeWindow) -> int:
+        if self._schedule_period:
+            return max(
+                0,
+                self._get_tick_idx_at_or_after(time_window.end.timestamp())
+                - self._get_tick_idx_at_or_after(time_window.start.timestamp()),
+            )
+        return len(self.get_partition_keys_in_time_window(time_window))
+
     def get_partition_key_range_for_time_window(self, time_window: TimeWindow) -> PartitionKeyRange:
         start_partition_key = self.get_partition_key_for_timestamp(time_window.start.timestamp())
         end_partition_key = self.get_partition_key_for_timestamp(
@@ -720,6 +780,109 @@ def _reverse_iterate_time_windows(self, end: datetime) -> Iterable[TimeWindow]:
             yield TimeWindow(next_time, prev_time)
             prev_time = next_time
 
+    @property
+    @cached_method
+    def _schedule_period(self) -> Optional[SchedulePeriod]:
+        """The fixed period between consecutive cron ticks, if the schedule has one. When it does,
+        the i-th tick after the start is computed directly, instead of by stepping through the cron
+        schedule.
+        """
+        period = get_schedule_period(self.cron_schedule, self.timezone)
+        if period is None or period.unit == ABSOLUTE_PERIOD_UNIT:
+            return period
+
+        # Calendar periods repeat the wall time of the first tick. If the first tick was shifted
+        # by a DST transition, fall back to cron iteration.
+        first_tick = self._first_tick
+        if first_tick.minute != period.minute or first_tick.hour != period.hour:
+            return None
+        return period
+
+    @property
+    @cached_method
+    def _first_tick(self) -> PendulumDateTime:
+        return next(iter(self._iterate_time_windows(self.start))).start
+
+    def _get_tick(self, idx: int) -> PendulumDateTime:
+        """Returns the idx-th cron tick counting from the start of the first partition. Only valid
+        when the schedule has a fixed period.
+        """
+        period = check.not_none(self._schedule_period)
+        first_tick = self._first_tick
+        if period.unit == ABSOLUTE_PERIOD_UNIT:
+            return pendulum.from_timestamp(
+                first_tick.timestamp() + idx * period.length, tz=self.timezone
+            )
+
+        tick = first_tick.add(**{period.unit: idx * period.length})
+        if tick.hour != first_tick.hour:
+            # The wall time does not exist on this day because of a DST transition. Mirror
+            # cron_string_iterator, which uses the start of the next hour instead.
+            return tick.replace(minute=0)
+        return tick
+
+    def _get_tick_idx_at_or_after(self, timestamp: float) -> int:
+        """Returns the index of the first cron tick at or after the given timestamp. Only valid when
+        the schedule has a fixed period.
+        """
+        period = check.not_none(self._schedule_period)
+        first_tick = self._first_tick
+        if period.unit == ABSOLUTE_PERIOD_UNIT:
+            return math.ceil((timestamp - first_tick.timestamp()) / period.length)
+
+        # estimate the index from the calendar distance to the first tick, then correct it
+        local_dt = pendulum.from_timestamp(timestamp, tz=self.timezone)
+        if period.unit == "months":
+            idx = (local_dt.year - first_tick.year) * 12 + local_dt.month - first_tick.month
+        else:
+            days = (local_dt.date() - first_tick.date()).days
+            idx = days // 7 if period.unit == "weeks" else days
+
+        while self._get_tick(idx - 1).timestamp() >= timestamp:
+            idx -= 1
+        while self._get_tick(idx).timestamp() < timestamp:
+            idx += 1
+        return idx
+
+    def _get_num_windows_before_offset(self, current_timestamp: float) -> int:
+        """Returns the number of partitions before a negative end_offset is applied. Only valid when
+        the schedule has a fixed period.
+        """
+        # windows that end at or before the current time
+        num_windows = max(0, self._get_tick_idx_after(current_timestamp) - 1)
+        if self.end_offset > 0:
+            num_windows += self.end_offset
+        if self.end:
+            num_windows = min(
+                num_windows, max(0, self._get_tick_idx_after(self.end.timestamp()) - 1)
+            )
+        return num_windows
+
+    def _get_tick_idx_after(self, timestamp: float) -> int:
+        """Returns the index of the first cron tick strictly after the given timestamp."""
+        idx = self._get_tick_idx_at_or_after(timestamp)
+        return idx + 1 if self._get_tick(idx).timestamp() == timestamp else idx
+
+    def _get_time_window_for_tick_idx(self, idx: int) -> TimeWindow:
+        return TimeWindow(self._get_tick(idx), self._get_tick(idx + 1))
+
+    def _get_partition_keys_for_tick_range(self, start_idx: int, end_idx: int) -> List[str]:
+        """Returns the keys of the partitions starting at the ticks in [start_idx, end_idx). Only
+        valid when the schedule has a fixed period.
+        """
+        period = check.not_none(self._schedule_period)
+        if period.unit == ABSOLUTE_PERIOD_UNIT:
+            # avoid allocating a pendulum datetime per key
+            tz = pytz.timezone(self.timezone)
+            first_timestamp = self._first_tick.timestamp()
+            return [
+                datetime.fromtimestamp(first_timestamp + idx * period.length, tz=tz).strftime(
+                    self.fmt
+                )
+                for idx in range(start_idx, end_idx)
+            ]
+        return [self._get_tick(idx).strftime(self.fmt) for idx in range(start_idx, end_idx)]
+
     def get_partition_key_for_timestamp(self, timestamp: float, end_closed: bool = False) -> str:
         """Args:
         timestamp (float): Timestamp from the unix epoch, UTC.
@@ -751,6 +914,23 @@ def partitions_subset_class(self) -> Type["PartitionsSubset"]:
     def empty_subset(self) -> "PartitionsSubset":
         return self.partitions_subset_class.empty_subset(self)
 
+    def subset_with_all_partitions(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "PartitionsSubset":
+        # a single time window, rather than a time window per formatted partition key
+        first_window = self.get_first_partition_window(current_time=current_time)
+        last_window = self.get_last_partition_window(current_time=current_time)
+        if first_window is None or last_window is None:
+            return self.empty_subset()
+
+        return TimeWindowPartitionsSubset(
+            self,
+            num_partitions=self.get_num_partitions(current_time=current_time),
+            included_time_windows=[TimeWindow(first_window.start, last_window.end)],
+        )
+
     def is_valid_partition_key(self, partition_key: str) -> bool:
         try:
             partition_time = pendulum.instance(
@@ -1362,6 +1542,18 @@ def inner(
     return inner
 
 
+def _merge_time_windows(time_windows: Iterable[TimeWindow]) -> List[TimeWindow]:
+    """Sorts the given time windows and merges the ones that overlap or are adjacent."""
+    result: List[TimeWindow] = []
+    for time_window in sorted(time_windows, key=lambda tw: tw.start):
+        if result and time_window.start <= result[-1].end:
+            if time_window.end > result[-1].end:
+                result[-1] = TimeWindow(result[-1].start, time_window.end)
+        else:
+            result.append(time_window)
+    return result
+
+
 class TimeWindowPartitionsSubset(PartitionsSubset):
     # Every time we change the serialization format, we should increment the version number.
     # This will ensure that we can gracefully degrade when deserializing old data.
@@ -1552,6 +1744,82 @@ def with_partition_keys(self, partition_keys: Iterable[str]) -> "TimeWindowParti
             included_time_windows=result_windows,
         )
 
+    def _with_time_windows(
+        self, time_windows: Sequence[TimeWindow]
+    ) -> "TimeWindowPartitionsSubset":
+        return TimeWindowPartitionsSubset(
+            self._partitions_def,
+            num_partitions=sum(
+                self._partitions_def.get_num_partitions_in_time_window(time_window)
+                for time_window in time_windows
+            ),
+            included_time_windows=time_windows,
+        )
+
+    def _has_same_partitions_def(self, other: PartitionsSubset) -> bool:
+        return (
+            isinstance(other, TimeWindowPartitionsSubset)
+            and self._partitions_def == other.partitions_def
+        )
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self
+        if not self._has_same_partitions_def(other):
+            return super().__or__(other)
+        other = cast(TimeWindowPartitionsSubset, other)
+
+        return self._with_time_windows(
+            _merge_time_windows([*self.included_time_windows, *other.included_time_windows])
+        )
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self
+        if not self._has_same_partitions_def(other):
+            return super().__and__(other)
+        other = cast(TimeWindowPartitionsSubset, other)
+
+        windows = _merge_time_windows(self.included_time_windows)
+        other_windows = _merge_time_windows(other.included_time_windows)
+        result_windows: List[TimeWindow] = []
+        i = j = 0
+        while i < len(windows) and j < len(other_windows):
+            start = max(windows[i].start, other_windows[j].start)
+            end = min(windows[i].end, other_windows[j].end)
+            if start < end:
+                result_windows.append(TimeWindow(start, end))
+            if windows[i].end < other_windows[j].end:
+                i += 1
+            else:
+                j += 1
+
+        return self._with_time_windows(result_windows)
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if not self._has_same_partitions_def(other):
+            return super().__sub__(other)
+        other = cast(TimeWindowPartitionsSubset, other)
+
+        other_windows = _merge_time_windows(other.included_time_windows)
+        result_windows: List[TimeWindow] = []
+        j = 0
+        for window in _merge_time_windows(self.included_time_windows):
+            start = window.start
+            # skip the windows that end before this one starts
+            while j < len(other_windows) and other_windows[j].end <= start:
+                j += 1
+            k = j
+            while k < len(other_windows) and other_windows[k].start < window.end:
+                if other_windows[k].start > start:
+                    result_windows.append(TimeWindow(start, other_windows[k].start))
+                start = max(start, other_windows[k].end)
+                k += 1
+            if start < window.end:
+                result_windows.append(TimeWindow(start, window.end))
+
+        return self._with_time_windows(result_windows)
+
     @classmethod
     def from_serialized(
         cls, partitions_def: PartitionsDefinition, serialized: str
@@ -6,6 +6,7 @@
     Any,
     Callable,
     Dict,
+    Hashable,
     Iterator,
     Mapping,
     NamedTuple,
@@ -31,9 +32,15 @@
 from dagster._core.execution.retries import RetryMode
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.selector import parse_step_selection
+from dagster._core.snap.execution_plan_snapshot import (
+    ExecutionPlanSnapshot,
+    snapshot_from_execution_plan,
+)
 from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus
 from dagster._core.system_config.objects import ResolvedRunConfig
 from dagster._core.telemetry import log_dagster_event, log_repo_stats, telemetry_wrapper
+from dagster._utils import make_hashable
+from dagster._utils.cache import LRUCache
 from dagster._utils.error import serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 from dagster._utils.merger import merge_dicts
@@ -50,6 +57,14 @@
 if TYPE_CHECKING:
     from dagster._core.execution.plan.outputs import StepOutputHandle
 
+# Execution plan snapshots are cached per process, keyed by the job snapshot id, run config, step
+# selection and dynamic mappings they were built from. Sensors and backfills often request plans
+# for many runs of a job with the same run config, which then share a single snapshot.
+_EXECUTION_PLAN_SNAPSHOT_CACHE_MAX_SIZE = 64
+_execution_plan_snapshot_cache: "LRUCache[Hashable, ExecutionPlanSnapshot]" = LRUCache(
+    _EXECUTION_PLAN_SNAPSHOT_CACHE_MAX_SIZE
+)
+
 ## Brief guide to the execution APIs
 # | function name               | operates over      | sync  | supports    | creates new DagsterRun  |
 # |                             |                    |       | reexecution | in instance             |
@@ -699,6 +714,7 @@ def create_execution_plan(
     instance_ref: Optional[InstanceRef] = None,
     tags: Optional[Mapping[str, str]] = None,
     repository_load_data: Optional[RepositoryLoadData] = None,
+    job_snapshot_id: Optional[str] = None,
 ) -> ExecutionPlan:
     if isinstance(job, IJob):
         # If you have repository_load_data, make sure to use it when building plan
@@ -732,9 +748,99 @@ def create_execution_plan(
         instance_ref=instance_ref,
         tags=tags,
         repository_load_data=repository_load_data,
+        job_snapshot_id=job_snapshot_id,
     )
 
 
+def create_execution_plan_snapshot(
+    job: Union[IJob, JobDefinition],
+    job_snapshot_id: str,
+    run_config: Optional[Mapping[str, object]] = None,
+    step_keys_to_execute: Optional[Sequence[str]] = None,
+    known_state: Optional[KnownExecutionState] = None,
+    instance_ref: Optional[InstanceRef] = None,
+    repository_load_data: Optional[RepositoryLoadData] = None,
+) -> ExecutionPlanSnapshot:
+    """Builds the snapshot of an execution plan for the job with the given snapshot id, reusing a
+    cached snapshot, or a cached plan for the entire job, when one was built for the same inputs.
+    """
+    check.str_param(job_snapshot_id, "job_snapshot_id")
+    run_config = check.opt_mapping_param(run_config, "run_config", key_type=str)
+    known_state = check.opt_inst_param(
+        known_state,
+        "known_state",
+        KnownExecutionState,
+        default=KnownExecutionState(),
+    )
+
+    if isinstance(job, IJob):
+        if isinstance(job, ReconstructableJob) and repository_load_data is not None:
+            job = job.with_repository_load_data(repository_load_data)
+        job_def = job.get_definition()
+    else:
+        job_def = job
+
+    cache_key = _get_execution_plan_snapshot_cache_key(
+        job_def, job_snapshot_id, run_config, step_keys_to_execute, known_state
+    )
+    cached_snapshot = (
+        _execution_plan_snapshot_cache.get(cache_key) if cache_key is not None else None
+    )
+    if cached_snapshot is not None:
+        return cached_snapshot._replace(
+            initial_known_state=known_state, repository_load_data=repository_load_data
+        )
+
+    snapshot = snapshot_from_execution_plan(
+        create_execution_plan(
+            job_def,
+            run_config=run_config,
+            step_keys_to_execute=step_keys_to_execute,
+            known_state=known_state,
+            instance_ref=instance_ref,
+            repository_load_data=repository_load_data,
+            job_snapshot_id=job_snapshot_id,
+        ),
+        job_snapshot_id,
+    )
+
+    if cache_key is not None:
+        _execution_plan_snapshot_cache.set(cache_key, snapshot)
+    return snapshot
+
+
+def clear_execution_plan_snapshot_cache() -> None:
+    """Drops all snapshots cached by `create_execution_plan_snapshot`, along with the plans cached
+    by `ExecutionPlan.build`.
+    """
+    _execution_plan_snapshot_cache.clear()
+    ExecutionPlan.clear_cache()
+
+
+def _get_execution_plan_snapshot_cache_key(
+    job_def: JobDefinition,
+    job_snapshot_id: str,
+    run_config: Mapping[str, object],
+    step_keys_to_execute: Optional[Sequence[str]],
+    known_state: KnownExecutionState,
+) -> Optional[Hashable]:
+    # memoized plans depend on the outputs stored for the job, so they are never cached
+    if job_def.is_using_memoization({}):
+        return None
+
+    cache_key = (
+        job_snapshot_id,
+        make_hashable(run_config),
+        tuple(step_keys_to_execute) if step_keys_to_execute is not None else None,
+        make_hashable(known_state.dynamic_mappings),
+    )
+    try:
+        hash(cache_key)
+    except TypeError:
+        return None
+    return cache_key
+
+
 def job_execution_iterator(
     job_context: PlanOrchestrationContext, execution_plan: ExecutionPlan
 ) -> Iterator[DagsterEvent]:
@@ -1,3 +1,4 @@
+import functools
 import json
 import logging
 from datetime import datetime
@@ -13,7 +14,6 @@
     Optional,
     Sequence,
     Set,
-    Tuple,
     Union,
     cast,
 )
@@ -29,12 +29,11 @@
 from dagster._core.definitions.asset_graph import AssetGraph
 from dagster._core.definitions.asset_graph_subset import AssetGraphSubset
 from dagster._core.definitions.asset_selection import AssetSelection
-from dagster._core.definitions.assets_job import is_base_asset_job_name
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
 from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
 from dagster._core.definitions.partition import PartitionsSubset
 from dagster._core.definitions.run_request import RunRequest
-from dagster._core.definitions.selector import JobSubsetSelector, PartitionsByAssetSelector
+from dagster._core.definitions.selector import PartitionsByAssetSelector
 from dagster._core.errors import (
     DagsterAssetBackfillDataLoadError,
     DagsterBackfillFailedError,
@@ -43,9 +42,10 @@
 )
 from dagster._core.event_api import EventRecordsFilter
 from dagster._core.events import DagsterEventType
-from dagster._core.host_representation import (
-    ExternalExecutionPlan,
-    ExternalJob,
+from dagster._core.execution.submit_asset_runs import (
+    RUN_SUBMISSION_CHUNK_SIZE,
+    ExternalJobAndExecutionPlanCache,
+    submit_asset_runs,
 )
 from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
 from dagster._core.storage.dagster_run import (
@@ -60,11 +60,10 @@
     PARTITION_NAME_TAG,
 )
 from dagster._core.workspace.context import (
-    BaseWorkspaceRequestContext,
     IWorkspaceProcessContext,
 )
 from dagster._core.workspace.workspace import IWorkspace
-from dagster._utils import hash_collection, utc_datetime_from_timestamp
+from dagster._utils import utc_datetime_from_timestamp
 from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
 if TYPE_CHECKING:
@@ -161,15 +160,16 @@ def have_all_requested_runs_finished(self) -> bool:
 
         return True
 
-    def get_target_root_asset_partitions(self) -> Iterable[AssetKeyPartitionKey]:
+    def get_target_root_subset(self) -> AssetGraphSubset:
         root_asset_keys = (
             AssetSelection.keys(*self.target_subset.asset_keys)
             .sources()
             .resolve(self.target_subset.asset_graph)
         )
-        return list(
-            self.target_subset.filter_asset_keys(root_asset_keys).iterate_asset_partitions()
-        )
+        return self.target_subset.filter_asset_keys(root_asset_keys)
+
+    def get_target_root_asset_partitions(self) -> Iterable[AssetKeyPartitionKey]:
+        return list(self.get_target_root_subset().iterate_asset_partitions())
 
     def get_target_root_partitions_subset(self) -> PartitionsSubset:
         """Returns the most upstream partitions subset that was targeted by the backfill."""
@@ -553,17 +553,17 @@ def execute_asset_backfill_iteration(
                 " AssetBackfillIterationResult"
             )
 
-        pipeline_and_execution_plan_cache: Dict[int, Tuple[ExternalJob, ExternalExecutionPlan]] = {}
-        for run_request in result.run_requests:
+        external_job_and_execution_plan_cache: ExternalJobAndExecutionPlanCache = {}
+        for i in range(0, len(result.run_requests), RUN_SUBMISSION_CHUNK_SIZE):
             yield None
-            submit_run_request(
-                run_request=run_request,
-                asset_graph=asset_graph,
-                # create a new request context for each run in case the code location server
-                # is swapped out in the middle of the backfill
-                workspace=workspace_process_context.create_request_context(),
+            submit_asset_runs(
+                run_requests=result.run_requests[i : i + RUN_SUBMISSION_CHUNK_SIZE],
                 instance=instance,
-                pipeline_and_execution_plan_cache=pipeline_and_execution_plan_cache,
+                # create a new request context for each chunk of runs in case the code location
+                # server is swapped out in the middle of the backfill
+                workspace=workspace_process_context.create_request_context(),
+                asset_graph=asset_graph,
+                external_job_and_execution_plan_cache=external_job_and_execution_plan_cache,
             )
 
         if result.backfill_data.is_complete():
@@ -680,91 +680,6 @@ def get_canceling_asset_backfill_iteration_data(
     yield updated_backfill_data
 
 
-def submit_run_request(
-    asset_graph: ExternalAssetGraph,
-    run_request: RunRequest,
-    instance: DagsterInstance,
-    workspace: BaseWorkspaceRequestContext,
-    pipeline_and_execution_plan_cache: Dict[int, Tuple[ExternalJob, ExternalExecutionPlan]],
-) -> None:
-    """Creates and submits a run for the given run request."""
-    repo_handle = asset_graph.get_repository_handle(
-        cast(Sequence[AssetKey], run_request.asset_selection)[0]
-    )
-    location_name = repo_handle.code_location_origin.location_name
-    job_name = _get_implicit_job_name_for_assets(
-        asset_graph, cast(Sequence[AssetKey], run_request.asset_selection)
-    )
-    if job_name is None:
-        check.failed(
-            "Could not find an implicit asset job for the given assets:"
-            f" {run_request.asset_selection}"
-        )
-
-    if not run_request.asset_selection:
-        check.failed("Expected RunRequest to have an asset selection")
-
-    pipeline_selector = JobSubsetSelector(
-        location_name=location_name,
-        repository_name=repo_handle.repository_name,
-        job_name=job_name,
-        asset_selection=run_request.asset_selection,
-        op_selection=None,
-    )
-
-    selector_id = hash_collection(pipeline_selector)
-
-    if selector_id not in pipeline_and_execution_plan_cache:
-        code_location = workspace.get_code_location(repo_handle.code_location_origin.location_name)
-
-        external_job = code_location.get_external_job(pipeline_selector)
-
-        external_execution_plan = code_location.get_external_execution_plan(
-            external_job,
-            {},
-            step_keys_to_execute=None,
-            known_state=None,
-            instance=instance,
-        )
-        pipeline_and_execution_plan_cache[selector_id] = (
-            external_job,
-            external_execution_plan,
-        )
-
-    external_job, external_execution_plan = pipeline_and_execution_plan_cache[selector_id]
-
-    run = instance.create_run(
-        job_snapshot=external_job.job_snapshot,
-        execution_plan_snapshot=external_execution_plan.execution_plan_snapshot,
-        parent_job_snapshot=external_job.parent_job_snapshot,
-        job_name=external_job.name,
-        run_id=None,
-        resolved_op_selection=None,
-        op_selection=None,
-        run_config={},
-        step_keys_to_execute=None,
-        tags=run_request.tags,
-        root_run_id=None,
-        parent_run_id=None,
-        status=DagsterRunStatus.NOT_STARTED,
-        external_job_origin=external_job.get_external_origin(),
-        job_code_origin=external_job.get_python_origin(),
-        asset_selection=frozenset(run_request.asset_selection),
-    )
-
-    instance.submit_run(run.run_id, workspace)
-
-
-def _get_implicit_job_name_for_assets(
-    asset_graph: ExternalAssetGraph, asset_keys: Sequence[AssetKey]
-) -> Optional[str]:
-    job_names = set(asset_graph.get_materialization_job_names(asset_keys[0]))
-    for asset_key in asset_keys[1:]:
-        job_names &= set(asset_graph.get_materialization_job_names(asset_key))
-
-    return next(job_name for job_name in job_names if is_base_asset_job_name(job_name))
-
-
 class AssetBackfillIterationResult(NamedTuple):
     run_requests: Sequence[RunRequest]
     backfill_data: AssetBackfillData
@@ -810,6 +725,19 @@ def get_asset_backfill_iteration_materialized_partitions(
     yield updated_materialized_subset
 
 
+def _can_plan_with_partitions_subsets(
+    asset_graph: ExternalAssetGraph, target_subset: AssetGraphSubset
+) -> bool:
+    """Returns whether the backfill can be planned with a partitions subset per asset. Otherwise,
+    planning visits targeted asset partitions one at a time, which is slow and memory-hungry for
+    backfills over many partitions.
+    """
+    asset_keys = set(target_subset.asset_keys)
+    for asset_key in target_subset.asset_keys:
+        asset_keys.update(asset_graph.get_children(asset_key))
+    return asset_graph.can_map_partitions_subsets(asset_keys)
+
+
 def _get_failed_and_downstream_asset_partitions(
     backfill_id: str,
     asset_backfill_data: AssetBackfillData,
@@ -817,6 +745,17 @@ def _get_failed_and_downstream_asset_partitions(
     instance_queryer: CachingInstanceQueryer,
     backfill_start_time: datetime,
 ) -> AssetGraphSubset:
+    failed_asset_partitions = _get_failed_asset_partitions(
+        instance_queryer, backfill_id, asset_graph
+    )
+    if _can_plan_with_partitions_subsets(asset_graph, asset_backfill_data.target_subset):
+        return asset_graph.toposort_filter_subsets(
+            instance_queryer,
+            lambda candidates, _: candidates & asset_backfill_data.target_subset,
+            AssetGraphSubset.from_asset_partition_set(set(failed_asset_partitions), asset_graph),
+            current_time=backfill_start_time,
+        )
+
     failed_and_downstream_subset = AssetGraphSubset.from_asset_partition_set(
         asset_graph.bfs_filter_asset_partitions(
             instance_queryer,
@@ -824,7 +763,7 @@ def _get_failed_and_downstream_asset_partitions(
                 asset_partition in asset_backfill_data.target_subset
                 for asset_partition in asset_partitions
             ),
-            _get_failed_asset_partitions(instance_queryer, backfill_id, asset_graph),
+            failed_asset_partitions,
             evaluation_time=backfill_start_time,
         ),
         asset_graph,
@@ -848,10 +787,9 @@ def execute_asset_backfill_iteration_inner(
     This is a generator so that we can return control to the daemon and let it heartbeat during
     expensive operations.
     """
-    initial_candidates: Set[AssetKeyPartitionKey] = set()
     request_roots = not asset_backfill_data.requested_runs_for_target_roots
     if request_roots:
-        initial_candidates.update(asset_backfill_data.get_target_root_asset_partitions())
+        initial_candidates = asset_backfill_data.get_target_root_subset()
 
         next_latest_storage_id = instance_queryer.get_latest_storage_id_for_event_type(
             event_type=DagsterEventType.ASSET_MATERIALIZATION
@@ -876,7 +814,9 @@ def execute_asset_backfill_iteration_inner(
             target_asset_keys_and_parents=frozenset(target_asset_keys_and_parents),
             latest_storage_id=asset_backfill_data.latest_storage_id,
         )
-        initial_candidates.update(parent_materialized_asset_partitions)
+        initial_candidates = AssetGraphSubset.from_asset_partition_set(
+            parent_materialized_asset_partitions, asset_graph
+        )
 
         yield None
 
@@ -898,35 +838,30 @@ def execute_asset_backfill_iteration_inner(
 
         yield None
 
-    asset_partitions_to_request = asset_graph.bfs_filter_asset_partitions(
-        instance_queryer,
-        lambda unit, visited: should_backfill_atomic_asset_partitions_unit(
-            candidates_unit=unit,
-            asset_partitions_to_request=visited,
-            asset_graph=asset_graph,
-            materialized_subset=updated_materialized_subset,
-            target_subset=asset_backfill_data.target_subset,
-            failed_and_downstream_subset=failed_and_downstream_subset,
-            dynamic_partitions_store=instance_queryer,
-            current_time=backfill_start_time,
+    asset_partitions_to_request = get_asset_partitions_to_request(
+        asset_graph=asset_graph,
+        initial_candidates=initial_candidates,
+        target_subset=asset_backfill_data.target_subset,
+        materialized_subset=updated_materialized_subset,
+        failed_and_downstream_subset=failed_and_downstream_subset,
+        instance_queryer=instance_queryer,
+        backfill_start_time=backfill_start_time,
+        plan_with_partitions_subsets=_can_plan_with_partitions_subsets(
+            asset_graph, asset_backfill_data.target_subset
         ),
-        initial_asset_partitions=initial_candidates,
-        evaluation_time=backfill_start_time,
     )
 
     # check if all assets have backfill policies if any of them do, otherwise, raise error
     asset_backfill_policies = [
         asset_graph.get_backfill_policy(asset_key)
-        for asset_key in {
-            asset_partition.asset_key for asset_partition in asset_partitions_to_request
-        }
+        for asset_key in asset_partitions_to_request.asset_keys
     ]
     all_assets_have_backfill_policies = all(
         backfill_policy is not None for backfill_policy in asset_backfill_policies
     )
     if all_assets_have_backfill_policies:
         run_requests = build_run_requests_with_backfill_policies(
-            asset_partitions=asset_partitions_to_request,
+            asset_partitions=list(asset_partitions_to_request.iterate_asset_partitions()),
             asset_graph=asset_graph,
             run_tags={**run_tags, BACKFILL_ID_TAG: backfill_id},
         )
@@ -941,7 +876,7 @@ def execute_asset_backfill_iteration_inner(
         # When any of the assets do not have backfill policies, we fall back to the default behavior of
         # backfilling them partition by partition.
         run_requests = build_run_requests(
-            asset_partitions=asset_partitions_to_request,
+            asset_partitions=asset_partitions_to_request.iterate_asset_partitions(),
             asset_graph=asset_graph,
             run_tags={**run_tags, BACKFILL_ID_TAG: backfill_id},
         )
@@ -965,6 +900,57 @@ def execute_asset_backfill_iteration_inner(
     yield AssetBackfillIterationResult(run_requests, updated_asset_backfill_data)
 
 
+def get_asset_partitions_to_request(
+    asset_graph: ExternalAssetGraph,
+    initial_candidates: AssetGraphSubset,
+    target_subset: AssetGraphSubset,
+    materialized_subset: AssetGraphSubset,
+    failed_and_downstream_subset: AssetGraphSubset,
+    instance_queryer: CachingInstanceQueryer,
+    backfill_start_time: datetime,
+    plan_with_partitions_subsets: bool,
+) -> AssetGraphSubset:
+    """Returns the targeted asset partitions that are downstream of the candidates and can be
+    requested, because all of their targeted parents are materialized or requested along with
+    them.
+    """
+    if plan_with_partitions_subsets:
+        return asset_graph.toposort_filter_subsets(
+            instance_queryer,
+            lambda candidates, visited: filter_subset_to_backfill(
+                candidates_subset=candidates,
+                asset_partitions_to_request=visited,
+                asset_graph=asset_graph,
+                materialized_subset=materialized_subset,
+                target_subset=target_subset,
+                failed_and_downstream_subset=failed_and_downstream_subset,
+                dynamic_partitions_store=instance_queryer,
+                current_time=backfill_start_time,
+            ),
+            initial_subset=initial_candidates,
+            current_time=backfill_start_time,
+        )
+
+    return AssetGraphSubset.from_asset_partition_set(
+        asset_graph.bfs_filter_asset_partitions(
+            instance_queryer,
+            lambda unit, visited: should_backfill_atomic_asset_partitions_unit(
+                candidates_unit=unit,
+                asset_partitions_to_request=visited,
+                asset_graph=asset_graph,
+                materialized_subset=materialized_subset,
+                target_subset=target_subset,
+                failed_and_downstream_subset=failed_and_downstream_subset,
+                dynamic_partitions_store=instance_queryer,
+                current_time=backfill_start_time,
+            ),
+            initial_asset_partitions=initial_candidates.iterate_asset_partitions(),
+            evaluation_time=backfill_start_time,
+        ),
+        asset_graph,
+    )
+
+
 def should_backfill_atomic_asset_partitions_unit(
     asset_graph: ExternalAssetGraph,
     candidates_unit: Iterable[AssetKeyPartitionKey],
@@ -1019,6 +1005,140 @@ def should_backfill_atomic_asset_partitions_unit(
     return True
 
 
+def filter_subset_to_backfill(
+    asset_graph: ExternalAssetGraph,
+    candidates_subset: AssetGraphSubset,
+    asset_partitions_to_request: AssetGraphSubset,
+    target_subset: AssetGraphSubset,
+    materialized_subset: AssetGraphSubset,
+    failed_and_downstream_subset: AssetGraphSubset,
+    dynamic_partitions_store: DynamicPartitionsStore,
+    current_time: datetime,
+) -> AssetGraphSubset:
+    """Counterpart of should_backfill_atomic_asset_partitions_unit that operates on a partitions
+    subset per asset. Only valid when the asset graph can map partitions subsets of the candidate
+    assets.
+
+    Args:
+        candidates_subset: The candidate partitions of a set of assets that must all be materialized
+            if any is materialized. Returns the candidate partitions that can be requested.
+    """
+    unit_asset_keys = candidates_subset.asset_keys
+    subset = (
+        (candidates_subset & target_subset) - failed_and_downstream_subset - materialized_subset
+    )
+
+    partitions_subsets_by_asset_key: Dict[AssetKey, PartitionsSubset] = {}
+    non_partitioned_asset_keys: Set[AssetKey] = set()
+    for asset_key in unit_asset_keys:
+        partitions_subset = subset.partitions_subsets_by_asset_key.get(asset_key)
+        if asset_key not in subset.asset_keys or (
+            partitions_subset is not None and len(partitions_subset) == 0
+        ):
+            # the unit can't be materialized if any of its assets can't be
+            return AssetGraphSubset(asset_graph)
+
+        _check_parent_partitions_exist(
+            asset_graph, asset_key, partitions_subset, dynamic_partitions_store, current_time
+        )
+
+        for parent_asset_key in asset_graph.get_parents(asset_key):
+            if parent_asset_key not in target_subset.asset_keys:
+                continue
+
+            # with the supported partition mappings, assets with the same partitioning depend on
+            # the parent partition with the same key
+            can_run_with_parent = (
+                asset_graph.have_same_partitioning(parent_asset_key, asset_key)
+                and asset_graph.get_repository_handle(asset_key)
+                is asset_graph.get_repository_handle(parent_asset_key)
+                and asset_graph.get_backfill_policy(parent_asset_key)
+                == asset_graph.get_backfill_policy(asset_key)
+            )
+
+            if asset_graph.get_partitions_def(parent_asset_key) is None:
+                if (
+                    parent_asset_key in target_subset.non_partitioned_asset_keys
+                    and parent_asset_key not in materialized_subset.non_partitioned_asset_keys
+                    and not (
+                        can_run_with_parent
+                        and parent_asset_key
+                        in asset_partitions_to_request.non_partitioned_asset_keys
+                    )
+                ):
+                    return AssetGraphSubset(asset_graph)
+                continue
+
+            blocking_parent_partitions_subset = target_subset.get_partitions_subset(
+                parent_asset_key
+            ) - materialized_subset.get_partitions_subset(parent_asset_key)
+            if can_run_with_parent:
+                blocking_parent_partitions_subset = (
+                    blocking_parent_partitions_subset
+                    - asset_partitions_to_request.get_partitions_subset(parent_asset_key)
+                )
+            if len(blocking_parent_partitions_subset) == 0:
+                continue
+
+            if partitions_subset is None:
+                return AssetGraphSubset(asset_graph)
+            partitions_subset = partitions_subset - asset_graph.get_child_partitions_subset(
+                dynamic_partitions_store,
+                current_time,
+                parent_asset_key,
+                blocking_parent_partitions_subset,
+                asset_key,
+            )
+
+        if partitions_subset is None:
+            non_partitioned_asset_keys.add(asset_key)
+        else:
+            partitions_subsets_by_asset_key[asset_key] = partitions_subset
+
+    if len(partitions_subsets_by_asset_key) > 1:
+        # assets that are materialized together must be requested for the same partitions
+        unit_partitions_subset = functools.reduce(
+            lambda a, b: a & b, partitions_subsets_by_asset_key.values()
+        )
+        partitions_subsets_by_asset_key = {
+            asset_key: unit_partitions_subset for asset_key in partitions_subsets_by_asset_key
+        }
+
+    return AssetGraphSubset(
+        asset_graph, partitions_subsets_by_asset_key, non_partitioned_asset_keys
+    )
+
+
+def _check_parent_partitions_exist(
+    asset_graph: ExternalAssetGraph,
+    asset_key: AssetKey,
+    partitions_subset: Optional[PartitionsSubset],
+    dynamic_partitions_store: DynamicPartitionsStore,
+    current_time: datetime,
+) -> None:
+    for parent_asset_key in asset_graph.get_parents(asset_key):
+        parent_partitions_def = asset_graph.get_partitions_def(parent_asset_key)
+        if parent_partitions_def is None:
+            continue
+
+        required_but_nonexistent_partition_keys = (
+            asset_graph.get_partition_mapping(asset_key, parent_asset_key)
+            .get_upstream_mapped_partitions_result_for_partitions(
+                partitions_subset,
+                upstream_partitions_def=parent_partitions_def,
+                dynamic_partitions_store=dynamic_partitions_store,
+                current_time=current_time,
+            )
+            .required_but_nonexistent_partition_keys
+        )
+        if required_but_nonexistent_partition_keys:
+            raise DagsterInvariantViolationError(
+                f"Asset {asset_key.to_user_string()} depends on invalid partition keys"
+                f" {required_but_nonexistent_partition_keys} of asset"
+                f" {parent_asset_key.to_user_string()}"
+            )
+
+
 def _get_failed_asset_partitions(
     instance_queryer: CachingInstanceQueryer, backfill_id: str, asset_graph: ExternalAssetGraph
 ) -> Sequence[AssetKeyPartitionKey]:
@@ -1,6 +1,7 @@
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Iterable, Mapping, Optional, Sequence, Tuple, cast
 
 import dagster._check as check
@@ -21,6 +22,7 @@
 from dagster._core.instance import DagsterInstance
 from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunsFilter
 from dagster._core.storage.tags import (
+    BACKFILL_ID_TAG,
     PARENT_RUN_ID_TAG,
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
@@ -49,6 +51,8 @@ def execute_job_backfill_iteration(
     workspace_process_context: IWorkspaceProcessContext,
     debug_crash_flags: Optional[Mapping[str, int]],
     instance: DagsterInstance,
+    submit_threadpool_executor: Optional[ThreadPoolExecutor] = None,
+    chunk_size: int = CHECKPOINT_COUNT,
 ) -> Iterable[Optional[SerializableErrorInfo]]:
     if not backfill.last_submitted_partition_name:
         logger.info(f"Starting backfill for {backfill.backfill_id}")
@@ -65,9 +69,7 @@ def execute_job_backfill_iteration(
         if backfill.status != BulkActionStatus.REQUESTED:
             break
 
-        chunk, checkpoint, has_more = _get_partitions_chunk(
-            instance, logger, backfill, CHECKPOINT_COUNT
-        )
+        chunk, checkpoint, has_more = _get_partitions_chunk(instance, logger, backfill, chunk_size)
         _check_for_debug_crash(debug_crash_flags, "BEFORE_SUBMIT")
 
         if chunk:
@@ -76,6 +78,7 @@ def execute_job_backfill_iteration(
                 lambda: workspace_process_context.create_request_context(),
                 backfill,
                 chunk,
+                submit_threadpool_executor=submit_threadpool_executor,
             ):
                 yield None
                 # before submitting, refetch the backfill job to check for status changes
@@ -142,11 +145,6 @@ def _get_partitions_chunk(
         index = partition_names.index(backfill_job.last_submitted_partition_name)
         partition_names = partition_names[index + 1 :]
 
-    # for idempotence, fetch all runs with the current backfill id
-    backfill_runs = instance.get_runs(
-        RunsFilter(tags=DagsterRun.tags_for_backfill_id(backfill_job.backfill_id))
-    )
-    completed_partitions = set([run.tags.get(PARTITION_NAME_TAG) for run in backfill_runs])
     initial_checkpoint = (
         partition_names.index(checkpoint) + 1 if checkpoint and checkpoint in partition_names else 0
     )
@@ -155,6 +153,21 @@ def _get_partitions_chunk(
     partitions_chunk = partition_names[:chunk_size]
     next_checkpoint = partitions_chunk[-1]
 
+    # for idempotence, fetch the runs with the current backfill id for the partitions in the chunk,
+    # reading only their tags
+    backfill_run_ids = instance.get_run_ids(
+        RunsFilter(
+            tags={
+                BACKFILL_ID_TAG: backfill_job.backfill_id,
+                PARTITION_NAME_TAG: partitions_chunk,
+            }
+        )
+    )
+    completed_partitions = set(
+        tags.get(PARTITION_NAME_TAG)
+        for tags in instance.get_tags_for_runs(backfill_run_ids).values()
+    )
+
     to_skip = set(partitions_chunk).intersection(completed_partitions)
     if to_skip:
         logger.info(
@@ -173,8 +186,11 @@ def submit_backfill_runs(
     create_workspace: Callable[[], BaseWorkspaceRequestContext],
     backfill_job: PartitionBackfill,
     partition_names: Optional[Sequence[str]] = None,
+    submit_threadpool_executor: Optional[ThreadPoolExecutor] = None,
 ) -> Iterable[Optional[str]]:
-    """Returns the run IDs of the submitted runs."""
+    """Returns the run IDs of the submitted runs. If a threadpool executor is passed, the runs for
+    the partitions are created and submitted in parallel.
+    """
     origin = cast(ExternalPartitionSetOrigin, backfill_job.partition_set_origin)
 
     repository_origin = origin.external_repository_origin
@@ -212,7 +228,19 @@ def submit_backfill_runs(
         external_job = code_location.get_external_job(pipeline_selector)
     else:
         external_job = external_repo.get_full_external_job(external_partition_set.job_name)
-    for partition_data in result.partition_data:
+
+    # fetch the previous run of every partition in the chunk with a single query
+    last_runs_by_partition = (
+        _fetch_last_runs(
+            instance,
+            external_partition_set,
+            [partition_data.name for partition_data in result.partition_data],
+        )
+        if backfill_job.from_failure or backfill_job.reexecution_steps
+        else {}
+    )
+
+    def create_and_submit_run(partition_data: ExternalPartitionExecutionParamData) -> Optional[str]:
         # Refresh the code location in case the workspace has reloaded mid-backfill
         workspace = create_workspace()
         code_location = workspace.get_code_location(location_name)
@@ -224,13 +252,25 @@ def submit_backfill_runs(
             external_partition_set,
             backfill_job,
             partition_data,
+            last_runs_by_partition=last_runs_by_partition,
         )
-        if dagster_run:
+        if not dagster_run:
             # we skip runs in certain cases, e.g. we are running a `from_failure` backfill job
             # and the partition has had a successful run since the time the backfill was
             # scheduled
-            instance.submit_run(dagster_run.run_id, workspace)
-            yield dagster_run.run_id
+            return None
+
+        instance.submit_run(dagster_run.run_id, workspace)
+        return dagster_run.run_id
+
+    if submit_threadpool_executor:
+        gen_run_ids = submit_threadpool_executor.map(create_and_submit_run, result.partition_data)
+    else:
+        gen_run_ids = map(create_and_submit_run, result.partition_data)
+
+    for run_id in gen_run_ids:
+        if run_id:
+            yield run_id
         yield None
 
 
@@ -241,7 +281,11 @@ def create_backfill_run(
     external_partition_set: ExternalPartitionSet,
     backfill_job: PartitionBackfill,
     partition_data: ExternalPartitionExecutionParamData,
+    last_runs_by_partition: Optional[Mapping[str, DagsterRun]] = None,
 ) -> Optional[DagsterRun]:
+    """Creates the run for a partition of a job backfill. If last_runs_by_partition is passed, it
+    is used instead of querying for the previous run of the partition.
+    """
     from dagster._daemon.daemon import get_telemetry_daemon_session_id
 
     log_action(
@@ -273,7 +317,11 @@ def create_backfill_run(
             op_selection = external_partition_set.op_selection
 
     elif backfill_job.from_failure:
-        last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
+        last_run = (
+            last_runs_by_partition.get(partition_data.name)
+            if last_runs_by_partition is not None
+            else _fetch_last_run(instance, external_partition_set, partition_data.name)
+        )
         if not last_run or last_run.status != DagsterRunStatus.FAILURE:
             return None
         return instance.create_reexecuted_run(
@@ -287,7 +335,11 @@ def create_backfill_run(
         )
 
     else:  # backfill_job.reexecution_steps
-        last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
+        last_run = (
+            last_runs_by_partition.get(partition_data.name)
+            if last_runs_by_partition is not None
+            else _fetch_last_run(instance, external_partition_set, partition_data.name)
+        )
         parent_run_id = last_run.run_id if last_run else None
         root_run_id = (last_run.root_run_id or last_run.run_id) if last_run else None
         if parent_run_id and root_run_id:
@@ -358,6 +410,35 @@ def _fetch_last_run(
     return runs[0] if runs else None
 
 
+def _fetch_last_runs(
+    instance: DagsterInstance,
+    external_partition_set: ExternalPartitionSet,
+    partition_names: Sequence[str],
+) -> Mapping[str, DagsterRun]:
+    if not partition_names:
+        return {}
+
+    # find the id of the latest run of each partition without loading every run of the
+    # partitions, then load just those runs
+    partition_data = instance.get_run_partition_data(
+        RunsFilter(
+            job_name=external_partition_set.job_name,
+            tags={
+                PARTITION_SET_TAG: external_partition_set.name,
+                PARTITION_NAME_TAG: partition_names,
+            },
+        )
+    )
+    if not partition_data:
+        return {}
+
+    partition_by_run_id = {data.run_id: data.partition for data in partition_data}
+    runs = instance.get_runs(
+        RunsFilter(run_ids=list(partition_by_run_id.keys())), limit=len(partition_by_run_id)
+    )
+    return {partition_by_run_id[run.run_id]: run for run in runs}
+
+
 def _check_for_debug_crash(debug_crash_flags: Optional[Mapping[str, int]], key) -> None:
     if not debug_crash_flags:
         return
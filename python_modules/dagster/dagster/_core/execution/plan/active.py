@@ -1,4 +1,7 @@
+import heapq
+import itertools
 import time
+from collections import defaultdict
 from types import TracebackType
 from typing import (
     Any,
@@ -10,6 +13,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -86,7 +90,18 @@ def __init__(
         self._step_outputs: Set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = dict(self._plan.get_executable_step_deps())
+        self._pending: Dict[str, Set[str]] = {}
+        # the upstream deps of every step that has been _pending, to requeue steps for retry
+        self._step_deps: Dict[str, Set[str]] = {}
+        # for each _pending step, the number of upstream deps that have not succeeded or skipped
+        self._num_unfinished_deps: Dict[str, int] = {}
+        # upstream step key -> keys of the _pending steps that are waiting on it
+        self._dependents: Dict[str, List[str]] = defaultdict(list)
+        # _pending steps whose deps have all finished, or one of whose deps failed or was
+        # abandoned, to be checked by _update in the order that they became _pending
+        self._pending_to_check: Set[str] = set()
+        self._pending_order: Dict[str, int] = {}
+        self._sequence = itertools.count()
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -101,11 +116,14 @@ def __init__(
         self._skipped_deps: Dict[str, Sequence[str]] = {}
 
         # steps move in to these buckets as a result of _update calls
-        self._executable: List[str] = []
+        # _executable is a heap ordered by sort key, then by the order steps became executable
+        self._executable: List[Tuple[float, int, str]] = []
         self._pending_skip: List[str] = []
         self._pending_retry: List[str] = []
         self._pending_abandon: List[str] = []
         self._waiting_to_retry: Dict[str, float] = {}
+        # heap of (retry at time, step key) for the steps in _waiting_to_retry
+        self._retry_heap: List[Tuple[float, str]] = []
 
         # then are considered _in_flight when vended via get_steps_to_*
         self._in_flight: Set[str] = set()
@@ -121,6 +139,9 @@ def __init__(
 
         self._interrupted: bool = False
 
+        for step_key, deps in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, deps)
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -174,7 +195,10 @@ def __exit__(
     def _pending_state_str(self) -> str:
         assert not self.is_complete
         pending_action = (
-            self._executable + self._pending_abandon + self._pending_retry + self._pending_skip
+            [step_key for _, _, step_key in sorted(self._executable)]
+            + self._pending_abandon
+            + self._pending_retry
+            + self._pending_skip
         )
         return "{pending_str}{in_flight_str}{action_str}{retry_str}{claim_str}".format(
             in_flight_str=f"\nSteps still in flight: {self._in_flight}" if self._in_flight else "",
@@ -196,31 +220,73 @@ def _pending_state_str(self) -> str:
             ),
         )
 
+    def _add_pending(self, step_key: str, deps: Set[str]) -> None:
+        self._pending[step_key] = deps
+        self._step_deps[step_key] = deps
+        self._pending_order[step_key] = next(self._sequence)
+
+        num_unfinished_deps = 0
+        for dep in deps:
+            if dep in self._success or dep in self._skipped:
+                continue
+            if dep in self._failed or dep in self._abandoned:
+                self._pending_to_check.add(step_key)
+                continue
+            num_unfinished_deps += 1
+            self._dependents[dep].append(step_key)
+
+        self._num_unfinished_deps[step_key] = num_unfinished_deps
+        if num_unfinished_deps == 0:
+            self._pending_to_check.add(step_key)
+
+    def _remove_pending(self, step_key: str) -> None:
+        del self._pending[step_key]
+        del self._num_unfinished_deps[step_key]
+        del self._pending_order[step_key]
+
+    def _finish_dep(self, step_key: str, succeeded_or_skipped: bool) -> None:
+        """Updates the _pending steps that depend on a step that reached a terminal state."""
+        for dependent_key in self._dependents.pop(step_key, []):
+            # may have already been abandoned due to another dep
+            if dependent_key not in self._pending:
+                continue
+
+            if succeeded_or_skipped:
+                self._num_unfinished_deps[dependent_key] -= 1
+                if self._num_unfinished_deps[dependent_key] == 0:
+                    self._pending_to_check.add(dependent_key)
+            else:
+                self._pending_to_check.add(dependent_key)
+
+    def _push_executable(self, step_key: str) -> None:
+        heapq.heappush(
+            self._executable,
+            (self._sort_key_fn(self.get_step_by_key(step_key)), next(self._sequence), step_key),
+        )
+
     def _update(self) -> None:
-        """Moves steps from _pending to _executable / _pending_skip / _pending_retry
+        """Moves steps from _pending to _executable / _pending_skip / _pending_abandon
         as a function of what has been _completed.
         """
-        new_steps_to_execute: List[str] = []
-        new_steps_to_skip: List[str] = []
-        new_steps_to_abandon: List[str] = []
-
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._completed_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, requirements in self._pending.items():
+        steps_to_check = sorted(self._pending_to_check, key=self._pending_order.__getitem__)
+        self._pending_to_check.clear()
+
+        for step_key in steps_to_check:
+            requirements = self._pending[step_key]
+
             # If any upstream deps failed - this is not executable
-            if requirements.intersection(failed_or_abandoned_steps):
-                new_steps_to_abandon.append(step_key)
+            if any(dep in self._failed or dep in self._abandoned for dep in requirements):
+                self._pending_abandon.append(step_key)
 
             # If all the upstream steps of a step are complete or skipped
-            elif requirements.issubset(successful_or_skipped_steps):
+            elif self._num_unfinished_deps[step_key] == 0:
                 step = self.get_step_by_key(step_key)
 
                 # The base case is downstream step won't skip
@@ -246,38 +312,26 @@ def _update(self) -> None:
                             break
 
                 if should_skip:
-                    new_steps_to_skip.append(step_key)
+                    self._pending_skip.append(step_key)
                 else:
-                    new_steps_to_execute.append(step_key)
-
-        for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
+                    self._push_executable(step_key)
 
-        for key in new_steps_to_skip:
-            self._pending_skip.append(key)
-            del self._pending[key]
+            else:
+                continue
 
-        for key in new_steps_to_abandon:
-            self._pending_abandon.append(key)
-            del self._pending[key]
+            self._remove_pending(step_key)
 
-        ready_to_retry = []
         tick_time = time.time()
-        for key, at_time in self._waiting_to_retry.items():
-            if tick_time >= at_time:
-                ready_to_retry.append(key)
-
-        for key in ready_to_retry:
-            self._executable.append(key)
-            del self._waiting_to_retry[key]
+        while self._retry_heap and tick_time >= self._retry_heap[0][0]:
+            _, step_key = heapq.heappop(self._retry_heap)
+            del self._waiting_to_retry[step_key]
+            self._push_executable(step_key)
 
     def sleep_interval(self):
         now = time.time()
         intervals = []
-        if self._waiting_to_retry:
-            for t in self._waiting_to_retry.values():
-                intervals.append(t - now)
+        if self._retry_heap:
+            intervals.append(self._retry_heap[0][0] - now)
         if (
             self._instance_concurrency_context
             and self._instance_concurrency_context.has_pending_claims()
@@ -321,11 +375,6 @@ def get_steps_to_execute(
 
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
-
         run_scoped_concurrency_limits_counter = None
         if self._tag_concurrency_limits:
             in_flight_steps = [self.get_step_by_key(key) for key in self._in_flight]
@@ -335,8 +384,10 @@ def get_steps_to_execute(
             )
 
         batch: List[ExecutionStep] = []
+        # steps that can not be launched yet, to put back in _executable
+        blocked: List[Tuple[float, int, str]] = []
 
-        for step in steps:
+        while self._executable:
             if limit is not None and len(batch) >= limit:
                 break
 
@@ -346,8 +397,12 @@ def get_steps_to_execute(
             ):
                 break
 
+            entry = heapq.heappop(self._executable)
+            step = self.get_step_by_key(entry[2])
+
             if run_scoped_concurrency_limits_counter:
                 if run_scoped_concurrency_limits_counter.is_blocked(step):
+                    blocked.append(entry)
                     continue
 
             if run_scoped_concurrency_limits_counter:
@@ -363,13 +418,16 @@ def get_steps_to_execute(
                 if not self._instance_concurrency_context.claim(
                     step_concurrency_key, step.key, priority
                 ):
+                    blocked.append(entry)
                     continue
 
             batch.append(step)
 
+        for entry in blocked:
+            heapq.heappush(self._executable, entry)
+
         for step in batch:
             self._in_flight.add(step.key)
-            self._executable.remove(step.key)
             self._prep_for_dynamic_outputs(step)
 
         return batch
@@ -378,14 +436,12 @@ def get_steps_to_skip(self) -> Sequence[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_skip = list(self._pending_skip)
-        for key in steps_to_skip:
+        for key in self._pending_skip:
             step = self.get_step_by_key(key)
             steps.append(step)
             self._in_flight.add(key)
-            self._pending_skip.remove(key)
-            self._gathering_dynamic_outputs  # noqa: B018
             self._skip_for_dynamic_outputs(step)
+        self._pending_skip.clear()
 
         return sorted(steps, key=self._sort_key_fn)
 
@@ -393,11 +449,10 @@ def get_steps_to_abandon(self) -> Sequence[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_abandon = list(self._pending_abandon)
-        for key in steps_to_abandon:
+        for key in self._pending_abandon:
             steps.append(self.get_step_by_key(key))
             self._in_flight.add(key)
-            self._pending_abandon.remove(key)
+        self._pending_abandon.clear()
 
         return sorted(steps, key=self._sort_key_fn)
 
@@ -449,20 +504,24 @@ def plan_events_iterator(
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
         self._mark_complete(step_key)
+        self._finish_dep(step_key, succeeded_or_skipped=False)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
         self._mark_complete(step_key)
+        self._finish_dep(step_key, succeeded_or_skipped=True)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
         self._mark_complete(step_key)
+        self._finish_dep(step_key, succeeded_or_skipped=True)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
         self._mark_complete(step_key)
+        self._finish_dep(step_key, succeeded_or_skipped=False)
 
     def mark_interrupted(self) -> None:
         self._interrupted = True
@@ -481,12 +540,14 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
         if self._retry_mode.enabled:
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
+                heapq.heappush(self._retry_heap, (at_time, step_key))
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._step_deps[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._finish_dep(step_key, succeeded_or_skipped=False)
 
         self._retry_state.mark_attempt(step_key)
 
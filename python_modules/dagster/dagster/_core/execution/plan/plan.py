@@ -5,6 +5,7 @@
     Callable,
     Dict,
     FrozenSet,
+    Hashable,
     List,
     Mapping,
     NamedTuple,
@@ -46,6 +47,8 @@
 from dagster._core.storage.mem_io_manager import mem_io_manager
 from dagster._core.system_config.objects import ResolvedRunConfig
 from dagster._core.utils import toposort
+from dagster._utils import make_hashable
+from dagster._utils.cache import LRUCache
 
 from ..context.output import get_output_context
 from ..resolve_versions import resolve_step_output_versions
@@ -93,6 +96,16 @@
     ExecutionStep, UnresolvedCollectExecutionStep, UnresolvedMappedExecutionStep
 ]
 
+# Plans for all the steps of a job are cached per process when the snapshot id of the job is passed
+# to ExecutionPlan.build, keyed by the job snapshot id, the resolved run config and the dynamic
+# mappings of the known state, which together determine every step of the plan. Plans for a step
+# selection or another known state are derived from a copy of the cached plan, so code servers
+# that build plans for many runs of the same job only walk the job's nodes once.
+_EXECUTION_PLAN_CACHE_MAX_SIZE = 16
+_execution_plan_cache: "LRUCache[Hashable, ExecutionPlan]" = LRUCache(
+    _EXECUTION_PLAN_CACHE_MAX_SIZE
+)
+
 
 class _PlanBuilder:
     """This is the state that is built up during the execution plan build process."""
@@ -106,6 +119,7 @@ def __init__(
         instance_ref: Optional[InstanceRef],
         tags: Mapping[str, str],
         repository_load_data: Optional[RepositoryLoadData],
+        job_snapshot_id: Optional[str] = None,
     ):
         self.job_def = check.inst_param(job_def, "job", JobDefinition)
         self.resolved_run_config = check.inst_param(
@@ -120,6 +134,7 @@ def __init__(
         self.repository_load_data = check.opt_inst_param(
             repository_load_data, "repository_load_data", RepositoryLoadData
         )
+        self._job_snapshot_id = check.opt_str_param(job_snapshot_id, "job_snapshot_id")
 
         self._steps: Dict[str, IExecutionStep] = {}
         self.step_output_map: Dict[
@@ -141,6 +156,58 @@ def get_step_by_node_handle(self, handle: NodeHandle) -> IExecutionStep:
 
     def build(self) -> "ExecutionPlan":
         """Builds the execution plan."""
+        cache_key = self._get_cache_key()
+        cached_plan = _execution_plan_cache.get(cache_key) if cache_key is not None else None
+        if cached_plan is not None:
+            plan = _copy_plan(cached_plan)._replace(
+                known_state=self.known_state, repository_load_data=self.repository_load_data
+            )
+        else:
+            plan = self._build_full_plan()
+            if cache_key is not None:
+                _execution_plan_cache.set(cache_key, _copy_plan(plan))
+
+        step_output_versions = self.known_state.step_output_versions if self.known_state else []
+
+        if self.step_keys_to_execute is not None:
+            plan = plan.build_subset_plan(
+                self.step_keys_to_execute, self.job_def, self.resolved_run_config
+            )
+
+        # Expects that if step_keys_to_execute was set, that the `plan` variable will have the
+        # reflected step_keys_to_execute
+        if self.job_def.is_using_memoization(self._tags) and len(step_output_versions) == 0:
+            if self._instance_ref is None:
+                raise DagsterInvariantViolationError(
+                    "Attempted to build memoized execution plan without providing a persistent "
+                    "DagsterInstance to create_execution_plan."
+                )
+            instance = DagsterInstance.from_ref(self._instance_ref)
+            plan = plan.build_memoized_plan(
+                self.job_def, self.resolved_run_config, instance, self.step_keys_to_execute
+            )
+
+        return plan
+
+    def _get_cache_key(self) -> Optional[Hashable]:
+        # memoized plans depend on the outputs stored for the job, so they are never cached
+        if self._job_snapshot_id is None or self.job_def.is_using_memoization(self._tags):
+            return None
+
+        cache_key = (
+            self._job_snapshot_id,
+            make_hashable(self.resolved_run_config.to_dict()),
+            make_hashable(self.resolved_run_config.inputs),
+            make_hashable(self.known_state.dynamic_mappings),
+        )
+        try:
+            hash(cache_key)
+        except TypeError:
+            # e.g. input values passed in process that can't be hashed
+            return None
+        return cache_key
+
+    def _build_full_plan(self) -> "ExecutionPlan":
         _check_persistent_storage_requirement(
             self.job_def,
             self.resolved_run_config,
@@ -190,9 +257,8 @@ def build(self) -> "ExecutionPlan":
         )
 
         executor_name = self.resolved_run_config.execution.execution_engine_name
-        step_output_versions = self.known_state.step_output_versions if self.known_state else []
 
-        plan = ExecutionPlan(
+        return ExecutionPlan(
             step_dict,
             executable_map,
             resolvable_map,
@@ -210,26 +276,6 @@ def build(self) -> "ExecutionPlan":
             repository_load_data=self.repository_load_data,
         )
 
-        if self.step_keys_to_execute is not None:
-            plan = plan.build_subset_plan(
-                self.step_keys_to_execute, self.job_def, self.resolved_run_config
-            )
-
-        # Expects that if step_keys_to_execute was set, that the `plan` variable will have the
-        # reflected step_keys_to_execute
-        if self.job_def.is_using_memoization(self._tags) and len(step_output_versions) == 0:
-            if self._instance_ref is None:
-                raise DagsterInvariantViolationError(
-                    "Attempted to build memoized execution plan without providing a persistent "
-                    "DagsterInstance to create_execution_plan."
-                )
-            instance = DagsterInstance.from_ref(self._instance_ref)
-            plan = plan.build_memoized_plan(
-                self.job_def, self.resolved_run_config, instance, self.step_keys_to_execute
-            )
-
-        return plan
-
     def _build_from_sorted_nodes(
         self,
         nodes: Sequence[Node],
@@ -957,6 +1003,7 @@ def build(
         instance_ref: Optional[InstanceRef] = None,
         tags: Optional[Mapping[str, str]] = None,
         repository_load_data: Optional[RepositoryLoadData] = None,
+        job_snapshot_id: Optional[str] = None,
     ) -> "ExecutionPlan":
         """Here we build a new ExecutionPlan from a job definition and the resolved run config.
 
@@ -965,6 +1012,10 @@ def build(
 
         Once we've processed the entire job, we invoke _PlanBuilder.build() to construct the
         ExecutionPlan object.
+
+        If the snapshot id of the job is provided, the plan for the entire job is cached, and later
+        plans for the same job, run config and dynamic mappings are derived from the cached plan
+        instead of being rebuilt.
         """
         return _PlanBuilder(
             job_def,
@@ -974,8 +1025,14 @@ def build(
             instance_ref=instance_ref,
             tags=tags or {},
             repository_load_data=repository_load_data,
+            job_snapshot_id=job_snapshot_id,
         ).build()
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Drops all plans cached by `build`."""
+        _execution_plan_cache.clear()
+
     @staticmethod
     def rebuild_step_input(
         step_input_snap: "ExecutionStepInputSnap",
@@ -1144,6 +1201,17 @@ def _update_from_resolved_dynamic_outputs(
         del resolvable_map[key_set]
 
 
+def _copy_plan(plan: ExecutionPlan) -> ExecutionPlan:
+    # resolving dynamic outputs updates the steps and maps of a plan in place
+    return plan._replace(
+        step_dict=dict(plan.step_dict),
+        executable_map=dict(plan.executable_map),
+        resolvable_map=dict(plan.resolvable_map),
+        step_handles_to_execute=list(plan.step_handles_to_execute),
+        step_dict_by_key=dict(plan.step_dict_by_key),
+    )
+
+
 def can_isolate_steps(job_def: JobDefinition) -> bool:
     """Returns true if every output definition in the pipeline uses an IO manager that's not
     the mem_io_manager.
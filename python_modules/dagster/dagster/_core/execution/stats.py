@@ -1,6 +1,6 @@
 from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, Iterable, NamedTuple, Optional, Sequence, cast
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, cast
 
 import dagster._check as check
 from dagster._core.definitions import ExpectationResult
@@ -87,100 +87,42 @@ class StepEventStatus(Enum):
     IN_PROGRESS = "IN_PROGRESS"
 
 
+# Step events that make a step show up in the step stats of a run, as opposed to markers and retry
+# events, which only annotate the stats of a step that has any of these
+STEP_STATS_STEP_EVENT_TYPES = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+}
+
+
 def build_run_step_stats_from_events(
     run_id: str, records: Iterable[EventLogEntry]
 ) -> Sequence["RunStepKeyStatsSnapshot"]:
-    by_step_key: Dict[str, Dict[str, Any]] = defaultdict(dict)
-    attempts = defaultdict(list)
-    attempt_events = defaultdict(list)
-    markers: Dict[str, Dict[str, Any]] = defaultdict(dict)
+    events_by_step_key: Dict[str, List[EventLogEntry]] = defaultdict(list)
+    # steps are listed in the order of their first step event
+    step_keys: Dict[str, None] = {}
     for event in records:
         if not event.is_dagster_event:
             continue
         dagster_event = event.get_dagster_event()
-
         step_key = dagster_event.step_key
         if not step_key:
             continue
 
-        if dagster_event.event_type == DagsterEventType.STEP_START:
-            by_step_key[step_key]["start_time"] = event.timestamp
-            by_step_key[step_key]["attempts"] = 1
-        if dagster_event.event_type == DagsterEventType.STEP_FAILURE:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.FAILURE
-        if dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-            by_step_key[step_key]["attempts"] = int(by_step_key[step_key].get("attempts") or 0) + 1
-        if dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SUCCESS
-        if dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
-        if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
-            materialization_events = by_step_key[step_key].get("materialization_events", [])
-            materialization_events.append(event)
-            by_step_key[step_key]["materialization_events"] = materialization_events
-        if dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
-            expectation_data = cast(StepExpectationResultData, dagster_event.event_specific_data)
-            expectation_result = expectation_data.expectation_result
-            step_expectation_results = by_step_key[step_key].get("expectation_results", [])
-            step_expectation_results.append(expectation_result)
-            by_step_key[step_key]["expectation_results"] = step_expectation_results
-        if dagster_event.event_type in (
-            DagsterEventType.STEP_UP_FOR_RETRY,
-            DagsterEventType.STEP_RESTARTED,
-        ):
-            attempt_events[step_key].append(event)
-        if dagster_event.event_type in MARKER_EVENTS:
-            if dagster_event.engine_event_data.marker_start:
-                key = dagster_event.engine_event_data.marker_start
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "start": event.timestamp}
-                else:
-                    markers[step_key][key]["start"] = event.timestamp
-
-            if dagster_event.engine_event_data.marker_end:
-                key = dagster_event.engine_event_data.marker_end
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "end": event.timestamp}
-                else:
-                    markers[step_key][key]["end"] = event.timestamp
-
-    for step_key, step_stats in by_step_key.items():
-        events = attempt_events[step_key]
-        step_attempts = []
-        attempt_start = step_stats.get("start_time")
-
-        for event in events:
-            if not event.dagster_event:
-                continue
-            if event.dagster_event.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
-                step_attempts.append(
-                    RunStepMarker(start_time=attempt_start, end_time=event.timestamp)
-                )
-            elif event.dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-                attempt_start = event.timestamp
-        if step_stats.get("end_time"):
-            step_attempts.append(
-                RunStepMarker(start_time=attempt_start, end_time=step_stats["end_time"])
-            )
-        else:
-            by_step_key[step_key]["status"] = StepEventStatus.IN_PROGRESS
-        attempts[step_key] = step_attempts
+        events_by_step_key[step_key].append(event)
+        if dagster_event.event_type in STEP_STATS_STEP_EVENT_TYPES:
+            step_keys.setdefault(step_key)
 
     return [
-        RunStepKeyStatsSnapshot(
-            run_id=run_id,
-            step_key=step_key,
-            attempts_list=attempts[step_key],
-            markers=[
-                RunStepMarker(start_time=marker.get("start"), end_time=marker.get("end"))
-                for marker in markers[step_key].values()
-            ],
-            **value,
-        )
-        for step_key, value in by_step_key.items()
+        RunStepKeyStatsAggregate.empty(step_key)
+        .with_events(events_by_step_key[step_key])
+        .to_snapshot(run_id, events_by_step_key[step_key])
+        for step_key in step_keys
     ]
 
 
@@ -253,3 +195,200 @@ def __new__(
             attempts_list=check.opt_sequence_param(attempts_list, "attempts_list", RunStepMarker),
             markers=check.opt_sequence_param(markers, "markers", RunStepMarker),
         )
+
+
+@whitelist_for_serdes
+class RunStepKeyStatsAggregate(
+    NamedTuple(
+        "_RunStepKeyStatsAggregate",
+        [
+            ("step_key", str),
+            ("has_step_events", bool),
+            ("status", Optional[str]),
+            ("start_time", Optional[float]),
+            ("end_time", Optional[float]),
+            ("attempts", Optional[int]),
+            ("attempt_start_time", Optional[float]),
+            ("completed_attempts", Sequence[RunStepMarker]),
+            ("materializations", int),
+            ("expectations", int),
+            ("marker_keys", Sequence[str]),
+            ("markers", Sequence[RunStepMarker]),
+        ],
+    )
+):
+    """The stats of a step folded over the step's events so far, so that they can be kept up to
+    date one batch of events at a time instead of replaying every event of the step.
+
+    A completed attempt without a start time started at the start time of the step, which may only
+    be known after the attempt completed. Materializations and expectation results are only
+    counted, so that the aggregate stays small however many of them the step has. Their events are
+    passed to `to_snapshot` instead.
+    """
+
+    def __new__(
+        cls,
+        step_key: str,
+        has_step_events: bool = False,
+        status: Optional[str] = None,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        attempts: Optional[int] = None,
+        attempt_start_time: Optional[float] = None,
+        completed_attempts: Optional[Sequence[RunStepMarker]] = None,
+        materializations: int = 0,
+        expectations: int = 0,
+        marker_keys: Optional[Sequence[str]] = None,
+        markers: Optional[Sequence[RunStepMarker]] = None,
+    ):
+        return super(RunStepKeyStatsAggregate, cls).__new__(
+            cls,
+            step_key=check.str_param(step_key, "step_key"),
+            has_step_events=check.bool_param(has_step_events, "has_step_events"),
+            status=check.opt_str_param(status, "status"),
+            start_time=check.opt_float_param(start_time, "start_time"),
+            end_time=check.opt_float_param(end_time, "end_time"),
+            attempts=check.opt_int_param(attempts, "attempts"),
+            attempt_start_time=check.opt_float_param(attempt_start_time, "attempt_start_time"),
+            completed_attempts=check.opt_sequence_param(
+                completed_attempts, "completed_attempts", RunStepMarker
+            ),
+            materializations=check.int_param(materializations, "materializations"),
+            expectations=check.int_param(expectations, "expectations"),
+            marker_keys=check.opt_sequence_param(marker_keys, "marker_keys", str),
+            markers=check.opt_sequence_param(markers, "markers", RunStepMarker),
+        )
+
+    @staticmethod
+    def empty(step_key: str) -> "RunStepKeyStatsAggregate":
+        return RunStepKeyStatsAggregate(step_key=step_key)
+
+    def with_events(self, events: Iterable[EventLogEntry]) -> "RunStepKeyStatsAggregate":
+        """Returns the stats of the step after the given events, in storage order."""
+        has_step_events = self.has_step_events
+        status = self.status
+        start_time = self.start_time
+        end_time = self.end_time
+        attempts = self.attempts
+        attempt_start_time = self.attempt_start_time
+        completed_attempts = list(self.completed_attempts)
+        materializations = self.materializations
+        expectations = self.expectations
+        marker_keys = list(self.marker_keys)
+        markers = list(self.markers)
+
+        for event in events:
+            if not event.is_dagster_event:
+                continue
+            dagster_event = event.get_dagster_event()
+            event_type = dagster_event.event_type
+
+            if event_type in STEP_STATS_STEP_EVENT_TYPES:
+                has_step_events = True
+            if event_type == DagsterEventType.STEP_START:
+                start_time = event.timestamp
+                attempts = 1
+            if event_type == DagsterEventType.STEP_FAILURE:
+                end_time = event.timestamp
+                status = StepEventStatus.FAILURE.value
+            if event_type == DagsterEventType.STEP_RESTARTED:
+                attempts = int(attempts or 0) + 1
+                attempt_start_time = event.timestamp
+            if event_type == DagsterEventType.STEP_SUCCESS:
+                end_time = event.timestamp
+                status = StepEventStatus.SUCCESS.value
+            if event_type == DagsterEventType.STEP_SKIPPED:
+                end_time = event.timestamp
+                status = StepEventStatus.SKIPPED.value
+            if event_type == DagsterEventType.ASSET_MATERIALIZATION:
+                materializations += 1
+            if event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+                expectations += 1
+            if event_type == DagsterEventType.STEP_UP_FOR_RETRY:
+                completed_attempts.append(
+                    RunStepMarker(start_time=attempt_start_time, end_time=event.timestamp)
+                )
+            if event_type in MARKER_EVENTS:
+                for key, is_start in (
+                    (dagster_event.engine_event_data.marker_start, True),
+                    (dagster_event.engine_event_data.marker_end, False),
+                ):
+                    if not key:
+                        continue
+                    if key not in marker_keys:
+                        marker_keys.append(key)
+                        markers.append(RunStepMarker())
+                    index = marker_keys.index(key)
+                    markers[index] = (
+                        markers[index]._replace(start_time=event.timestamp)
+                        if is_start
+                        else markers[index]._replace(end_time=event.timestamp)
+                    )
+
+        return RunStepKeyStatsAggregate(
+            step_key=self.step_key,
+            has_step_events=has_step_events,
+            status=status,
+            start_time=start_time,
+            end_time=end_time,
+            attempts=attempts,
+            attempt_start_time=attempt_start_time,
+            completed_attempts=completed_attempts,
+            materializations=materializations,
+            expectations=expectations,
+            marker_keys=marker_keys,
+            markers=markers,
+        )
+
+    def to_snapshot(
+        self, run_id: str, events: Iterable[EventLogEntry] = ()
+    ) -> RunStepKeyStatsSnapshot:
+        """Returns the stats of the step, with the materializations and expectation results of the
+        given events of the step, in storage order. Other events are ignored.
+        """
+        materialization_events: List[EventLogEntry] = []
+        expectation_results: List[ExpectationResult] = []
+        for event in events:
+            if not event.is_dagster_event:
+                continue
+            dagster_event = event.get_dagster_event()
+            if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
+                materialization_events.append(event)
+            if dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+                expectation_results.append(
+                    cast(
+                        StepExpectationResultData, dagster_event.event_specific_data
+                    ).expectation_result
+                )
+
+        attempts_list = [
+            attempt._replace(start_time=self.start_time) if attempt.start_time is None else attempt
+            for attempt in self.completed_attempts
+        ]
+        if self.end_time:
+            attempts_list.append(
+                RunStepMarker(
+                    start_time=(
+                        self.attempt_start_time
+                        if self.attempt_start_time is not None
+                        else self.start_time
+                    ),
+                    end_time=self.end_time,
+                )
+            )
+            status = StepEventStatus(self.status) if self.status else None
+        else:
+            status = StepEventStatus.IN_PROGRESS
+
+        return RunStepKeyStatsSnapshot(
+            run_id=run_id,
+            step_key=self.step_key,
+            status=status,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            materialization_events=materialization_events,
+            expectation_results=expectation_results,
+            attempts=self.attempts,
+            attempts_list=attempts_list,
+            markers=self.markers,
+        )
@@ -0,0 +1,143 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import dagster._check as check
+from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
+from dagster._core.definitions.run_request import RunRequest
+from dagster._core.definitions.selector import JobSubsetSelector
+from dagster._core.host_representation import ExternalExecutionPlan, ExternalJob
+from dagster._core.instance import DagsterInstance
+from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus
+from dagster._core.workspace.workspace import IWorkspace
+from dagster._utils import hash_collection
+
+ExternalJobAndExecutionPlanCache = Dict[int, Tuple[ExternalJob, ExternalExecutionPlan]]
+
+# Number of runs created and submitted in bulk at once. Daemons submit larger sets of run requests
+# in chunks of this size, yielding between chunks so that they keep heartbeating.
+RUN_SUBMISSION_CHUNK_SIZE = 100
+
+
+def _get_job_subset_selector(
+    asset_graph: ExternalAssetGraph, run_request: RunRequest
+) -> JobSubsetSelector:
+    asset_keys = check.not_none(run_request.asset_selection)
+    check.invariant(len(asset_keys) > 0, "Expected RunRequest to have an asset selection")
+
+    repo_handle = asset_graph.get_repository_handle(asset_keys[0])
+
+    # Check that all asset keys are from the same repo
+    for key in asset_keys[1:]:
+        check.invariant(repo_handle == asset_graph.get_repository_handle(key))
+
+    job_name = asset_graph.get_implicit_job_name_for_assets(asset_keys)
+    if job_name is None:
+        check.failed(f"Could not find an implicit asset job for the given assets: {asset_keys}")
+
+    return JobSubsetSelector(
+        location_name=repo_handle.code_location_origin.location_name,
+        repository_name=repo_handle.repository_name,
+        job_name=job_name,
+        op_selection=None,
+        asset_selection=asset_keys,
+    )
+
+
+def _fetch_external_job_and_execution_plan(
+    selector: JobSubsetSelector,
+    run_config: Mapping[str, object],
+    instance: DagsterInstance,
+    workspace: IWorkspace,
+) -> Tuple[ExternalJob, ExternalExecutionPlan]:
+    code_location = workspace.get_code_location(selector.location_name)
+    external_job = code_location.get_external_job(selector)
+    external_execution_plan = code_location.get_external_execution_plan(
+        external_job,
+        run_config,
+        step_keys_to_execute=None,
+        known_state=None,
+        instance=instance,
+    )
+    return external_job, external_execution_plan
+
+
+def submit_asset_runs(
+    run_requests: Sequence[RunRequest],
+    instance: DagsterInstance,
+    workspace: IWorkspace,
+    asset_graph: ExternalAssetGraph,
+    external_job_and_execution_plan_cache: Optional[ExternalJobAndExecutionPlanCache] = None,
+    threadpool_executor: Optional[ThreadPoolExecutor] = None,
+) -> Sequence[DagsterRun]:
+    """Creates and submits a run for each of the given asset run requests.
+
+    Run requests that target the same assets with the same run config share an external job and
+    execution plan, so each of those is only fetched from the code location once. The fetches are
+    made concurrently if a threadpool executor is provided. The runs are then created and submitted
+    in bulk.
+
+    Returns:
+        Sequence[DagsterRun]: The submitted runs, in the same order as the run requests.
+    """
+    cache = (
+        external_job_and_execution_plan_cache
+        if external_job_and_execution_plan_cache is not None
+        else {}
+    )
+
+    cache_keys: List[int] = []
+    to_fetch: Dict[int, Tuple[JobSubsetSelector, Mapping[str, object]]] = {}
+    for run_request in run_requests:
+        selector = _get_job_subset_selector(asset_graph, run_request)
+        cache_key = hash_collection((selector, run_request.run_config))
+        cache_keys.append(cache_key)
+        if cache_key not in cache and cache_key not in to_fetch:
+            to_fetch[cache_key] = (selector, run_request.run_config)
+
+    if threadpool_executor and len(to_fetch) > 1:
+        futures = {
+            cache_key: threadpool_executor.submit(
+                _fetch_external_job_and_execution_plan,
+                selector,
+                run_config,
+                instance,
+                workspace,
+            )
+            for cache_key, (selector, run_config) in to_fetch.items()
+        }
+        for cache_key, future in futures.items():
+            cache[cache_key] = future.result()
+    else:
+        for cache_key, (selector, run_config) in to_fetch.items():
+            cache[cache_key] = _fetch_external_job_and_execution_plan(
+                selector, run_config, instance, workspace
+            )
+
+    run_params = []
+    for run_request, cache_key in zip(run_requests, cache_keys):
+        external_job, external_execution_plan = cache[cache_key]
+        run_params.append(
+            dict(
+                job_name=external_job.name,
+                run_id=None,
+                # asset runs have always been created without run config, which is only used to
+                # build the execution plan
+                run_config=None,
+                resolved_op_selection=None,
+                step_keys_to_execute=None,
+                status=DagsterRunStatus.NOT_STARTED,
+                op_selection=None,
+                root_run_id=None,
+                parent_run_id=None,
+                tags=run_request.tags,
+                job_snapshot=external_job.job_snapshot,
+                execution_plan_snapshot=external_execution_plan.execution_plan_snapshot,
+                parent_job_snapshot=external_job.parent_job_snapshot,
+                external_job_origin=external_job.get_external_origin(),
+                job_code_origin=external_job.get_python_origin(),
+                asset_selection=frozenset(check.not_none(run_request.asset_selection)),
+            )
+        )
+
+    runs = instance.create_runs(run_params)
+    return instance.submit_runs([run.run_id for run in runs], workspace)
@@ -1,18 +1,33 @@
 """Facilities for running arbitrary commands in child processes."""
 
 
+import multiprocessing.connection
 import os
 import queue
+import selectors
 import sys
 from abc import ABC, abstractmethod
 from multiprocessing import Queue
+from multiprocessing.connection import Connection
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
-from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Union,
+)
 
 from typing_extensions import Literal
 
 import dagster._check as check
+import dagster._seven as seven
 from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._utils import start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 
@@ -57,6 +72,29 @@ def execute(self) -> Iterator[Union[ChildProcessEvent, "DagsterEvent"]]:
         """
 
 
+class ChildProcessWorkerCommand(ABC):
+    """Inherit from this class in order to execute a sequence of tasks in the same child process.
+
+    The object must be picklable, as must every task sent to the worker; pass it to
+    ChildProcessWorkerPool.
+    """
+
+    @abstractmethod
+    def worker_scope(self) -> ContextManager[None]:
+        """This method is invoked once in the child process, before any task is executed.
+
+        State that is shared by all tasks, such as loaded user code, should be set up while
+        entering the returned context manager and torn down while exiting it.
+        """
+
+    @abstractmethod
+    def execute_task(self, task: Any) -> Iterator[Union[ChildProcessEvent, "DagsterEvent"]]:
+        """This method is invoked in the child process for each task sent to the worker.
+
+        Yields a sequence of events to be handled by ChildProcessWorker.execute_task.
+        """
+
+
 class ChildProcessCrashException(Exception):
     """Thrown when the child process crashes."""
 
@@ -65,33 +103,77 @@ def __init__(self, exit_code=None):
         super().__init__()
 
 
-def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessCommand):
+def _execute_command_in_child_process(event_conn: Connection, command: ChildProcessCommand):
     """Wraps the execution of a ChildProcessCommand.
 
-    Handles errors and communicates across a queue with the parent process.
+    Handles errors and communicates across a pipe with the parent process.
     """
     check.inst_param(command, "command", ChildProcessCommand)
 
     with capture_interrupts():
         pid = os.getpid()
-        event_queue.put(ChildProcessStartEvent(pid=pid))
+        event_conn.send(ChildProcessStartEvent(pid=pid))
         try:
             for step_event in command.execute():
-                event_queue.put(step_event)
-            event_queue.put(ChildProcessDoneEvent(pid=pid))
+                event_conn.send(step_event)
+            event_conn.send(ChildProcessDoneEvent(pid=pid))
+
+        except (
+            Exception,
+            KeyboardInterrupt,
+            DagsterExecutionInterruptedError,
+        ):
+            event_conn.send(
+                ChildProcessSystemErrorEvent(
+                    pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
+                )
+            )
+
+
+def _execute_tasks_in_worker_process(
+    task_queue: Queue, event_conn: Connection, term_event: Any, command: ChildProcessWorkerCommand
+):
+    """Wraps the execution of a ChildProcessWorkerCommand.
+
+    Executes tasks from the task queue one at a time until it receives None or the termination
+    event is set. After a system error the worker exits, so that it is never handed another task.
+    """
+    check.inst_param(command, "command", ChildProcessWorkerCommand)
+
+    with capture_interrupts():
+        pid = os.getpid()
+        start_termination_thread(term_event)
+        try:
+            with command.worker_scope():
+                while not term_event.is_set():
+                    try:
+                        task = task_queue.get(block=True, timeout=TICK)
+                    except queue.Empty:
+                        continue
+
+                    if task is None:
+                        break
+
+                    event_conn.send(ChildProcessStartEvent(pid=pid))
+                    for step_event in command.execute_task(task):
+                        event_conn.send(step_event)
+                    event_conn.send(ChildProcessDoneEvent(pid=pid))
 
         except (
             Exception,
             KeyboardInterrupt,
             DagsterExecutionInterruptedError,
         ):
-            event_queue.put(
+            event_conn.send(
                 ChildProcessSystemErrorEvent(
                     pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
                 )
             )
 
 
+WORKER_SHUTDOWN_TIMEOUT = 10.0
+"""Seconds to wait for a worker process to exit on shutdown before terminating it."""
+
 TICK = 20.0 * 1.0 / 1000.0
 """The minimum interval at which to check for child process liveness -- default 20ms."""
 
@@ -99,33 +181,118 @@ def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessC
 """Sentinel value."""
 
 
+class ChildProcessEventSelector:
+    """Waits for events from many child processes at once.
+
+    Pass the same selector to every execute_child_process_command or ChildProcessWorker.execute_task
+    iterator that is in flight. Instead of blocking on their own child process, the iterators then
+    only check for events from child processes that the last wait reported as ready, and the caller
+    blocks in wait until any of the child processes sends an event or exits.
+
+    Child processes must be unregistered before their pipe is closed. Close the selector when done.
+    """
+
+    def __init__(self):
+        self._waitables: Set[Any] = set()
+        self._ready: Set[Any] = set()
+        # On posix, keeping the pipes and process sentinels registered with a selector is cheaper
+        # than passing them all to multiprocessing.connection.wait on every wait. Selectors only
+        # support sockets on windows.
+        self._selector = None if seven.IS_WINDOWS else selectors.DefaultSelector()
+
+    def __enter__(self) -> "ChildProcessEventSelector":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._selector:
+            self._selector.close()
+
+    def register(self, process, event_conn: Connection) -> None:
+        waitables = (process.sentinel, event_conn)
+        if self._selector:
+            for waitable in waitables:
+                self._selector.register(waitable, selectors.EVENT_READ, waitable)
+        self._waitables.update(waitables)
+        # check a newly registered child process before the next wait
+        self._ready.update(waitables)
+
+    def unregister(self, process, event_conn: Connection) -> None:
+        waitables = (process.sentinel, event_conn)
+        if self._selector:
+            for waitable in waitables:
+                self._selector.unregister(waitable)
+        self._waitables.difference_update(waitables)
+        self._ready.difference_update(waitables)
+
+    def is_ready(self, process, event_conn: Connection) -> bool:
+        return event_conn in self._ready or process.sentinel in self._ready
+
+    def mark_not_ready(self, process, event_conn: Connection) -> None:
+        self._ready.difference_update((process.sentinel, event_conn))
+
+    def wait(self, timeout: float = TICK) -> None:
+        """Block until any registered child process sends an event or exits, or until timeout."""
+        if not self._waitables:
+            return
+
+        if self._selector:
+            self._ready = {key.data for key, _ in self._selector.select(timeout)}
+        else:
+            self._ready = set(
+                multiprocessing.connection.wait(list(self._waitables), timeout=timeout)
+            )
+
+
+def _recv_event(event_conn: Connection):
+    try:
+        return event_conn.recv()
+    except (EOFError, OSError):
+        # The child process closed its end of the pipe, possibly in the middle of an event, so
+        # there are no more events to receive.
+        return PROCESS_DEAD_AND_QUEUE_EMPTY
+
+
 def _poll_for_event(
-    process, event_queue
+    process, event_conn: Connection, event_selector: Optional[ChildProcessEventSelector]
 ) -> Optional[Union["DagsterEvent", Literal["PROCESS_DEAD_AND_QUEUE_EMPTY"]]]:
-    try:
-        return event_queue.get(block=True, timeout=TICK)
-    except queue.Empty:
-        if not process.is_alive():
-            # There is a possibility that after the last queue.get the
-            # process created another event and then died. In that case
-            # we want to continue draining the queue.
-            try:
-                return event_queue.get(block=False)
-            except queue.Empty:
-                # If the queue empty we know that there are no more events
-                # and that the process has died.
-                return PROCESS_DEAD_AND_QUEUE_EMPTY
+    if event_selector is None:
+        multiprocessing.connection.wait([event_conn, process.sentinel], timeout=TICK)
+    elif not event_selector.is_ready(process, event_conn):
+        return None
+
+    if event_conn.poll():
+        return _recv_event(event_conn)
+
+    if not process.is_alive():
+        # There is a possibility that after the last poll the process sent another event and
+        # then died. In that case we want to continue draining the pipe.
+        if event_conn.poll():
+            return _recv_event(event_conn)
+
+        # If the pipe is empty we know that there are no more events and that the process has
+        # died.
+        return PROCESS_DEAD_AND_QUEUE_EMPTY
+
+    if event_selector:
+        # nothing to receive until the selector reports this process as ready again
+        event_selector.mark_not_ready(process, event_conn)
+
     return None
 
 
 def execute_child_process_command(
-    multiprocessing_ctx: MultiprocessingBaseContext, command: ChildProcessCommand
+    multiprocessing_ctx: MultiprocessingBaseContext,
+    command: ChildProcessCommand,
+    event_selector: Optional[ChildProcessEventSelector] = None,
 ) -> Iterator[Optional["DagsterEvent"]]:
     """Execute a ChildProcessCommand in a new process.
 
     This function starts a new process whose execution target is a ChildProcessCommand wrapped by
-    _execute_command_in_child_process; polls the queue for events yielded by the child process
-    until the process dies and the queue is empty.
+    _execute_command_in_child_process; polls the pipe for events yielded by the child process
+    until the process dies and the pipe is empty.
 
     This function yields a complex set of objects to enable having multiple child process
     executions in flight:
@@ -143,23 +310,34 @@ def execute_child_process_command(
     Args:
         multiprocessing_ctx: The multiprocessing context to execute in (spawn, forkserver, fork)
         command (ChildProcessCommand): The command to execute in the child process.
+        event_selector (Optional[ChildProcessEventSelector]): If provided, the child process is
+            registered with the selector, and this iterator yields None instead of waiting for the
+            child process. The caller is responsible for waiting on the selector.
 
     Warning: if the child process is in an infinite loop, this will
     also infinitely loop.
     """
     check.inst_param(command, "command", ChildProcessCommand)
+    check.opt_inst_param(event_selector, "event_selector", ChildProcessEventSelector)
 
-    event_queue = multiprocessing_ctx.Queue()
+    event_conn, child_event_conn = multiprocessing_ctx.Pipe(duplex=False)
+    process = None
     try:
         process = multiprocessing_ctx.Process(  # type: ignore
-            target=_execute_command_in_child_process, args=(event_queue, command)
+            target=_execute_command_in_child_process, args=(child_event_conn, command)
         )
         process.start()
+        # close the parent's copy of the child's end, so that the pipe reaches EOF when the child
+        # process exits
+        child_event_conn.close()
+
+        if event_selector:
+            event_selector.register(process, event_conn)
 
         completed_properly = False
 
         while not completed_properly:
-            event = _poll_for_event(process, event_queue)
+            event = _poll_for_event(process, event_conn, event_selector)
 
             if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
                 break
@@ -175,4 +353,160 @@ def execute_child_process_command(
 
         process.join()
     finally:
-        event_queue.close()
+        if event_selector and process is not None:
+            event_selector.unregister(process, event_conn)
+        child_event_conn.close()
+        event_conn.close()
+
+
+class ChildProcessWorker:
+    """A child process that executes the tasks of a ChildProcessWorkerCommand one at a time.
+
+    Use ChildProcessWorkerPool to create workers.
+    """
+
+    def __init__(
+        self, multiprocessing_ctx: MultiprocessingBaseContext, command: ChildProcessWorkerCommand
+    ):
+        check.inst_param(command, "command", ChildProcessWorkerCommand)
+
+        self.term_event = multiprocessing_ctx.Event()
+        self._task_queue = multiprocessing_ctx.Queue()
+        self._event_conn, child_event_conn = multiprocessing_ctx.Pipe(duplex=False)
+        self._process = multiprocessing_ctx.Process(  # type: ignore
+            target=_execute_tasks_in_worker_process,
+            args=(self._task_queue, child_event_conn, self.term_event, command),
+        )
+        self._process.start()
+        child_event_conn.close()
+        self._is_busy = False
+        self._is_retired = False
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid
+
+    @property
+    def is_available(self) -> bool:
+        return not self._is_busy and not self._is_retired and self._process.is_alive()
+
+    @property
+    def is_defunct(self) -> bool:
+        """Whether the worker is not executing a task and will never be handed another one, either
+        because it was retired or because its process died.
+        """
+        return not self._is_busy and (self._is_retired or not self._process.is_alive())
+
+    def execute_task(
+        self, task: Any, event_selector: Optional[ChildProcessEventSelector] = None
+    ) -> Iterator[Optional["DagsterEvent"]]:
+        """Send a task to the worker and poll for the events it yields until the task is done.
+
+        Yields the same objects as execute_child_process_command, and accepts an event selector
+        in the same way. If the worker reports a system error or crashes, it is retired and will
+        not be handed another task.
+        """
+        check.invariant(self.is_available, "Worker is not available to execute a task")
+        check.invariant(task is not None, "None is reserved to shut down the worker")
+        check.opt_inst_param(event_selector, "event_selector", ChildProcessEventSelector)
+
+        self._is_busy = True
+        self._task_queue.put(task)
+
+        if event_selector:
+            event_selector.register(self._process, self._event_conn)
+
+        try:
+            completed_properly = False
+
+            while not completed_properly:
+                event = _poll_for_event(self._process, self._event_conn, event_selector)
+
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    break
+
+                yield event
+
+                if isinstance(event, ChildProcessSystemErrorEvent):
+                    self._is_retired = True
+                    self._is_busy = False
+                    completed_properly = True
+                elif isinstance(event, ChildProcessDoneEvent):
+                    self._is_busy = False
+                    completed_properly = True
+
+            if not completed_properly:
+                self._is_retired = True
+                self._is_busy = False
+                raise ChildProcessCrashException(exit_code=self._process.exitcode)
+        finally:
+            if event_selector:
+                event_selector.unregister(self._process, self._event_conn)
+
+    def shutdown(self, timeout: Optional[float] = WORKER_SHUTDOWN_TIMEOUT) -> None:
+        """Stop the worker process and wait for it to exit, terminating it if it has not exited
+        within the timeout.
+        """
+        # setting the termination event would block on a worker that died while waiting on it
+        if self._process.is_alive():
+            if self._is_busy:
+                # the parent stopped polling in the middle of a task, so interrupt it
+                self.term_event.set()
+            else:
+                self._task_queue.put(None)
+            self._process.join(timeout)
+            if self._process.is_alive():
+                self._process.terminate()
+        self._process.join()
+
+        # don't block on flushing tasks to a worker that never read them
+        self._task_queue.cancel_join_thread()
+        self._task_queue.close()
+        self._event_conn.close()
+
+
+class ChildProcessWorkerPool:
+    """A pool of long-lived child processes that each execute tasks of the same
+    ChildProcessWorkerCommand.
+
+    Workers are started on demand, so the pool grows to the number of tasks that are executed
+    concurrently. Workers that report a system error or crash are replaced by new ones, and their
+    processes are joined the next time a worker is requested. All workers are shut down when the
+    pool's context exits.
+    """
+
+    def __init__(
+        self, multiprocessing_ctx: MultiprocessingBaseContext, command: ChildProcessWorkerCommand
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._command = check.inst_param(command, "command", ChildProcessWorkerCommand)
+        self._workers: List[ChildProcessWorker] = []
+
+    def __enter__(self) -> "ChildProcessWorkerPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def get_available_worker(self) -> ChildProcessWorker:
+        self._reap_defunct_workers()
+        for worker in self._workers:
+            if worker.is_available:
+                return worker
+
+        worker = ChildProcessWorker(self._multiprocessing_ctx, self._command)
+        self._workers.append(worker)
+        return worker
+
+    def _reap_defunct_workers(self) -> None:
+        # join the processes of workers that have been retired or have died, rather than leaving
+        # them around as zombies with open pipes until the pool shuts down
+        defunct_workers = [worker for worker in self._workers if worker.is_defunct]
+        for worker in defunct_workers:
+            worker.shutdown()
+        self._workers = [worker for worker in self._workers if worker not in defunct_workers]
+
+    def shutdown(self) -> None:
+        for worker in self._workers:
+            worker.shutdown()
+        self._workers = []
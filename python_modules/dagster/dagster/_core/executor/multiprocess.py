@@ -1,9 +1,20 @@
 import multiprocessing
 import os
 import sys
-from contextlib import ExitStack
+from contextlib import ExitStack, contextmanager
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
 
 from dagster import (
     _check as check,
@@ -29,6 +40,7 @@
 from dagster._core.execution.retries import RetryMode
 from dagster._core.executor.base import Executor
 from dagster._core.instance import DagsterInstance
+from dagster._core.system_config.objects import ResolvedRunConfig
 from dagster._utils import get_run_crash_explanation, start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.timing import TimerResult, format_duration, time_execution_scope
@@ -37,11 +49,16 @@
     ChildProcessCommand,
     ChildProcessCrashException,
     ChildProcessEvent,
+    ChildProcessEventSelector,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerCommand,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 
 if TYPE_CHECKING:
+    from dagster._core.definitions.job_definition import JobDefinition
     from dagster._core.instance.ref import InstanceRef
     from dagster._core.storage.dagster_run import DagsterRun
 
@@ -105,6 +122,96 @@ def execute(self) -> Iterator[DagsterEvent]:
             )
 
 
+class MultiprocessExecutorStepTask(NamedTuple):
+    """A step sent to a worker process, along with the known state of the execution."""
+
+    step_key: str
+    known_state: KnownExecutionState
+
+
+class MultiprocessExecutorWorkerCommand(ChildProcessWorkerCommand):
+    def __init__(
+        self,
+        run_config: Mapping[str, object],
+        dagster_run: "DagsterRun",
+        instance_ref: "InstanceRef",
+        recon_pipeline: ReconstructableJob,
+        retry_mode: RetryMode,
+        repository_load_data: Optional[RepositoryLoadData],
+    ):
+        self.run_config = run_config
+        self.dagster_run = dagster_run
+        self.instance_ref = instance_ref
+        self.recon_pipeline = recon_pipeline
+        self.retry_mode = retry_mode
+        self.repository_load_data = repository_load_data
+
+        # set in the worker process when entering the worker scope
+        self._instance: Optional[DagsterInstance] = None
+        self._resolved_run_config: Optional[ResolvedRunConfig] = None
+        self._execution_plan: Optional[ExecutionPlan] = None
+
+    @contextmanager
+    def worker_scope(self) -> Iterator[None]:
+        with DagsterInstance.from_ref(self.instance_ref) as instance:
+            self._instance = instance
+            self._resolved_run_config = ResolvedRunConfig.build(
+                self._get_job_def(), self.run_config
+            )
+            yield
+
+    def _get_job_def(self) -> "JobDefinition":
+        return self.recon_pipeline.with_repository_load_data(
+            self.repository_load_data
+        ).get_definition()
+
+    def _get_execution_plan(self, step_key: str, known_state: KnownExecutionState) -> ExecutionPlan:
+        job_def = self._get_job_def()
+        resolved_run_config = check.not_none(self._resolved_run_config)
+
+        # The plan for the whole job only changes when dynamic outputs are resolved, so it is
+        # rebuilt only when the dynamic mappings in the known state change.
+        if (
+            self._execution_plan is None
+            or self._execution_plan.known_state.dynamic_mappings != known_state.dynamic_mappings
+        ):
+            self._execution_plan = ExecutionPlan.build(
+                job_def,
+                resolved_run_config,
+                known_state=known_state,
+                repository_load_data=self.repository_load_data,
+            )
+
+        return self._execution_plan._replace(known_state=known_state).build_subset_plan(
+            [step_key], job_def, resolved_run_config
+        )
+
+    def execute_task(self, task: MultiprocessExecutorStepTask) -> Iterator[DagsterEvent]:
+        instance = check.not_none(self._instance)
+        execution_plan = self._get_execution_plan(task.step_key, task.known_state)
+
+        log_manager = create_context_free_log_manager(instance, self.dagster_run)
+
+        yield DagsterEvent.step_worker_started(
+            log_manager,
+            self.dagster_run.job_name,
+            message=f'Executing step "{task.step_key}" in worker process.',
+            metadata={
+                "pid": MetadataValue.text(str(os.getpid())),
+            },
+            step_key=task.step_key,
+        )
+
+        yield from execute_plan_iterator(
+            execution_plan,
+            self.recon_pipeline,
+            self.dagster_run,
+            run_config=self.run_config,
+            retry_mode=self.retry_mode.for_inner_plan(),
+            instance=instance,
+        )
+
+
 class MultiprocessExecutor(Executor):
     def __init__(
         self,
@@ -113,6 +220,7 @@ def __init__(
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        reuse_workers: bool = False,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -138,6 +246,7 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._reuse_workers = check.bool_param(reuse_workers, "reuse_workers")
 
     @property
     def retries(self) -> RetryMode:
@@ -201,6 +310,25 @@ def execute(
                     instance_concurrency_context=instance_concurrency_context,
                 )
             )
+            worker_pool = (
+                stack.enter_context(
+                    ChildProcessWorkerPool(
+                        multiproc_ctx,
+                        MultiprocessExecutorWorkerCommand(
+                            run_config=plan_context.run_config,
+                            dagster_run=plan_context.dagster_run,
+                            instance_ref=plan_context.instance.get_ref(),
+                            recon_pipeline=job,
+                            retry_mode=self.retries,
+                            repository_load_data=execution_plan.repository_load_data,
+                        ),
+                    )
+                )
+                if self._reuse_workers
+                else None
+            )
+            # wait on all child processes at once, instead of polling each one in turn
+            event_selector = stack.enter_context(ChildProcessEventSelector())
             active_iters: Dict[str, Iterator[Optional[DagsterEvent]]] = {}
             errors: Dict[int, SerializableErrorInfo] = {}
             term_events: Dict[str, Any] = {}
@@ -229,27 +357,42 @@ def execute(
 
                     for step in steps:
                         step_context = plan_context.for_step(step)
-                        term_events[step.key] = multiproc_ctx.Event()
-                        active_iters[step.key] = execute_step_out_of_process(
-                            multiproc_ctx,
-                            job,
-                            step_context,
-                            step,
-                            errors,
-                            term_events,
-                            self.retries,
-                            active_execution.get_known_state(),
-                            execution_plan.repository_load_data,
-                        )
+                        if worker_pool:
+                            worker = worker_pool.get_available_worker()
+                            term_events[step.key] = worker.term_event
+                            active_iters[step.key] = execute_step_in_worker_process(
+                                worker,
+                                step_context,
+                                step,
+                                errors,
+                                active_execution.get_known_state(),
+                                event_selector,
+                            )
+                        else:
+                            term_events[step.key] = multiproc_ctx.Event()
+                            active_iters[step.key] = execute_step_out_of_process(
+                                multiproc_ctx,
+                                job,
+                                step_context,
+                                step,
+                                errors,
+                                term_events,
+                                self.retries,
+                                active_execution.get_known_state(),
+                                execution_plan.repository_load_data,
+                                event_selector,
+                            )
 
                 # process active iterators
                 empty_iters = []
+                received_events = False
                 for key, step_iter in active_iters.items():
                     try:
                         event_or_none = next(step_iter)
                         if event_or_none is None:
                             continue
                         else:
+                            received_events = True
                             yield event_or_none
                             active_execution.handle_event(event_or_none)
 
@@ -287,6 +430,10 @@ def execute(
                 # process skipped and abandoned steps
                 yield from active_execution.plan_events_iterator(plan_context)
 
+                # if no child process had anything to report, block until any of them does
+                if active_iters and not received_events and not empty_iters:
+                    event_selector.wait()
+
             errs = {pid: err for pid, err in errors.items() if err}
 
             # After termination starts, raise an interrupted exception once all subprocesses
@@ -337,6 +484,7 @@ def execute_step_out_of_process(
     retries: RetryMode,
     known_state: KnownExecutionState,
     repository_load_data: Optional[RepositoryLoadData],
+    event_selector: Optional[ChildProcessEventSelector] = None,
 ) -> Iterator[Optional[DagsterEvent]]:
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
@@ -356,7 +504,36 @@ def execute_step_out_of_process(
         metadata={},
     )
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    yield from _handle_child_process_events(
+        execute_child_process_command(multiproc_ctx, command, event_selector), errors
+    )
+
+
+def execute_step_in_worker_process(
+    worker: ChildProcessWorker,
+    step_context: IStepContext,
+    step: ExecutionStep,
+    errors: Dict[int, SerializableErrorInfo],
+    known_state: KnownExecutionState,
+    event_selector: Optional[ChildProcessEventSelector] = None,
+) -> Iterator[Optional[DagsterEvent]]:
+    yield DagsterEvent.step_worker_starting(
+        step_context,
+        f'Sending "{step.key}" to worker process (pid: {worker.pid}).',
+        metadata={},
+    )
+
+    yield from _handle_child_process_events(
+        worker.execute_task(MultiprocessExecutorStepTask(step.key, known_state), event_selector),
+        errors,
+    )
+
+
+def _handle_child_process_events(
+    child_process_events: Iterator[Union[None, DagsterEvent, ChildProcessEvent]],
+    errors: Dict[int, SerializableErrorInfo],
+) -> Iterator[Optional[DagsterEvent]]:
+    for ret in child_process_events:
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
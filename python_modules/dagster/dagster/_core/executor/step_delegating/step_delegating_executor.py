@@ -1,13 +1,16 @@
 import os
 import sys
+import threading
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, cast
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, cast
 
 import pendulum
 
 import dagster._check as check
 from dagster._core.definitions.metadata import MetadataValue
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.context.system import PlanOrchestrationContext
 from dagster._core.execution.plan.active import ActiveExecution
 from dagster._core.execution.plan.instance_concurrency_context import InstanceConcurrencyContext
@@ -26,6 +29,9 @@
 DEFAULT_SLEEP_SECONDS = float(
     os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_SLEEP_SECONDS", "1.0")
 )
+DEFAULT_EVENT_POLL_FALLBACK_SECONDS = float(
+    os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_EVENT_POLL_FALLBACK_SECONDS", "5.0")
+)
 
 
 class StepDelegatingExecutor(Executor):
@@ -33,6 +39,13 @@ class StepDelegatingExecutor(Executor):
     sometimes creates its own events - when it does, that event is automatically written to the
     event log. But we wait until we later tail it from the event log database before yielding it,
     to avoid yielding the same event multiple times to callsites.
+
+    If the event log storage pushes new events to watchers (e.g. sqlite storage, which watches its
+    files), the executor watches the event log of the run and wakes up to read new events as soon as
+    they are stored. Since notifications could be delayed or lost, it also reads new events at least
+    every `event_poll_fallback_seconds`. Otherwise (e.g. Postgres and MySQL storages, whose watchers
+    poll the database with a backoff), or if the watch can not be started, the executor reads new
+    events every `sleep_seconds`.
     """
 
     def __init__(
@@ -44,6 +57,7 @@ def __init__(
         max_concurrent: Optional[int] = None,
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         should_verify_step: bool = False,
+        event_poll_fallback_seconds: Optional[float] = None,
     ):
         self._step_handler = step_handler
         self._retries = retries
@@ -67,6 +81,15 @@ def __init__(
             ),
         )
         self._should_verify_step = should_verify_step
+        self._event_poll_fallback_seconds = cast(
+            float,
+            check.opt_float_param(
+                event_poll_fallback_seconds,
+                "event_poll_fallback_seconds",
+                default=DEFAULT_EVENT_POLL_FALLBACK_SECONDS,
+            ),
+        )
+        self._events_notified = threading.Event()
 
     @property
     def retries(self):
@@ -79,6 +102,46 @@ def _pop_events(self, instance, run_id) -> Sequence[DagsterEvent]:
         check.invariant(None not in dagster_events, "Query should not return a non dagster event")
         return dagster_events
 
+    def _on_event_notification(self, _event: EventLogEntry, _cursor: str) -> None:
+        # called from the thread of the event log watcher, so only wake up the executor, which
+        # reads the new events itself
+        self._events_notified.set()
+
+    @contextmanager
+    def _watch_events(self, plan_context: PlanOrchestrationContext) -> Iterator[bool]:
+        """Watches the event log of the run while in the context, if the event log storage pushes
+        new events to watchers. Yields whether the event log is being watched.
+        """
+        instance = plan_context.instance
+        run_id = plan_context.run_id
+        self._events_notified.clear()
+        if not instance.event_log_storage.supports_push_event_watch:
+            # a polling watcher would only notify after its own poll, which backs off to well past
+            # sleep_seconds, so polling the event log directly is both sooner and no more load
+            yield False
+            return
+
+        try:
+            # only notify about events stored from now on
+            cursor = instance.event_log_storage.get_records_for_run(
+                run_id, limit=1, ascending=False
+            ).cursor
+            instance.watch_event_logs(run_id, cursor, self._on_event_notification)
+        except Exception:
+            DagsterEvent.engine_event(
+                plan_context,
+                "Could not watch the event log for new events, polling for new events every"
+                f" {self._sleep_seconds} seconds instead",
+                EngineEventData(error=serializable_error_info_from_exc_info(sys.exc_info())),
+            )
+            yield False
+            return
+
+        try:
+            yield True
+        finally:
+            instance.end_watch_event_logs(run_id, self._on_event_notification)
+
     def _get_step_handler_context(
         self, plan_context, steps, active_execution
     ) -> StepHandlerContext:
@@ -109,7 +172,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
             f"Starting execution with step handler {self._step_handler.name}.",
             EngineEventData(),
         )
-        with InstanceConcurrencyContext(
+        with self._watch_events(plan_context) as watching_events, InstanceConcurrencyContext(
             plan_context.instance, plan_context.run_id
         ) as instance_concurrency_context:
             with ActiveExecution(
@@ -188,6 +251,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         running_steps[step.key] = step
 
                 last_check_step_health_time = pendulum.now("UTC")
+                last_event_poll_time: Optional[float] = None
 
                 # Order of events is important here. During an interation, we call handle_event, then get_steps_to_execute,
                 # then is_complete. get_steps_to_execute updates the state of ActiveExecution, and without it
@@ -225,10 +289,23 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
 
                         return
 
-                    for dagster_event in self._pop_events(
-                        plan_context.instance,
-                        plan_context.run_id,
+                    if (
+                        not watching_events
+                        or self._events_notified.is_set()
+                        or last_event_poll_time is None
+                        or time.time() - last_event_poll_time >= self._event_poll_fallback_seconds
                     ):
+                        # clear before reading, so events stored while reading wake the next wait
+                        self._events_notified.clear()
+                        last_event_poll_time = time.time()
+                        dagster_events = self._pop_events(
+                            plan_context.instance,
+                            plan_context.run_id,
+                        )
+                    else:
+                        dagster_events = []
+
+                    for dagster_event in dagster_events:
                         yield dagster_event
                         # STEP_SKIPPED events are only emitted by ActiveExecution, which already handles
                         # and yields them.
@@ -313,4 +390,5 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                             )
                         )
 
-                    time.sleep(self._sleep_seconds)
+                    # wakes up early when new events are stored
+                    self._events_notified.wait(self._sleep_seconds)
@@ -3,7 +3,20 @@
 import threading
 from abc import abstractmethod
 from contextlib import AbstractContextManager
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence, Tuple, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+import grpc
 
 import dagster._check as check
 from dagster._api.get_server_id import sync_get_server_id
@@ -24,7 +37,7 @@
 from dagster._core.definitions.repository_definition import RepositoryDefinition
 from dagster._core.definitions.selector import JobSubsetSelector
 from dagster._core.errors import DagsterInvariantViolationError, DagsterUserCodeProcessError
-from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.api import create_execution_plan_snapshot
 from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.host_representation import ExternalJobSubsetResult
 from dagster._core.host_representation.external import (
@@ -48,7 +61,6 @@
 from dagster._core.instance import DagsterInstance
 from dagster._core.libraries import DagsterLibraryRegistry
 from dagster._core.origin import RepositoryPythonOrigin
-from dagster._core.snap.execution_plan_snapshot import snapshot_from_execution_plan
 from dagster._grpc.impl import (
     get_external_schedule_execution,
     get_external_sensor_execution,
@@ -58,9 +70,10 @@
     get_partition_set_execution_param_data,
     get_partition_tags,
 )
-from dagster._grpc.types import GetCurrentImageResult, GetCurrentRunsResult
+from dagster._grpc.types import GetCurrentImageResult, GetCurrentRunsResult, SensorExecutionArgs
 from dagster._serdes import deserialize_value
 from dagster._seven.compat.pendulum import PendulumDateTime
+from dagster._utils.error import serializable_error_info_from_exc_info
 from dagster._utils.merger import merge_dicts
 
 if TYPE_CHECKING:
@@ -213,6 +226,31 @@ def get_external_sensor_execution_data(
     ) -> "SensorExecutionData":
         pass
 
+    def get_external_sensor_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        sensor_execution_args: Sequence[SensorExecutionArgs],
+    ) -> Iterator[Union["SensorExecutionData", ExternalSensorExecutionErrorData]]:
+        """Evaluates a batch of sensors in this code location, yielding the result of each sensor in
+        the same order as the given args. A sensor that fails to evaluate yields an
+        ExternalSensorExecutionErrorData instead of raising, so that the rest of the batch is still
+        evaluated.
+        """
+        for args in sensor_execution_args:
+            try:
+                yield self.get_external_sensor_execution_data(
+                    instance,
+                    self.get_repository(args.repository_origin.repository_name).handle,
+                    args.sensor_name,
+                    args.last_completion_time,
+                    args.last_run_key,
+                    args.cursor,
+                )
+            except Exception:
+                yield ExternalSensorExecutionErrorData(
+                    serializable_error_info_from_exc_info(sys.exc_info())
+                )
+
     @abstractmethod
     def get_external_notebook_data(self, notebook_path: str) -> bytes:
         pass
@@ -387,22 +425,19 @@ def get_external_execution_plan(
         check.opt_inst_param(known_state, "known_state", KnownExecutionState)
         check.opt_inst_param(instance, "instance", DagsterInstance)
 
-        execution_plan = create_execution_plan(
-            job=self.get_reconstructable_job(
-                external_job.repository_handle.repository_name, external_job.name
-            ).get_subset(
-                op_selection=external_job.resolved_op_selection,
-                asset_selection=external_job.asset_selection,
-            ),
-            run_config=run_config,
-            step_keys_to_execute=step_keys_to_execute,
-            known_state=known_state,
-            instance_ref=instance.get_ref() if instance and instance.is_persistent else None,
-        )
         return ExternalExecutionPlan(
-            execution_plan_snapshot=snapshot_from_execution_plan(
-                execution_plan,
+            execution_plan_snapshot=create_execution_plan_snapshot(
+                self.get_reconstructable_job(
+                    external_job.repository_handle.repository_name, external_job.name
+                ).get_subset(
+                    op_selection=external_job.resolved_op_selection,
+                    asset_selection=external_job.asset_selection,
+                ),
                 external_job.identifying_job_snapshot_id,
+                run_config=run_config,
+                step_keys_to_execute=step_keys_to_execute,
+                known_state=known_state,
+                instance_ref=instance.get_ref() if instance and instance.is_persistent else None,
             )
         )
 
@@ -506,6 +541,29 @@ def get_external_sensor_execution_data(
 
         return result
 
+    def get_external_sensor_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        sensor_execution_args: Sequence[SensorExecutionArgs],
+    ) -> Iterator[Union["SensorExecutionData", ExternalSensorExecutionErrorData]]:
+        check.sequence_param(
+            sensor_execution_args, "sensor_execution_args", of_type=SensorExecutionArgs
+        )
+        for args in sensor_execution_args:
+            try:
+                yield get_external_sensor_execution(
+                    self._get_repo_def(args.repository_origin.repository_name),
+                    args.instance_ref,
+                    args.sensor_name,
+                    args.last_completion_time,
+                    args.last_run_key,
+                    args.cursor,
+                )
+            except Exception:
+                yield ExternalSensorExecutionErrorData(
+                    serializable_error_info_from_exc_info(sys.exc_info())
+                )
+
     def get_external_partition_set_execution_param_data(
         self,
         repository_handle: RepositoryHandle,
@@ -578,6 +636,9 @@ def __init__(
         self._container_context = None
         self._repository_code_pointer_dict = None
         self._entry_point = None
+        # set to False once the server has rejected a batch sensor evaluation request, which
+        # servers from before that API was added do
+        self._supports_sensor_execution_batch = True
 
         try:
             self.client = DagsterGrpcClient(
@@ -852,6 +913,33 @@ def get_external_sensor_execution_data(
             cursor,
         )
 
+    def get_external_sensor_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        sensor_execution_args: Sequence[SensorExecutionArgs],
+    ) -> Iterator[Union["SensorExecutionData", ExternalSensorExecutionErrorData]]:
+        from dagster._api.snapshot_sensor import sync_get_external_sensor_execution_data_batch_grpc
+
+        if self._supports_sensor_execution_batch:
+            try:
+                yield from sync_get_external_sensor_execution_data_batch_grpc(
+                    self.client, sensor_execution_args
+                )
+                return
+            except Exception as e:
+                # Handle case when this is called against `dagster api grpc` servers that don't
+                # have this API method implemented. The server rejects the request before any
+                # result is streamed back, so every sensor in the batch can still be evaluated.
+                if (
+                    isinstance(e.__cause__, grpc.RpcError)
+                    and cast(grpc.RpcError, e.__cause__).code() == grpc.StatusCode.UNIMPLEMENTED
+                ):
+                    self._supports_sensor_execution_batch = False
+                else:
+                    raise
+
+        yield from super().get_external_sensor_execution_data_batch(instance, sensor_execution_args)
+
     def get_external_partition_set_execution_param_data(
         self,
         repository_handle: RepositoryHandle,
@@ -0,0 +1,200 @@
+"""Deferred deserialization of `ExternalRepositoryData`.
+
+`ExternalRepositoryData` for large code locations can be tens of megabytes of serialized JSON, the
+bulk of which are the job snapshots and asset nodes. `DeferredExternalRepositoryData` keeps the
+serialized payload around and only indexes it on load: for every job and asset node it records the
+name (or asset key) along with the offsets of its sub-document in the payload. Individual job datas
+and asset nodes are then unpacked from their slice of the payload the first time they are accessed.
+
+Indexing splits the indexed fields into elements with the JSON decoder, so the offsets do not depend
+on the key order, separators or string contents of the payload. Elements are decoded to plain JSON
+values to read the fields that identify them, but are only unpacked into their serdes classes when
+accessed.
+"""
+import json
+import re
+from threading import RLock
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import dagster._check as check
+from dagster._core.definitions.events import AssetKey
+from dagster._serdes import deserialize_value, unpack_value
+
+from .external_data import ExternalAssetNode, ExternalJobData, ExternalRepositoryData
+
+# The serialized name of the fields whose elements are indexed rather than unpacked on load
+_JOB_DATAS_FIELD = "external_pipeline_datas"
+_ASSET_NODES_FIELD = "external_asset_graph_data"
+
+# `__class__` is always packed as the first key of a serialized object
+_SERIALIZED_PREFIX = re.compile(r'\s*\{\s*"__class__"\s*:\s*"ExternalRepositoryData"')
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+# (start, end) offsets of a sub-document in the serialized payload
+Span = Tuple[int, int]
+
+
+def can_defer_external_repository_data(serialized: str) -> bool:
+    """Whether the serialized value is an `ExternalRepositoryData` in a format that can be indexed
+    for deferred deserialization (i.e. JSON, rather than an error or the binary serdes encoding).
+    """
+    return _SERIALIZED_PREFIX.match(serialized) is not None
+
+
+class DeferredExternalRepositoryData:
+    """A serialized `ExternalRepositoryData`, with job datas and asset nodes unpacked on demand.
+
+    All other fields (schedules, sensors, partition sets, resources, ...) are small and are
+    unpacked on load into `base_data`, an `ExternalRepositoryData` with no job datas or asset nodes.
+    """
+
+    def __init__(self, serialized: str):
+        check.str_param(serialized, "serialized")
+        check.invariant(
+            can_defer_external_repository_data(serialized),
+            "Expected a JSON serialized ExternalRepositoryData",
+        )
+        self._serialized = serialized
+        self._lock = RLock()
+
+        self._job_spans: Dict[str, Span] = {}
+        self._asset_node_spans: Dict[AssetKey, Span] = {}
+        self._asset_keys_by_job_name: Dict[str, List[AssetKey]] = {}
+        self._asset_nodes: Dict[AssetKey, ExternalAssetNode] = {}
+
+        top_level = self._index()
+        has_job_datas = top_level.get(_JOB_DATAS_FIELD) is not None
+        self._base_data = unpack_value(
+            {
+                **top_level,
+                _JOB_DATAS_FIELD: [] if has_job_datas else None,
+                _ASSET_NODES_FIELD: [],
+            },
+            as_type=ExternalRepositoryData,
+        )
+        self._has_job_datas = has_job_datas
+
+    def _index(self) -> Mapping[str, Any]:
+        """Walk the top-level object of the payload, decoding each field except for the indexed
+        sequences, for which only the offsets and identifying keys of each element are kept.
+        """
+        s = self._serialized
+        top_level: Dict[str, Any] = {}
+
+        idx = self._expect(s, 0, "{")
+        if s[idx] == "}":
+            return top_level
+        while True:
+            key, idx = _DECODER.raw_decode(s, idx)
+            idx = self._expect(s, idx, ":")
+            if key == _JOB_DATAS_FIELD and s[idx] == "[":
+                idx = self._index_sequence(s, idx, self._index_job_data)
+                top_level[key] = True
+            elif key == _ASSET_NODES_FIELD and s[idx] == "[":
+                idx = self._index_sequence(s, idx, self._index_asset_node)
+            else:
+                top_level[key], idx = _DECODER.raw_decode(s, idx)
+            idx = _WHITESPACE.match(s, idx).end()  # type: ignore  # always matches
+            if s[idx] == "}":
+                return top_level
+            idx = self._expect(s, idx, ",")
+
+    def _index_sequence(
+        self,
+        s: str,
+        idx: int,
+        index_fn: Callable[[Mapping[str, Any], Span], None],
+    ) -> int:
+        idx = self._expect(s, idx, "[")
+        if s[idx] == "]":
+            return idx + 1
+        while True:
+            value, end = _DECODER.raw_decode(s, idx)
+            check.invariant(
+                isinstance(value, dict),
+                f"Malformed serialized ExternalRepositoryData at offset {idx}",
+            )
+            index_fn(value, (idx, end))
+            idx = _WHITESPACE.match(s, end).end()  # type: ignore  # always matches
+            if s[idx : idx + 1] == "]":
+                return idx + 1
+            idx = self._expect(s, idx, ",")
+
+    def _index_job_data(self, value: Mapping[str, Any], span: Span) -> None:
+        check.invariant("name" in value, f"Job data without a name at offset {span[0]}")
+        self._job_spans[value["name"]] = span
+
+    def _index_asset_node(self, value: Mapping[str, Any], span: Span) -> None:
+        check.invariant(
+            "asset_key" in value, f"Asset node without an asset key at offset {span[0]}"
+        )
+        asset_key = unpack_value(value["asset_key"], as_type=AssetKey)
+        self._asset_node_spans[asset_key] = span
+        for job_name in value.get("job_names") or []:
+            self._asset_keys_by_job_name.setdefault(job_name, []).append(asset_key)
+
+    @staticmethod
+    def _expect(s: str, idx: int, token: str) -> int:
+        idx = _WHITESPACE.match(s, idx).end()  # type: ignore  # always matches
+        if s[idx : idx + 1] != token:
+            check.failed(f"Malformed serialized ExternalRepositoryData at offset {idx}")
+        return _WHITESPACE.match(s, idx + 1).end()  # type: ignore  # always matches
+
+    @property
+    def name(self) -> str:
+        return self._base_data.name
+
+    @property
+    def base_data(self) -> ExternalRepositoryData:
+        return self._base_data
+
+    def has_job_data(self) -> bool:
+        return self._has_job_datas
+
+    @property
+    def job_names(self) -> Sequence[str]:
+        return list(self._job_spans.keys())
+
+    def get_external_job_data(self, job_name: str) -> ExternalJobData:
+        check.str_param(job_name, "job_name")
+        check.invariant(job_name in self._job_spans, f'No job data named "{job_name}" found')
+        start, end = self._job_spans[job_name]
+        return deserialize_value(self._serialized[start:end], ExternalJobData)
+
+    @property
+    def asset_keys(self) -> Sequence[AssetKey]:
+        return list(self._asset_node_spans.keys())
+
+    def get_asset_keys_for_job(self, job_name: str) -> Sequence[AssetKey]:
+        return self._asset_keys_by_job_name.get(job_name, [])
+
+    def get_external_asset_node(self, asset_key: AssetKey) -> Optional[ExternalAssetNode]:
+        with self._lock:
+            if asset_key not in self._asset_nodes:
+                span = self._asset_node_spans.get(asset_key)
+                if span is None:
+                    return None
+                start, end = span
+                self._asset_nodes[asset_key] = deserialize_value(
+                    self._serialized[start:end], ExternalAssetNode
+                )
+            return self._asset_nodes[asset_key]
+
+    def get_external_asset_nodes(self) -> Sequence[ExternalAssetNode]:
+        return [
+            check.not_none(self.get_external_asset_node(asset_key))
+            for asset_key in self._asset_node_spans
+        ]
+
+    def materialize(self) -> ExternalRepositoryData:
+        """Unpack the full `ExternalRepositoryData`."""
+        return self._base_data._replace(
+            external_job_datas=(
+                [self.get_external_job_data(job_name) for job_name in self._job_spans]
+                if self._has_job_datas
+                else None
+            ),
+            external_asset_graph_data=self.get_external_asset_nodes(),
+        )
@@ -48,6 +48,7 @@
 from dagster._utils.cached_method import cached_method
 from dagster._utils.schedules import schedule_execution_time_iterator
 
+from .deferred_external_data import DeferredExternalRepositoryData
 from .external_data import (
     DEFAULT_MODE_NAME,
     EnvVarConsumer,
@@ -83,22 +84,42 @@ class ExternalRepository:
 
     def __init__(
         self,
-        external_repository_data: ExternalRepositoryData,
+        external_repository_data: Union[ExternalRepositoryData, DeferredExternalRepositoryData],
         repository_handle: RepositoryHandle,
         ref_to_data_fn: Optional[Callable[[ExternalJobRef], ExternalJobData]] = None,
     ):
-        self.external_repository_data = check.inst_param(
-            external_repository_data, "external_repository_data", ExternalRepositoryData
+        check.inst_param(
+            external_repository_data,
+            "external_repository_data",
+            (ExternalRepositoryData, DeferredExternalRepositoryData),
         )
 
-        if external_repository_data.external_job_datas is not None:
-            self._job_map: Dict[str, Union[ExternalJobData, ExternalJobRef]] = {
-                d.name: d for d in external_repository_data.external_job_datas
-            }
+        # When loaded from a serialized payload, job datas and asset nodes are unpacked from the
+        # payload the first time they are accessed.
+        if isinstance(external_repository_data, DeferredExternalRepositoryData):
+            self._deferred_repository_data: Optional[DeferredExternalRepositoryData] = (
+                external_repository_data
+            )
+            self._external_repository_data: Optional[ExternalRepositoryData] = None
+            self._base_repository_data = external_repository_data.base_data
+        else:
+            self._deferred_repository_data = None
+            self._external_repository_data = external_repository_data
+            self._base_repository_data = external_repository_data
+
+        if self._deferred_repository_data and self._deferred_repository_data.has_job_data():
+            # job datas are unpacked lazily in get_full_external_job
+            self._job_map: Dict[str, Union[ExternalJobData, ExternalJobRef, None]] = dict.fromkeys(
+                self._deferred_repository_data.job_names
+            )
             self._deferred_snapshots: bool = False
             self._ref_to_data_fn = None
-        elif external_repository_data.external_job_refs is not None:
-            self._job_map = {r.name: r for r in external_repository_data.external_job_refs}
+        elif self._base_repository_data.external_job_datas is not None:
+            self._job_map = {d.name: d for d in self._base_repository_data.external_job_datas}
+            self._deferred_snapshots = False
+            self._ref_to_data_fn = None
+        elif self._base_repository_data.external_job_refs is not None:
+            self._job_map = {r.name: r for r in self._base_repository_data.external_job_refs}
             self._deferred_snapshots = True
             if ref_to_data_fn is None:
                 check.failed(
@@ -112,28 +133,32 @@ def __init__(
 
         self._handle = check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
 
-        self._asset_jobs: Dict[str, List[ExternalAssetNode]] = {}
-        for asset_node in external_repository_data.external_asset_graph_data:
-            for job_name in asset_node.job_names:
-                if job_name not in self._asset_jobs:
-                    self._asset_jobs[job_name] = [asset_node]
-                else:
-                    self._asset_jobs[job_name].append(asset_node)
-
         # memoize job instances to share instances
         self._memo_lock: RLock = RLock()
         self._cached_jobs: Dict[str, ExternalJob] = {}
 
+    @property
+    def external_repository_data(self) -> ExternalRepositoryData:
+        """The full ExternalRepositoryData. If loaded from a serialized payload, accessing this
+        unpacks every job data and asset node, so prefer the more specific accessors.
+        """
+        with self._memo_lock:
+            if self._external_repository_data is None:
+                self._external_repository_data = check.not_none(
+                    self._deferred_repository_data
+                ).materialize()
+            return self._external_repository_data
+
     @property
     def name(self) -> str:
-        return self.external_repository_data.name
+        return self._base_repository_data.name
 
     @property
     @cached_method
     def _external_schedules(self) -> Dict[str, "ExternalSchedule"]:
         return {
             external_schedule_data.name: ExternalSchedule(external_schedule_data, self._handle)
-            for external_schedule_data in self.external_repository_data.external_schedule_datas
+            for external_schedule_data in self._base_repository_data.external_schedule_datas
         }
 
     def has_external_schedule(self, schedule_name: str) -> bool:
@@ -150,9 +175,7 @@ def get_external_schedules(self) -> Sequence["ExternalSchedule"]:
     def _external_resources(self) -> Dict[str, "ExternalResource"]:
         return {
             external_resource_data.name: ExternalResource(external_resource_data, self._handle)
-            for external_resource_data in (
-                self.external_repository_data.external_resource_data or []
-            )
+            for external_resource_data in (self._base_repository_data.external_resource_data or [])
         }
 
     def has_external_resource(self, resource_name: str) -> bool:
@@ -166,7 +189,7 @@ def get_external_resources(self) -> Iterable["ExternalResource"]:
 
     @property
     def _utilized_env_vars(self) -> Mapping[str, Sequence[EnvVarConsumer]]:
-        return self.external_repository_data.utilized_env_vars or {}
+        return self._base_repository_data.utilized_env_vars or {}
 
     def get_utilized_env_vars(self) -> Mapping[str, Sequence[EnvVarConsumer]]:
         return self._utilized_env_vars
@@ -176,7 +199,7 @@ def get_utilized_env_vars(self) -> Mapping[str, Sequence[EnvVarConsumer]]:
     def _external_sensors(self) -> Dict[str, "ExternalSensor"]:
         return {
             external_sensor_data.name: ExternalSensor(external_sensor_data, self._handle)
-            for external_sensor_data in self.external_repository_data.external_sensor_datas
+            for external_sensor_data in self._base_repository_data.external_sensor_datas
         }
 
     def has_external_sensor(self, sensor_name: str) -> bool:
@@ -195,7 +218,7 @@ def _external_partition_sets(self) -> Dict[str, "ExternalPartitionSet"]:
             external_partition_set_data.name: ExternalPartitionSet(
                 external_partition_set_data, self._handle
             )
-            for external_partition_set_data in self.external_repository_data.external_partition_set_datas
+            for external_partition_set_data in self._base_repository_data.external_partition_set_datas
         }
 
     def has_external_partition_set(self, partition_set_name: str) -> bool:
@@ -218,6 +241,10 @@ def get_full_external_job(self, job_name: str) -> "ExternalJob":
         with self._memo_lock:
             if job_name not in self._cached_jobs:
                 job_item = self._job_map[job_name]
+                if job_item is None:
+                    job_item = check.not_none(self._deferred_repository_data).get_external_job_data(
+                        job_name
+                    )
                 if self._deferred_snapshots:
                     if not isinstance(job_item, ExternalJobRef):
                         check.failed("unexpected job item")
@@ -263,9 +290,29 @@ def get_external_origin_id(self) -> str:
         """
         return self.get_external_origin().get_id()
 
+    @property
+    @cached_method
+    def _asset_jobs(self) -> Dict[str, List[ExternalAssetNode]]:
+        asset_jobs: Dict[str, List[ExternalAssetNode]] = {}
+        for asset_node in self.get_external_asset_nodes():
+            for job_name in asset_node.job_names:
+                if job_name not in asset_jobs:
+                    asset_jobs[job_name] = [asset_node]
+                else:
+                    asset_jobs[job_name].append(asset_node)
+        return asset_jobs
+
     def get_external_asset_nodes(
         self, job_name: Optional[str] = None
     ) -> Sequence[ExternalAssetNode]:
+        if self._deferred_repository_data and self._external_repository_data is None:
+            if job_name is None:
+                return self._deferred_repository_data.get_external_asset_nodes()
+            return [
+                check.not_none(self._deferred_repository_data.get_external_asset_node(asset_key))
+                for asset_key in self._deferred_repository_data.get_asset_keys_for_job(job_name)
+            ]
+
         return (
             self.external_repository_data.external_asset_graph_data
             if job_name is None
@@ -273,6 +320,9 @@ def get_external_asset_nodes(
         )
 
     def get_external_asset_node(self, asset_key: AssetKey) -> Optional[ExternalAssetNode]:
+        if self._deferred_repository_data and self._external_repository_data is None:
+            return self._deferred_repository_data.get_external_asset_node(asset_key)
+
         matching = [
             asset_node
             for asset_node in self.external_repository_data.external_asset_graph_data
@@ -2,6 +2,7 @@
 import logging.config
 import os
 import sys
+import threading
 import time
 import weakref
 from abc import abstractmethod
@@ -79,7 +80,7 @@
     get_default_tick_retention_settings,
     get_tick_retention_settings,
 )
-from .ref import InstanceRef
+from .ref import InstanceRef, configurable_class_data
 
 # 'airflow_execution_date' and 'is_airflow_ingest_pipeline' are hardcoded tags used in the
 # airflow ingestion logic (see: dagster_pipeline_factory.py). 'airflow_execution_date' stores the
@@ -129,6 +130,7 @@
     from dagster._core.storage.compute_log_manager import ComputeLogManager
     from dagster._core.storage.daemon_cursor import DaemonCursorStorage
     from dagster._core.storage.event_log import EventLogStorage
+    from dagster._core.storage.event_log.archive import EventLogArchive
     from dagster._core.storage.event_log.base import (
         AssetRecord,
         EventLogConnection,
@@ -183,12 +185,34 @@ def _format_field_diff(field_diff: Mapping[str, Tuple[Any, Any]]) -> str:
 
 
 class _EventListenerLogHandler(logging.Handler):
-    def __init__(self, instance: "DagsterInstance"):
+    """Writes log records to the instance's event log.
+
+    When batching is enabled, user-generated log messages are buffered and written with a single
+    `store_events` call once `flush_size` events have accumulated or `flush_interval_seconds` have
+    elapsed since the first buffered event. Dagster events are never delayed: each one flushes the
+    buffer, and is written in the same batch as the messages that preceded it.
+    """
+
+    def __init__(
+        self,
+        instance: "DagsterInstance",
+        flush_size: Optional[int] = None,
+        flush_interval_seconds: Optional[float] = None,
+    ):
         self._instance = instance
+        self._flush_size = check.opt_int_param(flush_size, "flush_size")
+        self._flush_interval_seconds = check.opt_numeric_param(
+            flush_interval_seconds, "flush_interval_seconds"
+        )
+        self._buffer: List["EventLogEntry"] = []
+        self._flush_timer: Optional[threading.Timer] = None
         super(_EventListenerLogHandler, self).__init__()
 
+    @property
+    def is_batching(self) -> bool:
+        return self._flush_size is not None and self._flush_size > 1
+
     def emit(self, record: DagsterLogRecord) -> None:
-        from dagster._core.events import EngineEventData
         from dagster._core.events.log import StructuredLoggerMessage, construct_event_record
 
         event = construct_event_record(
@@ -201,16 +225,58 @@ def emit(self, record: DagsterLogRecord) -> None:
             )
         )
 
+        if self.is_batching and not event.is_dagster_event:
+            self._buffer.append(event)
+            if len(self._buffer) >= check.not_none(self._flush_size):
+                self._flush_buffer()
+            elif self._flush_interval_seconds is not None and not self._flush_timer:
+                self._flush_timer = threading.Timer(self._flush_interval_seconds, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+            return
+
+        self._write_events([*self._drain_buffer(), event])
+
+    def flush(self) -> None:
+        self.acquire()
         try:
-            self._instance.handle_new_event(event)
+            self._flush_buffer()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        self.flush()
+        super(_EventListenerLogHandler, self).close()
+
+    def _drain_buffer(self) -> Sequence["EventLogEntry"]:
+        if self._flush_timer:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        events, self._buffer = self._buffer, []
+        return events
+
+    def _flush_buffer(self) -> None:
+        events = self._drain_buffer()
+        if events:
+            self._write_events(events)
+
+    def _write_events(self, events: Sequence["EventLogEntry"]) -> None:
+        from dagster._core.events import EngineEventData
+
+        try:
+            if len(events) == 1:
+                self._instance.handle_new_event(events[0])
+            else:
+                self._instance.handle_new_events(events)
         except Exception as e:
             sys.stderr.write(f"Exception while writing logger call to event log: {e}\n")
-            if event.dagster_event:
+            if any(event.dagster_event for event in events):
                 # Swallow user-generated log failures so that the entire step/run doesn't fail, but
                 # raise failures writing system-generated log events since they are the source of
                 # truth for the state of the run
                 raise
-            elif event.run_id:
+            elif events[-1].run_id:
+                event = events[-1]
                 self._instance.report_engine_event(
                     "Exception while writing logger call to event log",
                     job_name=event.job_name,
@@ -427,6 +493,9 @@ def __init__(
 
         self._ref = check.opt_inst_param(ref, "ref", InstanceRef)
 
+        # lazily loaded from settings
+        self._event_log_archive: Optional["EventLogArchive"] = None
+
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
 
         run_monitoring_enabled = self.run_monitoring_settings.get("enabled", False)
@@ -887,6 +956,49 @@ def auto_materialize_respect_materialization_data_versions(self) -> bool:
             "respect_materialization_data_versions", False
         )
 
+    @property
+    def auto_materialize_evaluate_incrementally(self) -> bool:
+        return self.get_settings("auto_materialize").get("evaluate_incrementally", False)
+
+    @property
+    def event_log_batching_enabled(self) -> bool:
+        return self.get_settings("event_log_batching").get("enabled", False)
+
+    @property
+    def event_log_batching_flush_size(self) -> int:
+        return self.get_settings("event_log_batching").get("flush_size", 100)
+
+    @property
+    def event_log_batching_flush_interval_seconds(self) -> float:
+        return self.get_settings("event_log_batching").get("flush_interval_seconds", 1.0)
+
+    # binary serdes
+
+    @property
+    def binary_serdes_event_log_enabled(self) -> bool:
+        return self.get_settings("binary_serdes").get("event_log", False)
+
+    @property
+    def binary_serdes_snapshots_enabled(self) -> bool:
+        return self.get_settings("binary_serdes").get("snapshots", False)
+
+    # event log archive
+
+    @property
+    def event_log_archive(self) -> Optional["EventLogArchive"]:
+        from dagster._core.storage.event_log.archive import EventLogArchive
+
+        archive_settings = self.get_settings("event_log_archive")
+        if not archive_settings:
+            return None
+
+        if self._event_log_archive is None:
+            self._event_log_archive = configurable_class_data(archive_settings).rehydrate(
+                as_type=EventLogArchive
+            )
+            self._event_log_archive.register_instance(self)
+        return self._event_log_archive
+
     # python logs
 
     @property
@@ -951,6 +1063,8 @@ def dispose(self) -> None:
             self._compute_log_manager.dispose()
         if self._secrets_loader:
             self._secrets_loader.dispose()
+        if self._event_log_archive:
+            self._event_log_archive.dispose()
 
         if self in DagsterInstance._TEMP_DIRS:
             DagsterInstance._TEMP_DIRS[self].cleanup()
@@ -1146,6 +1260,7 @@ def _construct_run_with_snapshots(
         op_selection: Optional[Sequence[str]] = None,
         external_job_origin: Optional["ExternalJobOrigin"] = None,
         job_code_origin: Optional[JobPythonOrigin] = None,
+        snapshot_id_cache: Optional[Dict[int, str]] = None,
     ) -> DagsterRun:
         # https://github.com/dagster-io/dagster/issues/2403
         if tags and IS_AIRFLOW_INGEST_PIPELINE_STR in tags:
@@ -1163,14 +1278,16 @@ def _construct_run_with_snapshots(
         )
 
         job_snapshot_id = (
-            self._ensure_persisted_job_snapshot(job_snapshot, parent_job_snapshot)
+            self._ensure_persisted_job_snapshot(
+                job_snapshot, parent_job_snapshot, snapshot_id_cache
+            )
             if job_snapshot
             else None
         )
 
         execution_plan_snapshot_id = (
             self._ensure_persisted_execution_plan_snapshot(
-                execution_plan_snapshot, job_snapshot_id, step_keys_to_execute
+                execution_plan_snapshot, job_snapshot_id, step_keys_to_execute, snapshot_id_cache
             )
             if execution_plan_snapshot and job_snapshot_id
             else None
@@ -1200,12 +1317,17 @@ def _ensure_persisted_job_snapshot(
         self,
         job_snapshot: "JobSnapshot",
         parent_job_snapshot: "Optional[JobSnapshot]",
+        snapshot_id_cache: Optional[Dict[int, str]] = None,
     ) -> str:
         from dagster._core.snap import JobSnapshot, create_job_snapshot_id
 
         check.inst_param(job_snapshot, "job_snapshot", JobSnapshot)
         check.opt_inst_param(parent_job_snapshot, "parent_job_snapshot", JobSnapshot)
 
+        # runs created in bulk typically share snapshot objects, so only hash and persist each once
+        if snapshot_id_cache is not None and id(job_snapshot) in snapshot_id_cache:
+            return snapshot_id_cache[id(job_snapshot)]
+
         if job_snapshot.lineage_snapshot:
             if not self._run_storage.has_job_snapshot(
                 job_snapshot.lineage_snapshot.parent_snapshot_id
@@ -1228,6 +1350,9 @@ def _ensure_persisted_job_snapshot(
             returned_job_snapshot_id = self._run_storage.add_job_snapshot(job_snapshot)
             check.invariant(job_snapshot_id == returned_job_snapshot_id)
 
+        if snapshot_id_cache is not None:
+            snapshot_id_cache[id(job_snapshot)] = job_snapshot_id
+
         return job_snapshot_id
 
     def _ensure_persisted_execution_plan_snapshot(
@@ -1235,6 +1360,7 @@ def _ensure_persisted_execution_plan_snapshot(
         execution_plan_snapshot: "ExecutionPlanSnapshot",
         job_snapshot_id: str,
         step_keys_to_execute: Optional[Sequence[str]],
+        snapshot_id_cache: Optional[Dict[int, str]] = None,
     ) -> str:
         from dagster._core.snap.execution_plan_snapshot import (
             ExecutionPlanSnapshot,
@@ -1257,6 +1383,9 @@ def _ensure_persisted_execution_plan_snapshot(
             ),
         )
 
+        if snapshot_id_cache is not None and id(execution_plan_snapshot) in snapshot_id_cache:
+            return snapshot_id_cache[id(execution_plan_snapshot)]
+
         execution_plan_snapshot_id = create_execution_plan_snapshot_id(execution_plan_snapshot)
 
         if not self._run_storage.has_execution_plan_snapshot(execution_plan_snapshot_id):
@@ -1266,11 +1395,23 @@ def _ensure_persisted_execution_plan_snapshot(
 
             check.invariant(execution_plan_snapshot_id == returned_execution_plan_snapshot_id)
 
+        if snapshot_id_cache is not None:
+            snapshot_id_cache[id(execution_plan_snapshot)] = execution_plan_snapshot_id
+
         return execution_plan_snapshot_id
 
     def _log_asset_materialization_planned_events(
         self, dagster_run: DagsterRun, execution_plan_snapshot: "ExecutionPlanSnapshot"
     ) -> None:
+        for event in self._get_asset_materialization_planned_events(
+            dagster_run, execution_plan_snapshot
+        ):
+            # Logs and stores asset_materialization_planned event
+            self.report_dagster_event(event, dagster_run.run_id, logging.DEBUG)
+
+    def _get_asset_materialization_planned_events(
+        self, dagster_run: DagsterRun, execution_plan_snapshot: "ExecutionPlanSnapshot"
+    ) -> Sequence["DagsterEvent"]:
         from dagster._core.events import (
             AssetMaterializationPlannedData,
             DagsterEvent,
@@ -1278,13 +1419,13 @@ def _log_asset_materialization_planned_events(
         )
 
         job_name = dagster_run.job_name
+        events = []
 
         for step in execution_plan_snapshot.steps:
             if step.key in execution_plan_snapshot.step_keys_to_execute:
                 for output in step.outputs:
                     asset_key = check.not_none(output.properties).asset_key
                     if asset_key:
-                        # Logs and stores asset_materialization_planned event
                         partition_tag = dagster_run.tags.get(PARTITION_NAME_TAG)
                         partition_range_start, partition_range_end = dagster_run.tags.get(
                             ASSET_PARTITION_RANGE_START_TAG
@@ -1312,19 +1453,23 @@ def _log_asset_materialization_planned_events(
                             else None
                         )
 
-                        event = DagsterEvent(
-                            event_type_value=DagsterEventType.ASSET_MATERIALIZATION_PLANNED.value,
-                            job_name=job_name,
-                            message=(
-                                f"{job_name} intends to materialize asset {asset_key.to_string()}"
-                            ),
-                            event_specific_data=AssetMaterializationPlannedData(
-                                asset_key, partition=partition
-                            ),
+                        events.append(
+                            DagsterEvent(
+                                event_type_value=DagsterEventType.ASSET_MATERIALIZATION_PLANNED.value,
+                                job_name=job_name,
+                                message=(
+                                    f"{job_name} intends to materialize asset"
+                                    f" {asset_key.to_string()}"
+                                ),
+                                event_specific_data=AssetMaterializationPlannedData(
+                                    asset_key, partition=partition
+                                ),
+                            )
                         )
-                        self.report_dagster_event(event, dagster_run.run_id, logging.DEBUG)
 
-    def create_run(
+        return events
+
+    def _construct_run(
         self,
         *,
         job_name: str,
@@ -1343,6 +1488,7 @@ def create_run(
         op_selection: Optional[Sequence[str]],
         external_job_origin: Optional["ExternalJobOrigin"],
         job_code_origin: Optional[JobPythonOrigin],
+        snapshot_id_cache: Optional[Dict[int, str]] = None,
     ) -> DagsterRun:
         from dagster._core.definitions.utils import validate_tags
         from dagster._core.host_representation.origin import ExternalJobOrigin
@@ -1438,7 +1584,7 @@ def create_run(
         check.opt_inst_param(external_job_origin, "external_job_origin", ExternalJobOrigin)
         check.opt_inst_param(job_code_origin, "job_code_origin", JobPythonOrigin)
 
-        dagster_run = self._construct_run_with_snapshots(
+        return self._construct_run_with_snapshots(
             job_name=job_name,
             run_id=run_id,  # type: ignore  # (possible none)
             run_config=run_config,
@@ -1455,6 +1601,46 @@ def create_run(
             parent_job_snapshot=parent_job_snapshot,
             external_job_origin=external_job_origin,
             job_code_origin=job_code_origin,
+            snapshot_id_cache=snapshot_id_cache,
+        )
+
+    def create_run(
+        self,
+        *,
+        job_name: str,
+        run_id: Optional[str],
+        run_config: Optional[Mapping[str, object]],
+        status: Optional[DagsterRunStatus],
+        tags: Optional[Mapping[str, Any]],
+        root_run_id: Optional[str],
+        parent_run_id: Optional[str],
+        step_keys_to_execute: Optional[Sequence[str]],
+        execution_plan_snapshot: Optional["ExecutionPlanSnapshot"],
+        job_snapshot: Optional["JobSnapshot"],
+        parent_job_snapshot: Optional["JobSnapshot"],
+        asset_selection: Optional[AbstractSet[AssetKey]],
+        resolved_op_selection: Optional[AbstractSet[str]],
+        op_selection: Optional[Sequence[str]],
+        external_job_origin: Optional["ExternalJobOrigin"],
+        job_code_origin: Optional[JobPythonOrigin],
+    ) -> DagsterRun:
+        dagster_run = self._construct_run(
+            job_name=job_name,
+            run_id=run_id,
+            run_config=run_config,
+            status=status,
+            tags=tags,
+            root_run_id=root_run_id,
+            parent_run_id=parent_run_id,
+            step_keys_to_execute=step_keys_to_execute,
+            execution_plan_snapshot=execution_plan_snapshot,
+            job_snapshot=job_snapshot,
+            parent_job_snapshot=parent_job_snapshot,
+            asset_selection=asset_selection,
+            resolved_op_selection=resolved_op_selection,
+            op_selection=op_selection,
+            external_job_origin=external_job_origin,
+            job_code_origin=job_code_origin,
         )
 
         dagster_run = self._run_storage.add_run(dagster_run)
@@ -1464,6 +1650,40 @@ def create_run(
 
         return dagster_run
 
+    def create_runs(self, run_params: Sequence[Mapping[str, Any]]) -> Sequence[DagsterRun]:
+        """Create a batch of runs.
+
+        Each element of ``run_params`` holds the keyword arguments that would be passed to
+        ``create_run``. Snapshots shared between runs are only persisted once, the runs and their
+        tags are added to run storage together, and the asset materialization planned events for
+        every run are stored in a single event log write.
+
+        Returns:
+            Sequence[DagsterRun]: The created runs, in the same order as ``run_params``.
+        """
+        check.sequence_param(run_params, "run_params", of_type=Mapping)
+
+        snapshot_id_cache: Dict[int, str] = {}
+        dagster_runs = [
+            self._construct_run(**params, snapshot_id_cache=snapshot_id_cache)
+            for params in run_params
+        ]
+        dagster_runs = self._run_storage.add_runs(dagster_runs)
+
+        planned_events = []
+        for dagster_run, params in zip(dagster_runs, run_params):
+            execution_plan_snapshot = params.get("execution_plan_snapshot")
+            if execution_plan_snapshot:
+                planned_events.extend(
+                    (dagster_run.run_id, event)
+                    for event in self._get_asset_materialization_planned_events(
+                        dagster_run, execution_plan_snapshot
+                    )
+                )
+        self.report_dagster_events(planned_events, logging.DEBUG)
+
+        return dagster_runs
+
     def create_reexecuted_run(
         self,
         *,
@@ -1667,6 +1887,10 @@ def get_run_ids(
     ) -> Sequence[str]:
         return self._run_storage.get_run_ids(filters, cursor=cursor, limit=limit)
 
+    @traced
+    def get_tags_for_runs(self, run_ids: Sequence[str]) -> Mapping[str, Mapping[str, str]]:
+        return self._run_storage.get_tags_for_runs(run_ids)
+
     @traced
     def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
         return self._run_storage.get_runs_count(filters)
@@ -1717,6 +1941,8 @@ def delete_run(self, run_id: str) -> None:
         """
         self._run_storage.delete_run(run_id)
         self._event_storage.delete_events(run_id)
+        if self.event_log_archive:
+            self.event_log_archive.delete_events_for_run(run_id)
 
     # event storage
     @traced
@@ -2065,7 +2291,14 @@ def _get_yaml_python_handlers(self) -> Sequence[logging.Handler]:
         return []
 
     def _get_event_log_handler(self) -> _EventListenerLogHandler:
-        event_log_handler = _EventListenerLogHandler(self)
+        if self.event_log_batching_enabled:
+            event_log_handler = _EventListenerLogHandler(
+                self,
+                flush_size=self.event_log_batching_flush_size,
+                flush_interval_seconds=self.event_log_batching_flush_interval_seconds,
+            )
+        else:
+            event_log_handler = _EventListenerLogHandler(self)
         event_log_handler.setLevel(10)
         return event_log_handler
 
@@ -2088,6 +2321,19 @@ def handle_new_event(self, event: "EventLogEntry") -> None:
         for sub in self._subscribers[run_id]:
             sub(event)
 
+    def handle_new_events(self, events: Sequence["EventLogEntry"]) -> None:
+        """Store a batch of events with a single event log write, then notify the run storage and
+        any subscribers of each event in order.
+        """
+        self._event_storage.store_events(events)
+
+        for event in events:
+            if event.is_dagster_event and event.get_dagster_event().is_job_event:
+                self._run_storage.handle_run_event(event.run_id, event.get_dagster_event())
+
+            for sub in self._subscribers[event.run_id]:
+                sub(event)
+
     def add_event_listener(self, run_id: str, cb) -> None:
         self._subscribers[run_id].append(cb)
 
@@ -2163,6 +2409,35 @@ def report_dagster_event(
         )
         self.handle_new_event(event_record)
 
+    def report_dagster_events(
+        self,
+        dagster_events: Sequence[Tuple[str, "DagsterEvent"]],
+        log_level: Union[str, int] = logging.INFO,
+    ) -> None:
+        """Takes a sequence of (run_id, DagsterEvent) pairs and stores them in persistent storage
+        with a single event log write.
+        """
+        from dagster._core.events.log import EventLogEntry
+
+        if not dagster_events:
+            return
+
+        self.handle_new_events(
+            [
+                EventLogEntry(
+                    user_message="",
+                    level=log_level,
+                    job_name=dagster_event.job_name,
+                    run_id=run_id,
+                    error_info=None,
+                    timestamp=time.time(),
+                    step_key=dagster_event.step_key,
+                    dagster_event=dagster_event,
+                )
+                for run_id, dagster_event in dagster_events
+            ]
+        )
+
     def report_run_canceling(self, run: DagsterRun, message: Optional[str] = None):
         from dagster._core.events import DagsterEvent, DagsterEventType
 
@@ -2287,6 +2562,68 @@ def submit_run(self, run_id: str, workspace: "IWorkspace") -> DagsterRun:
 
         return submitted_run
 
+    def submit_runs(self, run_ids: Sequence[str], workspace: "IWorkspace") -> Sequence[DagsterRun]:
+        """Submit a batch of runs to the coordinator.
+
+        Like ``submit_run``, but loads the runs with a single query and delegates to
+        ``RunCoordinator.submit_runs()`` so that the coordinator can submit them together.
+
+        Args:
+            run_ids (Sequence[str]): The ids of the runs.
+
+        Returns:
+            Sequence[DagsterRun]: The submitted runs, in the same order as ``run_ids``.
+        """
+        from dagster._core.host_representation import ExternalJobOrigin
+        from dagster._core.run_coordinator import SubmitRunContext
+
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        if not run_ids:
+            return []
+
+        runs_by_id = {run.run_id: run for run in self.get_runs(RunsFilter(run_ids=list(run_ids)))}
+        runs = []
+        for run_id in run_ids:
+            run = runs_by_id.get(run_id)
+            if run is None:
+                raise DagsterInvariantViolationError(
+                    f"Could not load run {run_id} that was passed to submit_runs"
+                )
+
+            check.inst(
+                run.external_job_origin,
+                ExternalJobOrigin,
+                "External pipeline origin must be set for submitted runs",
+            )
+            check.inst(
+                run.job_code_origin,
+                JobPythonOrigin,
+                "Python origin must be set for submitted runs",
+            )
+            runs.append(run)
+
+        try:
+            submitted_runs = self.run_coordinator.submit_runs(
+                [SubmitRunContext(run, workspace=workspace) for run in runs]
+            )
+        except:
+            from dagster._core.events import EngineEventData
+
+            error = serializable_error_info_from_exc_info(sys.exc_info())
+            # only fail the runs that did not make it through the coordinator
+            for run in self.get_runs(
+                RunsFilter(run_ids=list(run_ids), statuses=[DagsterRunStatus.NOT_STARTED])
+            ):
+                self.report_engine_event(
+                    error.message,
+                    run,
+                    EngineEventData.engine_error(error),
+                )
+                self.report_run_failed(run)
+            raise
+
+        return submitted_runs
+
     # Run launcher
 
     def launch_run(self, run_id: str, workspace: "IWorkspace") -> DagsterRun:
@@ -260,6 +260,18 @@ def sensors_daemon_config() -> Field:
                     " tick."
                 ),
             ),
+            "batch_code_location_evaluations": Field(
+                Bool,
+                is_required=False,
+                default_value=False,
+                description=(
+                    "Whether to evaluate the sensors that are due in each code location together in"
+                    " a single request to the code server, scheduling each sensor by the time it"
+                    " is next due given its minimum interval, rather than evaluating each sensor"
+                    " with its own request. Can be used to decrease overhead when there are many"
+                    " sensors in each code location."
+                ),
+            ),
         },
         is_required=False,
     )
@@ -285,6 +297,34 @@ def schedules_daemon_config() -> Field:
                     " tick."
                 ),
             ),
+            "use_deadline_queue": Field(
+                Bool,
+                is_required=False,
+                default_value=False,
+                description=(
+                    "Only evaluate each schedule when its next execution time is due, instead of"
+                    " checking every running schedule once per minute. Running schedules are only"
+                    " reloaded when the workspace or the stored schedule states change."
+                ),
+            ),
+        },
+        is_required=False,
+    )
+
+
+def backfills_daemon_config() -> Field:
+    return Field(
+        {
+            "use_threads": Field(Bool, is_required=False, default_value=False),
+            "num_submit_workers": Field(
+                int,
+                is_required=False,
+                description=(
+                    "How many threads to use to create and submit the runs for the partitions of a"
+                    " job backfill in parallel. Each chunk of partitions that is submitted between"
+                    " checkpoints is also scaled up by this number."
+                ),
+            ),
         },
         is_required=False,
     )
@@ -352,12 +392,86 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
         "retention": retention_config_schema(),
         "sensors": sensors_daemon_config(),
         "schedules": schedules_daemon_config(),
+        "backfills": backfills_daemon_config(),
         "auto_materialize": Field(
             {
                 "enabled": Field(Bool, is_required=False),
                 "minimum_interval_seconds": Field(int, is_required=False),
                 "run_tags": Field(dict, is_required=False),
                 "respect_materialization_data_versions": Field(Bool, is_required=False),
+                "evaluate_incrementally": Field(
+                    Bool,
+                    is_required=False,
+                    description=(
+                        "Only evaluate the auto-materialize policies of assets that have been"
+                        " updated, or that have updated parents, since the previous tick, along"
+                        " with assets whose policies depend on the passage of time."
+                    ),
+                ),
+                "use_threads": Field(Bool, is_required=False, default_value=False),
+                "num_workers": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "How many threads to use to evaluate the auto-materialize policies of"
+                        " independent assets in parallel"
+                    ),
+                ),
             }
         ),
+        "event_log_batching": Field(
+            {
+                "enabled": Field(Bool, is_required=False, default_value=False),
+                "flush_size": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "How many log messages to buffer before writing them to the event log in"
+                        " a single batch"
+                    ),
+                ),
+                "flush_interval_seconds": Field(
+                    float,
+                    is_required=False,
+                    description=(
+                        "The maximum amount of time a buffered log message waits before being"
+                        " written to the event log"
+                    ),
+                ),
+            },
+            is_required=False,
+        ),
+        "event_log_archive": config_field_for_configurable_class(),
+        "binary_serdes": Field(
+            {
+                "event_log": Field(
+                    Bool,
+                    is_required=False,
+                    default_value=False,
+                    description="Store new event log entries with the binary serdes encoding",
+                ),
+                "snapshots": Field(
+                    Bool,
+                    is_required=False,
+                    default_value=False,
+                    description=(
+                        "Store new job and execution plan snapshots with the binary serdes encoding"
+                    ),
+                ),
+                "code_servers": Field(
+                    Bool,
+                    is_required=False,
+                    default_value=False,
+                    description=(
+                        "Stream repository data from code servers launched with this instance"
+                        " with the binary serdes encoding"
+                    ),
+                ),
+            },
+            is_required=False,
+            description=(
+                "Opt in to the binary serdes encoding, which is faster to read than JSON. Requires"
+                " the msgpack package. Values stored as JSON can still be read."
+            ),
+        ),
     }
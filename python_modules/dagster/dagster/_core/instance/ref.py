@@ -454,6 +454,10 @@ def from_dir(
             "schedules",
             "nux",
             "auto_materialize",
+            "event_log_batching",
+            "binary_serdes",
+            "backfills",
+            "event_log_archive",
         }
         settings = {key: config_value.get(key) for key in settings_keys if config_value.get(key)}
 
@@ -14,7 +14,7 @@
 from dagster._config import Array, Field, Noneable, ScalarUnion, Shape
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.instance import T_DagsterInstance
-from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus
+from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunsFilter
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 
 from .base import RunCoordinator, SubmitRunContext
@@ -59,6 +59,7 @@ def __init__(
         dequeue_interval_seconds: Optional[int] = None,
         dequeue_use_threads: Optional[bool] = None,
         dequeue_num_workers: Optional[int] = None,
+        dequeue_pipeline_launches: Optional[bool] = None,
         max_user_code_failure_retries: Optional[int] = None,
         user_code_failure_retry_delay: Optional[int] = None,
         inst_data: Optional[ConfigurableClassData] = None,
@@ -87,6 +88,9 @@ def __init__(
         self._dequeue_num_workers: Optional[int] = check.opt_int_param(
             dequeue_num_workers, "dequeue_num_workers"
         )
+        self._dequeue_pipeline_launches: bool = check.opt_bool_param(
+            dequeue_pipeline_launches, "dequeue_pipeline_launches", False
+        )
         self._max_user_code_failure_retries: int = check.opt_int_param(
             max_user_code_failure_retries, "max_user_code_failure_retries", 0
         )
@@ -120,6 +124,10 @@ def dequeue_use_threads(self) -> bool:
     def dequeue_num_workers(self) -> Optional[int]:
         return self._dequeue_num_workers
 
+    @property
+    def dequeue_pipeline_launches(self) -> bool:
+        return self._dequeue_pipeline_launches
+
     @classmethod
     def config_type(cls) -> UserConfigSchema:
         return {
@@ -181,6 +189,16 @@ def config_type(cls) -> UserConfigSchema:
                     "If dequeue_use_threads is true, limit the number of concurrent worker threads."
                 ),
             ),
+            "dequeue_pipeline_launches": Field(
+                config=bool,
+                is_required=False,
+                description=(
+                    "If dequeue_use_threads is true, start the next dequeue iteration without"
+                    " waiting for the runs from the previous iteration to finish launching, so that"
+                    " a code location that is slow to launch runs does not hold up the runs from"
+                    " other code locations."
+                ),
+            ),
             "max_user_code_failure_retries": Field(
                 config=IntSource,
                 is_required=False,
@@ -217,6 +235,7 @@ def from_config_value(
             dequeue_interval_seconds=config_value.get("dequeue_interval_seconds"),
             dequeue_use_threads=config_value.get("dequeue_use_threads"),
             dequeue_num_workers=config_value.get("dequeue_num_workers"),
+            dequeue_pipeline_launches=config_value.get("dequeue_pipeline_launches"),
             max_user_code_failure_retries=config_value.get("max_user_code_failure_retries"),
             user_code_failure_retry_delay=config_value.get("user_code_failure_retry_delay"),
         )
@@ -242,6 +261,39 @@ def submit_run(self, context: SubmitRunContext) -> DagsterRun:
             check.failed(f"Failed to reload run {dagster_run.run_id}")
         return run
 
+    def submit_runs(self, contexts: Sequence[SubmitRunContext]) -> Sequence[DagsterRun]:
+        enqueued_events = []
+        for context in contexts:
+            dagster_run = context.dagster_run
+            if dagster_run.status == DagsterRunStatus.NOT_STARTED:
+                enqueued_events.append(
+                    (
+                        dagster_run.run_id,
+                        DagsterEvent(
+                            event_type_value=DagsterEventType.PIPELINE_ENQUEUED.value,
+                            job_name=dagster_run.job_name,
+                        ),
+                    )
+                )
+            else:
+                # the run was already submitted, this is a no-op
+                self._logger.warning(
+                    f"submit_run called for run {dagster_run.run_id} with status "
+                    f"{dagster_run.status.value}, skipping enqueue."
+                )
+
+        # store all of the enqueued events in a single event log write
+        self._instance.report_dagster_events(enqueued_events)
+
+        run_ids = [context.dagster_run.run_id for context in contexts]
+        runs_by_id = {
+            run.run_id: run for run in self._instance.get_runs(RunsFilter(run_ids=run_ids))
+        }
+        for run_id in run_ids:
+            if run_id not in runs_by_id:
+                check.failed(f"Failed to reload run {run_id}")
+        return [runs_by_id[run_id] for run_id in run_ids]
+
     def cancel_run(self, run_id: str) -> bool:
         run = self._instance.get_run_by_id(run_id)
         if not run:
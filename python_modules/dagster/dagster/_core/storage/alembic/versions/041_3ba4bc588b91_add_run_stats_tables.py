@@ -0,0 +1,71 @@
+"""add run stats and step stats tables
+
+Revision ID: 3ba4bc588b91
+Revises: 5771160a95ad
+Create Date: 2023-06-12 14:02:11.482931
+
+"""
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "3ba4bc588b91"
+down_revision = "5771160a95ad"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("run_stats"):
+        op.create_table(
+            "run_stats",
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("run_id", db.String(255), unique=True, nullable=False),
+            db.Column("steps_succeeded", db.Integer, nullable=False, default=0),
+            db.Column("steps_failed", db.Integer, nullable=False, default=0),
+            db.Column("materializations", db.Integer, nullable=False, default=0),
+            db.Column("expectations", db.Integer, nullable=False, default=0),
+            db.Column("enqueued_time", db.types.TIMESTAMP),
+            db.Column("launch_time", db.types.TIMESTAMP),
+            db.Column("start_time", db.types.TIMESTAMP),
+            db.Column("end_time", db.types.TIMESTAMP),
+        )
+
+    if not has_table("step_stats"):
+        op.create_table(
+            "step_stats",
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("step_key", db.Text, nullable=False),
+            db.Column("step_key_hash", db.String(64), nullable=False),
+            db.Column("version", db.Integer, nullable=False, default=0),
+            db.Column("stats", db.Text, nullable=False),
+        )
+        op.create_index(
+            "idx_step_stats",
+            "step_stats",
+            ["run_id", "step_key_hash"],
+            unique=True,
+        )
+
+
+def downgrade():
+    if has_table("run_stats"):
+        op.drop_table("run_stats")
+
+    if has_table("step_stats"):
+        if has_index("step_stats", "idx_step_stats"):
+            op.drop_index("idx_step_stats", "step_stats")
+        op.drop_table("step_stats")
@@ -0,0 +1,60 @@
+"""add asset partition events table
+
+Revision ID: 8f3b1c2d7e94
+Revises: 3ba4bc588b91
+Create Date: 2023-06-19 10:41:37.215084
+
+"""
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "8f3b1c2d7e94"
+down_revision = "3ba4bc588b91"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("asset_partition_events"):
+        op.create_table(
+            "asset_partition_events",
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("asset_key", db.Text, nullable=False),
+            db.Column("partition", db.Text, nullable=False),
+            db.Column("asset_key_hash", db.String(64), nullable=False),
+            db.Column("partition_hash", db.String(64), nullable=False),
+            db.Column("dagster_event_type", db.Text, nullable=False),
+            db.Column("last_event_id", db.BigInteger, nullable=False),
+            db.Column("last_run_id", db.String(255)),
+            db.Column("event_count", db.Integer, nullable=False, default=0),
+        )
+        op.create_index(
+            "idx_asset_partition_events",
+            "asset_partition_events",
+            ["asset_key", "dagster_event_type", "partition"],
+            mysql_length={"asset_key": 255, "dagster_event_type": 64, "partition": 255},
+        )
+        op.create_index(
+            "idx_asset_partition_events_hash",
+            "asset_partition_events",
+            ["asset_key_hash", "dagster_event_type", "partition_hash"],
+            mysql_length={"dagster_event_type": 64},
+            unique=True,
+        )
+
+
+def downgrade():
+    if has_table("asset_partition_events"):
+        if has_index("asset_partition_events", "idx_asset_partition_events"):
+            op.drop_index("idx_asset_partition_events", "asset_partition_events")
+        if has_index("asset_partition_events", "idx_asset_partition_events_hash"):
+            op.drop_index("idx_asset_partition_events_hash", "asset_partition_events")
+        op.drop_table("asset_partition_events")
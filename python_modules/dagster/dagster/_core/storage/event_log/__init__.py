@@ -4,7 +4,10 @@
     EventLogStorage as EventLogStorage,
 )
 from .in_memory import InMemoryEventLogStorage as InMemoryEventLogStorage
-from .polling_event_watcher import SqlPollingEventWatcher as SqlPollingEventWatcher
+from .polling_event_watcher import (
+    SqlPollingEventWatcher as SqlPollingEventWatcher,
+    SqlPollingMultiRunEventWatcher as SqlPollingMultiRunEventWatcher,
+)
 from .schema import (
     AssetKeyTable as AssetKeyTable,
     DynamicPartitionsTable as DynamicPartitionsTable,
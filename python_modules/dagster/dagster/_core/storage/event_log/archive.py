@@ -0,0 +1,478 @@
+"""Archival of the event logs of completed runs to columnar files.
+
+Most rows in the event log belong to runs that finished long ago, and are only ever read back when
+someone looks at the logs for that run. Archiving moves those rows out of the event log database
+into one file per run, keeping the rows that are queried across runs (asset events and run status
+events) in the database. Reads for an archived run transparently merge the rows that remain in the
+database with the rows from the archive.
+
+Runs whose event logs have been archived are marked with the `EVENT_LOGS_ARCHIVED_TAG` run tag, so
+that reads only consult the archive for runs that have rows in it.
+"""
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+)
+
+from typing_extensions import Self
+
+import dagster._check as check
+from dagster._config import Field, IntSource, StringSource
+from dagster._core.events import ASSET_EVENTS, PIPELINE_EVENTS
+from dagster._core.instance import MayHaveInstanceWeakref, T_DagsterInstance
+from dagster._core.storage.dagster_run import FINISHED_STATUSES, RunRecord, RunsFilter
+from dagster._core.storage.tags import HIDDEN_TAG_PREFIX
+from dagster._serdes import ConfigurableClass, ConfigurableClassData
+
+if TYPE_CHECKING:
+    from dagster._core.instance import DagsterInstance
+
+EVENT_LOGS_ARCHIVED_TAG = f"{HIDDEN_TAG_PREFIX}event_logs_archived"
+
+# Events of these types are queried across runs (e.g. by run status sensors and asset queries), so
+# they are kept in the event log storage when archiving. So are all other events with an asset key.
+UNARCHIVED_EVENT_TYPES = PIPELINE_EVENTS | ASSET_EVENTS
+
+# Number of runs fetched from the run storage at a time when looking for runs to archive
+_RUN_BATCH_SIZE = 100
+
+# Daemon cursor storage key for the update timestamp up to which finished runs have been considered
+# for archival
+ARCHIVE_WATERMARK_KEY = "EVENT_LOG_ARCHIVE_WATERMARK"
+
+
+class ArchivedEventLogRow(
+    NamedTuple(
+        "_ArchivedEventLogRow",
+        [
+            ("storage_id", int),
+            ("dagster_event_type", Optional[str]),
+            ("event", str),
+        ],
+    )
+):
+    """A row of the event log, with the event left in its serialized form."""
+
+    def __new__(cls, storage_id: int, dagster_event_type: Optional[str], event: str):
+        return super(ArchivedEventLogRow, cls).__new__(
+            cls,
+            storage_id=check.int_param(storage_id, "storage_id"),
+            dagster_event_type=check.opt_str_param(dagster_event_type, "dagster_event_type"),
+            event=check.str_param(event, "event"),
+        )
+
+
+class EventLogArchive(ABC, MayHaveInstanceWeakref[T_DagsterInstance]):
+    """Abstract base class for storing the archived event logs of runs, configured on the instance
+    with the `event_log_archive` key in the ``dagster.yaml`` file.
+    """
+
+    @abstractmethod
+    def write_events_for_run(self, run_id: str, rows: Sequence[ArchivedEventLogRow]) -> None:
+        """Store the given rows for a run, replacing any rows previously archived for it."""
+
+    @abstractmethod
+    def read_events_for_run(
+        self,
+        run_id: str,
+        dagster_event_types: Optional[Set[str]] = None,
+        after_storage_id: Optional[int] = None,
+        before_storage_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+    ) -> Sequence[ArchivedEventLogRow]:
+        """Return the archived rows for a run, ordered by storage id.
+
+        Args:
+            run_id (str): The id of the run for which to read rows.
+            dagster_event_types (Optional[Set[str]]): If set, only return rows with one of the
+                given dagster event type values.
+            after_storage_id (Optional[int]): If set, only return rows with a greater storage id.
+            before_storage_id (Optional[int]): If set, only return rows with a lesser storage id.
+            limit (Optional[int]): The maximum number of rows to return.
+            ascending (bool): Whether to order the rows by ascending or descending storage id. The
+                limit applies to the rows in this order.
+        """
+
+    @abstractmethod
+    def delete_events_for_run(self, run_id: str) -> None:
+        """Remove the archived rows for a run, if there are any."""
+
+    def dispose(self) -> None:
+        return
+
+
+class ParquetEventLogArchive(EventLogArchive, ConfigurableClass):
+    """Stores the archived event logs of each run in a Parquet file.
+
+    Requires the ``pyarrow`` package. ``base_dir`` is either a local directory or a URI for any
+    filesystem supported by ``pyarrow.fs`` (e.g. ``s3://bucket/prefix`` or ``gs://bucket/prefix``).
+
+    .. code-block:: YAML
+
+        event_log_archive:
+          module: dagster._core.storage.event_log.archive
+          class: ParquetEventLogArchive
+          config:
+            base_dir: s3://my-bucket/dagster/event_logs
+    """
+
+    def __init__(
+        self,
+        base_dir: str,
+        compression: str = "zstd",
+        row_group_size: int = 10000,
+        inst_data: Optional[ConfigurableClassData] = None,
+    ):
+        self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+        self._compression = check.str_param(compression, "compression")
+        self._row_group_size = check.int_param(row_group_size, "row_group_size")
+
+        check.str_param(base_dir, "base_dir")
+        fs = _import_pyarrow_fs()
+        if "://" in base_dir:
+            self._filesystem, self._base_path = fs.FileSystem.from_uri(base_dir)
+        else:
+            self._filesystem = fs.LocalFileSystem()
+            self._base_path = os.path.abspath(base_dir)
+        self._filesystem.create_dir(self._base_path, recursive=True)
+        super().__init__()
+
+    @property
+    def inst_data(self) -> Optional[ConfigurableClassData]:
+        return self._inst_data
+
+    @classmethod
+    def config_type(cls):
+        return {
+            "base_dir": StringSource,
+            "compression": Field(StringSource, is_required=False),
+            "row_group_size": Field(IntSource, is_required=False),
+        }
+
+    @classmethod
+    def from_config_value(
+        cls, inst_data: Optional[ConfigurableClassData], config_value: Mapping[str, Any]
+    ) -> Self:
+        return cls(inst_data=inst_data, **config_value)
+
+    def _path_for_run(self, run_id: str) -> str:
+        return f"{self._base_path}/{run_id}.parquet"
+
+    def _schema(self):
+        pa = _import_pyarrow()
+        return pa.schema(
+            [
+                ("storage_id", pa.int64()),
+                ("dagster_event_type", pa.string()),
+                ("event", pa.large_string()),
+            ]
+        )
+
+    def write_events_for_run(self, run_id: str, rows: Sequence[ArchivedEventLogRow]) -> None:
+        check.str_param(run_id, "run_id")
+        pa = _import_pyarrow()
+        pq = _import_pyarrow_parquet()
+
+        table = pa.Table.from_arrays(
+            [
+                pa.array([row.storage_id for row in rows], type=pa.int64()),
+                pa.array([row.dagster_event_type for row in rows], type=pa.string()),
+                pa.array([row.event for row in rows], type=pa.large_string()),
+            ],
+            schema=self._schema(),
+        )
+
+        # write to a temporary path first, so that readers never see a partially written file
+        path = self._path_for_run(run_id)
+        tmp_path = f"{path}.tmp"
+        pq.write_table(
+            table,
+            tmp_path,
+            filesystem=self._filesystem,
+            compression=self._compression,
+            row_group_size=self._row_group_size,
+        )
+        self._filesystem.move(tmp_path, path)
+
+    def read_events_for_run(
+        self,
+        run_id: str,
+        dagster_event_types: Optional[Set[str]] = None,
+        after_storage_id: Optional[int] = None,
+        before_storage_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+    ) -> Sequence[ArchivedEventLogRow]:
+        check.str_param(run_id, "run_id")
+        check.opt_set_param(dagster_event_types, "dagster_event_types", of_type=str)
+        check.opt_int_param(after_storage_id, "after_storage_id")
+        check.opt_int_param(before_storage_id, "before_storage_id")
+        check.opt_int_param(limit, "limit")
+        check.bool_param(ascending, "ascending")
+        pa = _import_pyarrow()
+        pc = _import_pyarrow_compute()
+        pq = _import_pyarrow_parquet()
+        fs = _import_pyarrow_fs()
+
+        path = self._path_for_run(run_id)
+        if self._filesystem.get_file_info(path).type == fs.FileType.NotFound:
+            return []
+
+        rows: List[ArchivedEventLogRow] = []
+        with self._filesystem.open_input_file(path) as f:
+            parquet_file = pq.ParquetFile(f)
+            # Rows are written in storage id order, so row groups cover increasing ranges of
+            # storage ids. Only the row groups that overlap the requested range are read, in the
+            # requested order, until the limit is reached.
+            row_groups = [
+                i
+                for i in range(parquet_file.num_row_groups)
+                if _row_group_may_overlap(
+                    parquet_file.metadata.row_group(i), after_storage_id, before_storage_id
+                )
+            ]
+            for i in row_groups if ascending else reversed(row_groups):
+                table = parquet_file.read_row_group(i)
+                mask = None
+                if after_storage_id is not None:
+                    mask = _and_mask(pc, mask, pc.greater(table["storage_id"], after_storage_id))
+                if before_storage_id is not None:
+                    mask = _and_mask(pc, mask, pc.less(table["storage_id"], before_storage_id))
+                if dagster_event_types:
+                    mask = _and_mask(
+                        pc,
+                        mask,
+                        pc.is_in(
+                            table["dagster_event_type"],
+                            value_set=pa.array(sorted(dagster_event_types), type=pa.string()),
+                        ),
+                    )
+                if mask is not None:
+                    table = table.filter(mask)
+
+                group_rows = [
+                    ArchivedEventLogRow(storage_id, dagster_event_type, event)
+                    for storage_id, dagster_event_type, event in zip(
+                        table.column("storage_id").to_pylist(),
+                        table.column("dagster_event_type").to_pylist(),
+                        table.column("event").to_pylist(),
+                    )
+                ]
+                rows.extend(group_rows if ascending else reversed(group_rows))
+                if limit and len(rows) >= limit:
+                    break
+
+        return rows[:limit] if limit else rows
+
+    def delete_events_for_run(self, run_id: str) -> None:
+        check.str_param(run_id, "run_id")
+        fs = _import_pyarrow_fs()
+
+        path = self._path_for_run(run_id)
+        if self._filesystem.get_file_info(path).type != fs.FileType.NotFound:
+            self._filesystem.delete_file(path)
+
+
+def is_event_log_archived(instance: "DagsterInstance", run_id: str) -> bool:
+    """Whether some of the event logs of the given run are stored in the instance's archive."""
+    if not instance.event_log_archive:
+        return False
+    run = instance.get_run_by_id(run_id)
+    return bool(run and run.tags.get(EVENT_LOGS_ARCHIVED_TAG))
+
+
+def archive_event_logs(
+    instance: "DagsterInstance",
+    updated_before: datetime,
+    limit: Optional[int] = None,
+    print_fn: Optional[Callable[[str], Any]] = None,
+) -> Sequence[str]:
+    """Moves the event logs of completed runs that were last updated before the given time from the
+    event log storage to the instance's archive. Asset events and run status events are kept in the
+    event log storage.
+
+    Args:
+        instance (DagsterInstance): The instance, which must have an event log archive configured.
+        updated_before (datetime): Only archive the event logs of runs last updated before this time.
+        limit (Optional[int]): The maximum number of runs to archive.
+        print_fn (Optional[Callable[[str], Any]]): Called with a progress message for each run.
+
+    Returns:
+        Sequence[str]: The ids of the runs whose event logs were archived.
+    """
+    check.inst_param(updated_before, "updated_before", datetime)
+    check.opt_int_param(limit, "limit")
+    archive = check.not_none(
+        instance.event_log_archive, "No event log archive is configured on the instance."
+    )
+    event_log_storage = instance.event_log_storage
+    check.invariant(
+        event_log_storage.supports_event_log_archival,
+        "The configured event log storage does not support archiving event logs.",
+    )
+
+    # Every run last updated at or before the watermark has already been considered, so each pass
+    # only scans the runs updated since. Archiving a run tags it, which bumps its update timestamp
+    # past the watermark, so archived runs come back around once and are skipped by their tag.
+    watermark = _get_archive_watermark(instance)
+    # The watermark can only move past a timestamp once every run updated at that time has been
+    # considered, so track the last timestamp for which that is known.
+    completed_timestamp = watermark
+    current_timestamp = watermark
+
+    archived_run_ids: List[str] = []
+    for record in _iterate_run_records_to_archive(instance, updated_before, watermark):
+        if current_timestamp is None or record.update_timestamp > current_timestamp:
+            completed_timestamp = current_timestamp
+            current_timestamp = record.update_timestamp
+
+        if limit is not None and len(archived_run_ids) >= limit:
+            # the current run is left for the next pass, along with any other run updated at the
+            # same time
+            current_timestamp = completed_timestamp
+            break
+
+        run_id = record.dagster_run.run_id
+        if record.dagster_run.tags.get(EVENT_LOGS_ARCHIVED_TAG):
+            continue
+
+        # Write to the archive and mark the run before deleting rows from the event log storage.
+        # Reads dedupe rows that are in both, so an interrupted archival never loses events.
+        last_storage_id = event_log_storage.archive_events(run_id, archive)
+        if last_storage_id is not None:
+            instance.add_run_tags(run_id, {EVENT_LOGS_ARCHIVED_TAG: "true"})
+            event_log_storage.delete_archived_events(run_id, last_storage_id)
+
+        archived_run_ids.append(run_id)
+        if print_fn:
+            print_fn(f"Archived event logs for run {run_id}.")
+
+    if current_timestamp is not None and current_timestamp != watermark:
+        instance.daemon_cursor_storage.set_cursor_values(
+            {ARCHIVE_WATERMARK_KEY: current_timestamp.isoformat()}
+        )
+
+    return archived_run_ids
+
+
+def _get_archive_watermark(instance: "DagsterInstance") -> Optional[datetime]:
+    value = instance.daemon_cursor_storage.get_cursor_values({ARCHIVE_WATERMARK_KEY}).get(
+        ARCHIVE_WATERMARK_KEY
+    )
+    return datetime.fromisoformat(value) if value else None
+
+
+def _iterate_run_records_to_archive(
+    instance: "DagsterInstance", updated_before: datetime, updated_after: Optional[datetime]
+) -> Iterable[RunRecord]:
+    """Yields the records of finished runs updated in the given window, ordered by update timestamp.
+    The runs updated at the same time are paged through by storage id, so none of them are skipped
+    however many there are.
+    """
+    while True:
+        records = instance.get_run_records(
+            filters=RunsFilter(
+                statuses=list(FINISHED_STATUSES),
+                updated_after=updated_after,
+                updated_before=updated_before,
+            ),
+            limit=_RUN_BATCH_SIZE,
+            order_by="update_timestamp",
+            ascending=True,
+        )
+        if len(records) < _RUN_BATCH_SIZE:
+            yield from records
+            return
+
+        # more runs may have been updated at the last timestamp of the batch than fit in it, so
+        # all of the runs updated at that timestamp are paged through by storage id instead
+        last_timestamp = records[-1].update_timestamp
+        yield from (record for record in records if record.update_timestamp < last_timestamp)
+        yield from _iterate_run_records_updated_at(instance, last_timestamp)
+        updated_after = last_timestamp
+
+
+def _iterate_run_records_updated_at(
+    instance: "DagsterInstance", update_timestamp: datetime
+) -> Iterable[RunRecord]:
+    """Yields the records of finished runs updated at exactly the given time, by descending storage
+    id.
+    """
+    # timestamps are stored with at most microsecond precision
+    precision = timedelta(microseconds=1)
+    records: Sequence[RunRecord] = []
+    while True:
+        records = instance.get_run_records(
+            filters=RunsFilter(
+                statuses=list(FINISHED_STATUSES),
+                updated_after=update_timestamp - precision,
+                updated_before=update_timestamp + precision,
+            ),
+            limit=_RUN_BATCH_SIZE,
+            cursor=records[-1].dagster_run.run_id if records else None,
+        )
+        yield from records
+        if len(records) < _RUN_BATCH_SIZE:
+            return
+
+
+def _row_group_may_overlap(
+    row_group_metadata: Any, after_storage_id: Optional[int], before_storage_id: Optional[int]
+) -> bool:
+    # storage_id is the first column of the schema
+    statistics = row_group_metadata.column(0).statistics
+    if statistics is None or not statistics.has_min_max:
+        return True
+    if after_storage_id is not None and statistics.max <= after_storage_id:
+        return False
+    if before_storage_id is not None and statistics.min >= before_storage_id:
+        return False
+    return True
+
+
+def _and_mask(pc: Any, mask: Any, condition: Any) -> Any:
+    return condition if mask is None else pc.and_(mask, condition)
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "Archiving event logs to Parquet requires the pyarrow package. Install it with `pip"
+            " install dagster[pyarrow]`."
+        )
+    return pyarrow
+
+
+def _import_pyarrow_fs() -> Any:
+    _import_pyarrow()
+    import pyarrow.fs
+
+    return pyarrow.fs
+
+
+def _import_pyarrow_compute() -> Any:
+    _import_pyarrow()
+    import pyarrow.compute
+
+    return pyarrow.compute
+
+
+def _import_pyarrow_parquet() -> Any:
+    _import_pyarrow()
+    import pyarrow.parquet
+
+    return pyarrow.parquet
@@ -16,6 +16,7 @@
 import dagster._check as check
 from dagster._core.assets import AssetDetails
 from dagster._core.definitions.events import AssetKey
+from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.event_api import EventHandlerFn, EventLogRecord, EventRecordsFilter
 from dagster._core.events import DagsterEventType
 from dagster._core.execution.stats import (
@@ -32,6 +33,7 @@
 
 if TYPE_CHECKING:
     from dagster._core.events.log import EventLogEntry
+    from dagster._core.storage.event_log.archive import EventLogArchive
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
 
@@ -225,10 +227,51 @@ def store_event(self, event: "EventLogEntry") -> None:
             event (EventLogEntry): The event to store.
         """
 
+    def store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        """Store a batch of events, in order. Storages that can write multiple events in a single
+        round trip should override this method.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str) -> None:
         """Remove events for a given run id."""
 
+    @property
+    def supports_event_log_archival(self) -> bool:
+        """Indicates that the EventLogStorage can move the event logs of runs to an
+        EventLogArchive.
+        """
+        return False
+
+    def archive_events(self, run_id: str, archive: "EventLogArchive") -> Optional[int]:
+        """Write the events of a run that are not needed for queries across runs (i.e. all events
+        other than asset events and run status events) to the given archive.
+
+        Returns:
+            Optional[int]: The storage id of the last archived event, or None if there were no
+                events to archive.
+        """
+        self._check_supports_event_log_archival()
+        raise NotImplementedError()
+
+    def delete_archived_events(self, run_id: str, up_to_storage_id: int) -> None:
+        """Remove the events of a run that were written to an archive by `archive_events`, up to
+        and including the given storage id.
+        """
+        self._check_supports_event_log_archival()
+        raise NotImplementedError()
+
+    def _check_supports_event_log_archival(self) -> None:
+        if not self.supports_event_log_archival:
+            raise DagsterInvariantViolationError(
+                f"{self.__class__.__name__} does not support archiving event logs."
+            )
+
     @abstractmethod
     def upgrade(self) -> None:
         """This method should perform any schema migrations necessary to bring an
@@ -255,6 +298,13 @@ def watch(self, run_id: str, cursor: Optional[str], callback: EventHandlerFn) ->
     def end_watch(self, run_id: str, handler: EventHandlerFn) -> None:
         """Call this method to stop watching."""
 
+    @property
+    def supports_push_event_watch(self) -> bool:
+        """bool: Whether `watch` calls back as soon as new events are stored, rather than by
+        polling the storage for them.
+        """
+        return False
+
     @property
     @abstractmethod
     def is_persistent(self) -> bool:
@@ -291,6 +341,26 @@ def get_maximum_record_id(self) -> Optional[int]:
         """Get the current greatest record id in the event log. Only supported for non sharded sql storage."""
         raise NotImplementedError()
 
+    @property
+    def supports_multi_run_records(self) -> bool:
+        """Indicates that the EventLogStorage can fetch the records of several runs in one query,
+        ordered by storage id, via `get_records_for_runs`.
+        """
+        return False
+
+    def get_records_for_runs(
+        self,
+        run_ids: Sequence[str],
+        after_storage_id: int = -1,
+        limit: Optional[int] = None,
+        after_storage_id_by_run_id: Optional[Mapping[str, int]] = None,
+    ) -> Sequence[EventLogRecord]:
+        """Get the event log records for a set of runs with storage ids greater than the given
+        storage id, or than the storage id given for the run in `after_storage_id_by_run_id`, in
+        ascending storage id order. Only supported if `supports_multi_run_records`.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def can_cache_asset_status_data(self) -> bool:
         pass
@@ -2,11 +2,12 @@
 import uuid
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import Callable, Optional
+from typing import Callable, Optional, Sequence
 
 import sqlalchemy as db
 from sqlalchemy.pool import NullPool
 
+from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.sql import create_engine, get_alembic_config, stamp_alembic_rev
 from dagster._core.storage.sqlite import create_in_memory_conn_string
@@ -91,6 +92,20 @@ def store_event(self, event):
             except Exception:
                 logging.exception("Exception in callback for event watch on run %s.", event.run_id)
 
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        super(InMemoryEventLogStorage, self).store_events(events)
+
+        for event in events:
+            self._storage_id += 1
+            handlers = list(self._handlers[event.run_id])
+            for handler in handlers:
+                try:
+                    handler(event, str(EventLogCursor.from_storage_id(self._storage_id)))
+                except Exception:
+                    logging.exception(
+                        "Exception in callback for event watch on run %s.", event.run_id
+                    )
+
     def watch(self, run_id: str, cursor: str, callback: Callable):
         self._handlers[run_id].add(callback)
 
@@ -98,6 +113,10 @@ def end_watch(self, run_id: str, handler: Callable):
         if handler in self._handlers[run_id]:
             self._handlers[run_id].remove(handler)
 
+    @property
+    def supports_push_event_watch(self) -> bool:
+        return True
+
     @property
     def is_persistent(self) -> bool:
         return False
@@ -11,9 +11,17 @@
 
 SECONDARY_INDEX_ASSET_KEY = "asset_key_table"  # builds the asset key table from the event log
 ASSET_KEY_INDEX_COLS = "asset_key_index_columns"  # extracts index columns from the asset_keys table
+RUN_STATS_INDEX = (  # builds the run_stats and step_stats tables from the event log
+    "run_stats_tables"
+)
+ASSET_PARTITION_EVENTS_INDEX = (  # builds the asset_partition_events table from the event log
+    "asset_partition_events_table"
+)
 
 EVENT_LOG_DATA_MIGRATIONS = {
     SECONDARY_INDEX_ASSET_KEY: lambda: migrate_asset_key_data,
+    RUN_STATS_INDEX: lambda: migrate_run_stats_data,
+    ASSET_PARTITION_EVENTS_INDEX: lambda: migrate_asset_partition_events_data,
 }
 ASSET_DATA_MIGRATIONS = {ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns}
 
@@ -73,6 +81,74 @@ def migrate_asset_key_data(event_log_storage, print_fn=None):
                 pass
 
 
+def migrate_run_stats_data(event_log_storage, print_fn=None):
+    """Utility method to build the run stats and step stats tables from the data in existing event
+    log records. Takes in event_log_storage, and a print_fn to keep track of progress.
+    """
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    from .schema import SqlEventLogStorageTable
+
+    if not isinstance(event_log_storage, SqlEventLogStorage) or event_log_storage.is_run_sharded:
+        return
+
+    query = (
+        db_select([SqlEventLogStorageTable.c.run_id])
+        .where(SqlEventLogStorageTable.c.run_id != None)  # noqa: E711
+        .group_by(SqlEventLogStorageTable.c.run_id)
+    )
+    with event_log_storage.index_connection() as conn:
+        if print_fn:
+            print_fn("Querying event logs.")
+        run_ids = [run_id for (run_id,) in conn.execute(query).fetchall()]
+
+    if print_fn:
+        print_fn(f"Found {len(run_ids)} runs to index")
+        run_ids = tqdm(run_ids)
+
+    for run_id in run_ids:
+        event_log_storage.rebuild_run_stats(run_id)
+
+
+def migrate_asset_partition_events_data(event_log_storage, print_fn=None):
+    """Utility method to build the asset partition events table from the data in existing event log
+    records. Takes in event_log_storage, and a print_fn to keep track of progress.
+    """
+    from dagster._core.definitions.events import AssetKey
+    from dagster._core.events import ASSET_EVENTS
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    from .schema import SqlEventLogStorageTable
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    query = (
+        db_select([SqlEventLogStorageTable.c.asset_key])
+        .where(SqlEventLogStorageTable.c.asset_key != None)  # noqa: E711
+        .where(SqlEventLogStorageTable.c.partition != None)  # noqa: E711
+        .where(
+            SqlEventLogStorageTable.c.dagster_event_type.in_(
+                [event_type.value for event_type in ASSET_EVENTS]
+            )
+        )
+        .group_by(SqlEventLogStorageTable.c.asset_key)
+    )
+    with event_log_storage.index_connection() as conn:
+        if print_fn:
+            print_fn("Querying event logs.")
+        asset_key_strs = [asset_key_str for (asset_key_str,) in conn.execute(query).fetchall()]
+
+    if print_fn:
+        print_fn(f"Found {len(asset_key_strs)} partitioned assets to index")
+        asset_key_strs = tqdm(asset_key_strs)
+
+    for asset_key_str in asset_key_strs:
+        asset_key = AssetKey.from_db_string(asset_key_str)
+        if asset_key:
+            event_log_storage.rebuild_asset_partition_events(asset_key)
+
+
 def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
     from dagster._core.definitions.events import AssetKey
     from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
@@ -1,12 +1,15 @@
+import logging
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+from collections import defaultdict
+from typing import Callable, Dict, List, MutableMapping, NamedTuple, Optional, Sequence, Set
 
 import dagster._check as check
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventLogStorage
 
 INIT_POLL_PERIOD = 0.250  # 250ms
 MAX_POLL_PERIOD = 16.0  # 16s
+MAX_RECORDS_PER_POLL = 1000
 
 
 class CallbackAfterCursor(NamedTuple):
@@ -171,3 +174,239 @@ def run(self):
                                 str(EventLogCursor.from_storage_id(event_record.storage_id)),
                             )
             wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+
+
+class SqlPollingMultiRunEventWatcher:
+    """Event Log Watcher that polls the event log for every watched run_id from a single thread.
+
+    Each poll issues one query for the records of all watched runs past each run's own cursor, and
+    fans the results out to the callbacks registered for each run, so the number of threads and
+    queries does not grow with the number of watched runs. Keeping a cursor per run, rather than one
+    across runs, means that a record that is committed after records of other runs with greater
+    storage ids is still picked up. When a run starts being watched, it is first caught up with a
+    single per-run query from its callbacks' cursors.
+
+    Callbacks are called without holding the lock, so that they may watch or stop watching runs.
+
+    Requires an event log storage that supports cross-run queries by storage id, i.e. one whose
+    `supports_multi_run_records` is True.
+
+    LOCKING INFO:
+        INVARIANTS: _lock protects _callbacks_by_run_id, _cursor_by_run_id, and _runs_to_catch_up
+    """
+
+    def __init__(
+        self,
+        event_log_storage: EventLogStorage,
+        max_records_per_poll: int = MAX_RECORDS_PER_POLL,
+    ):
+        self._event_log_storage = check.inst_param(
+            event_log_storage, "event_log_storage", EventLogStorage
+        )
+        check.invariant(
+            event_log_storage.supports_multi_run_records,
+            "SqlPollingMultiRunEventWatcher requires an event log storage that supports fetching"
+            " the records of several runs at once",
+        )
+        self._max_records_per_poll = check.int_param(max_records_per_poll, "max_records_per_poll")
+
+        self._lock: threading.Lock = threading.Lock()
+        self._callbacks_by_run_id: Dict[str, List[CallbackAfterCursor]] = {}
+        # storage id of the last record dispatched for each run, None if nothing has been seen yet
+        self._cursor_by_run_id: Dict[str, Optional[int]] = {}
+        self._runs_to_catch_up: Set[str] = set()
+
+        self._wake_event = threading.Event()
+        self._should_thread_exit = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._disposed = False
+
+    def has_run_id(self, run_id: str) -> bool:
+        run_id = check.str_param(run_id, "run_id")
+        with self._lock:
+            return run_id in self._callbacks_by_run_id
+
+    def watch_run(
+        self, run_id: str, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]
+    ):
+        run_id = check.str_param(run_id, "run_id")
+        cursor = check.opt_str_param(cursor, "cursor")
+        callback = check.callable_param(callback, "callback")
+        with self._lock:
+            if run_id not in self._callbacks_by_run_id:
+                self._callbacks_by_run_id[run_id] = []
+                self._cursor_by_run_id[run_id] = (
+                    EventLogCursor.parse(cursor).storage_id() if cursor else None
+                )
+                self._runs_to_catch_up.add(run_id)
+            elif run_id in self._runs_to_catch_up:
+                # not yet caught up, so start the catch up query from the earliest cursor
+                self._cursor_by_run_id[run_id] = _min_storage_id(
+                    self._cursor_by_run_id[run_id],
+                    EventLogCursor.parse(cursor).storage_id() if cursor else None,
+                )
+            self._callbacks_by_run_id[run_id].append(CallbackAfterCursor(cursor, callback))
+
+            if self._thread is None and not self._disposed:
+                self._thread = threading.Thread(
+                    target=self._run, name="sql-event-watch-multi-run", daemon=True
+                )
+                self._thread.start()
+
+        # poll right away so the new watcher does not wait out the current backoff period
+        self._wake_event.set()
+
+    def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]):
+        run_id = check.str_param(run_id, "run_id")
+        handler = check.callable_param(handler, "handler")
+        with self._lock:
+            if run_id not in self._callbacks_by_run_id:
+                return
+            callbacks = [
+                callback_with_cursor
+                for callback_with_cursor in self._callbacks_by_run_id[run_id]
+                if callback_with_cursor.callback != handler
+            ]
+            if callbacks:
+                self._callbacks_by_run_id[run_id] = callbacks
+            else:
+                del self._callbacks_by_run_id[run_id]
+                del self._cursor_by_run_id[run_id]
+                self._runs_to_catch_up.discard(run_id)
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        if not self._disposed:
+            self._disposed = True
+            self._should_thread_exit.set()
+            self._wake_event.set()
+            if self._thread and self._thread is not threading.current_thread():
+                self._thread.join()
+            with self._lock:
+                self._callbacks_by_run_id = {}
+                self._cursor_by_run_id = {}
+                self._runs_to_catch_up = set()
+
+    def _run(self):
+        """Polling function to update Observers with EventLogEntrys from Event Log DB.
+        Wakes every poll period, or as soon as a new run is watched, and fetches new records for
+        all of the watched runs. Backs off up to MAX_POLL_PERIOD while no new records arrive.
+        """
+        wait_time = INIT_POLL_PERIOD
+        while not self._should_thread_exit.is_set():
+            self._wake_event.wait(wait_time)
+            self._wake_event.clear()
+            if self._should_thread_exit.is_set():
+                break
+
+            try:
+                has_new_records = self._poll()
+            except Exception:
+                logging.exception("Exception while polling the event log for watched runs.")
+                has_new_records = False
+
+            wait_time = INIT_POLL_PERIOD if has_new_records else min(wait_time * 2, MAX_POLL_PERIOD)
+
+    def _poll(self) -> bool:
+        with self._lock:
+            catch_up_cursors = {
+                run_id: self._cursor_by_run_id[run_id] for run_id in self._runs_to_catch_up
+            }
+            self._runs_to_catch_up = set()
+
+        has_new_records = False
+        for run_id, cursor in catch_up_cursors.items():
+            has_new_records = self._catch_up(run_id, cursor) or has_new_records
+
+        with self._lock:
+            cursor_by_run_id = {
+                run_id: cursor if cursor is not None else -1
+                for run_id, cursor in self._cursor_by_run_id.items()
+                if run_id not in self._runs_to_catch_up
+            }
+
+        if not cursor_by_run_id:
+            return has_new_records
+
+        records = self._event_log_storage.get_records_for_runs(
+            list(cursor_by_run_id.keys()),
+            limit=self._max_records_per_poll,
+            after_storage_id_by_run_id=cursor_by_run_id,
+        )
+
+        records_by_run_id: Dict[str, List[EventLogRecord]] = defaultdict(list)
+        for record in records:
+            records_by_run_id[record.event_log_entry.run_id].append(record)
+        for run_id, run_records in records_by_run_id.items():
+            has_new_records = self._dispatch(run_id, run_records) or has_new_records
+
+        # poll again right away if the query was truncated
+        return has_new_records or len(records) >= self._max_records_per_poll
+
+    def _catch_up(self, run_id: str, cursor: Optional[int]) -> bool:
+        """Dispatches the records of a newly watched run after the given storage id, one page of
+        max_records_per_poll records at a time.
+        """
+        has_new_records = False
+        while True:
+            connection = self._event_log_storage.get_records_for_run(
+                run_id,
+                cursor=(
+                    EventLogCursor.from_storage_id(cursor).to_string()
+                    if cursor is not None
+                    else None
+                ),
+                limit=self._max_records_per_poll,
+            )
+            has_new_records = self._dispatch(run_id, connection.records) or has_new_records
+            if not connection.has_more or not connection.records:
+                return has_new_records
+            cursor = connection.records[-1].storage_id
+
+    def _dispatch(self, run_id: str, records: Sequence[EventLogRecord]) -> bool:
+        """Fires the callbacks watching the given run on each record past the run's cursor,
+        returning whether any such record was found.
+        """
+        with self._lock:
+            if run_id not in self._callbacks_by_run_id:
+                return False
+
+            run_cursor = self._cursor_by_run_id.get(run_id)
+            new_records = [
+                event_record
+                for event_record in records
+                if run_cursor is None or event_record.storage_id > run_cursor
+            ]
+            if not new_records:
+                return False
+
+            self._cursor_by_run_id[run_id] = new_records[-1].storage_id
+            callbacks = list(self._callbacks_by_run_id[run_id])
+
+        for event_record in new_records:
+            for callback_with_cursor in callbacks:
+                if not (
+                    callback_with_cursor.cursor is None
+                    or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
+                    < event_record.storage_id
+                ):
+                    continue
+
+                with self._lock:
+                    # a callback may have stopped watching the run
+                    is_watching = callback_with_cursor in self._callbacks_by_run_id.get(run_id, [])
+                if is_watching:
+                    callback_with_cursor.callback(
+                        event_record.event_log_entry,
+                        str(EventLogCursor.from_storage_id(event_record.storage_id)),
+                    )
+
+        return True
+
+
+def _min_storage_id(left: Optional[int], right: Optional[int]) -> Optional[int]:
+    if left is None or right is None:
+        return None
+    return min(left, right)
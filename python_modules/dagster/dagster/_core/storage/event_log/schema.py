@@ -137,6 +137,69 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
 )
 
+RunStatsTable = db.Table(
+    "run_stats",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", db.String(255), unique=True, nullable=False),
+    db.Column("steps_succeeded", db.Integer, nullable=False, default=0),
+    db.Column("steps_failed", db.Integer, nullable=False, default=0),
+    db.Column("materializations", db.Integer, nullable=False, default=0),
+    db.Column("expectations", db.Integer, nullable=False, default=0),
+    db.Column("enqueued_time", db.types.TIMESTAMP),
+    db.Column("launch_time", db.types.TIMESTAMP),
+    db.Column("start_time", db.types.TIMESTAMP),
+    db.Column("end_time", db.types.TIMESTAMP),
+)
+
+StepStatsTable = db.Table(
+    "step_stats",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("step_key", db.Text, nullable=False),
+    # a hash of the step key, which is unique per run. MySQL can only index a prefix of the step key
+    # itself, which step keys may share
+    db.Column("step_key_hash", db.String(64), nullable=False),
+    # one row per step, holding the serialized stats of the step folded over its events so far. The
+    # version is incremented on every update, so that concurrent writers can detect conflicts
+    db.Column("version", db.Integer, nullable=False, default=0),
+    db.Column("stats", db.Text, nullable=False),
+)
+
+# One row per (asset key, partition, event type), summarizing the asset events of that type for
+# that partition, so that per-partition lookups do not need to aggregate over the event log
+AssetPartitionEventsTable = db.Table(
+    "asset_partition_events",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("asset_key", db.Text, nullable=False),
+    db.Column("partition", db.Text, nullable=False),
+    # hashes of the asset key and partition, which are unique per event type. MySQL can only index
+    # a prefix of the asset key and partition themselves, which they may share
+    db.Column("asset_key_hash", db.String(64), nullable=False),
+    db.Column("partition_hash", db.String(64), nullable=False),
+    db.Column("dagster_event_type", db.Text, nullable=False),
+    db.Column("last_event_id", db.BigInteger, nullable=False),
+    db.Column("last_run_id", db.String(255)),
+    db.Column("event_count", db.Integer, nullable=False, default=0),
+)
+
 db.Index(
     "idx_step_key",
     SqlEventLogStorageTable.c.step_key,
@@ -202,3 +265,24 @@
     mysql_length={"concurrency_key": 255, "run_id": 255, "step_key": 32},
     unique=True,
 )
+db.Index(
+    "idx_step_stats",
+    StepStatsTable.c.run_id,
+    StepStatsTable.c.step_key_hash,
+    unique=True,
+)
+db.Index(
+    "idx_asset_partition_events",
+    AssetPartitionEventsTable.c.asset_key,
+    AssetPartitionEventsTable.c.dagster_event_type,
+    AssetPartitionEventsTable.c.partition,
+    mysql_length={"asset_key": 255, "dagster_event_type": 64, "partition": 255},
+)
+db.Index(
+    "idx_asset_partition_events_hash",
+    AssetPartitionEventsTable.c.asset_key_hash,
+    AssetPartitionEventsTable.c.dagster_event_type,
+    AssetPartitionEventsTable.c.partition_hash,
+    mysql_length={"dagster_event_type": 64},
+    unique=True,
+)
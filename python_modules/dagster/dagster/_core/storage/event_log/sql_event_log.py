@@ -1,7 +1,11 @@
+import hashlib
 import logging
+import time
 from abc import abstractmethod
 from collections import OrderedDict, defaultdict
 from datetime import datetime
+from functools import cached_property
+from itertools import groupby
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -35,9 +39,19 @@
     DagsterInvariantViolationError,
 )
 from dagster._core.event_api import RunShardedEventsCursor
-from dagster._core.events import ASSET_EVENTS, MARKER_EVENTS, DagsterEventType
+from dagster._core.events import (
+    ASSET_EVENTS,
+    EVENT_TYPE_TO_PIPELINE_RUN_STATUS,
+    MARKER_EVENTS,
+    DagsterEventType,
+)
 from dagster._core.events.log import EventLogEntry
-from dagster._core.execution.stats import RunStepKeyStatsSnapshot, build_run_step_stats_from_events
+from dagster._core.execution.stats import (
+    RunStepKeyStatsAggregate,
+    RunStepKeyStatsSnapshot,
+    build_run_stats_from_events,
+    build_run_step_stats_from_events,
+)
 from dagster._core.storage.sql import SqlAlchemyQuery, SqlAlchemyRow
 from dagster._core.storage.sqlalchemy_compat import (
     db_case,
@@ -48,6 +62,7 @@
 from dagster._serdes import (
     deserialize_value,
     serialize_value,
+    serialize_value_to_binary_str,
 )
 from dagster._serdes.errors import DeserializationError
 from dagster._utils import (
@@ -62,7 +77,14 @@
     ConcurrencySlotStatus,
 )
 
-from ..dagster_run import DagsterRunStatsSnapshot
+from ..dagster_run import FINISHED_STATUSES, DagsterRunStatsSnapshot
+from .archive import (
+    EVENT_LOGS_ARCHIVED_TAG,
+    UNARCHIVED_EVENT_TYPES,
+    ArchivedEventLogRow,
+    EventLogArchive,
+    is_event_log_archived,
+)
 from .base import (
     AssetEntry,
     AssetRecord,
@@ -72,23 +94,91 @@
     EventLogStorage,
     EventRecordsFilter,
 )
-from .migration import ASSET_DATA_MIGRATIONS, ASSET_KEY_INDEX_COLS, EVENT_LOG_DATA_MIGRATIONS
+from .migration import (
+    ASSET_DATA_MIGRATIONS,
+    ASSET_KEY_INDEX_COLS,
+    ASSET_PARTITION_EVENTS_INDEX,
+    EVENT_LOG_DATA_MIGRATIONS,
+    RUN_STATS_INDEX,
+)
 from .schema import (
     AssetEventTagsTable,
     AssetKeyTable,
+    AssetPartitionEventsTable,
     ConcurrencySlotsTable,
     DynamicPartitionsTable,
     PendingStepsTable,
+    RunStatsTable,
     SecondaryIndexMigrationTable,
     SqlEventLogStorageTable,
+    StepStatsTable,
 )
 
 if TYPE_CHECKING:
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
 MAX_CONCURRENCY_SLOTS = 1000
+
+# A table that was missing is checked for again after this many seconds
+MISSING_TABLE_RECHECK_INTERVAL_SECONDS = 60
 MIN_ASSET_ROWS = 25
 
+# Caps the number of rows written by a single multi-row event insert, keeping each statement well
+# below the bound parameter limits of the supported databases
+MAX_EVENT_INSERT_BATCH_SIZE = 100
+
+# Run-level events that are counted in the run_stats table, keyed by their counter column
+RUN_STATS_COUNT_COLUMNS = {
+    DagsterEventType.STEP_SUCCESS: "steps_succeeded",
+    DagsterEventType.STEP_FAILURE: "steps_failed",
+    DagsterEventType.ASSET_MATERIALIZATION: "materializations",
+    DagsterEventType.STEP_EXPECTATION_RESULT: "expectations",
+}
+
+# Run-level events whose latest timestamp is tracked in the run_stats table, keyed by column
+RUN_STATS_TIME_COLUMNS = {
+    DagsterEventType.PIPELINE_ENQUEUED: "enqueued_time",
+    DagsterEventType.PIPELINE_STARTING: "launch_time",
+    DagsterEventType.PIPELINE_START: "start_time",
+    DagsterEventType.PIPELINE_SUCCESS: "end_time",
+    DagsterEventType.PIPELINE_FAILURE: "end_time",
+    DagsterEventType.PIPELINE_CANCELED: "end_time",
+}
+
+# Caps the number of times the stats row of a step is re-read and written back when concurrent
+# writers for the same step conflict
+MAX_STEP_STATS_UPDATE_ATTEMPTS = 10
+
+# Step-level events that step stats are derived from
+STEP_STATS_EVENT_TYPES = [
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    *MARKER_EVENTS,
+]
+
+# Step-level events that are only counted in the step_stats table, and are read from the event log
+# when the step stats are read
+STEP_STATS_COUNTED_EVENT_TYPES = {
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+}
+
+# The values of the event types that mark a run as finished. These events are never archived.
+RUN_FINISHED_EVENT_TYPE_VALUES = {
+    event_type.value
+    for event_type, status in EVENT_TYPE_TO_PIPELINE_RUN_STATUS.items()
+    if status in FINISHED_STATUSES
+}
+
+# The maximum number of runs whose archival status is cached by each event log storage
+MAX_ARCHIVED_RUN_CACHE_SIZE = 1000
+
 # We are using third-party library objects for DB connections-- at this time, these libraries are
 # untyped. When/if we upgrade to typed variants, the `Any` here can be replaced or the alias as a
 # whole can be dropped.
@@ -125,6 +215,55 @@ def upgrade(self) -> None:
     def has_table(self, table_name: str) -> bool:
         """This method checks if a table exists in the database."""
 
+    @cached_property
+    def _table_existence_cache(self) -> Dict[str, Tuple[bool, float]]:
+        return {}
+
+    def _has_table_cached(self, table_name: str) -> bool:
+        """Checks if a table exists, for tables whose existence gates every event write. A table
+        that exists is only checked for once per storage instance. A missing table is checked for
+        again after MISSING_TABLE_RECHECK_INTERVAL_SECONDS, so that the storage picks up tables
+        created by a migration in another process, or right away after `upgrade`.
+        """
+        now = time.time()
+        cached = self._table_existence_cache.get(table_name)
+        if cached is None or (
+            not cached[0] and now - cached[1] >= MISSING_TABLE_RECHECK_INTERVAL_SECONDS
+        ):
+            cached = (self.has_table(table_name), now)
+            self._table_existence_cache[table_name] = cached
+        return cached[0]
+
+    def _clear_table_existence_cache(self) -> None:
+        """Called after running schema migrations, which may have created tables."""
+        self._table_existence_cache.clear()
+
+    @cached_property
+    def _archived_run_cache(self) -> "OrderedDict[str, bool]":
+        return OrderedDict()
+
+    def _is_event_log_archived_cached(self, run_id: str) -> bool:
+        """Checks if some of the event logs of a run have been archived. Looking up the run on every
+        read of a run that is in progress, like every poll of a run that is being watched, is
+        wasteful, so the result is cached for runs that have been archived, which stay archived, and
+        for runs that have not finished, which can't be archived before they finish. The cached
+        result for an unfinished run is dropped by `get_records_for_run` once it reads the event
+        that finished the run, which is never archived.
+        """
+        archived = self._archived_run_cache.get(run_id)
+        if archived is not None:
+            return archived
+
+        run = self._instance.get_run_by_id(run_id)
+        if run is None:
+            return False
+        archived = bool(run.tags.get(EVENT_LOGS_ARCHIVED_TAG))
+        if archived or not run.is_finished:
+            self._archived_run_cache[run_id] = archived
+            while len(self._archived_run_cache) > MAX_ARCHIVED_RUN_CACHE_SIZE:
+                self._archived_run_cache.popitem(last=False)
+        return archived
+
     def prepare_insert_event(self, event):
         """Helper method for preparing the event log SQL insertion statement.  Abstracted away to
         have a single place for the logical table representation of the event, while having a way
@@ -132,6 +271,10 @@ def prepare_insert_event(self, event):
         the `dagster-postgres` implementation which overrides the generic SQL implementation of
         `store_event`.
         """
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(**self._get_event_insert_values(event))
+
+    def _get_event_insert_values(self, event: EventLogEntry) -> Dict[str, Any]:
         dagster_event_type = None
         asset_key_str = None
         partition = None
@@ -145,10 +288,9 @@ def prepare_insert_event(self, event):
             if event.dagster_event.partition:
                 partition = event.dagster_event.partition
 
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(
+        return dict(
             run_id=event.run_id,
-            event=serialize_value(event),
+            event=self._serialize_event(event),
             dagster_event_type=dagster_event_type,
             # Postgres requires a datetime that is in UTC but has no timezone info set
             # in order to be stored correctly
@@ -158,6 +300,11 @@ def prepare_insert_event(self, event):
             partition=partition,
         )
 
+    def _serialize_event(self, event: EventLogEntry) -> str:
+        if self.has_instance and self._instance.binary_serdes_event_log_enabled:
+            return serialize_value_to_binary_str(event)
+        return serialize_value(event)
+
     def has_asset_key_col(self, column_name: str) -> bool:
         with self.index_connection() as conn:
             column_names = [x.get("name") for x in db.inspect(conn).get_columns(AssetKeyTable.name)]
@@ -185,22 +332,27 @@ def store_asset_event(self, event: EventLogEntry, event_id: int):
         # https://github.com/dagster-io/dagster/issues/3945
 
         values = self._get_asset_entry_values(event, event_id, self.has_asset_key_index_cols())
-        insert_statement = AssetKeyTable.insert().values(
-            asset_key=event.dagster_event.asset_key.to_string(), **values
-        )
+        with self.index_connection() as conn:
+            self._upsert_asset_entry(conn, event.dagster_event.asset_key.to_string(), values)
+
+        self.store_asset_partition_events([(event, event_id)])
+
+    def _upsert_asset_entry(
+        self, conn: Connection, asset_key_str: str, values: Mapping[str, Any]
+    ) -> None:
+        insert_statement = AssetKeyTable.insert().values(asset_key=asset_key_str, **values)
         update_statement = (
             AssetKeyTable.update()
             .values(**values)
             .where(
-                AssetKeyTable.c.asset_key == event.dagster_event.asset_key.to_string(),
+                AssetKeyTable.c.asset_key == asset_key_str,
             )
         )
 
-        with self.index_connection() as conn:
-            try:
-                conn.execute(insert_statement)
-            except db_exc.IntegrityError:
-                conn.execute(update_statement)
+        try:
+            conn.execute(insert_statement)
+        except db_exc.IntegrityError:
+            conn.execute(update_statement)
 
     def _get_asset_entry_values(
         self, event: EventLogEntry, event_id: int, has_asset_key_index_cols: bool
@@ -337,39 +489,46 @@ def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         check.int_param(event_id, "event_id")
 
-        if event.dagster_event and event.dagster_event.asset_key:
-            if event.dagster_event.is_step_materialization:
-                tags = event.dagster_event.step_materialization_data.materialization.tags
-            elif event.dagster_event.is_asset_observation:
-                tags = event.dagster_event.asset_observation_data.asset_observation.tags
-            else:
-                tags = None
+        tag_rows = self._get_asset_event_tag_rows(event, event_id)
+        if not tag_rows or not self.has_table(AssetEventTagsTable.name):
+            # If tags table does not exist, silently exit. This is to support OSS
+            # users who have not yet run the migration to create the table.
+            # On read, we will throw an error if the table does not exist.
+            return
 
-            if not tags or not self.has_table(AssetEventTagsTable.name):
-                # If tags table does not exist, silently exit. This is to support OSS
-                # users who have not yet run the migration to create the table.
-                # On read, we will throw an error if the table does not exist.
-                return
+        with self.index_connection() as conn:
+            conn.execute(AssetEventTagsTable.insert(), tag_rows)
 
-            check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
-            asset_key_str = event.dagster_event.asset_key.to_string()
+    def _get_asset_event_tag_rows(
+        self, event: EventLogEntry, event_id: int
+    ) -> Sequence[Mapping[str, Any]]:
+        if not (event.dagster_event and event.dagster_event.asset_key):
+            return []
 
-            with self.index_connection() as conn:
-                conn.execute(
-                    AssetEventTagsTable.insert(),
-                    [
-                        dict(
-                            event_id=event_id,
-                            asset_key=asset_key_str,
-                            key=key,
-                            value=value,
-                            # Postgres requires a datetime that is in UTC but has no timezone info
-                            # set in order to be stored correctly
-                            event_timestamp=datetime.utcfromtimestamp(event.timestamp),
-                        )
-                        for key, value in tags.items()
-                    ],
-                )
+        if event.dagster_event.is_step_materialization:
+            tags = event.dagster_event.step_materialization_data.materialization.tags
+        elif event.dagster_event.is_asset_observation:
+            tags = event.dagster_event.asset_observation_data.asset_observation.tags
+        else:
+            tags = None
+
+        if not tags:
+            return []
+
+        check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
+        asset_key_str = event.dagster_event.asset_key.to_string()
+        return [
+            dict(
+                event_id=event_id,
+                asset_key=asset_key_str,
+                key=key,
+                value=value,
+                # Postgres requires a datetime that is in UTC but has no timezone info
+                # set in order to be stored correctly
+                event_timestamp=datetime.utcfromtimestamp(event.timestamp),
+            )
+            for key, value in tags.items()
+        ]
 
     def store_event(self, event: EventLogEntry) -> None:
         """Store an event corresponding to a pipeline run.
@@ -401,6 +560,96 @@ def store_event(self, event: EventLogEntry) -> None:
 
             self.store_asset_event_tags(event, event_id)
 
+        self.store_run_stats([event])
+
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events corresponding to one or more runs.
+
+        Consecutive events for the same run are written with multi-row inserts over a single
+        connection. Asset events are inserted individually, since their storage ids are needed to
+        index them, and the resulting asset key upserts and asset event tags are then written
+        in bulk over a single index connection.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        stored_asset_events: List[Tuple[EventLogEntry, int]] = []
+        for run_id, run_events in groupby(events, key=lambda event: event.run_id):
+            with self.run_connection(run_id) as conn:
+                stored_asset_events.extend(self._insert_event_batch(conn, list(run_events)))
+
+        self.store_asset_events(stored_asset_events)
+        self.store_run_stats(events)
+
+    def _insert_event_batch(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Tuple[EventLogEntry, int]]:
+        """Inserts the given events in order, returning the storage ids of any asset events."""
+        stored_asset_events: List[Tuple[EventLogEntry, int]] = []
+        pending_rows: List[Mapping[str, Any]] = []
+
+        for event in events:
+            if not _is_indexed_asset_event(event):
+                pending_rows.append(self._get_event_insert_values(event))
+                continue
+
+            # flush buffered rows first so that storage ids respect the order of the batch
+            self._insert_event_rows(conn, pending_rows)
+            pending_rows = []
+
+            result = conn.execute(self.prepare_insert_event(event))
+            event_id = result.inserted_primary_key[0]
+            if event_id is None:
+                raise DagsterInvariantViolationError(
+                    "Cannot store asset event tags for null event id."
+                )
+            stored_asset_events.append((event, event_id))
+
+        self._insert_event_rows(conn, pending_rows)
+        return stored_asset_events
+
+    def _insert_event_rows(self, conn: Connection, rows: Sequence[Mapping[str, Any]]) -> None:
+        for start in range(0, len(rows), MAX_EVENT_INSERT_BATCH_SIZE):
+            conn.execute(
+                SqlEventLogStorageTable.insert().values(
+                    rows[start : start + MAX_EVENT_INSERT_BATCH_SIZE]
+                )
+            )
+
+    def store_asset_events(self, stored_events: Sequence[Tuple[EventLogEntry, int]]) -> None:
+        """Updates the asset key index and the asset event tags table for a batch of stored asset
+        events, given as (event, storage id) pairs in storage order.
+        """
+        if not stored_events:
+            return
+
+        has_asset_key_index_cols = self.has_asset_key_index_cols()
+
+        # Every asset event overwrites a subset of the asset key columns, so folding the values
+        # in storage order yields the same row as applying one update per event.
+        values_by_asset_key: Dict[str, Dict[str, Any]] = OrderedDict()
+        tag_rows: List[Mapping[str, Any]] = []
+        for event, event_id in stored_events:
+            asset_key_str = check.not_none(event.get_dagster_event().asset_key).to_string()
+            values_by_asset_key.setdefault(asset_key_str, {}).update(
+                self._get_asset_entry_values(event, event_id, has_asset_key_index_cols)
+            )
+            tag_rows.extend(self._get_asset_event_tag_rows(event, event_id))
+
+        with self.index_connection() as conn:
+            for asset_key_str, values in values_by_asset_key.items():
+                self._upsert_asset_entry(conn, asset_key_str, values)
+
+        self.store_asset_partition_events(stored_events)
+
+        # If tags table does not exist, silently skip writing tags, matching
+        # `store_asset_event_tags`.
+        if tag_rows and self.has_table(AssetEventTagsTable.name):
+            with self.index_connection() as conn:
+                conn.execute(AssetEventTagsTable.insert(), tag_rows)
+
     def get_records_for_run(
         self,
         run_id,
@@ -430,7 +679,14 @@ def get_records_for_run(
         )
 
         query = (
-            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.event,
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                    SqlEventLogStorageTable.c.asset_key,
+                ]
+            )
             .where(SqlEventLogStorageTable.c.run_id == run_id)
             .order_by(
                 SqlEventLogStorageTable.c.id.asc()
@@ -460,7 +716,36 @@ def get_records_for_run(
             query = query.limit(limit)
 
         with self.run_connection(run_id) as conn:
-            results = conn.execute(query).fetchall()
+            rows = conn.execute(query).fetchall()
+        results = [(record_id, json_str) for (record_id, json_str, _, _) in rows]
+
+        if run_id in self._archived_run_cache and any(
+            dagster_event_type in RUN_FINISHED_EVENT_TYPE_VALUES
+            for (_, _, dagster_event_type, _) in rows
+        ):
+            self._archived_run_cache.pop(run_id, None)
+
+        # Only runs that are tagged as archived have rows in the archive, but looking up the run on
+        # every read is wasteful, since most reads are for runs that are far from being archived.
+        # Archival moves all archivable rows of a finished run out of the database at once, so if
+        # any of the rows read from the database is archivable, no rows of the run are missing.
+        if (
+            self._may_have_archived_rows(dagster_event_types)
+            and not any(
+                _is_archivable_row(dagster_event_type, asset_key)
+                for (_, _, dagster_event_type, asset_key) in rows
+            )
+            and (
+                # a read of some of the event types of a run may not include the event that
+                # finished the run, so the cached status of the run can't be relied on
+                self._is_event_log_archived_cached(run_id)
+                if not dagster_event_types
+                else is_event_log_archived(self._instance, run_id)
+            )
+        ):
+            results = self._get_rows_for_archived_run(
+                run_id, dagster_event_types, cursor, limit, ascending
+            )
 
         last_record_id = None
         try:
@@ -494,9 +779,690 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    def _get_rows_for_archived_run(
+        self,
+        run_id: str,
+        dagster_event_types: Set[DagsterEventType],
+        cursor: Optional[str],
+        limit: Optional[int],
+        ascending: bool,
+    ) -> Sequence[Tuple[int, str]]:
+        """Returns the (storage id, serialized event) rows for a run whose event logs have been
+        archived, merging the rows that were kept in the database with the rows in the archive.
+        """
+        archive = check.not_none(self._instance.event_log_archive)
+
+        # Both sources are read in the requested order from the cursor on, up to the number of rows
+        # needed for the page, so that paging through an archived run does not read all of it.
+        after_storage_id = None
+        before_storage_id = None
+        offset = 0
+        if cursor is not None:
+            cursor_obj = EventLogCursor.parse(cursor)
+            if cursor_obj.is_offset_cursor():
+                offset = cursor_obj.offset()
+            elif cursor_obj.is_id_cursor():
+                if ascending:
+                    after_storage_id = cursor_obj.storage_id()
+                else:
+                    before_storage_id = cursor_obj.storage_id()
+        fetch_limit = offset + limit if limit else None
+
+        query = db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event]).where(
+            SqlEventLogStorageTable.c.run_id == run_id
+        )
+        if dagster_event_types:
+            query = query.where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [dagster_event_type.value for dagster_event_type in dagster_event_types]
+                )
+            )
+        if after_storage_id is not None:
+            query = query.where(SqlEventLogStorageTable.c.id > after_storage_id)
+        if before_storage_id is not None:
+            query = query.where(SqlEventLogStorageTable.c.id < before_storage_id)
+        query = query.order_by(
+            SqlEventLogStorageTable.c.id.asc() if ascending else SqlEventLogStorageTable.c.id.desc()
+        )
+        if fetch_limit:
+            query = query.limit(fetch_limit)
+        with self.run_connection(run_id) as conn:
+            events_by_storage_id = dict(conn.execute(query).fetchall())
+
+        # an interrupted archival can leave rows in both the database and the archive
+        archived_rows = archive.read_events_for_run(
+            run_id,
+            (
+                {dagster_event_type.value for dagster_event_type in dagster_event_types}
+                if dagster_event_types
+                else None
+            ),
+            after_storage_id=after_storage_id,
+            before_storage_id=before_storage_id,
+            limit=fetch_limit,
+            ascending=ascending,
+        )
+        for row in archived_rows:
+            events_by_storage_id.setdefault(row.storage_id, row.event)
+
+        # the first rows of the merged sources in order are among the first rows of each source
+        rows = sorted(events_by_storage_id.items(), reverse=not ascending)[offset:]
+        return rows[:limit] if limit else rows
+
+    def _may_have_archived_rows(self, dagster_event_types: Set[DagsterEventType]) -> bool:
+        return (
+            self.has_instance
+            and self._instance.event_log_archive is not None
+            and not (dagster_event_types and dagster_event_types <= UNARCHIVED_EVENT_TYPES)
+        )
+
+    def _get_events_for_archived_run(
+        self, run_id: str, dagster_event_types: Set[DagsterEventType]
+    ) -> Optional[Sequence[EventLogEntry]]:
+        """Returns the events of the given types for a run, in storage order, if some of the
+        events of the run have been archived. Returns None if the run has not been archived, in
+        which case all of its events are in the database.
+        """
+        if not self._may_have_archived_rows(dagster_event_types) or not is_event_log_archived(
+            self._instance, run_id
+        ):
+            return None
+
+        rows = self._get_rows_for_archived_run(
+            run_id, dagster_event_types, cursor=None, limit=None, ascending=True
+        )
+        try:
+            return [deserialize_value(json_str, EventLogEntry) for (_, json_str) in rows]
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+    def _archivable_events_clause(self):
+        return db.and_(
+            SqlEventLogStorageTable.c.asset_key == None,  # noqa: E711
+            db.or_(
+                SqlEventLogStorageTable.c.dagster_event_type == None,  # noqa: E711
+                SqlEventLogStorageTable.c.dagster_event_type.notin_(
+                    [dagster_event_type.value for dagster_event_type in UNARCHIVED_EVENT_TYPES]
+                ),
+            ),
+        )
+
+    @property
+    def supports_event_log_archival(self) -> bool:
+        return True
+
+    def archive_events(self, run_id: str, archive: EventLogArchive) -> Optional[int]:
+        check.str_param(run_id, "run_id")
+        check.inst_param(archive, "archive", EventLogArchive)
+
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(self._archivable_events_clause())
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        with self.run_connection(run_id) as conn:
+            rows = [ArchivedEventLogRow(*row) for row in conn.execute(query).fetchall()]
+
+        if not rows:
+            return None
+
+        archive.write_events_for_run(run_id, rows)
+        return rows[-1].storage_id
+
+    def delete_archived_events(self, run_id: str, up_to_storage_id: int) -> None:
+        check.str_param(run_id, "run_id")
+        check.int_param(up_to_storage_id, "up_to_storage_id")
+
+        # Only archived events are deleted, which never include asset events. So for sharded
+        # storages, there are no mirrored rows to delete from the index shard.
+        with self.run_connection(run_id) as conn:
+            conn.execute(
+                SqlEventLogStorageTable.delete()
+                .where(SqlEventLogStorageTable.c.run_id == run_id)
+                .where(SqlEventLogStorageTable.c.id <= up_to_storage_id)
+                .where(self._archivable_events_clause())
+            )
+
+    @property
+    def _has_asset_partition_events_table(self) -> bool:
+        return self._has_table_cached(AssetPartitionEventsTable.name)
+
+    def _use_asset_partition_events_table(self) -> bool:
+        return self._has_asset_partition_events_table and self.has_secondary_index(
+            ASSET_PARTITION_EVENTS_INDEX
+        )
+
+    def store_asset_partition_events(
+        self, stored_events: Sequence[Tuple[EventLogEntry, int]]
+    ) -> None:
+        """Folds a batch of stored asset events, given as (event, storage id) pairs in storage
+        order, into the asset_partition_events table, so that the latest event and the event count
+        of each partition can be read without aggregating over the event log.
+        """
+        if not self._has_asset_partition_events_table:
+            return
+
+        values_by_row_key: Dict[Tuple[str, str, str], Dict[str, Any]] = OrderedDict()
+        for event, event_id in stored_events:
+            dagster_event = event.get_dagster_event()
+            if not (
+                dagster_event.asset_key
+                and dagster_event.partition
+                and dagster_event.event_type in ASSET_EVENTS
+            ):
+                continue
+
+            row_key = (
+                dagster_event.asset_key.to_string(),
+                dagster_event.partition,
+                dagster_event.event_type_value,
+            )
+            values = values_by_row_key.setdefault(row_key, {"event_count": 0})
+            values["event_count"] += 1
+            values["last_event_id"] = event_id
+            values["last_run_id"] = event.run_id
+
+        if not values_by_row_key:
+            return
+
+        with self.index_connection() as conn:
+            for (asset_key_str, partition, event_type_value), values in values_by_row_key.items():
+                self._upsert_asset_partition_events_row(
+                    conn, asset_key_str, partition, event_type_value, **values
+                )
+
+    def _upsert_asset_partition_events_row(
+        self,
+        conn: Connection,
+        asset_key_str: str,
+        partition: str,
+        event_type_value: str,
+        last_event_id: int,
+        last_run_id: str,
+        event_count: int,
+    ) -> None:
+        # the count is incremented, and the latest event only ever moves forward, so that
+        # concurrent writers for the same partition compose
+        asset_key_hash = _hash_key(asset_key_str)
+        partition_hash = _hash_key(partition)
+        is_later_event = AssetPartitionEventsTable.c.last_event_id < last_event_id
+        update_statement = (
+            AssetPartitionEventsTable.update()
+            .where(AssetPartitionEventsTable.c.asset_key_hash == asset_key_hash)
+            .where(AssetPartitionEventsTable.c.dagster_event_type == event_type_value)
+            .where(AssetPartitionEventsTable.c.partition_hash == partition_hash)
+            .values(
+                event_count=AssetPartitionEventsTable.c.event_count + event_count,
+                last_event_id=db_case(
+                    [(is_later_event, last_event_id)],
+                    else_=AssetPartitionEventsTable.c.last_event_id,
+                ),
+                last_run_id=db_case(
+                    [(is_later_event, last_run_id)],
+                    else_=AssetPartitionEventsTable.c.last_run_id,
+                ),
+            )
+        )
+
+        result = conn.execute(update_statement)
+        if result.rowcount > 0:
+            return
+
+        try:
+            conn.execute(
+                AssetPartitionEventsTable.insert().values(
+                    asset_key=asset_key_str,
+                    partition=partition,
+                    asset_key_hash=asset_key_hash,
+                    partition_hash=partition_hash,
+                    dagster_event_type=event_type_value,
+                    last_event_id=last_event_id,
+                    last_run_id=last_run_id,
+                    event_count=event_count,
+                )
+            )
+        except db_exc.IntegrityError:
+            # the row was concurrently inserted
+            result = conn.execute(update_statement)
+            if result.rowcount == 0:
+                raise DagsterInvariantViolationError(
+                    f"Could not update the {event_type_value} events of partition {partition} of"
+                    f" asset {asset_key_str}: the row could neither be inserted nor updated."
+                )
+
+    def rebuild_asset_partition_events(self, asset_key: AssetKey) -> None:
+        """Rebuilds the asset_partition_events rows for an asset from the event log, ignoring any
+        events from before the asset was last wiped.
+        """
+        check.inst_param(asset_key, "asset_key", AssetKey)
+        if not self._has_asset_partition_events_table:
+            return
+
+        asset_key_str = asset_key.to_string()
+        aggregate_query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.partition,
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                    db.func.max(SqlEventLogStorageTable.c.id).label("last_event_id"),
+                    db.func.count(SqlEventLogStorageTable.c.id).label("event_count"),
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.asset_key == asset_key_str,
+                    SqlEventLogStorageTable.c.partition != None,  # noqa: E711
+                    SqlEventLogStorageTable.c.dagster_event_type.in_(
+                        [event_type.value for event_type in ASSET_EVENTS]
+                    ),
+                )
+            )
+            .group_by(
+                SqlEventLogStorageTable.c.partition, SqlEventLogStorageTable.c.dagster_event_type
+            )
+        )
+        aggregate_subquery = db_subquery(
+            self._add_assets_wipe_filter_to_query(
+                aggregate_query, self._get_assets_details([asset_key]), [asset_key]
+            ),
+            "asset_partition_events_subquery",
+        )
+        query = db_select(
+            [
+                aggregate_subquery.c.partition,
+                aggregate_subquery.c.dagster_event_type,
+                aggregate_subquery.c.last_event_id,
+                aggregate_subquery.c.event_count,
+                SqlEventLogStorageTable.c.run_id,
+            ]
+        ).select_from(
+            aggregate_subquery.join(
+                SqlEventLogStorageTable,
+                SqlEventLogStorageTable.c.id == aggregate_subquery.c.last_event_id,
+            )
+        )
+
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+            conn.execute(
+                AssetPartitionEventsTable.delete().where(
+                    AssetPartitionEventsTable.c.asset_key == asset_key_str
+                )
+            )
+            for start in range(0, len(rows), MAX_EVENT_INSERT_BATCH_SIZE):
+                conn.execute(
+                    AssetPartitionEventsTable.insert().values(
+                        [
+                            dict(
+                                asset_key=asset_key_str,
+                                partition=partition,
+                                asset_key_hash=_hash_key(asset_key_str),
+                                partition_hash=_hash_key(partition),
+                                dagster_event_type=event_type_value,
+                                last_event_id=last_event_id,
+                                last_run_id=run_id,
+                                event_count=event_count,
+                            )
+                            for partition, event_type_value, last_event_id, event_count, run_id in rows[
+                                start : start + MAX_EVENT_INSERT_BATCH_SIZE
+                            ]
+                        ]
+                    )
+                )
+
+    def _get_partitioned_asset_keys_for_run(self, run_id: str) -> Sequence[AssetKey]:
+        """Returns the keys of the assets with partitioned events in the given run, whose rows in
+        the asset_partition_events table must be rebuilt if the run's events are deleted.
+        """
+        if not self._has_asset_partition_events_table:
+            return []
+
+        query = (
+            db_select([SqlEventLogStorageTable.c.asset_key])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(SqlEventLogStorageTable.c.asset_key != None)  # noqa: E711
+            .where(SqlEventLogStorageTable.c.partition != None)  # noqa: E711
+            .group_by(SqlEventLogStorageTable.c.asset_key)
+        )
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        return [
+            asset_key
+            for asset_key in (AssetKey.from_db_string(row[0]) for row in rows)
+            if asset_key
+        ]
+
+    @property
+    def _has_run_stats_tables(self) -> bool:
+        # Run-sharded storages keep per-run databases, which are already cheap to aggregate over
+        return (
+            not self.is_run_sharded
+            and self._has_table_cached(RunStatsTable.name)
+            and self._has_table_cached(StepStatsTable.name)
+        )
+
+    def _use_run_stats_tables(self) -> bool:
+        return self._has_run_stats_tables and self.has_secondary_index(RUN_STATS_INDEX)
+
+    def store_run_stats(self, events: Sequence[EventLogEntry]) -> None:
+        """Folds the given stored events into the run_stats and step_stats tables, so that run and
+        step stats can be read without aggregating over the whole event log of a run.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events that were stored, in storage order.
+        """
+        stats_events = [event for event in events if _is_run_stats_event(event)]
+        # until the tables are built from the event log, the stats are read from the event log, so
+        # there is nothing to keep up to date
+        if not stats_events or not self._use_run_stats_tables():
+            return
+
+        for run_id, run_events in groupby(stats_events, key=lambda event: event.run_id):
+            with self.run_connection(run_id) as conn:
+                self._update_run_stats(conn, run_id, list(run_events))
+
+    def rebuild_run_stats(self, run_id: str) -> None:
+        """Rebuilds the run_stats and step_stats rows for a run from its event log."""
+        check.str_param(run_id, "run_id")
+        if not self._has_run_stats_tables:
+            return
+
+        query = (
+            db_select([SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    {
+                        event_type.value
+                        for event_type in [
+                            *RUN_STATS_COUNT_COLUMNS,
+                            *RUN_STATS_TIME_COLUMNS,
+                            *STEP_STATS_EVENT_TYPES,
+                        ]
+                    }
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        archived_events = self._get_events_for_archived_run(
+            run_id, {*RUN_STATS_COUNT_COLUMNS, *RUN_STATS_TIME_COLUMNS, *STEP_STATS_EVENT_TYPES}
+        )
+
+        with self.run_connection(run_id) as conn:
+            events = (
+                archived_events
+                if archived_events is not None
+                else [
+                    deserialize_value(json_str, EventLogEntry)
+                    for (json_str,) in conn.execute(query).fetchall()
+                ]
+            )
+            self._delete_run_stats_for_run(conn, run_id)
+            self._update_run_stats(
+                conn, run_id, [event for event in events if _is_run_stats_event(event)]
+            )
+
+    def _update_run_stats(
+        self, conn: Connection, run_id: str, events: Sequence[EventLogEntry]
+    ) -> None:
+        counts: Dict[str, int] = defaultdict(int)
+        times: Dict[str, datetime] = {}
+        events_by_step_key: Dict[str, List[EventLogEntry]] = defaultdict(list)
+
+        for event in events:
+            event_type = check.not_none(event.dagster_event_type)
+            if event_type in RUN_STATS_COUNT_COLUMNS:
+                counts[RUN_STATS_COUNT_COLUMNS[event_type]] += 1
+            if event_type in RUN_STATS_TIME_COLUMNS:
+                column = RUN_STATS_TIME_COLUMNS[event_type]
+                # Postgres requires a datetime that is in UTC but has no timezone info set in order
+                # to be stored correctly
+                timestamp = datetime.utcfromtimestamp(event.timestamp)
+                times[column] = max(times.get(column, timestamp), timestamp)
+            if event.step_key and event_type in STEP_STATS_EVENT_TYPES:
+                events_by_step_key[event.step_key].append(event)
+
+        if counts or times:
+            self._upsert_run_stats(conn, run_id, counts, times)
+
+        for step_key, step_events in events_by_step_key.items():
+            self._update_step_stats(conn, run_id, step_key, step_events)
+
+    def _upsert_run_stats(
+        self,
+        conn: Connection,
+        run_id: str,
+        counts: Mapping[str, int],
+        times: Mapping[str, datetime],
+    ) -> None:
+        # counters are incremented, and timestamps only ever move forward, so that concurrent
+        # writers for the same run compose
+        update_values: Dict[str, Any] = {
+            column: RunStatsTable.c[column] + count for column, count in counts.items()
+        }
+        for column, timestamp in times.items():
+            update_values[column] = db_case(
+                [
+                    (RunStatsTable.c[column] == None, timestamp),  # noqa: E711
+                    (RunStatsTable.c[column] < timestamp, timestamp),
+                ],
+                else_=RunStatsTable.c[column],
+            )
+        update_statement = (
+            RunStatsTable.update().where(RunStatsTable.c.run_id == run_id).values(update_values)
+        )
+
+        result = conn.execute(update_statement)
+        if result.rowcount > 0:
+            return
+
+        try:
+            conn.execute(RunStatsTable.insert().values(run_id=run_id, **counts, **times))
+        except db_exc.IntegrityError:
+            # the row exists, but the update did not change it, or it was concurrently inserted
+            conn.execute(update_statement)
+
+    def _update_step_stats(
+        self,
+        conn: Connection,
+        run_id: str,
+        step_key: str,
+        events: Sequence[EventLogEntry],
+    ) -> None:
+        # The stats of each step are kept in a single row, which is read, folded over the new events
+        # and written back. The write only applies if the row has not changed since it was read,
+        # and is retried otherwise, so that concurrent writers for the same step compose.
+        step_key_hash = _hash_key(step_key)
+        step_filter = db.and_(
+            StepStatsTable.c.run_id == run_id, StepStatsTable.c.step_key_hash == step_key_hash
+        )
+        for _ in range(MAX_STEP_STATS_UPDATE_ATTEMPTS):
+            row = conn.execute(
+                db_select([StepStatsTable.c.version, StepStatsTable.c.stats]).where(step_filter)
+            ).fetchone()
+
+            if row is None:
+                stats = RunStepKeyStatsAggregate.empty(step_key).with_events(events)
+                try:
+                    conn.execute(
+                        StepStatsTable.insert().values(
+                            run_id=run_id,
+                            step_key=step_key,
+                            step_key_hash=step_key_hash,
+                            version=0,
+                            stats=serialize_value(stats),
+                        )
+                    )
+                    return
+                except db_exc.IntegrityError:
+                    # the row was concurrently inserted
+                    continue
+
+            version, stats_str = row
+            stats = deserialize_value(stats_str, RunStepKeyStatsAggregate).with_events(events)
+            result = conn.execute(
+                StepStatsTable.update()
+                .where(db.and_(step_filter, StepStatsTable.c.version == version))
+                .values(version=version + 1, stats=serialize_value(stats))
+            )
+            if result.rowcount > 0:
+                return
+
+        raise DagsterInvariantViolationError(
+            f"Could not update the stats of step {step_key} in run {run_id} after"
+            f" {MAX_STEP_STATS_UPDATE_ATTEMPTS} attempts due to concurrent updates."
+        )
+
+    def _get_stats_for_run_from_table(self, run_id: str) -> DagsterRunStatsSnapshot:
+        query = db_select(
+            [
+                RunStatsTable.c.steps_succeeded,
+                RunStatsTable.c.steps_failed,
+                RunStatsTable.c.materializations,
+                RunStatsTable.c.expectations,
+                RunStatsTable.c.enqueued_time,
+                RunStatsTable.c.launch_time,
+                RunStatsTable.c.start_time,
+                RunStatsTable.c.end_time,
+            ]
+        ).where(RunStatsTable.c.run_id == run_id)
+
+        with self.run_connection(run_id) as conn:
+            row = conn.execute(query).fetchone()
+
+        if not row:
+            return DagsterRunStatsSnapshot(
+                run_id=run_id,
+                steps_succeeded=0,
+                steps_failed=0,
+                materializations=0,
+                expectations=0,
+                enqueued_time=None,
+                launch_time=None,
+                start_time=None,
+                end_time=None,
+            )
+
+        (
+            steps_succeeded,
+            steps_failed,
+            materializations,
+            expectations,
+            enqueued_time,
+            launch_time,
+            start_time,
+            end_time,
+        ) = row
+        return DagsterRunStatsSnapshot(
+            run_id=run_id,
+            steps_succeeded=steps_succeeded,
+            steps_failed=steps_failed,
+            materializations=materializations,
+            expectations=expectations,
+            enqueued_time=datetime_as_float(enqueued_time) if enqueued_time else None,
+            launch_time=datetime_as_float(launch_time) if launch_time else None,
+            start_time=datetime_as_float(start_time) if start_time else None,
+            end_time=datetime_as_float(end_time) if end_time else None,
+        )
+
+    def _get_step_stats_for_run_from_table(
+        self, run_id: str, step_keys: Optional[Sequence[str]] = None
+    ) -> Sequence[RunStepKeyStatsSnapshot]:
+        # steps are listed in the order in which their rows were created
+        query = (
+            db_select([StepStatsTable.c.stats])
+            .where(StepStatsTable.c.run_id == run_id)
+            .order_by(StepStatsTable.c.id.asc())
+        )
+        if step_keys:
+            query = query.where(StepStatsTable.c.step_key.in_(step_keys))
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        try:
+            step_stats = [
+                deserialize_value(stats_str, RunStepKeyStatsAggregate) for (stats_str,) in results
+            ]
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        # steps that only have markers or retry events so far are left out, as when the step stats
+        # are built from the event log
+        step_stats = [stats for stats in step_stats if stats.has_step_events]
+        counted_events_by_step_key = self._get_step_stats_counted_events(
+            run_id,
+            [
+                stats.step_key
+                for stats in step_stats
+                if stats.materializations or stats.expectations
+            ],
+        )
+        return [
+            stats.to_snapshot(run_id, counted_events_by_step_key.get(stats.step_key, []))
+            for stats in step_stats
+        ]
+
+    def _get_step_stats_counted_events(
+        self, run_id: str, step_keys: Sequence[str]
+    ) -> Mapping[str, Sequence[EventLogEntry]]:
+        """Returns the materialization and expectation result events of the given steps of a run,
+        in storage order, which the step_stats table only counts.
+        """
+        if not step_keys:
+            return {}
+
+        events = self._get_events_for_archived_run(run_id, STEP_STATS_COUNTED_EVENT_TYPES)
+        if events is None:
+            query = (
+                db_select([SqlEventLogStorageTable.c.event])
+                .where(SqlEventLogStorageTable.c.run_id == run_id)
+                .where(SqlEventLogStorageTable.c.step_key.in_(step_keys))
+                .where(
+                    SqlEventLogStorageTable.c.dagster_event_type.in_(
+                        [event_type.value for event_type in STEP_STATS_COUNTED_EVENT_TYPES]
+                    )
+                )
+                .order_by(SqlEventLogStorageTable.c.id.asc())
+            )
+            with self.run_connection(run_id) as conn:
+                results = conn.execute(query).fetchall()
+            try:
+                events = [deserialize_value(json_str, EventLogEntry) for (json_str,) in results]
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        events_by_step_key: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        for event in events:
+            if event.step_key:
+                events_by_step_key[event.step_key].append(event)
+        return events_by_step_key
+
+    def _delete_run_stats_for_run(self, conn: Connection, run_id: str) -> None:
+        conn.execute(RunStatsTable.delete().where(RunStatsTable.c.run_id == run_id))
+        conn.execute(StepStatsTable.delete().where(StepStatsTable.c.run_id == run_id))
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
+        if self._use_run_stats_tables():
+            return self._get_stats_for_run_from_table(run_id)
+
+        archived_events = self._get_events_for_archived_run(
+            run_id, {*RUN_STATS_COUNT_COLUMNS, *RUN_STATS_TIME_COLUMNS}
+        )
+        if archived_events is not None:
+            return build_run_stats_from_events(run_id, archived_events)
+
         query = (
             db_select(
                 [
@@ -557,6 +1523,20 @@ def get_step_stats_for_run(
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
 
+        if self._use_run_stats_tables():
+            return self._get_step_stats_for_run_from_table(run_id, step_keys)
+
+        archived_events = self._get_events_for_archived_run(run_id, set(STEP_STATS_EVENT_TYPES))
+        if archived_events is not None:
+            return build_run_step_stats_from_events(
+                run_id,
+                [
+                    event
+                    for event in archived_events
+                    if event.step_key and (not step_keys or event.step_key in step_keys)
+                ],
+            )
+
         # Originally, this was two different queries:
         # 1) one query which aggregated top-level step stats by grouping by event type / step_key in
         #    a single query, using pure SQL (e.g. start_time, end_time, status, attempt counts).
@@ -575,18 +1555,7 @@ def get_step_stats_for_run(
             .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
             .where(
                 SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [
-                        DagsterEventType.STEP_START.value,
-                        DagsterEventType.STEP_SUCCESS.value,
-                        DagsterEventType.STEP_SKIPPED.value,
-                        DagsterEventType.STEP_FAILURE.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.ASSET_MATERIALIZATION.value,
-                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.STEP_UP_FOR_RETRY.value,
-                    ]
-                    + [marker_event.value for marker_event in MARKER_EVENTS]
+                    [event_type.value for event_type in STEP_STATS_EVENT_TYPES]
                 )
             )
             .order_by(SqlEventLogStorageTable.c.id.asc())
@@ -650,6 +1619,15 @@ def wipe(self) -> None:
             if self.has_table("pending_steps"):
                 conn.execute(PendingStepsTable.delete())
 
+            if self.has_table("run_stats"):
+                conn.execute(RunStatsTable.delete())
+
+            if self.has_table("step_stats"):
+                conn.execute(StepStatsTable.delete())
+
+            if self.has_table("asset_partition_events"):
+                conn.execute(AssetPartitionEventsTable.delete())
+
         self._wipe_index()
 
     def _wipe_index(self):
@@ -669,12 +1647,27 @@ def _wipe_index(self):
             if self.has_table("pending_steps"):
                 conn.execute(PendingStepsTable.delete())
 
+            if self.has_table("run_stats"):
+                conn.execute(RunStatsTable.delete())
+
+            if self.has_table("step_stats"):
+                conn.execute(StepStatsTable.delete())
+
+            if self.has_table("asset_partition_events"):
+                conn.execute(AssetPartitionEventsTable.delete())
+
     def delete_events(self, run_id: str) -> None:
+        partitioned_asset_keys = self._get_partitioned_asset_keys_for_run(run_id)
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
+            if self._has_run_stats_tables:
+                self._delete_run_stats_for_run(conn, run_id)
         with self.index_connection() as conn:
             self.delete_events_for_run(conn, run_id)
 
+        for asset_key in partitioned_asset_keys:
+            self.rebuild_asset_partition_events(asset_key)
+
     def delete_events_for_run(self, conn: Connection, run_id: str) -> None:
         check.str_param(run_id, "run_id")
         conn.execute(
@@ -1010,6 +2003,87 @@ def get_logs_for_all_runs_by_log_id(
 
         return events
 
+    @property
+    def supports_multi_run_records(self) -> bool:
+        # storage ids are only unique within each run shard
+        return not self.is_run_sharded
+
+    def get_records_for_runs(
+        self,
+        run_ids: Sequence[str],
+        after_storage_id: int = -1,
+        limit: Optional[int] = None,
+        after_storage_id_by_run_id: Optional[Mapping[str, int]] = None,
+    ) -> Sequence[EventLogRecord]:
+        """Get the event log records for a set of runs with storage ids greater than the given
+        storage id, in ascending storage id order. Only supported for non sharded sql storage.
+
+        Args:
+            run_ids (Sequence[str]): The ids of the runs for which to fetch logs.
+            after_storage_id (int): Only records with a greater storage id will be returned.
+            limit (Optional[int]): the maximum number of records to fetch
+            after_storage_id_by_run_id (Optional[Mapping[str, int]]): Storage ids to use instead of
+                after_storage_id for some of the runs.
+        """
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        check.int_param(after_storage_id, "after_storage_id")
+        check.opt_int_param(limit, "limit")
+        after_storage_id_by_run_id = check.opt_mapping_param(
+            after_storage_id_by_run_id,
+            "after_storage_id_by_run_id",
+            key_type=str,
+            value_type=int,
+        )
+        check.invariant(
+            self.supports_multi_run_records,
+            "Fetching the records of several runs is not supported for run sharded storage",
+        )
+
+        if not run_ids:
+            return []
+
+        # runs with the same storage id share a clause
+        run_ids_by_storage_id: Dict[int, List[str]] = defaultdict(list)
+        for run_id in run_ids:
+            run_ids_by_storage_id[after_storage_id_by_run_id.get(run_id, after_storage_id)].append(
+                run_id
+            )
+
+        query = (
+            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(
+                db.or_(
+                    *[
+                        db.and_(
+                            SqlEventLogStorageTable.c.run_id.in_(storage_id_run_ids),
+                            SqlEventLogStorageTable.c.id > storage_id,
+                        )
+                        for storage_id, storage_id_run_ids in run_ids_by_storage_id.items()
+                    ]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if limit:
+            query = query.limit(limit)
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records = []
+        for record_id, json_str in results:
+            try:
+                records.append(
+                    EventLogRecord(
+                        storage_id=record_id,
+                        event_log_entry=deserialize_value(json_str, EventLogEntry),
+                    )
+                )
+            except (seven.JSONDecodeError, DeserializationError):
+                logging.warning("Could not parse event record id `%s`.", record_id)
+
+        return records
+
     def get_maximum_record_id(self) -> Optional[int]:
         with self.index_connection() as conn:
             result = conn.execute(db_select([db.func.max(SqlEventLogStorageTable.c.id)])).fetchone()
@@ -1648,11 +2722,53 @@ def wipe_asset(self, asset_key: AssetKey) -> None:
                 )
             )
 
+            if self._has_asset_partition_events_table:
+                conn.execute(
+                    AssetPartitionEventsTable.delete().where(
+                        AssetPartitionEventsTable.c.asset_key == asset_key.to_string()
+                    )
+                )
+
     def get_materialization_count_by_partition(
         self, asset_keys: Sequence[AssetKey], after_cursor: Optional[int] = None
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         check.sequence_param(asset_keys, "asset_keys", AssetKey)
 
+        if after_cursor is None and self._use_asset_partition_events_table():
+            query = db_select(
+                [
+                    AssetPartitionEventsTable.c.asset_key,
+                    AssetPartitionEventsTable.c.partition,
+                    AssetPartitionEventsTable.c.event_count,
+                ]
+            ).where(
+                db.and_(
+                    AssetPartitionEventsTable.c.asset_key.in_(
+                        [asset_key.to_string() for asset_key in asset_keys]
+                    ),
+                    AssetPartitionEventsTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
+                )
+            )
+        else:
+            query = self._materialization_count_by_partition_query(asset_keys, after_cursor)
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        materialization_count_by_partition: Dict[AssetKey, Dict[str, int]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        for row in results:
+            asset_key = AssetKey.from_db_string(cast(Optional[str], row[0]))
+            if asset_key:
+                materialization_count_by_partition[asset_key][cast(str, row[1])] = cast(int, row[2])
+
+        return materialization_count_by_partition
+
+    def _materialization_count_by_partition_query(
+        self, asset_keys: Sequence[AssetKey], after_cursor: Optional[int]
+    ) -> SqlAlchemyQuery:
         query = (
             db_select(
                 [
@@ -1680,18 +2796,7 @@ def get_materialization_count_by_partition(
         if after_cursor:
             query = query.where(SqlEventLogStorageTable.c.id > after_cursor)
 
-        with self.index_connection() as conn:
-            results = conn.execute(query).fetchall()
-
-        materialization_count_by_partition: Dict[AssetKey, Dict[str, int]] = {
-            asset_key: {} for asset_key in asset_keys
-        }
-        for row in results:
-            asset_key = AssetKey.from_db_string(cast(Optional[str], row[0]))
-            if asset_key:
-                materialization_count_by_partition[asset_key][cast(str, row[1])] = cast(int, row[2])
-
-        return materialization_count_by_partition
+        return query
 
     def _latest_event_ids_by_partition_subquery(
         self,
@@ -1704,6 +2809,34 @@ def _latest_event_ids_by_partition_subquery(
         """Subquery for locating the latest event ids by partition for a given asset key and set
         of event types.
         """
+        if before_cursor is None and self._use_asset_partition_events_table():
+            # The latest event after a cursor is the latest event overall, if it is after the
+            # cursor. Wiped events are removed from the table, so no wipe filter is needed.
+            index_query = db_select(
+                [
+                    AssetPartitionEventsTable.c.dagster_event_type,
+                    AssetPartitionEventsTable.c.partition,
+                    AssetPartitionEventsTable.c.last_event_id.label("id"),
+                    AssetPartitionEventsTable.c.last_run_id.label("run_id"),
+                ]
+            ).where(
+                db.and_(
+                    AssetPartitionEventsTable.c.asset_key == asset_key.to_string(),
+                    AssetPartitionEventsTable.c.dagster_event_type.in_(
+                        [event_type.value for event_type in event_types]
+                    ),
+                )
+            )
+            if asset_partitions is not None:
+                index_query = index_query.where(
+                    AssetPartitionEventsTable.c.partition.in_(asset_partitions)
+                )
+            if after_cursor is not None:
+                index_query = index_query.where(
+                    AssetPartitionEventsTable.c.last_event_id > after_cursor
+                )
+            return db_subquery(index_query, "latest_event_ids_by_partition_subquery")
+
         query = db_select(
             [
                 SqlEventLogStorageTable.c.dagster_event_type,
@@ -1836,22 +2969,27 @@ def get_latest_asset_partition_materialization_attempts_without_materializations
             ],
         )
 
-        latest_events_subquery = db_subquery(
-            db_select(
-                [
-                    SqlEventLogStorageTable.c.dagster_event_type,
-                    SqlEventLogStorageTable.c.partition,
-                    SqlEventLogStorageTable.c.run_id,
-                    SqlEventLogStorageTable.c.id,
-                ]
-            ).select_from(
-                latest_event_ids_subquery.join(
-                    SqlEventLogStorageTable,
-                    SqlEventLogStorageTable.c.id == latest_event_ids_subquery.c.id,
+        if "run_id" in latest_event_ids_subquery.c:
+            # the subquery reads from the asset_partition_events table, which already stores the
+            # run id of the latest event of each partition
+            latest_events_subquery = latest_event_ids_subquery
+        else:
+            latest_events_subquery = db_subquery(
+                db_select(
+                    [
+                        SqlEventLogStorageTable.c.dagster_event_type,
+                        SqlEventLogStorageTable.c.partition,
+                        SqlEventLogStorageTable.c.run_id,
+                        SqlEventLogStorageTable.c.id,
+                    ]
+                ).select_from(
+                    latest_event_ids_subquery.join(
+                        SqlEventLogStorageTable,
+                        SqlEventLogStorageTable.c.id == latest_event_ids_subquery.c.id,
+                    ),
                 ),
-            ),
-            "latest_events_subquery",
-        )
+                "latest_events_subquery",
+            )
 
         materialization_planned_events = db_select(
             [
@@ -2468,3 +3606,37 @@ def _get_from_row(row: SqlAlchemyRow, column: str) -> object:
     if column not in row.keys():
         return None
     return row[column]
+
+
+def _is_indexed_asset_event(event: EventLogEntry) -> bool:
+    return bool(
+        event.is_dagster_event
+        and event.dagster_event_type in ASSET_EVENTS
+        and event.get_dagster_event().asset_key
+    )
+
+
+def _is_run_stats_event(event: EventLogEntry) -> bool:
+    if not event.is_dagster_event:
+        return False
+    event_type = event.dagster_event_type
+    return (
+        event_type in RUN_STATS_COUNT_COLUMNS
+        or event_type in RUN_STATS_TIME_COLUMNS
+        or bool(event.step_key and event_type in STEP_STATS_EVENT_TYPES)
+    )
+
+
+def _hash_key(key: str) -> str:
+    # Unique indexes over text columns are built over hashes of them, since MySQL can only index a
+    # prefix of a text column, which distinct values may share
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _is_archivable_row(dagster_event_type: Optional[str], asset_key: Optional[str]) -> bool:
+    # matches the rows selected by SqlEventLogStorage._archivable_events_clause
+    return asset_key is None and (
+        dagster_event_type is None
+        or dagster_event_type
+        not in {dagster_event_type.value for dagster_event_type in UNARCHIVED_EVENT_TYPES}
+    )
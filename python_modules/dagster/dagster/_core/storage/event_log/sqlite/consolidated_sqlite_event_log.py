@@ -122,6 +122,7 @@ def upgrade(self):
         alembic_config = get_alembic_config(__file__)
         with self._connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
+        self._clear_table_existence_cache()
 
     def has_secondary_index(self, name):
         if name not in self._secondary_index_cache:
@@ -145,6 +146,10 @@ def watch(self, run_id, cursor, callback):
 
         self._watchers[run_id][callback] = cursor
 
+    @property
+    def supports_push_event_watch(self) -> bool:
+        return True
+
     @property
     def supports_global_concurrency_limits(self) -> bool:
         return False
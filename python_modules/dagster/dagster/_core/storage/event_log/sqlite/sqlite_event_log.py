@@ -8,6 +8,7 @@
 import time
 from collections import defaultdict
 from contextlib import contextmanager
+from itertools import groupby
 from typing import TYPE_CHECKING, Any, ContextManager, Iterable, Iterator, Optional, Sequence
 
 import sqlalchemy as db
@@ -122,6 +123,7 @@ def upgrade(self) -> None:
             run_alembic_upgrade(alembic_config, conn, "index")
 
         self._initialized_dbs = set()
+        self._clear_table_existence_cache()
 
     @property
     def inst_data(self) -> Optional[ConfigurableClassData]:
@@ -260,6 +262,42 @@ def store_event(self, event: EventLogEntry) -> None:
 
             self.store_asset_event_tags(event, event_id)
 
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Overridden method to write each run's events to its shard in bulk, mirroring asset events
+        in the central index shard.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        for run_id, run_event_iter in groupby(events, key=lambda event: event.run_id):
+            run_events = list(run_event_iter)
+            with self.run_connection(run_id) as conn:
+                self._insert_event_rows(
+                    conn, [self._get_event_insert_values(event) for event in run_events]
+                )
+
+            asset_events = [
+                event
+                for event in run_events
+                if event.is_dagster_event and event.get_dagster_event().asset_key
+            ]
+            if not asset_events:
+                continue
+
+            check.invariant(
+                all(event.dagster_event_type in ASSET_EVENTS for event in asset_events),
+                "Can only store asset materializations, materialization_planned, and"
+                " observations in index database",
+            )
+
+            # mirror the asset events in the cross-run index database
+            with self.index_connection() as conn:
+                stored_asset_events = self._insert_event_batch(conn, asset_events)
+
+            self.store_asset_events(stored_asset_events)
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -355,6 +393,7 @@ def supports_event_consumer_queries(self) -> bool:
         return False
 
     def delete_events(self, run_id: str) -> None:
+        partitioned_asset_keys = self._get_partitioned_asset_keys_for_run(run_id)
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
 
@@ -362,6 +401,9 @@ def delete_events(self, run_id: str) -> None:
         with self.index_connection() as conn:
             self.delete_events_for_run(conn, run_id)
 
+        for asset_key in partitioned_asset_keys:
+            self.rebuild_asset_partition_events(asset_key)
+
     def wipe(self) -> None:
         # should delete all the run-sharded db files and drop the contents of the index
         for filename in (
@@ -412,6 +454,10 @@ def end_watch(self, run_id: str, handler: EventHandlerFn) -> None:
             self._obs.remove_handler_for_watch(event_handler, watch)  # type: ignore  # (possible none)
             del self._watchers[run_id][handler]
 
+    @property
+    def supports_push_event_watch(self) -> bool:
+        return True
+
     def dispose(self) -> None:
         if self._obs:
             self._obs.stop()
@@ -58,6 +58,7 @@
         RunsFilter,
         TagBucket,
     )
+    from dagster._core.storage.event_log.archive import EventLogArchive
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
     from dagster._daemon.types import DaemonHeartbeat
 
@@ -189,6 +190,12 @@ def from_config_value(
     def add_run(self, dagster_run: "DagsterRun") -> "DagsterRun":
         return self._storage.run_storage.add_run(dagster_run)
 
+    def add_runs(self, dagster_runs: Sequence["DagsterRun"]) -> Sequence["DagsterRun"]:
+        return self._storage.run_storage.add_runs(dagster_runs)
+
+    def get_tags_for_runs(self, run_ids: Sequence[str]) -> Mapping[str, Mapping[str, str]]:
+        return self._storage.run_storage.get_tags_for_runs(run_ids)
+
     def handle_run_event(self, run_id: str, event: "DagsterEvent") -> None:
         return self._storage.run_storage.handle_run_event(run_id, event)
 
@@ -400,9 +407,22 @@ def get_step_stats_for_run(
     def store_event(self, event: "EventLogEntry") -> None:
         return self._storage.event_log_storage.store_event(event)
 
+    def store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        return self._storage.event_log_storage.store_events(events)
+
     def delete_events(self, run_id: str) -> None:
         return self._storage.event_log_storage.delete_events(run_id)
 
+    @property
+    def supports_event_log_archival(self) -> bool:
+        return self._storage.event_log_storage.supports_event_log_archival
+
+    def archive_events(self, run_id: str, archive: "EventLogArchive") -> Optional[int]:
+        return self._storage.event_log_storage.archive_events(run_id, archive)
+
+    def delete_archived_events(self, run_id: str, up_to_storage_id: int) -> None:
+        return self._storage.event_log_storage.delete_archived_events(run_id, up_to_storage_id)
+
     def upgrade(self) -> None:
         return self._storage.event_log_storage.upgrade()
 
@@ -421,6 +441,10 @@ def watch(self, run_id: str, cursor: str, callback: EventHandlerFn) -> None:
     def end_watch(self, run_id: str, handler: EventHandlerFn) -> None:
         return self._storage.event_log_storage.end_watch(run_id, handler)
 
+    @property
+    def supports_push_event_watch(self) -> bool:
+        return self._storage.event_log_storage.supports_push_event_watch
+
     @property
     def is_persistent(self) -> bool:
         return self._storage.event_log_storage.is_persistent
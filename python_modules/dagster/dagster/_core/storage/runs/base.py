@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Mapping, Optional, Sequence, Set, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Sequence, Set, Tuple, Union
 
 from typing_extensions import TypedDict
 
@@ -53,6 +53,17 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
             dagster_run (DagsterRun): The run to add.
         """
 
+    def add_runs(self, dagster_runs: Sequence[DagsterRun]) -> Sequence[DagsterRun]:
+        """Add a batch of runs to storage. Storages that can insert several runs in a single
+        round trip should override this method.
+
+        Raises the same errors as ``add_run``.
+
+        Args:
+            dagster_runs (Sequence[DagsterRun]): The runs to add.
+        """
+        return [self.add_run(dagster_run) for dagster_run in dagster_runs]
+
     @abstractmethod
     def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
         """Update run storage in accordance to a pipeline run related DagsterEvent.
@@ -179,6 +190,23 @@ def get_run_tag_keys(self) -> Sequence[str]:
             List[str]
         """
 
+    def get_tags_for_runs(self, run_ids: Sequence[str]) -> Mapping[str, Mapping[str, str]]:
+        """Get the stored tags of each of the given runs, without loading the run bodies. Storages
+        that can read the tags separately from the runs should override this method.
+
+        Args:
+            run_ids (Sequence[str]): The runs to fetch tags for.
+
+        Returns:
+            Mapping[str, Mapping[str, str]]: The tags of each run, keyed by run ID. Runs that have
+                no tags, or that are not found, map to an empty dict.
+        """
+        tags_by_run_id: Dict[str, Mapping[str, str]] = {run_id: {} for run_id in run_ids}
+        if run_ids:
+            for run in self.get_runs(RunsFilter(run_ids=run_ids)):
+                tags_by_run_id[run.run_id] = run.tags_for_storage()
+        return tags_by_run_id
+
     @abstractmethod
     def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
         """Add additional tags for a pipeline run.
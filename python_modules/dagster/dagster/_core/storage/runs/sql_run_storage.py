@@ -3,6 +3,7 @@
 import zlib
 from abc import abstractmethod
 from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
 from typing import (
@@ -11,6 +12,7 @@
     ContextManager,
     Dict,
     Iterable,
+    Iterator,
     Mapping,
     NamedTuple,
     Optional,
@@ -59,7 +61,9 @@
 from dagster._serdes import (
     deserialize_value,
     serialize_value,
+    serialize_value_to_bytes,
 )
+from dagster._serdes.serdes import BINARY_SERDES_MAGIC
 from dagster._seven import JSONDecodeError
 from dagster._utils import PrintFn, utc_datetime_from_timestamp
 from dagster._utils.merger import merge_dicts
@@ -91,6 +95,8 @@
     SnapshotsTable,
 )
 
+RUN_IDS_QUERY_CHUNK_SIZE = 500
+
 
 class SnapshotType(Enum):
     PIPELINE = "PIPELINE"
@@ -110,6 +116,17 @@ def upgrade(self) -> None:
         out-of-date instance of the storage up to date.
         """
 
+    @contextmanager
+    def _transaction(self, conn: Connection) -> Iterator[Connection]:
+        """Context manager yielding a connection on which all statements are executed in one
+        transaction. Storages whose connections autocommit every statement override this.
+        """
+        if conn.in_transaction():
+            yield conn
+        else:
+            with conn.begin():
+                yield conn
+
     def fetchall(self, query: SqlAlchemyQuery) -> Sequence[Any]:
         with self.connect() as conn:
             return db_fetch_mappings(conn, query)
@@ -123,44 +140,52 @@ def fetchone(self, query: SqlAlchemyQuery) -> Optional[Any]:
 
     def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
         check.inst_param(dagster_run, "dagster_run", DagsterRun)
+        return self.add_runs([dagster_run])[0]
+
+    def add_runs(self, dagster_runs: Sequence[DagsterRun]) -> Sequence[DagsterRun]:
+        check.sequence_param(dagster_runs, "dagster_runs", of_type=DagsterRun)
+        if not dagster_runs:
+            return []
+
+        # many runs in a batch typically share a job snapshot, so only check each one once
+        for snapshot_id in {run.job_snapshot_id for run in dagster_runs if run.job_snapshot_id}:
+            if not self.has_job_snapshot(snapshot_id):
+                raise DagsterSnapshotDoesNotExist(
+                    f"Snapshot {snapshot_id} does not exist in run storage"
+                )
 
-        if dagster_run.job_snapshot_id and not self.has_job_snapshot(dagster_run.job_snapshot_id):
-            raise DagsterSnapshotDoesNotExist(
-                "Snapshot {ss_id} does not exist in run storage".format(
-                    ss_id=dagster_run.job_snapshot_id
+        run_rows = []
+        tag_rows = []
+        for dagster_run in dagster_runs:
+            has_tags = dagster_run.tags and len(dagster_run.tags) > 0
+            run_rows.append(
+                dict(
+                    run_id=dagster_run.run_id,
+                    pipeline_name=dagster_run.job_name,
+                    status=dagster_run.status.value,
+                    run_body=serialize_value(dagster_run),
+                    snapshot_id=dagster_run.job_snapshot_id,
+                    partition=dagster_run.tags.get(PARTITION_NAME_TAG) if has_tags else None,
+                    partition_set=dagster_run.tags.get(PARTITION_SET_TAG) if has_tags else None,
                 )
             )
+            tag_rows.extend(
+                dict(run_id=dagster_run.run_id, key=k, value=v)
+                for k, v in dagster_run.tags_for_storage().items()
+            )
 
-        has_tags = dagster_run.tags and len(dagster_run.tags) > 0
-        partition = dagster_run.tags.get(PARTITION_NAME_TAG) if has_tags else None
-        partition_set = dagster_run.tags.get(PARTITION_SET_TAG) if has_tags else None
-
-        runs_insert = RunsTable.insert().values(
-            run_id=dagster_run.run_id,
-            pipeline_name=dagster_run.job_name,
-            status=dagster_run.status.value,
-            run_body=serialize_value(dagster_run),
-            snapshot_id=dagster_run.job_snapshot_id,
-            partition=partition,
-            partition_set=partition_set,
-        )
-        with self.connect() as conn:
+        # the runs and their tags are inserted in one transaction, so that a failure leaves none of
+        # the runs in the batch behind
+        with self.connect() as conn, self._transaction(conn) as txn_conn:
             try:
-                conn.execute(runs_insert)
+                txn_conn.execute(RunsTable.insert(), run_rows)
             except db_exc.IntegrityError as exc:
                 raise DagsterRunAlreadyExists from exc
 
-            tags_to_insert = dagster_run.tags_for_storage()
-            if tags_to_insert:
-                conn.execute(
-                    RunTagsTable.insert(),
-                    [
-                        dict(run_id=dagster_run.run_id, key=k, value=v)
-                        for k, v in tags_to_insert.items()
-                    ],
-                )
+            if tag_rows:
+                txn_conn.execute(RunTagsTable.insert(), tag_rows)
 
-        return dagster_run
+        return dagster_runs
 
     def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
         check.str_param(run_id, "run_id")
@@ -440,6 +465,19 @@ def get_run_tag_keys(self) -> Sequence[str]:
         rows = self.fetchall(query)
         return sorted([r["key"] for r in rows])
 
+    def get_tags_for_runs(self, run_ids: Sequence[str]) -> Mapping[str, Mapping[str, str]]:
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+
+        tags_by_run_id: Dict[str, Dict[str, str]] = {run_id: {} for run_id in run_ids}
+        # query in chunks, to stay under the limit on the number of bound parameters
+        for i in range(0, len(run_ids), RUN_IDS_QUERY_CHUNK_SIZE):
+            query = db_select(
+                [RunTagsTable.c.run_id, RunTagsTable.c.key, RunTagsTable.c.value]
+            ).where(RunTagsTable.c.run_id.in_(run_ids[i : i + RUN_IDS_QUERY_CHUNK_SIZE]))
+            for row in self.fetchall(query):
+                tags_by_run_id[row["run_id"]][row["key"]] = row["value"]
+        return tags_by_run_id
+
     def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
         check.str_param(run_id, "run_id")
         check.mapping_param(new_tags, "new_tags", key_type=str, value_type=str)
@@ -583,6 +621,11 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
         return self._get_snapshot(execution_plan_snapshot_id)  # type: ignore  # (allowed to return None?)
 
+    def _serialize_snapshot(self, snapshot_obj) -> bytes:
+        if self.has_instance and self._instance.binary_serdes_snapshots_enabled:
+            return serialize_value_to_bytes(snapshot_obj)
+        return serialize_value(snapshot_obj).encode("utf-8")
+
     def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotType) -> str:
         check.str_param(snapshot_id, "snapshot_id")
         check.not_none_param(snapshot_obj, "snapshot_obj")
@@ -591,7 +634,7 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
         with self.connect() as conn:
             snapshot_insert = SnapshotsTable.insert().values(
                 snapshot_id=snapshot_id,
-                snapshot_body=zlib.compress(serialize_value(snapshot_obj).encode("utf-8")),
+                snapshot_body=zlib.compress(self._serialize_snapshot(snapshot_obj)),
                 snapshot_type=snapshot_type.value,
             )
             try:
@@ -936,6 +979,14 @@ def _warn(msg: str) -> None:
         _warn("Could not decompress bytes stored in snapshot table.")
         return None
 
+    if uncompressed_bytes.startswith(BINARY_SERDES_MAGIC):
+        try:
+            return deserialize_value(uncompressed_bytes, (ExecutionPlanSnapshot, JobSnapshot))
+        except ValueError:
+            # raised by msgpack for malformed data
+            _warn("Could not unpack binary encoded snapshot in snapshot table.")
+            return None
+
     try:
         decoded_str = uncompressed_bytes.decode("utf-8")
     except UnicodeDecodeError:
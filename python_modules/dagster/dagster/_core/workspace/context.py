@@ -11,6 +11,7 @@
 from typing_extensions import Self
 
 import dagster._check as check
+from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
 from dagster._core.definitions.selector import JobSubsetSelector
 from dagster._core.errors import (
     DagsterCodeLocationLoadError,
@@ -661,6 +662,8 @@ def reload_code_location(self, name: str) -> None:
             # Relying on GC to clean up the old location once nothing else
             # is referencing it
             self._location_entry_dict[name] = new
+        # release asset graphs that hold on to the old location
+        ExternalAssetGraph.clear_cache()
 
     def shutdown_code_location(self, name: str) -> None:
         with self._lock:
@@ -704,6 +707,7 @@ def _update_workspace(self, new_locations: Dict[str, CodeLocationEntry]):
         for watch_thread in previous_threads.values():
             watch_thread.join()
 
+        ExternalAssetGraph.clear_cache()
         for entry in previous_locations.values():
             if entry.code_location:
                 entry.code_location.cleanup()
@@ -742,6 +746,8 @@ def refresh_code_location(self, name: str) -> None:
             # Relying on GC to clean up the old location once nothing else
             # is referencing it
             self._location_entry_dict[name] = new
+        # release asset graphs that hold on to the old location
+        ExternalAssetGraph.clear_cache()
 
     def __enter__(self):
         return self
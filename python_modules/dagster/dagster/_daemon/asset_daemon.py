@@ -1,24 +1,35 @@
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, List, Optional
 
 import pendulum
 
 import dagster._check as check
-from dagster._core.definitions.asset_daemon_context import AssetDaemonContext
+from dagster._core.definitions.asset_daemon_context import (
+    AssetDaemonContext,
+    IncrementalEvaluationState,
+)
 from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.data_time import DataTimeCache
 from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
-from dagster._core.definitions.run_request import RunRequest
-from dagster._core.definitions.selector import JobSubsetSelector
+from dagster._core.execution.submit_asset_runs import (
+    RUN_SUBMISSION_CHUNK_SIZE,
+    ExternalJobAndExecutionPlanCache,
+    submit_asset_runs,
+)
 from dagster._core.instance import DagsterInstance
-from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus
 from dagster._core.storage.tags import (
     ASSET_EVALUATION_ID_TAG,
     AUTO_MATERIALIZE_TAG,
     AUTO_OBSERVE_TAG,
 )
+from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import IWorkspaceProcessContext
-from dagster._core.workspace.workspace import IWorkspace
 from dagster._daemon.daemon import DaemonIterator, IntervalDaemon
 
+if TYPE_CHECKING:
+    from dagster._core.storage.dagster_run import DagsterRun
+
 CURSOR_KEY = "ASSET_DAEMON_CURSOR"
 ASSET_DAEMON_PAUSED_KEY = "ASSET_DAEMON_PAUSED"
 
@@ -51,8 +62,30 @@ def get_current_evaluation_id(instance: DagsterInstance) -> Optional[int]:
 
 class AssetDaemon(IntervalDaemon):
     def __init__(self, interval_seconds: int):
+        self._exit_stack = ExitStack()
+        self._threadpool_executor: Optional[ThreadPoolExecutor] = None
+        # data times of records with immutable lineage, shared across ticks
+        self._data_time_cache = DataTimeCache()
+        # per-asset state of incremental evaluations, shared across ticks
+        self._incremental_evaluation_state = IncrementalEvaluationState()
         super().__init__(interval_seconds=interval_seconds)
 
+    def _get_threadpool_executor(self, max_workers: Optional[int]) -> ThreadPoolExecutor:
+        if self._threadpool_executor is None:
+            # assumes max_workers wont change
+            self._threadpool_executor = self._exit_stack.enter_context(
+                InheritContextThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix="asset_daemon_worker",
+                )
+            )
+        return self._threadpool_executor
+
+    def __exit__(self, _exception_type, _exception_value, _traceback):
+        self._threadpool_executor = None
+        self._exit_stack.close()
+        super().__exit__(_exception_type, _exception_value, _traceback)
+
     @classmethod
     def daemon_type(cls) -> str:
         return "ASSET"
@@ -102,7 +135,14 @@ def run_iteration(
             else AssetDaemonCursor.empty()
         )
 
-        run_requests, new_cursor, evaluations = AssetDaemonContext(
+        settings = instance.get_settings("auto_materialize")
+        threadpool_executor = (
+            self._get_threadpool_executor(settings.get("num_workers"))
+            if settings.get("use_threads")
+            else None
+        )
+
+        context = AssetDaemonContext(
             asset_graph=asset_graph,
             target_asset_keys=target_asset_keys,
             instance=instance,
@@ -114,29 +154,55 @@ def run_iteration(
             observe_run_tags={AUTO_OBSERVE_TAG: "true"},
             auto_observe=True,
             respect_materialization_data_versions=instance.auto_materialize_respect_materialization_data_versions,
-        ).evaluate()
+            evaluate_incrementally=instance.auto_materialize_evaluate_incrementally,
+            threadpool_executor=threadpool_executor,
+            data_time_cache=self._data_time_cache,
+            incremental_evaluation_state=self._incremental_evaluation_state,
+        )
+        run_requests, new_cursor, evaluations = context.evaluate()
+
+        rule_evaluation_seconds = context.get_rule_evaluation_seconds()
+        if rule_evaluation_seconds:
+            self._logger.info(
+                "Time spent evaluating auto-materialize rules: "
+                + ", ".join(
+                    f"{rule_name}: {seconds:.3f}s"
+                    for rule_name, seconds in sorted(
+                        rule_evaluation_seconds.items(), key=lambda item: item[1], reverse=True
+                    )
+                )
+            )
 
         evaluations_by_asset_key = {evaluation.asset_key: evaluation for evaluation in evaluations}
 
-        for run_request in run_requests:
+        run_requests = [
+            run_request._replace(
+                tags={
+                    **run_request.tags,
+                    ASSET_EVALUATION_ID_TAG: str(new_cursor.evaluation_id),
+                }
+            )
+            for run_request in run_requests
+        ]
+        runs: List["DagsterRun"] = []
+        external_job_and_execution_plan_cache: ExternalJobAndExecutionPlanCache = {}
+        for i in range(0, len(run_requests), RUN_SUBMISSION_CHUNK_SIZE):
             yield
 
-            asset_keys = check.not_none(run_request.asset_selection)
-
-            run = submit_asset_run(
-                run_request._replace(
-                    tags={
-                        **run_request.tags,
-                        ASSET_EVALUATION_ID_TAG: str(new_cursor.evaluation_id),
-                    }
-                ),
-                instance,
-                workspace,
-                asset_graph,
+            runs.extend(
+                submit_asset_runs(
+                    run_requests[i : i + RUN_SUBMISSION_CHUNK_SIZE],
+                    instance,
+                    workspace,
+                    asset_graph,
+                    external_job_and_execution_plan_cache=external_job_and_execution_plan_cache,
+                    threadpool_executor=threadpool_executor,
+                )
             )
 
-            # add run id to evaluations
-            for asset_key in asset_keys:
+        # add run id to evaluations
+        for run_request, run in zip(run_requests, runs):
+            for asset_key in check.not_none(run_request.asset_selection):
                 # asset keys for observation runs don't have evaluations
                 if asset_key in evaluations_by_asset_key:
                     evaluation = evaluations_by_asset_key[asset_key]
@@ -155,64 +221,3 @@ def run_iteration(
             schedule_storage.purge_asset_evaluations(
                 before=pendulum.now("UTC").subtract(days=EVALUATIONS_TTL_DAYS).timestamp(),
             )
-
-
-def submit_asset_run(
-    run_request: RunRequest,
-    instance: DagsterInstance,
-    workspace: IWorkspace,
-    asset_graph: ExternalAssetGraph,
-) -> DagsterRun:
-    asset_keys = check.not_none(run_request.asset_selection)
-    check.invariant(len(asset_keys) > 0)
-
-    repo_handle = asset_graph.get_repository_handle(asset_keys[0])
-
-    # Check that all asset keys are from the same repo
-    for key in asset_keys[1:]:
-        check.invariant(repo_handle == asset_graph.get_repository_handle(key))
-
-    location_name = repo_handle.code_location_origin.location_name
-    repository_name = repo_handle.repository_name
-    job_name = check.not_none(asset_graph.get_implicit_job_name_for_assets(asset_keys))
-
-    code_location = workspace.get_code_location(location_name)
-    external_job = code_location.get_external_job(
-        JobSubsetSelector(
-            location_name=location_name,
-            repository_name=repository_name,
-            job_name=job_name,
-            op_selection=None,
-            asset_selection=asset_keys,
-        )
-    )
-
-    external_execution_plan = code_location.get_external_execution_plan(
-        external_job,
-        run_request.run_config,
-        step_keys_to_execute=None,
-        known_state=None,
-        instance=instance,
-    )
-    execution_plan_snapshot = external_execution_plan.execution_plan_snapshot
-
-    run = instance.create_run(
-        job_name=external_job.name,
-        run_id=None,
-        run_config=None,
-        resolved_op_selection=None,
-        step_keys_to_execute=None,
-        status=DagsterRunStatus.NOT_STARTED,
-        op_selection=None,
-        root_run_id=None,
-        parent_run_id=None,
-        tags=run_request.tags,
-        job_snapshot=external_job.job_snapshot,
-        execution_plan_snapshot=execution_plan_snapshot,
-        parent_job_snapshot=external_job.parent_job_snapshot,
-        external_job_origin=external_job.get_external_origin(),
-        job_code_origin=external_job.get_python_origin(),
-        asset_selection=frozenset(asset_keys),
-    )
-    instance.submit_run(run.run_id, workspace)
-    return run
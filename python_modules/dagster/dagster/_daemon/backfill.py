@@ -1,10 +1,11 @@
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable, Mapping, Optional, cast
 
 from dagster._core.execution.asset_backfill import execute_asset_backfill_iteration
 from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
-from dagster._core.execution.job_backfill import execute_job_backfill_iteration
+from dagster._core.execution.job_backfill import CHECKPOINT_COUNT, execute_job_backfill_iteration
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
@@ -13,6 +14,8 @@ def execute_backfill_iteration(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
     debug_crash_flags: Optional[Mapping[str, int]] = None,
+    submit_threadpool_executor: Optional[ThreadPoolExecutor] = None,
+    job_backfill_chunk_size: int = CHECKPOINT_COUNT,
 ) -> Iterable[Optional[SerializableErrorInfo]]:
     instance = workspace_process_context.instance
 
@@ -36,7 +39,13 @@ def execute_backfill_iteration(
                 )
             else:
                 yield from execute_job_backfill_iteration(
-                    backfill, logger, workspace_process_context, debug_crash_flags, instance
+                    backfill,
+                    logger,
+                    workspace_process_context,
+                    debug_crash_flags,
+                    instance,
+                    submit_threadpool_executor=submit_threadpool_executor,
+                    chunk_size=job_backfill_chunk_size,
                 )
         except Exception:
             error_info = serializable_error_info_from_exc_info(sys.exc_info())
@@ -4,7 +4,7 @@
 import uuid
 from abc import ABC, abstractmethod
 from collections import deque
-from contextlib import AbstractContextManager
+from contextlib import AbstractContextManager, ExitStack
 from threading import Event
 from typing import TYPE_CHECKING, Generator, Generic, Optional, TypeVar, Union
 
@@ -15,8 +15,10 @@
     DagsterInstance,
     _check as check,
 )
+from dagster._core.execution.job_backfill import CHECKPOINT_COUNT
 from dagster._core.scheduler.scheduler import DagsterDaemonScheduler
 from dagster._core.telemetry import DAEMON_ALIVE, log_action
+from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._daemon.backfill import execute_backfill_iteration
 from dagster._daemon.monitoring import (
@@ -29,6 +31,8 @@
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
     from pendulum.datetime import DateTime
 
 
@@ -276,15 +280,46 @@ def core_loop(
 
 
 class BackfillDaemon(IntervalDaemon):
+    def __init__(self, interval_seconds):
+        self._exit_stack = ExitStack()
+        self._submit_threadpool_executor: Optional[ThreadPoolExecutor] = None
+        super().__init__(interval_seconds)
+
     @classmethod
     def daemon_type(cls) -> str:
         return "BACKFILL"
 
+    def __exit__(self, _exception_type, _exception_value, _traceback):
+        self._submit_threadpool_executor = None
+        self._exit_stack.close()
+        super().__exit__(_exception_type, _exception_value, _traceback)
+
     def run_iteration(
         self,
         workspace_process_context: IWorkspaceProcessContext,
     ) -> DaemonIterator:
-        yield from execute_backfill_iteration(workspace_process_context, self._logger)
+        settings = workspace_process_context.instance.get_settings("backfills")
+        num_submit_workers = settings.get("num_submit_workers")
+        if settings.get("use_threads") and self._submit_threadpool_executor is None:
+            # assumes the settings won't change
+            self._submit_threadpool_executor = self._exit_stack.enter_context(
+                InheritContextThreadPoolExecutor(
+                    max_workers=num_submit_workers,
+                    thread_name_prefix="backfill_submit_worker",
+                )
+            )
+
+        yield from execute_backfill_iteration(
+            workspace_process_context,
+            self._logger,
+            submit_threadpool_executor=self._submit_threadpool_executor,
+            # submit enough runs per chunk to keep each of the workers busy
+            job_backfill_chunk_size=(
+                CHECKPOINT_COUNT * num_submit_workers
+                if self._submit_threadpool_executor and num_submit_workers
+                else CHECKPOINT_COUNT
+            ),
+        )
 
 
 class MonitoringDaemon(IntervalDaemon):
@@ -1,9 +1,21 @@
 import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+import pendulum
 
 from dagster import (
     DagsterEvent,
@@ -23,11 +35,10 @@
 )
 from dagster._core.storage.dagster_run import (
     IN_PROGRESS_RUN_STATUSES,
-    DagsterRun,
     DagsterRunStatus,
     RunsFilter,
 )
-from dagster._core.storage.tags import PRIORITY_TAG
+from dagster._core.storage.tags import PRIORITY_TAG, REPOSITORY_LABEL_TAG
 from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._core.workspace.workspace import IWorkspace
@@ -35,6 +46,36 @@
 from dagster._utils.error import serializable_error_info_from_exc_info
 from dagster._utils.tags import TagConcurrencyLimitsCounter
 
+if TYPE_CHECKING:
+    from pendulum.datetime import DateTime
+
+# The update timestamp of a run is set from the clock of the process that updated it, so runs
+# updated this long before the previous read of the in-progress run tags are also re-read
+IN_PROGRESS_RUN_TAGS_CLOCK_SKEW_SECONDS = 60
+
+
+class TaggedRun(NamedTuple):
+    """Lightweight view of a queued or in progress run, read from the run tags table so that the
+    run body does not need to be loaded.
+    """
+
+    run_id: str
+    tags: Mapping[str, str]
+    location_name: Optional[str]
+
+    @staticmethod
+    def from_stored_tags(run_id: str, stored_tags: Mapping[str, str]) -> "TaggedRun":
+        # The repository label is added to the stored tags of runs with an external job origin, as
+        # "<repository name>@<location name>". Very old (pre 0.10.0) runs and programatically
+        # submitted runs may not have an attached code location name
+        repository_label = stored_tags.get(REPOSITORY_LABEL_TAG)
+        location_name = repository_label.partition("@")[2] if repository_label else None
+        return TaggedRun(
+            run_id=run_id,
+            tags={key: value for key, value in stored_tags.items() if key != REPOSITORY_LABEL_TAG},
+            location_name=location_name or None,
+        )
+
 
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
     """Used with the QueuedRunCoordinator on the instance. This process finds queued runs from the run
@@ -46,6 +87,13 @@ def __init__(self, interval_seconds) -> None:
         self._executor: Optional[ThreadPoolExecutor] = None
         self._location_timeouts_lock = threading.Lock()
         self._location_timeouts: Dict[str, float] = {}
+        # stored tags of the runs that were in progress as of the last iteration, so that only the
+        # tags of runs that have since started or been updated need to be fetched
+        self._in_progress_run_tags: Dict[str, Mapping[str, str]] = {}
+        self._in_progress_run_tags_read_time: Optional["DateTime"] = None
+        # launches that are still in flight from previous iterations, when pipelining launches
+        self._launch_futures: Dict[str, Future] = {}
+        self._launching_runs: Dict[str, TaggedRun] = {}
         super().__init__(interval_seconds)
 
     def _get_executor(self, max_workers) -> ThreadPoolExecutor:
@@ -80,6 +128,9 @@ def run_iteration(
         run_queue_config = run_coordinator.get_run_queue_config()
 
         instance = workspace_process_context.instance
+        if self._launch_futures:
+            self._collect_finished_launches()
+
         runs_to_dequeue = self._get_runs_to_dequeue(
             instance, run_queue_config, fixed_iteration_time=fixed_iteration_time
         )
@@ -95,11 +146,19 @@ def _dequeue_runs_iter(
         self,
         workspace_process_context: IWorkspaceProcessContext,
         run_coordinator: QueuedRunCoordinator,
-        runs_to_dequeue: List[DagsterRun],
+        runs_to_dequeue: List[TaggedRun],
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
     ) -> Iterator[None]:
-        if run_coordinator.dequeue_use_threads:
+        if run_coordinator.dequeue_use_threads and run_coordinator.dequeue_pipeline_launches:
+            yield from self._dequeue_runs_iter_pipelined(
+                workspace_process_context,
+                runs_to_dequeue,
+                run_coordinator.dequeue_num_workers,
+                run_queue_config,
+                fixed_iteration_time=fixed_iteration_time,
+            )
+        elif run_coordinator.dequeue_use_threads:
             yield from self._dequeue_runs_iter_threaded(
                 workspace_process_context,
                 runs_to_dequeue,
@@ -118,14 +177,14 @@ def _dequeue_runs_iter(
     def _dequeue_run_thread(
         self,
         workspace_process_context: IWorkspaceProcessContext,
-        run: DagsterRun,
+        run_id: str,
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
     ) -> bool:
         return self._dequeue_run(
             workspace_process_context.instance,
             workspace_process_context.create_request_context(),
-            run,
+            run_id,
             run_queue_config,
             fixed_iteration_time,
         )
@@ -133,7 +192,7 @@ def _dequeue_run_thread(
     def _dequeue_runs_iter_threaded(
         self,
         workspace_process_context: IWorkspaceProcessContext,
-        runs_to_dequeue: List[DagsterRun],
+        runs_to_dequeue: List[TaggedRun],
         max_workers: Optional[int],
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
@@ -144,7 +203,7 @@ def _dequeue_runs_iter_threaded(
             self._get_executor(max_workers).submit(
                 self._dequeue_run_thread,
                 workspace_process_context,
-                run,
+                run.run_id,
                 run_queue_config,
                 fixed_iteration_time=fixed_iteration_time,
             )
@@ -158,10 +217,46 @@ def _dequeue_runs_iter_threaded(
         if num_dequeued_runs > 0:
             self._logger.info("Launched %d runs.", num_dequeued_runs)
 
+    def _dequeue_runs_iter_pipelined(
+        self,
+        workspace_process_context: IWorkspaceProcessContext,
+        runs_to_dequeue: List[TaggedRun],
+        max_workers: Optional[int],
+        run_queue_config: RunQueueConfig,
+        fixed_iteration_time: Optional[float],
+    ) -> Iterator[None]:
+        # Submit the launches without waiting for them to finish, so that a code location that is
+        # slow to launch runs does not hold up the next iteration. The launches still in flight
+        # are skipped, and count against the concurrency limits, in the following iterations.
+        for run in runs_to_dequeue:
+            self._launch_futures[run.run_id] = self._get_executor(max_workers).submit(
+                self._dequeue_run_thread,
+                workspace_process_context,
+                run.run_id,
+                run_queue_config,
+                fixed_iteration_time=fixed_iteration_time,
+            )
+            self._launching_runs[run.run_id] = run
+            yield None
+
+    def _collect_finished_launches(self) -> None:
+        num_dequeued_runs = 0
+        for run_id, future in list(self._launch_futures.items()):
+            if not future.done():
+                continue
+
+            del self._launch_futures[run_id]
+            del self._launching_runs[run_id]
+            if future.result():
+                num_dequeued_runs += 1
+
+        if num_dequeued_runs > 0:
+            self._logger.info("Launched %d runs.", num_dequeued_runs)
+
     def _dequeue_runs_iter_loop(
         self,
         workspace_process_context: IWorkspaceProcessContext,
-        runs_to_dequeue: List[DagsterRun],
+        runs_to_dequeue: List[TaggedRun],
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
     ) -> Iterator[None]:
@@ -170,7 +265,7 @@ def _dequeue_runs_iter_loop(
             run_launched = self._dequeue_run(
                 workspace_process_context.instance,
                 workspace_process_context.create_request_context(),
-                run,
+                run.run_id,
                 run_queue_config,
                 fixed_iteration_time=fixed_iteration_time,
             )
@@ -186,7 +281,7 @@ def _get_runs_to_dequeue(
         instance: DagsterInstance,
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
-    ) -> List[DagsterRun]:
+    ) -> List[TaggedRun]:
         if not isinstance(instance.run_coordinator, QueuedRunCoordinator):
             check.failed(f"Expected QueuedRunCoordinator, got {instance.run_coordinator}")
 
@@ -240,7 +335,7 @@ def _get_runs_to_dequeue(
             tag_concurrency_limits, in_progress_runs
         )
 
-        batch: List[DagsterRun] = []
+        batch: List[TaggedRun] = []
         for run in sorted_runs:
             if max_concurrent_runs_enabled and len(batch) >= max_runs_to_launch:
                 break
@@ -248,10 +343,7 @@ def _get_runs_to_dequeue(
             if tag_concurrency_limits_counter.is_blocked(run):
                 continue
 
-            location_name = (
-                run.external_job_origin.location_name if run.external_job_origin else None
-            )
-            if location_name and location_name in paused_location_names:
+            if run.location_name and run.location_name in paused_location_names:
                 continue
 
             tag_concurrency_limits_counter.update_counters_with_launched_item(run)
@@ -259,18 +351,71 @@ def _get_runs_to_dequeue(
 
         return batch
 
-    def _get_queued_runs(self, instance: DagsterInstance) -> Sequence[DagsterRun]:
+    def _get_queued_runs(self, instance: DagsterInstance) -> Sequence[TaggedRun]:
         queued_runs_filter = RunsFilter(statuses=[DagsterRunStatus.QUEUED])
 
-        # Reversed for fifo ordering
-        runs = instance.get_runs(filters=queued_runs_filter)[::-1]
-        return runs
+        # Reversed for fifo ordering. Runs whose launch is still in flight from a previous iteration
+        # are skipped.
+        run_ids = [
+            run_id
+            for run_id in instance.get_run_ids(filters=queued_runs_filter)[::-1]
+            if run_id not in self._launching_runs
+        ]
+        tags_by_run_id = instance.get_tags_for_runs(run_ids)
+        return [TaggedRun.from_stored_tags(run_id, tags_by_run_id[run_id]) for run_id in run_ids]
+
+    def _get_in_progress_runs(self, instance: DagsterInstance) -> List[TaggedRun]:
+        read_time = pendulum.now("UTC")
+        in_progress_run_ids = instance.get_run_ids(
+            filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)
+        )
 
-    def _get_in_progress_runs(self, instance: DagsterInstance) -> Sequence[DagsterRun]:
-        return instance.get_runs(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
+        # Only the tags of the runs that have started since the previous iteration are fetched,
+        # along with those of the in-progress runs that have been updated since. Tags can be added
+        # to a run while it is in progress, which also updates the run, so these are the only runs
+        # whose stored tags can differ from the cached ones. Runs that have finished since the
+        # previous iteration are dropped.
+        stale_run_ids = {
+            run_id for run_id in in_progress_run_ids if run_id not in self._in_progress_run_tags
+        }
+        if self._in_progress_run_tags_read_time is not None:
+            stale_run_ids.update(
+                instance.get_run_ids(
+                    filters=RunsFilter(
+                        statuses=IN_PROGRESS_RUN_STATUSES,
+                        updated_after=self._in_progress_run_tags_read_time.subtract(
+                            seconds=IN_PROGRESS_RUN_TAGS_CLOCK_SKEW_SECONDS
+                        ),
+                    )
+                )
+            )
+        stale_run_tags = (
+            instance.get_tags_for_runs(sorted(stale_run_ids)) if stale_run_ids else {}
+        )
+        self._in_progress_run_tags = {
+            run_id: (
+                stale_run_tags[run_id]
+                if run_id in stale_run_tags
+                else self._in_progress_run_tags[run_id]
+            )
+            for run_id in in_progress_run_ids
+        }
+        self._in_progress_run_tags_read_time = read_time
+
+        in_progress_runs = [
+            TaggedRun.from_stored_tags(run_id, tags)
+            for run_id, tags in self._in_progress_run_tags.items()
+        ]
+        # runs whose launch is in flight but that have not yet moved out of the queue
+        in_progress_runs.extend(
+            run
+            for run_id, run in self._launching_runs.items()
+            if run_id not in self._in_progress_run_tags
+        )
+        return in_progress_runs
 
-    def _priority_sort(self, runs: Iterable[DagsterRun]) -> Sequence[DagsterRun]:
-        def get_priority(run: DagsterRun) -> int:
+    def _priority_sort(self, runs: Iterable[TaggedRun]) -> Sequence[TaggedRun]:
+        def get_priority(run: TaggedRun) -> int:
             priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
             try:
                 return int(priority_tag_value)
@@ -291,12 +436,12 @@ def _dequeue_run(
         self,
         instance: DagsterInstance,
         workspace: IWorkspace,
-        run: DagsterRun,
+        run_id: str,
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
     ) -> bool:
         # double check that the run is still queued before dequeing
-        run = check.not_none(instance.get_run_by_id(run.run_id))
+        run = check.not_none(instance.get_run_by_id(run_id))
 
         now = fixed_iteration_time or time.time()
 
@@ -16,6 +16,7 @@
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Type,
     Union,
     cast,
@@ -35,10 +36,13 @@
 from dagster._core.definitions.selector import JobSubsetSelector
 from dagster._core.definitions.sensor_definition import DefaultSensorStatus, SensorExecutionData
 from dagster._core.definitions.utils import validate_tags
-from dagster._core.errors import DagsterError
+from dagster._core.errors import DagsterError, DagsterUserCodeProcessError
 from dagster._core.host_representation.code_location import CodeLocation
 from dagster._core.host_representation.external import ExternalJob, ExternalSensor
-from dagster._core.host_representation.external_data import ExternalTargetData
+from dagster._core.host_representation.external_data import (
+    ExternalSensorExecutionErrorData,
+    ExternalTargetData,
+)
 from dagster._core.instance import DagsterInstance
 from dagster._core.scheduler.instigation import (
     DynamicPartitionsRequestResult,
@@ -54,8 +58,10 @@
 from dagster._core.telemetry import SENSOR_RUN_CREATED, hash_name, log_action
 from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._grpc.types import MAX_SENSOR_EXECUTION_BATCH_SIZE, SensorExecutionArgs
 from dagster._scheduler.stale import resolve_stale_or_missing_assets
 from dagster._utils import DebugCrashFlags, SingleInstigatorDebugCrashFlags
+from dagster._utils.deadline_queue import DeadlineQueue
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.merger import merge_dicts
 
@@ -225,6 +231,53 @@ def __exit__(
             )
 
 
+class SensorEvaluationQueue:
+    """Queue of the running sensors, ordered by the timestamp at which each sensor is next due to be
+    evaluated given its min_interval.
+    """
+
+    def __init__(self):
+        self._queue: DeadlineQueue[str] = DeadlineQueue()
+        self._sensors: Dict[str, ExternalSensor] = {}
+
+    def __len__(self) -> int:
+        return len(self._sensors)
+
+    @property
+    def next_evaluation_timestamp(self) -> Optional[float]:
+        return self._queue.next_timestamp
+
+    def update(
+        self,
+        sensors: Mapping[str, ExternalSensor],
+        sensor_states: Mapping[str, InstigatorState],
+    ) -> None:
+        """Replaces the set of running sensors, scheduling each of them from its stored state."""
+        self._sensors = dict(sensors)
+        self._queue.retain(self._sensors.keys())
+
+        for selector_id, external_sensor in self._sensors.items():
+            timestamp = _get_next_evaluation_timestamp(
+                sensor_states.get(selector_id), external_sensor
+            )
+            if self._queue.get_timestamp(selector_id) != timestamp:
+                self._queue.push(selector_id, timestamp)
+
+    def pop_due(self, now: float) -> Sequence[ExternalSensor]:
+        """Returns the sensors that are due at the given timestamp, rescheduling each of them one
+        min_interval later.
+        """
+        due_sensors = [self._sensors[selector_id] for selector_id in self._queue.pop_due(now)]
+        for external_sensor in due_sensors:
+            # sensors are evaluated no more often than the polling loop would evaluate them
+            self._queue.push(
+                external_sensor.selector_id,
+                now + max(external_sensor.min_interval_seconds or 0, MIN_INTERVAL_LOOP_TIME),
+            )
+
+        return due_sensors
+
+
 def _check_for_debug_crash(
     debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags], key: str
 ) -> None:
@@ -276,6 +329,19 @@ def execute_sensor_iteration_loop(
                     )
                 )
 
+        if settings.get("batch_code_location_evaluations"):
+            yield from _execute_batched_sensor_iteration_loop(
+                workspace_process_context,
+                logger,
+                shutdown_event,
+                threadpool_executor=threadpool_executor,
+                submit_threadpool_executor=submit_threadpool_executor,
+                sensor_tick_futures=sensor_tick_futures,
+                sensor_state_lock=sensor_state_lock,
+                until=until,
+            )
+            return
+
         last_verbose_time = None
         while True:
             start_time = pendulum.now("UTC").timestamp()
@@ -312,20 +378,71 @@ def execute_sensor_iteration_loop(
             yield None
 
 
-def execute_sensor_iteration(
+def _execute_batched_sensor_iteration_loop(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
-    threadpool_executor: Optional[ThreadPoolExecutor] = None,
-    submit_threadpool_executor: Optional[ThreadPoolExecutor] = None,
-    sensor_tick_futures: Optional[Dict[str, Future]] = None,
-    sensor_state_lock: Optional[threading.Lock] = None,
-    log_verbose_checks: bool = True,
-    debug_crash_flags: Optional[DebugCrashFlags] = None,
-):
-    instance = workspace_process_context.instance
+    shutdown_event: threading.Event,
+    threadpool_executor: Optional[ThreadPoolExecutor],
+    submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    sensor_tick_futures: Dict[str, Future],
+    sensor_state_lock: threading.Lock,
+    until: Optional[float] = None,
+) -> TDaemonGenerator:
+    """Variant of the sensor iteration loop that sleeps until the next sensor is due, rather than
+    for a fixed interval. The running sensors are only reloaded from the workspace every
+    MIN_INTERVAL_LOOP_TIME seconds; in between, the loop only wakes up to evaluate the sensors that
+    have come due.
+    """
+    sensor_queue = SensorEvaluationQueue()
+    last_refresh_time = None
+    last_verbose_time = None
+    while True:
+        start_time = pendulum.now("UTC").timestamp()
+        if until and start_time >= until:
+            # provide a way of organically ending the loop to support test environment
+            break
+
+        refresh_sensors = (
+            last_refresh_time is None or start_time - last_refresh_time >= MIN_INTERVAL_LOOP_TIME
+        )
+        verbose_logs_iteration = refresh_sensors and (
+            last_verbose_time is None or start_time - last_verbose_time > VERBOSE_LOGS_INTERVAL
+        )
+        yield from execute_batched_sensor_iteration(
+            workspace_process_context,
+            logger,
+            sensor_queue,
+            threadpool_executor=threadpool_executor,
+            submit_threadpool_executor=submit_threadpool_executor,
+            sensor_tick_futures=sensor_tick_futures,
+            sensor_state_lock=sensor_state_lock,
+            log_verbose_checks=verbose_logs_iteration,
+            refresh_sensors=refresh_sensors,
+        )
+        yield None
 
-    if not sensor_state_lock:
-        sensor_state_lock = threading.Lock()
+        end_time = pendulum.now("UTC").timestamp()
+
+        if refresh_sensors:
+            last_refresh_time = start_time
+        if verbose_logs_iteration:
+            last_verbose_time = end_time
+
+        next_wakeup_time = check.not_none(last_refresh_time) + MIN_INTERVAL_LOOP_TIME
+        next_evaluation_timestamp = sensor_queue.next_evaluation_timestamp
+        if next_evaluation_timestamp is not None:
+            next_wakeup_time = min(next_wakeup_time, next_evaluation_timestamp)
+        shutdown_event.wait(max(0, next_wakeup_time - end_time))
+
+        yield None
+
+
+def _get_running_sensors(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    log_verbose_checks: bool,
+) -> Tuple[Dict[str, ExternalSensor], Dict[str, InstigatorState]]:
+    instance = workspace_process_context.instance
 
     workspace_snapshot = {
         location_entry.origin.location_name: location_entry
@@ -339,8 +456,6 @@ def execute_sensor_iteration(
         for sensor_state in instance.all_instigator_state(instigator_type=InstigatorType.SENSOR)
     }
 
-    tick_retention_settings = instance.get_tick_retention_settings(InstigatorType.SENSOR)
-
     sensors: Dict[str, ExternalSensor] = {}
     for location_entry in workspace_snapshot.values():
         code_location = location_entry.code_location
@@ -397,6 +512,30 @@ def execute_sensor_iteration(
                     "Status tab.",
                 )
 
+    return sensors, all_sensor_states
+
+
+def execute_sensor_iteration(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    threadpool_executor: Optional[ThreadPoolExecutor] = None,
+    submit_threadpool_executor: Optional[ThreadPoolExecutor] = None,
+    sensor_tick_futures: Optional[Dict[str, Future]] = None,
+    sensor_state_lock: Optional[threading.Lock] = None,
+    log_verbose_checks: bool = True,
+    debug_crash_flags: Optional[DebugCrashFlags] = None,
+):
+    instance = workspace_process_context.instance
+
+    if not sensor_state_lock:
+        sensor_state_lock = threading.Lock()
+
+    sensors, all_sensor_states = _get_running_sensors(
+        workspace_process_context, logger, log_verbose_checks
+    )
+
+    tick_retention_settings = instance.get_tick_retention_settings(InstigatorType.SENSOR)
+
     if not sensors:
         if log_verbose_checks:
             logger.debug("Not checking for any runs since no sensors have been started.")
@@ -408,14 +547,7 @@ def execute_sensor_iteration(
         sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
         sensor_state = all_sensor_states.get(external_sensor.selector_id)
         if not sensor_state:
-            assert external_sensor.default_status == DefaultSensorStatus.RUNNING
-            sensor_state = InstigatorState(
-                external_sensor.get_external_origin(),
-                InstigatorType.SENSOR,
-                InstigatorStatus.AUTOMATICALLY_RUNNING,
-                SensorInstigatorData(min_interval=external_sensor.min_interval_seconds),
-            )
-            instance.add_instigator_state(sensor_state)
+            sensor_state = _add_automatically_running_sensor_state(instance, external_sensor)
         elif _is_under_min_interval(sensor_state, external_sensor):
             continue
 
@@ -459,6 +591,113 @@ def execute_sensor_iteration(
             )
 
 
+def execute_batched_sensor_iteration(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    sensor_queue: SensorEvaluationQueue,
+    threadpool_executor: Optional[ThreadPoolExecutor] = None,
+    submit_threadpool_executor: Optional[ThreadPoolExecutor] = None,
+    sensor_tick_futures: Optional[Dict[str, Future]] = None,
+    sensor_state_lock: Optional[threading.Lock] = None,
+    log_verbose_checks: bool = True,
+    debug_crash_flags: Optional[DebugCrashFlags] = None,
+    refresh_sensors: bool = True,
+):
+    """Evaluates the sensors in the queue that are currently due, with a single request to each
+    code location for all of its due sensors. If refresh_sensors is set, the queue is first updated
+    with the sensors that are currently running in the workspace.
+    """
+    instance = workspace_process_context.instance
+
+    if not sensor_state_lock:
+        sensor_state_lock = threading.Lock()
+
+    if refresh_sensors:
+        sensors, all_sensor_states = _get_running_sensors(
+            workspace_process_context, logger, log_verbose_checks
+        )
+        for selector_id, external_sensor in sensors.items():
+            if selector_id not in all_sensor_states:
+                all_sensor_states[selector_id] = _add_automatically_running_sensor_state(
+                    instance, external_sensor
+                )
+        sensor_queue.update(sensors, all_sensor_states)
+
+        if not sensors and log_verbose_checks:
+            logger.debug("Not checking for any runs since no sensors have been started.")
+
+    due_sensors = sensor_queue.pop_due(pendulum.now("UTC").timestamp())
+    if not due_sensors:
+        yield
+        return
+
+    tick_retention_settings = instance.get_tick_retention_settings(InstigatorType.SENSOR)
+
+    due_sensors_by_location_name: Dict[str, List[ExternalSensor]] = defaultdict(list)
+    for external_sensor in due_sensors:
+        if threadpool_executor:
+            if sensor_tick_futures is None:
+                check.failed("sensor_tick_futures dict must be passed with threadpool_executor")
+
+            # only allow one tick per sensor to be in flight
+            if (
+                external_sensor.selector_id in sensor_tick_futures
+                and not sensor_tick_futures[external_sensor.selector_id].done()
+            ):
+                continue
+
+        location_name = external_sensor.handle.location_name
+        due_sensors_by_location_name[location_name].append(external_sensor)
+
+    # each batch is evaluated concurrently by the code server, so cap the size of a batch to bound
+    # the number of threads that it uses there
+    sensor_batches = [
+        external_sensors[i : i + MAX_SENSOR_EXECUTION_BATCH_SIZE]
+        for external_sensors in due_sensors_by_location_name.values()
+        for i in range(0, len(external_sensors), MAX_SENSOR_EXECUTION_BATCH_SIZE)
+    ]
+    for external_sensors in sensor_batches:
+        if threadpool_executor:
+            future = threadpool_executor.submit(
+                _process_sensor_batch,
+                workspace_process_context,
+                logger,
+                external_sensors,
+                sensor_state_lock,
+                debug_crash_flags,
+                tick_retention_settings,
+                submit_threadpool_executor,
+            )
+            for external_sensor in external_sensors:
+                check.not_none(sensor_tick_futures)[external_sensor.selector_id] = future
+            yield
+
+        else:
+            yield from _process_sensor_batch_generator(
+                workspace_process_context,
+                logger,
+                external_sensors,
+                sensor_state_lock,
+                debug_crash_flags,
+                tick_retention_settings,
+                submit_threadpool_executor=None,
+            )
+
+
+def _add_automatically_running_sensor_state(
+    instance: DagsterInstance, external_sensor: ExternalSensor
+) -> InstigatorState:
+    assert external_sensor.default_status == DefaultSensorStatus.RUNNING
+    sensor_state = InstigatorState(
+        external_sensor.get_external_origin(),
+        InstigatorType.SENSOR,
+        InstigatorStatus.AUTOMATICALLY_RUNNING,
+        SensorInstigatorData(min_interval=external_sensor.min_interval_seconds),
+    )
+    instance.add_instigator_state(sensor_state)
+    return sensor_state
+
+
 def _process_tick(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
@@ -497,33 +736,13 @@ def _process_tick_generator(
 ):
     instance = workspace_process_context.instance
     error_info = None
-    with sensor_state_lock:
-        # acquire the lock to avoid a race condition where we're updating the recently touched
-        # timestamp on the sensor state, but clobbering it with an older timestamp which might open
-        # us up to a new evaluation being delegated within the minimum interval
-        now = pendulum.now("UTC")
-        sensor_state = check.not_none(
-            instance.get_instigator_state(
-                external_sensor.get_external_origin_id(), external_sensor.selector_id
-            )
-        )
-        if _is_under_min_interval(sensor_state, external_sensor):
-            # check the since we might have been queued before processing
-            return
-        else:
-            _mark_sensor_state_for_tick(instance, external_sensor, sensor_state, now)
+    marked = _mark_sensor_state_for_tick_if_due(instance, external_sensor, sensor_state_lock)
+    if not marked:
+        return
+    sensor_state, now = marked
 
     try:
-        tick = instance.create_tick(
-            TickData(
-                instigator_origin_id=sensor_state.instigator_origin_id,
-                instigator_name=sensor_state.instigator_name,
-                instigator_type=InstigatorType.SENSOR,
-                status=TickStatus.STARTED,
-                timestamp=now.timestamp(),
-                selector_id=external_sensor.selector_id,
-            )
-        )
+        tick = _create_sensor_tick(instance, external_sensor, sensor_state, now)
 
         _check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
 
@@ -547,6 +766,191 @@ def _process_tick_generator(
     yield error_info
 
 
+def _process_sensor_batch(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    external_sensors: Sequence[ExternalSensor],
+    sensor_state_lock: threading.Lock,
+    debug_crash_flags: Optional[DebugCrashFlags],
+    tick_retention_settings,
+    submit_threadpool_executor: Optional[ThreadPoolExecutor],
+):
+    # evaluate the batch immediately, but from within a thread.  The main thread should be able to
+    # heartbeat to keep the daemon alive
+    return list(
+        _process_sensor_batch_generator(
+            workspace_process_context,
+            logger,
+            external_sensors,
+            sensor_state_lock,
+            debug_crash_flags,
+            tick_retention_settings,
+            submit_threadpool_executor,
+        )
+    )
+
+
+def _process_sensor_batch_generator(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    external_sensors: Sequence[ExternalSensor],
+    sensor_state_lock: threading.Lock,
+    debug_crash_flags: Optional[DebugCrashFlags],
+    tick_retention_settings,
+    submit_threadpool_executor: Optional[ThreadPoolExecutor],
+):
+    """Evaluates a batch of sensors from the same code location with a single request, processing
+    the result of each sensor within its own tick as soon as it has been streamed back.
+    """
+    instance = workspace_process_context.instance
+
+    pending_ticks: List[Tuple[ExternalSensor, InstigatorState, InstigatorTick]] = []
+    for external_sensor in external_sensors:
+        sensor_debug_crash_flags = (
+            debug_crash_flags.get(external_sensor.name) if debug_crash_flags else None
+        )
+        try:
+            marked = _mark_sensor_state_for_tick_if_due(
+                instance, external_sensor, sensor_state_lock
+            )
+            if not marked:
+                continue
+            sensor_state, now = marked
+
+            tick = _create_sensor_tick(instance, external_sensor, sensor_state, now)
+            _check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
+        except Exception:
+            logger.exception(f"Sensor daemon caught an error for sensor {external_sensor.name}")
+            yield serializable_error_info_from_exc_info(sys.exc_info())
+            continue
+
+        pending_ticks.append((external_sensor, sensor_state, tick))
+
+    if not pending_ticks:
+        return
+
+    # if the request for the batch fails, each of the remaining ticks fails with the same error
+    batch_exception: Optional[Exception] = None
+    sensor_runtime_data_iter: Iterator[
+        Union[SensorExecutionData, ExternalSensorExecutionErrorData]
+    ] = iter([])
+    location_name = pending_ticks[0][0].handle.location_name
+    try:
+        code_location = _get_code_location_for_sensor(
+            workspace_process_context, pending_ticks[0][0]
+        )
+        sensor_runtime_data_iter = iter(
+            code_location.get_external_sensor_execution_data_batch(
+                instance,
+                [
+                    _get_sensor_execution_args(instance, external_sensor, sensor_state)
+                    for external_sensor, sensor_state, _tick in pending_ticks
+                ],
+            )
+        )
+    except Exception as e:
+        batch_exception = e
+
+    for external_sensor, sensor_state, tick in pending_ticks:
+        sensor_debug_crash_flags = (
+            debug_crash_flags.get(external_sensor.name) if debug_crash_flags else None
+        )
+        error_info = None
+        try:
+            with SensorLaunchContext(
+                external_sensor, tick, instance, logger, tick_retention_settings, sensor_state_lock
+            ) as tick_context:
+                _check_for_debug_crash(sensor_debug_crash_flags, "TICK_HELD")
+
+                sensor_runtime_data = None
+                if not batch_exception:
+                    try:
+                        sensor_runtime_data = next(sensor_runtime_data_iter, None)
+                        if sensor_runtime_data is None:
+                            raise DagsterSensorDaemonError(
+                                f"No result was returned for sensor {external_sensor.name} in"
+                                f" the batch of sensors for code location {location_name}."
+                            )
+                    except Exception as e:
+                        batch_exception = e
+                if batch_exception:
+                    raise batch_exception
+
+                yield from _evaluate_sensor(
+                    workspace_process_context,
+                    tick_context,
+                    external_sensor,
+                    sensor_state,
+                    submit_threadpool_executor,
+                    sensor_debug_crash_flags,
+                    sensor_runtime_data=sensor_runtime_data,
+                )
+
+        except Exception:
+            error_info = serializable_error_info_from_exc_info(sys.exc_info())
+            logger.exception(f"Sensor daemon caught an error for sensor {external_sensor.name}")
+
+        yield error_info
+
+
+def _mark_sensor_state_for_tick_if_due(
+    instance: DagsterInstance,
+    external_sensor: ExternalSensor,
+    sensor_state_lock: threading.Lock,
+) -> Optional[Tuple[InstigatorState, "DateTime"]]:
+    with sensor_state_lock:
+        # acquire the lock to avoid a race condition where we're updating the recently touched
+        # timestamp on the sensor state, but clobbering it with an older timestamp which might open
+        # us up to a new evaluation being delegated within the minimum interval
+        now = pendulum.now("UTC")
+        sensor_state = check.not_none(
+            instance.get_instigator_state(
+                external_sensor.get_external_origin_id(), external_sensor.selector_id
+            )
+        )
+        if _is_under_min_interval(sensor_state, external_sensor):
+            # check the since we might have been queued before processing
+            return None
+        else:
+            _mark_sensor_state_for_tick(instance, external_sensor, sensor_state, now)
+
+    return sensor_state, now
+
+
+def _create_sensor_tick(
+    instance: DagsterInstance,
+    external_sensor: ExternalSensor,
+    sensor_state: InstigatorState,
+    now: "DateTime",
+) -> InstigatorTick:
+    return instance.create_tick(
+        TickData(
+            instigator_origin_id=sensor_state.instigator_origin_id,
+            instigator_name=sensor_state.instigator_name,
+            instigator_type=InstigatorType.SENSOR,
+            status=TickStatus.STARTED,
+            timestamp=now.timestamp(),
+            selector_id=external_sensor.selector_id,
+        )
+    )
+
+
+def _get_sensor_execution_args(
+    instance: DagsterInstance,
+    external_sensor: ExternalSensor,
+    sensor_state: InstigatorState,
+) -> SensorExecutionArgs:
+    instigator_data = _sensor_instigator_data(sensor_state)
+    return SensorExecutionArgs(
+        repository_origin=external_sensor.handle.repository_handle.get_external_origin(),
+        instance_ref=instance.get_ref(),
+        sensor_name=external_sensor.name,
+        last_completion_time=instigator_data.last_tick_timestamp if instigator_data else None,
+        last_run_key=instigator_data.last_run_key if instigator_data else None,
+        cursor=instigator_data.cursor if instigator_data else None,
+    )
+
+
 def _sensor_instigator_data(state: InstigatorState) -> Optional[SensorInstigatorData]:
     instigator_data = state.instigator_data
     if instigator_data is None or isinstance(instigator_data, SensorInstigatorData):
@@ -591,6 +995,11 @@ def _submit_run_request(
     logger,
     sensor_debug_crash_flags,
 ) -> SubmitRunRequestResult:
+    # Unlike asset daemon and asset backfill runs, which are created in bulk with
+    # DagsterInstance.create_runs, each run request is created and submitted on its own. Run
+    # requests are submitted in parallel with num_submit_workers, and each run is deduplicated by
+    # its run key and recorded on the tick as soon as it is submitted, so that a crash or an error
+    # in one submission doesn't affect the rest of the tick.
     instance = workspace_process_context.instance
     sensor_origin = external_sensor.get_external_origin()
 
@@ -660,21 +1069,29 @@ def _evaluate_sensor(
     state: InstigatorState,
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags] = None,
+    sensor_runtime_data: Optional[
+        Union[SensorExecutionData, ExternalSensorExecutionErrorData]
+    ] = None,
 ):
     instance = workspace_process_context.instance
     context.logger.info(f"Checking for new runs for sensor: {external_sensor.name}")
-    code_location = _get_code_location_for_sensor(workspace_process_context, external_sensor)
-    repository_handle = external_sensor.handle.repository_handle
-    instigator_data = _sensor_instigator_data(state)
 
-    sensor_runtime_data = code_location.get_external_sensor_execution_data(
-        instance,
-        repository_handle,
-        external_sensor.name,
-        instigator_data.last_tick_timestamp if instigator_data else None,
-        instigator_data.last_run_key if instigator_data else None,
-        instigator_data.cursor if instigator_data else None,
-    )
+    if sensor_runtime_data is None:
+        # not already evaluated as part of a batch
+        code_location = _get_code_location_for_sensor(workspace_process_context, external_sensor)
+        repository_handle = external_sensor.handle.repository_handle
+        instigator_data = _sensor_instigator_data(state)
+
+        sensor_runtime_data = code_location.get_external_sensor_execution_data(
+            instance,
+            repository_handle,
+            external_sensor.name,
+            instigator_data.last_tick_timestamp if instigator_data else None,
+            instigator_data.last_run_key if instigator_data else None,
+            instigator_data.cursor if instigator_data else None,
+        )
+    elif isinstance(sensor_runtime_data, ExternalSensorExecutionErrorData):
+        raise DagsterUserCodeProcessError.from_error_info(sensor_runtime_data.error)
 
     yield
 
@@ -868,22 +1285,33 @@ def _evaluate_sensor(
     yield
 
 
-def _is_under_min_interval(state: InstigatorState, external_sensor: ExternalSensor) -> bool:
-    instigator_data = _sensor_instigator_data(state)
+def _get_next_evaluation_timestamp(
+    state: Optional[InstigatorState], external_sensor: ExternalSensor
+) -> float:
+    """Returns the earliest timestamp at which the sensor can next be evaluated, given the time of
+    its last tick and its min_interval.
+    """
+    instigator_data = _sensor_instigator_data(state) if state else None
     if not instigator_data:
-        return False
+        return 0
 
     if not instigator_data.last_tick_start_timestamp and not instigator_data.last_tick_timestamp:
-        return False
+        return 0
 
     if not external_sensor.min_interval_seconds:
-        return False
+        return 0
 
-    elapsed = pendulum.now("UTC").timestamp() - max(
-        instigator_data.last_tick_timestamp or 0,
-        instigator_data.last_tick_start_timestamp or 0,
+    return (
+        max(
+            instigator_data.last_tick_timestamp or 0,
+            instigator_data.last_tick_start_timestamp or 0,
+        )
+        + external_sensor.min_interval_seconds
     )
-    return elapsed < external_sensor.min_interval_seconds
+
+
+def _is_under_min_interval(state: InstigatorState, external_sensor: ExternalSensor) -> bool:
+    return pendulum.now("UTC").timestamp() < _get_next_evaluation_timestamp(state, external_sensor)
 
 
 def _fetch_existing_runs(
@@ -50,6 +50,7 @@
     b' \x01(\x05\x12,\n$serialized_external_repository_chunk\x18\x02 \x01(\t"W\n'
     b" ExternalScheduleExecutionRequest\x12\x33\n+serialized_external_schedule_execution_args\x18\x01"
     b' \x01(\t"S\n\x1e\x45xternalSensorExecutionRequest\x12\x31\n)serialized_external_sensor_execution_args\x18\x01'
+    b' \x01(\t"^\n#ExternalSensorExecutionBatchRequest\x12\x37\n/serialized_external_sensor_execution_batch_args\x18\x01'
     b' \x01(\t"H\n\x13StreamingChunkEvent\x12\x17\n\x0fsequence_number\x18\x01'
     b" \x01(\x05\x12\x18\n\x10serialized_chunk\x18\x02"
     b' \x01(\t"@\n\x13ShutdownServerReply\x12)\n!serialized_shutdown_server_result\x18\x01'
@@ -66,9 +67,9 @@
     b' \x01(\t"I\n\x10\x45xternalJobReply\x12\x1b\n\x13serialized_job_data\x18\x01'
     b" \x01(\t\x12\x18\n\x10serialized_error\x18\x02"
     b' \x01(\t"\x13\n\x11ReloadCodeRequest"+\n\x0fReloadCodeReply\x12\x18\n\x10serialized_error\x18\x02'
-    b' \x01(\t2\x91\x0f\n\nDagsterApi\x12*\n\x04Ping\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12/\n\tHeartbeat\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12G\n\rStreamingPing\x12\x19.api.StreamingPingRequest\x1a\x17.api.StreamingPingEvent"\x00\x30\x01\x12\x32\n\x0bGetServerId\x12\n.api.Empty\x1a\x15.api.GetServerIdReply"\x00\x12]\n\x15\x45xecutionPlanSnapshot\x12!.api.ExecutionPlanSnapshotRequest\x1a\x1f.api.ExecutionPlanSnapshotReply"\x00\x12N\n\x10ListRepositories\x12\x1c.api.ListRepositoriesRequest\x1a\x1a.api.ListRepositoriesReply"\x00\x12`\n\x16\x45xternalPartitionNames\x12".api.ExternalPartitionNamesRequest\x1a'
+    b' \x01(\t2\xf9\x0f\n\nDagsterApi\x12*\n\x04Ping\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12/\n\tHeartbeat\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12G\n\rStreamingPing\x12\x19.api.StreamingPingRequest\x1a\x17.api.StreamingPingEvent"\x00\x30\x01\x12\x32\n\x0bGetServerId\x12\n.api.Empty\x1a\x15.api.GetServerIdReply"\x00\x12]\n\x15\x45xecutionPlanSnapshot\x12!.api.ExecutionPlanSnapshotRequest\x1a\x1f.api.ExecutionPlanSnapshotReply"\x00\x12N\n\x10ListRepositories\x12\x1c.api.ListRepositoriesRequest\x1a\x1a.api.ListRepositoriesReply"\x00\x12`\n\x16\x45xternalPartitionNames\x12".api.ExternalPartitionNamesRequest\x1a'
     b' .api.ExternalPartitionNamesReply"\x00\x12Z\n\x14\x45xternalNotebookData\x12'
-    b' .api.ExternalNotebookDataRequest\x1a\x1e.api.ExternalNotebookDataReply"\x00\x12\x63\n\x17\x45xternalPartitionConfig\x12#.api.ExternalPartitionConfigRequest\x1a!.api.ExternalPartitionConfigReply"\x00\x12]\n\x15\x45xternalPartitionTags\x12!.api.ExternalPartitionTagsRequest\x1a\x1f.api.ExternalPartitionTagsReply"\x00\x12t\n#ExternalPartitionSetExecutionParams\x12/.api.ExternalPartitionSetExecutionParamsRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12x\n\x1e\x45xternalPipelineSubsetSnapshot\x12*.api.ExternalPipelineSubsetSnapshotRequest\x1a(.api.ExternalPipelineSubsetSnapshotReply"\x00\x12T\n\x12\x45xternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a\x1c.api.ExternalRepositoryReply"\x00\x12?\n\x0b\x45xternalJob\x12\x17.api.ExternalJobRequest\x1a\x15.api.ExternalJobReply"\x00\x12h\n\x1bStreamingExternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a%.api.StreamingExternalRepositoryEvent"\x00\x30\x01\x12`\n\x19\x45xternalScheduleExecution\x12%.api.ExternalScheduleExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\\\n\x17\x45xternalSensorExecution\x12#.api.ExternalSensorExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\x38\n\x0eShutdownServer\x12\n.api.Empty\x1a\x18.api.ShutdownServerReply"\x00\x12K\n\x0f\x43\x61ncelExecution\x12\x1b.api.CancelExecutionRequest\x1a\x19.api.CancelExecutionReply"\x00\x12T\n\x12\x43\x61nCancelExecution\x12\x1e.api.CanCancelExecutionRequest\x1a\x1c.api.CanCancelExecutionReply"\x00\x12\x36\n\x08StartRun\x12\x14.api.StartRunRequest\x1a\x12.api.StartRunReply"\x00\x12:\n\x0fGetCurrentImage\x12\n.api.Empty\x1a\x19.api.GetCurrentImageReply"\x00\x12\x38\n\x0eGetCurrentRuns\x12\n.api.Empty\x1a\x18.api.GetCurrentRunsReply"\x00\x12<\n\nReloadCode\x12\x16.api.ReloadCodeRequest\x1a\x14.api.ReloadCodeReply"\x00\x62\x06proto3'
+    b' .api.ExternalNotebookDataRequest\x1a\x1e.api.ExternalNotebookDataReply"\x00\x12\x63\n\x17\x45xternalPartitionConfig\x12#.api.ExternalPartitionConfigRequest\x1a!.api.ExternalPartitionConfigReply"\x00\x12]\n\x15\x45xternalPartitionTags\x12!.api.ExternalPartitionTagsRequest\x1a\x1f.api.ExternalPartitionTagsReply"\x00\x12t\n#ExternalPartitionSetExecutionParams\x12/.api.ExternalPartitionSetExecutionParamsRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12x\n\x1e\x45xternalPipelineSubsetSnapshot\x12*.api.ExternalPipelineSubsetSnapshotRequest\x1a(.api.ExternalPipelineSubsetSnapshotReply"\x00\x12T\n\x12\x45xternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a\x1c.api.ExternalRepositoryReply"\x00\x12?\n\x0b\x45xternalJob\x12\x17.api.ExternalJobRequest\x1a\x15.api.ExternalJobReply"\x00\x12h\n\x1bStreamingExternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a%.api.StreamingExternalRepositoryEvent"\x00\x30\x01\x12`\n\x19\x45xternalScheduleExecution\x12%.api.ExternalScheduleExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\\\n\x17\x45xternalSensorExecution\x12#.api.ExternalSensorExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\x66\n\x1c\x45xternalSensorExecutionBatch\x12(.api.ExternalSensorExecutionBatchRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\x38\n\x0eShutdownServer\x12\n.api.Empty\x1a\x18.api.ShutdownServerReply"\x00\x12K\n\x0f\x43\x61ncelExecution\x12\x1b.api.CancelExecutionRequest\x1a\x19.api.CancelExecutionReply"\x00\x12T\n\x12\x43\x61nCancelExecution\x12\x1e.api.CanCancelExecutionRequest\x1a\x1c.api.CanCancelExecutionReply"\x00\x12\x36\n\x08StartRun\x12\x14.api.StartRunRequest\x1a\x12.api.StartRunReply"\x00\x12:\n\x0fGetCurrentImage\x12\n.api.Empty\x1a\x19.api.GetCurrentImageReply"\x00\x12\x38\n\x0eGetCurrentRuns\x12\n.api.Empty\x1a\x18.api.GetCurrentRunsReply"\x00\x12<\n\nReloadCode\x12\x16.api.ReloadCodeRequest\x1a\x14.api.ReloadCodeReply"\x00\x62\x06proto3'
 )
 
 
@@ -108,6 +109,9 @@
     "ExternalScheduleExecutionRequest"
 ]
 _EXTERNALSENSOREXECUTIONREQUEST = DESCRIPTOR.message_types_by_name["ExternalSensorExecutionRequest"]
+_EXTERNALSENSOREXECUTIONBATCHREQUEST = DESCRIPTOR.message_types_by_name[
+    "ExternalSensorExecutionBatchRequest"
+]
 _STREAMINGCHUNKEVENT = DESCRIPTOR.message_types_by_name["StreamingChunkEvent"]
 _SHUTDOWNSERVERREPLY = DESCRIPTOR.message_types_by_name["ShutdownServerReply"]
 _CANCELEXECUTIONREQUEST = DESCRIPTOR.message_types_by_name["CancelExecutionRequest"]
@@ -408,6 +412,17 @@
 )
 _sym_db.RegisterMessage(ExternalSensorExecutionRequest)
 
+ExternalSensorExecutionBatchRequest = _reflection.GeneratedProtocolMessageType(
+    "ExternalSensorExecutionBatchRequest",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _EXTERNALSENSOREXECUTIONBATCHREQUEST,
+        "__module__": "api_pb2",
+        # @@protoc_insertion_point(class_scope:api.ExternalSensorExecutionBatchRequest)
+    },
+)
+_sym_db.RegisterMessage(ExternalSensorExecutionBatchRequest)
+
 StreamingChunkEvent = _reflection.GeneratedProtocolMessageType(
     "StreamingChunkEvent",
     (_message.Message,),
@@ -617,34 +632,36 @@
     _EXTERNALSCHEDULEEXECUTIONREQUEST._serialized_end = 1809
     _EXTERNALSENSOREXECUTIONREQUEST._serialized_start = 1811
     _EXTERNALSENSOREXECUTIONREQUEST._serialized_end = 1894
-    _STREAMINGCHUNKEVENT._serialized_start = 1896
-    _STREAMINGCHUNKEVENT._serialized_end = 1968
-    _SHUTDOWNSERVERREPLY._serialized_start = 1970
-    _SHUTDOWNSERVERREPLY._serialized_end = 2034
-    _CANCELEXECUTIONREQUEST._serialized_start = 2036
-    _CANCELEXECUTIONREQUEST._serialized_end = 2105
-    _CANCELEXECUTIONREPLY._serialized_start = 2107
-    _CANCELEXECUTIONREPLY._serialized_end = 2173
-    _CANCANCELEXECUTIONREQUEST._serialized_start = 2175
-    _CANCANCELEXECUTIONREQUEST._serialized_end = 2251
-    _CANCANCELEXECUTIONREPLY._serialized_start = 2253
-    _CANCANCELEXECUTIONREPLY._serialized_end = 2326
-    _STARTRUNREQUEST._serialized_start = 2328
-    _STARTRUNREQUEST._serialized_end = 2382
-    _STARTRUNREPLY._serialized_start = 2384
-    _STARTRUNREPLY._serialized_end = 2436
-    _GETCURRENTIMAGEREPLY._serialized_start = 2438
-    _GETCURRENTIMAGEREPLY._serialized_end = 2494
-    _GETCURRENTRUNSREPLY._serialized_start = 2496
-    _GETCURRENTRUNSREPLY._serialized_end = 2550
-    _EXTERNALJOBREQUEST._serialized_start = 2552
-    _EXTERNALJOBREQUEST._serialized_end = 2628
-    _EXTERNALJOBREPLY._serialized_start = 2630
-    _EXTERNALJOBREPLY._serialized_end = 2703
-    _RELOADCODEREQUEST._serialized_start = 2705
-    _RELOADCODEREQUEST._serialized_end = 2724
-    _RELOADCODEREPLY._serialized_start = 2726
-    _RELOADCODEREPLY._serialized_end = 2769
-    _DAGSTERAPI._serialized_start = 2772
-    _DAGSTERAPI._serialized_end = 4709
+    _EXTERNALSENSOREXECUTIONBATCHREQUEST._serialized_start = 1896
+    _EXTERNALSENSOREXECUTIONBATCHREQUEST._serialized_end = 1990
+    _STREAMINGCHUNKEVENT._serialized_start = 1992
+    _STREAMINGCHUNKEVENT._serialized_end = 2064
+    _SHUTDOWNSERVERREPLY._serialized_start = 2066
+    _SHUTDOWNSERVERREPLY._serialized_end = 2130
+    _CANCELEXECUTIONREQUEST._serialized_start = 2132
+    _CANCELEXECUTIONREQUEST._serialized_end = 2201
+    _CANCELEXECUTIONREPLY._serialized_start = 2203
+    _CANCELEXECUTIONREPLY._serialized_end = 2269
+    _CANCANCELEXECUTIONREQUEST._serialized_start = 2271
+    _CANCANCELEXECUTIONREQUEST._serialized_end = 2347
+    _CANCANCELEXECUTIONREPLY._serialized_start = 2349
+    _CANCANCELEXECUTIONREPLY._serialized_end = 2422
+    _STARTRUNREQUEST._serialized_start = 2424
+    _STARTRUNREQUEST._serialized_end = 2478
+    _STARTRUNREPLY._serialized_start = 2480
+    _STARTRUNREPLY._serialized_end = 2532
+    _GETCURRENTIMAGEREPLY._serialized_start = 2534
+    _GETCURRENTIMAGEREPLY._serialized_end = 2590
+    _GETCURRENTRUNSREPLY._serialized_start = 2592
+    _GETCURRENTRUNSREPLY._serialized_end = 2646
+    _EXTERNALJOBREQUEST._serialized_start = 2648
+    _EXTERNALJOBREQUEST._serialized_end = 2724
+    _EXTERNALJOBREPLY._serialized_start = 2726
+    _EXTERNALJOBREPLY._serialized_end = 2799
+    _RELOADCODEREQUEST._serialized_start = 2801
+    _RELOADCODEREQUEST._serialized_end = 2820
+    _RELOADCODEREPLY._serialized_start = 2822
+    _RELOADCODEREPLY._serialized_end = 2865
+    _DAGSTERAPI._serialized_start = 2868
+    _DAGSTERAPI._serialized_end = 4909
 # @@protoc_insertion_point(module_scope)
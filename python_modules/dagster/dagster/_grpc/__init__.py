@@ -40,6 +40,7 @@
     PartitionSetExecutionParamArgs as PartitionSetExecutionParamArgs,
     ResumeRunArgs as ResumeRunArgs,
     SensorExecutionArgs as SensorExecutionArgs,
+    SensorExecutionBatchArgs as SensorExecutionBatchArgs,
     ShutdownServerResult as ShutdownServerResult,
     StartRunResult as StartRunResult,
 )
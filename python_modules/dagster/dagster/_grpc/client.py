@@ -2,7 +2,7 @@
 import sys
 from contextlib import contextmanager
 from threading import Event
-from typing import Any, Iterator, Optional, Sequence, Tuple
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
 
 import grpc
 from google.protobuf.reflection import GeneratedProtocolMessageType
@@ -32,6 +32,7 @@
     PartitionNamesArgs,
     PartitionSetExecutionParamArgs,
     SensorExecutionArgs,
+    SensorExecutionBatchArgs,
 )
 from .utils import default_grpc_timeout, max_rx_bytes, max_send_bytes
 
@@ -400,6 +401,44 @@ def external_sensor_execution(self, sensor_execution_args, timeout=DEFAULT_GRPC_
 
         return "".join([chunk.serialized_chunk for chunk in chunks])
 
+    def external_sensor_execution_batch(
+        self, sensor_execution_batch_args, timeout=DEFAULT_GRPC_TIMEOUT
+    ) -> Iterator[str]:
+        """Yields the serialized result of each sensor in the batch, in request order, as soon as it
+        has been fully received.
+        """
+        check.inst_param(
+            sensor_execution_batch_args,
+            "sensor_execution_batch_args",
+            SensorExecutionBatchArgs,
+        )
+
+        custom_timeout_message = (
+            f"The sensor batch timed out due to taking longer than {timeout} seconds to execute the"
+            " sensor functions. One way to avoid this error is to break up the sensor work into"
+            " chunks, using cursors to let subsequent sensor calls pick up where the previous call"
+            " left off."
+        )
+
+        chunks: List[str] = []
+        for chunk in self._streaming_query(
+            "ExternalSensorExecutionBatch",
+            api_pb2.ExternalSensorExecutionBatchRequest,
+            timeout=timeout,
+            serialized_external_sensor_execution_batch_args=serialize_value(
+                sensor_execution_batch_args
+            ),
+            custom_timeout_message=custom_timeout_message,
+        ):
+            # the chunk sequence of each result starts from 0
+            if chunk.sequence_number == 0 and chunks:
+                yield "".join(chunks)
+                chunks = []
+            chunks.append(chunk.serialized_chunk)
+
+        if chunks:
+            yield "".join(chunks)
+
     def external_notebook_data(self, notebook_path: str):
         check.str_param(notebook_path, "notebook_path")
         res = self._query(
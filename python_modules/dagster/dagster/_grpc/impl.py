@@ -29,7 +29,7 @@
     user_code_error_boundary,
 )
 from dagster._core.events import DagsterEvent, EngineEventData
-from dagster._core.execution.api import create_execution_plan, execute_run_iterator
+from dagster._core.execution.api import create_execution_plan_snapshot, execute_run_iterator
 from dagster._core.host_representation import external_job_data_from_def
 from dagster._core.host_representation.external_data import (
     ExternalJobSubsetResult,
@@ -45,10 +45,7 @@
 )
 from dagster._core.instance import DagsterInstance
 from dagster._core.instance.ref import InstanceRef
-from dagster._core.snap.execution_plan_snapshot import (
-    ExecutionPlanSnapshotErrorData,
-    snapshot_from_execution_plan,
-)
+from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshotErrorData
 from dagster._core.storage.dagster_run import DagsterRun
 from dagster._grpc.types import ExecutionPlanSnapshotArgs
 from dagster._serdes import deserialize_value
@@ -506,16 +503,14 @@ def get_external_execution_plan_snapshot(
             asset_selection=args.asset_selection,
         )
 
-        return snapshot_from_execution_plan(
-            create_execution_plan(
-                job_def,
-                run_config=args.run_config,
-                step_keys_to_execute=args.step_keys_to_execute,
-                known_state=args.known_state,
-                instance_ref=args.instance_ref,
-                repository_load_data=repo_def.repository_load_data,
-            ),
+        return create_execution_plan_snapshot(
+            job_def,
             args.job_snapshot_id,
+            run_config=args.run_config,
+            step_keys_to_execute=args.step_keys_to_execute,
+            known_state=args.known_state,
+            instance_ref=args.instance_ref,
+            repository_load_data=repo_def.repository_load_data,
         )
     except:
         return ExecutionPlanSnapshotErrorData(
@@ -249,6 +249,9 @@ def ExternalScheduleExecution(self, request, context):
     def ExternalSensorExecution(self, request, context):
         return self._streaming_query("ExternalSensorExecution", request, context)
 
+    def ExternalSensorExecutionBatch(self, request, context):
+        return self._streaming_query("ExternalSensorExecutionBatch", request, context)
+
     def ShutdownServer(self, request, context):
         try:
             self._shutdown_once_executions_finish_event.set()
@@ -9,7 +9,10 @@
 import time
 import uuid
 import warnings
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    TimeoutError as FuturesTimeoutError,
+)
 from contextlib import ExitStack
 from threading import Event as ThreadingEventType
 from time import sleep
@@ -51,14 +54,14 @@
 from dagster._core.origin import DEFAULT_DAGSTER_ENTRY_POINT, get_python_environment_entry_point
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._core.workspace.autodiscovery import LoadableTarget
-from dagster._serdes import deserialize_value, serialize_value
+from dagster._serdes import deserialize_value, serialize_value, serialize_value_to_binary_str
 from dagster._serdes.ipc import IPCErrorMessage, open_ipc_subprocess
 from dagster._utils import (
     find_free_port,
     get_run_crash_explanation,
     safe_tempfile_path_unmanaged,
 )
-from dagster._utils.error import serializable_error_info_from_exc_info
+from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 from .__generated__ import api_pb2
 from .__generated__.api_pb2_grpc import DagsterApiServicer, add_DagsterApiServicer_to_server
@@ -77,6 +80,7 @@
     start_run_in_subprocess,
 )
 from .types import (
+    MAX_SENSOR_EXECUTION_BATCH_SIZE,
     CanCancelExecutionRequest,
     CanCancelExecutionResult,
     CancelExecutionRequest,
@@ -93,6 +97,7 @@
     PartitionNamesArgs,
     PartitionSetExecutionParamArgs,
     SensorExecutionArgs,
+    SensorExecutionBatchArgs,
     ShutdownServerResult,
     StartRunResult,
 )
@@ -255,6 +260,13 @@ def __init__(
         self._termination_times: Dict[str, float] = {}
         self._execution_lock = threading.Lock()
 
+        # Shared by every ExternalSensorExecutionBatch call, so that the number of threads evaluating
+        # sensors stays bounded even when sensors time out and keep running in the background
+        self._sensor_batch_executor = ThreadPoolExecutor(
+            max_workers=MAX_SENSOR_EXECUTION_BATCH_SIZE,
+            thread_name_prefix="sensor_batch_worker",
+        )
+
         self._serializable_load_error = None
 
         self._entry_point = (
@@ -274,6 +286,14 @@ def __init__(
         #  - When using an integration that spins up gRPC servers (for example, the Dagster Helm
         #    chart or the deploy_docker example)
         self._instance_ref = check.opt_inst_param(instance_ref, "instance_ref", InstanceRef)
+        # Clients that share the instance can read the binary serdes encoding, so repository data
+        # is only streamed in it when the instance opts in.
+        self._stream_binary_serdes = bool(
+            instance_ref
+            and cast(Mapping[str, Any], instance_ref.settings.get("binary_serdes", {})).get(
+                "code_servers"
+            )
+        )
         self._exit_stack = ExitStack()
 
         try:
@@ -325,6 +345,8 @@ def cleanup(self) -> None:
             self.__heartbeat_thread.join()
         self.__cleanup_thread.join()
 
+        # don't wait for sensors that timed out, which may still be running
+        self._sensor_batch_executor.shutdown(wait=False)
         self._exit_stack.close()
 
     def _heartbeat_thread(self, heartbeat_timeout: float) -> None:
@@ -592,21 +614,22 @@ def ExternalPipelineSubsetSnapshot(
             serialized_external_pipeline_subset_result=serialized_external_pipeline_subset_result
         )
 
-    def _get_serialized_external_repository_data(self, request):
+    def _get_serialized_external_repository_data(self, request, binary: bool = False):
+        serialize_fn = serialize_value_to_binary_str if binary else serialize_value
         try:
             repository_origin = deserialize_value(
                 request.serialized_repository_python_origin,
                 ExternalRepositoryOrigin,
             )
 
-            return serialize_value(
+            return serialize_fn(
                 external_repository_data_from_def(
                     self._get_repo_for_origin(repository_origin),
                     defer_snapshots=request.defer_snapshots,
                 )
             )
         except Exception:
-            return serialize_value(
+            return serialize_fn(
                 ExternalRepositoryErrorData(serializable_error_info_from_exc_info(sys.exc_info()))
             )
 
@@ -636,7 +659,9 @@ def ExternalJob(self, request, _context) -> api_pb2.ExternalJobReply:
     def StreamingExternalRepository(
         self, request, _context
     ) -> Iterable[api_pb2.StreamingExternalRepositoryEvent]:
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
+        serialized_external_repository_data = self._get_serialized_external_repository_data(
+            request, binary=self._stream_binary_serdes
+        )
 
         num_chunks = int(
             math.ceil(float(len(serialized_external_repository_data)) / STREAMING_CHUNK_SIZE)
@@ -722,6 +747,73 @@ def ExternalSensorExecution(self, request, _context):
 
         yield from self._split_serialized_data_into_chunk_events(serialized_sensor_data)
 
+    def ExternalSensorExecutionBatch(self, request, _context):
+        # The sensors are evaluated concurrently, so that a slow sensor doesn't hold up the
+        # evaluation of the rest of the batch. The results are streamed back in request order, so a
+        # result is only sent once the results of all the sensors before it have been sent. A
+        # sensor that takes longer than the timeout fails on its own without failing the rest of the
+        # batch.
+        batch_args = deserialize_value(
+            request.serialized_external_sensor_execution_batch_args,
+            SensorExecutionBatchArgs,
+        )
+        if not batch_args.sensor_execution_args:
+            return
+
+        deadline = time.time() + batch_args.timeout if batch_args.timeout else None
+        futures = [
+            self._sensor_batch_executor.submit(self._get_serialized_sensor_execution_data, args)
+            for args in batch_args.sensor_execution_args
+        ]
+        try:
+            for args, future in zip(batch_args.sensor_execution_args, futures):
+                try:
+                    serialized_sensor_data = future.result(
+                        timeout=max(0, deadline - time.time()) if deadline else None
+                    )
+                except FuturesTimeoutError:
+                    # a sensor that timed out before it started running is never run
+                    future.cancel()
+                    serialized_sensor_data = serialize_value(
+                        ExternalSensorExecutionErrorData(
+                            SerializableErrorInfo(
+                                message=(
+                                    f"Sensor {args.sensor_name} timed out due to taking longer"
+                                    f" than {batch_args.timeout} seconds to execute the sensor"
+                                    " function."
+                                ),
+                                stack=[],
+                                cls_name=FuturesTimeoutError.__name__,
+                            )
+                        )
+                    )
+
+                yield from self._split_serialized_data_into_chunk_events(serialized_sensor_data)
+        finally:
+            # if the client stops reading the stream, don't evaluate the sensors that haven't
+            # started running yet
+            for future in futures:
+                future.cancel()
+
+    def _get_serialized_sensor_execution_data(self, args: SensorExecutionArgs) -> str:
+        try:
+            return serialize_value(
+                get_external_sensor_execution(
+                    self._get_repo_for_origin(args.repository_origin),
+                    args.instance_ref,
+                    args.sensor_name,
+                    args.last_completion_time,
+                    args.last_run_key,
+                    args.cursor,
+                )
+            )
+        except Exception:
+            return serialize_value(
+                ExternalSensorExecutionErrorData(
+                    serializable_error_info_from_exc_info(sys.exc_info())
+                )
+            )
+
     def ShutdownServer(self, request, _context) -> api_pb2.ShutdownServerReply:
         try:
             self._shutdown_once_executions_finish_event.set()
@@ -593,6 +593,38 @@ def __new__(
         )
 
 
+# The maximum number of sensors evaluated with a single ExternalSensorExecutionBatch call. The code
+# server evaluates the sensors in a batch concurrently, in a thread pool of this size that is shared
+# by all batch calls.
+MAX_SENSOR_EXECUTION_BATCH_SIZE = 32
+
+
+@whitelist_for_serdes
+class SensorExecutionBatchArgs(
+    NamedTuple(
+        "_SensorExecutionBatchArgs",
+        [
+            ("sensor_execution_args", Sequence[SensorExecutionArgs]),
+            ("timeout", Optional[int]),
+        ],
+    )
+):
+    """Args for evaluating a batch of sensors. ``timeout`` is the number of seconds that each sensor
+    in the batch is given to evaluate, after which it fails with a timeout error.
+    """
+
+    def __new__(
+        cls, sensor_execution_args: Sequence[SensorExecutionArgs], timeout: Optional[int] = None
+    ):
+        return super(SensorExecutionBatchArgs, cls).__new__(
+            cls,
+            sensor_execution_args=check.sequence_param(
+                sensor_execution_args, "sensor_execution_args", of_type=SensorExecutionArgs
+            ),
+            timeout=check.opt_int_param(timeout, "timeout"),
+        )
+
+
 @whitelist_for_serdes
 class ExternalJobArgs(
     NamedTuple(
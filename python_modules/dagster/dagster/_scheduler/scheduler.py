@@ -7,7 +7,18 @@
 from collections import defaultdict
 from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack
-from typing import TYPE_CHECKING, Dict, List, Mapping, NamedTuple, Optional, cast
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
 
 import pendulum
 
@@ -36,9 +47,11 @@
 from dagster._core.telemetry import SCHEDULED_RUN_CREATED, hash_name, log_action
 from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._core.workspace.workspace import CodeLocationEntry
 from dagster._scheduler.stale import resolve_stale_or_missing_assets
 from dagster._seven.compat.pendulum import to_timezone
 from dagster._utils import DebugCrashFlags, SingleInstigatorDebugCrashFlags
+from dagster._utils.deadline_queue import DeadlineQueue
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.log import default_date_format_string
 from dagster._utils.merger import merge_dicts
@@ -114,6 +127,10 @@ def __exit__(self, exception_type, exception_value, traceback):
 SECONDS_IN_MINUTE = 60
 VERBOSE_LOGS_INTERVAL = 60
 
+# Names of the structured fields of the log record emitted when a tick submits its runs
+SCHEDULE_NAME_LOG_FIELD = "schedule_name"
+SCHEDULE_LAUNCH_LAG_LOG_FIELD = "schedule_launch_lag_seconds"
+
 
 def _get_next_scheduler_iteration_time(start_time: float) -> float:
     # Wait until at least the next minute to run again, since the minimum granularity
@@ -122,6 +139,142 @@ def _get_next_scheduler_iteration_time(start_time: float) -> float:
     return last_minute_time + SECONDS_IN_MINUTE
 
 
+class ScheduleEvaluationQueue:
+    """Queue of the running schedules, ordered by the timestamp at which each schedule is next due
+    to be evaluated.
+
+    The running schedules are reloaded at most once a minute, or sooner if the workspace snapshot
+    changes, and only the schedules that were added or changed are made due right away.
+    """
+
+    def __init__(self):
+        self._queue: DeadlineQueue[str] = DeadlineQueue()
+        self._schedules: Dict[str, ExternalSchedule] = {}
+        self._schedule_state_keys: Dict[str, Tuple[InstigatorStatus, Tuple[str, ...]]] = {}
+        self._workspace_key: Optional[AbstractSet[Tuple[str, float, int]]] = None
+        self._next_reload_timestamp: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._schedules)
+
+    @property
+    def next_evaluation_timestamp(self) -> Optional[float]:
+        return self._queue.next_timestamp
+
+    def should_reload(self, workspace_key: AbstractSet[Tuple[str, float, int]], now: float) -> bool:
+        """Returns True if the running schedules should be reloaded from the stored schedule states,
+        because the workspace has changed or they have not been reloaded this minute.
+        """
+        return (
+            workspace_key != self._workspace_key
+            or self._next_reload_timestamp is None
+            or now >= self._next_reload_timestamp
+        )
+
+    def is_stale(
+        self,
+        workspace_key: AbstractSet[Tuple[str, float, int]],
+        schedule_states: Mapping[str, InstigatorState],
+    ) -> bool:
+        return (
+            workspace_key != self._workspace_key
+            or _get_schedule_state_keys(schedule_states) != self._schedule_state_keys
+        )
+
+    def set_reloaded(self, now: float) -> None:
+        self._next_reload_timestamp = _get_next_scheduler_iteration_time(now)
+
+    def update(
+        self,
+        workspace_key: AbstractSet[Tuple[str, float, int]],
+        schedules: Mapping[str, ExternalSchedule],
+        schedule_states: Mapping[str, InstigatorState],
+        now: float,
+    ) -> None:
+        """Replaces the set of running schedules. Schedules that are new, or whose cron schedule,
+        timezone or status changed, are due immediately. Changes to the rest of a schedule's state,
+        e.g. the timestamp of its last tick, do not affect when it is next due.
+        """
+        schedule_state_keys = _get_schedule_state_keys(schedule_states)
+        self._queue.retain(schedules.keys())
+
+        for selector_id, external_schedule in schedules.items():
+            previous_schedule = self._schedules.get(selector_id)
+            if (
+                selector_id not in self._queue
+                or not previous_schedule
+                or previous_schedule.cron_schedule != external_schedule.cron_schedule
+                or previous_schedule.execution_timezone != external_schedule.execution_timezone
+                or self._schedule_state_keys.get(selector_id)
+                != schedule_state_keys.get(selector_id)
+            ):
+                self._queue.push(selector_id, now)
+
+        self._workspace_key = workspace_key
+        self._schedules = dict(schedules)
+        self._schedule_state_keys = schedule_state_keys
+
+    def get_schedule(self, selector_id: str) -> Optional[ExternalSchedule]:
+        return self._schedules.get(selector_id)
+
+    def pop_due(self, now: float) -> Sequence[ExternalSchedule]:
+        return [self._schedules[selector_id] for selector_id in self._queue.pop_due(now)]
+
+    def schedule_next_evaluation(
+        self, external_schedule: ExternalSchedule, end_timestamp: float, retry: bool = False
+    ) -> None:
+        """Schedules the next evaluation of a schedule that has been evaluated up to the given
+        timestamp: at its next execution time, or at the start of the next minute if its tick
+        should be retried. Each schedule is also evaluated at least every
+        LAST_RECORDED_ITERATION_INTERVAL_SECONDS, so that its iteration timestamp is kept up to date.
+        """
+        selector_id = external_schedule.selector_id
+        if selector_id not in self._schedules:
+            return
+
+        if retry:
+            timestamp = _get_next_scheduler_iteration_time(end_timestamp)
+        else:
+            next_execution_time = next(
+                iter(external_schedule.execution_time_iterator(end_timestamp + 1)), None
+            )
+            timestamp = end_timestamp + LAST_RECORDED_ITERATION_INTERVAL_SECONDS
+            if next_execution_time:
+                timestamp = min(timestamp, next_execution_time.timestamp())
+
+        self._queue.push(selector_id, timestamp)
+
+
+def _get_schedule_state_keys(
+    schedule_states: Mapping[str, InstigatorState]
+) -> Dict[str, Tuple[InstigatorStatus, Tuple[str, ...]]]:
+    # the parts of a schedule's state that determine when it is due, leaving out the cursor and
+    # tick timestamps that are written on every tick
+    schedule_state_keys = {}
+    for selector_id, schedule_state in schedule_states.items():
+        instigator_data = schedule_state.instigator_data
+        cron_schedule = (
+            instigator_data.cron_schedule
+            if isinstance(instigator_data, ScheduleInstigatorData)
+            else ()
+        )
+        schedule_state_keys[selector_id] = (
+            schedule_state.status,
+            (cron_schedule,) if isinstance(cron_schedule, str) else tuple(cron_schedule),
+        )
+    return schedule_state_keys
+
+
+def _get_workspace_key(
+    workspace_snapshot: Mapping[str, CodeLocationEntry]
+) -> AbstractSet[Tuple[str, float, int]]:
+    # a reloaded location gets a new entry, with a new update timestamp and code location object
+    return frozenset(
+        (location_name, location_entry.update_timestamp, id(location_entry.code_location))
+        for location_name, location_entry in workspace_snapshot.items()
+    )
+
+
 def execute_scheduler_iteration_loop(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
@@ -153,6 +306,20 @@ def execute_scheduler_iteration_loop(
                     )
                 )
 
+        if settings.get("use_deadline_queue"):
+            yield from _execute_scheduler_deadline_queue_loop(
+                workspace_process_context,
+                logger,
+                max_catchup_runs,
+                max_tick_retries,
+                shutdown_event,
+                threadpool_executor=threadpool_executor,
+                submit_threadpool_executor=submit_threadpool_executor,
+                scheduler_run_futures=scheduler_run_futures,
+                schedule_state_lock=schedule_state_lock,
+            )
+            return
+
         last_verbose_time = None
         while True:
             start_time = pendulum.now("UTC").timestamp()
@@ -189,6 +356,244 @@ def execute_scheduler_iteration_loop(
                 yield
 
 
+def _execute_scheduler_deadline_queue_loop(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    max_catchup_runs: int,
+    max_tick_retries: int,
+    shutdown_event: threading.Event,
+    threadpool_executor: Optional[ThreadPoolExecutor],
+    submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    scheduler_run_futures: Dict[str, Future],
+    schedule_state_lock: threading.Lock,
+) -> "DaemonIterator":
+    """Variant of the scheduler iteration loop that only evaluates the schedules that are due, and
+    sleeps until the next one is due. The schedule states are still checked for changes once a
+    minute, and the workspace whenever the loop wakes up.
+    """
+    schedule_queue = ScheduleEvaluationQueue()
+    last_verbose_time = None
+    while True:
+        start_time = pendulum.now("UTC").timestamp()
+        end_datetime_utc = pendulum.now("UTC")
+
+        # occasionally enable verbose logging (doing it always would be too much)
+        verbose_logs_iteration = (
+            last_verbose_time is None or start_time - last_verbose_time > VERBOSE_LOGS_INTERVAL
+        )
+        yield from launch_due_scheduled_runs(
+            workspace_process_context,
+            logger,
+            schedule_queue,
+            end_datetime_utc=end_datetime_utc,
+            threadpool_executor=threadpool_executor,
+            submit_threadpool_executor=submit_threadpool_executor,
+            scheduler_run_futures=scheduler_run_futures,
+            schedule_state_lock=schedule_state_lock,
+            max_catchup_runs=max_catchup_runs,
+            max_tick_retries=max_tick_retries,
+            log_verbose_checks=verbose_logs_iteration,
+        )
+        yield
+        end_time = pendulum.now("UTC").timestamp()
+
+        if verbose_logs_iteration:
+            last_verbose_time = end_time
+
+        next_wakeup_time = _get_next_scheduler_iteration_time(start_time)
+        next_evaluation_timestamp = schedule_queue.next_evaluation_timestamp
+        if next_evaluation_timestamp is not None:
+            next_wakeup_time = min(next_wakeup_time, next_evaluation_timestamp)
+
+        if next_wakeup_time > end_time:
+            # Sleep until the next wakeup time, plus a small epsilon to be sure that we're past it
+            shutdown_event.wait(next_wakeup_time - end_time + 0.001)
+            yield
+
+
+def launch_due_scheduled_runs(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    schedule_queue: ScheduleEvaluationQueue,
+    end_datetime_utc: "DateTime",
+    threadpool_executor: Optional[ThreadPoolExecutor] = None,
+    submit_threadpool_executor: Optional[ThreadPoolExecutor] = None,
+    scheduler_run_futures: Optional[Dict[str, Future]] = None,
+    schedule_state_lock: Optional[threading.Lock] = None,
+    max_catchup_runs: int = DEFAULT_MAX_CATCHUP_RUNS,
+    max_tick_retries: int = 0,
+    debug_crash_flags: Optional[DebugCrashFlags] = None,
+    log_verbose_checks: bool = True,
+) -> "DaemonIterator":
+    """Launches runs for the schedules in the queue that are due at end_datetime_utc. The queue is
+    first reloaded if the workspace snapshot has changed, or if the schedule states have changed
+    and they have not been checked yet this minute.
+    """
+    instance = workspace_process_context.instance
+    end_timestamp = end_datetime_utc.timestamp()
+
+    if not schedule_state_lock:
+        schedule_state_lock = threading.Lock()
+
+    if threadpool_executor:
+        if scheduler_run_futures is None:
+            check.failed("scheduler_run_futures dict must be passed with threadpool_executor")
+
+        # retry the ticks that failed in a thread at the start of the next minute, as the polling
+        # loop would have
+        for selector_id, future in list(scheduler_run_futures.items()):
+            if future.done():
+                del scheduler_run_futures[selector_id]
+                external_schedule = schedule_queue.get_schedule(selector_id)
+                if external_schedule and (future.exception() or any(future.result() or [])):
+                    schedule_queue.schedule_next_evaluation(
+                        external_schedule, end_timestamp, retry=True
+                    )
+
+    workspace_snapshot = {
+        location_entry.origin.location_name: location_entry
+        for location_entry in workspace_process_context.create_request_context()
+        .get_workspace_snapshot()
+        .values()
+    }
+    workspace_key = _get_workspace_key(workspace_snapshot)
+
+    if schedule_queue.should_reload(workspace_key, end_timestamp):
+        _reload_schedule_queue(
+            instance,
+            logger,
+            schedule_queue,
+            workspace_snapshot,
+            workspace_key,
+            end_datetime_utc,
+            log_verbose_checks,
+        )
+
+    due_schedules = schedule_queue.pop_due(end_timestamp)
+    if not due_schedules:
+        yield
+        return
+
+    if log_verbose_checks:
+        schedule_names = ", ".join([schedule.name for schedule in due_schedules])
+        logger.info(f"Checking for new runs for the following schedules: {schedule_names}")
+
+    tick_retention_settings = instance.get_tick_retention_settings(InstigatorType.SCHEDULE)
+
+    for external_schedule in due_schedules:
+        schedule_queue.schedule_next_evaluation(external_schedule, end_timestamp)
+
+        error_info = None
+        try:
+            # only the states of the due schedules are read, rather than every schedule state
+            schedule_state = check.not_none(
+                instance.get_instigator_state(
+                    external_schedule.get_external_origin_id(), external_schedule.selector_id
+                )
+            )
+            schedule_debug_crash_flags = (
+                debug_crash_flags.get(schedule_state.instigator_name) if debug_crash_flags else None
+            )
+
+            if threadpool_executor:
+                scheduler_run_futures = check.not_none(scheduler_run_futures)
+
+                # only allow one tick per schedule to be in flight
+                if (
+                    external_schedule.selector_id in scheduler_run_futures
+                    and not scheduler_run_futures[external_schedule.selector_id].done()
+                ):
+                    continue
+
+                future = threadpool_executor.submit(
+                    launch_scheduled_runs_for_schedule,
+                    workspace_process_context,
+                    logger,
+                    external_schedule,
+                    schedule_state,
+                    schedule_state_lock,
+                    end_datetime_utc,
+                    max_catchup_runs,
+                    max_tick_retries,
+                    tick_retention_settings,
+                    schedule_debug_crash_flags,
+                    log_verbose_checks=log_verbose_checks,
+                    submit_threadpool_executor=submit_threadpool_executor,
+                )
+                scheduler_run_futures[external_schedule.selector_id] = future
+                yield
+
+            else:
+                for result in launch_scheduled_runs_for_schedule_iterator(
+                    workspace_process_context,
+                    logger,
+                    external_schedule,
+                    schedule_state,
+                    schedule_state_lock,
+                    end_datetime_utc,
+                    max_catchup_runs,
+                    max_tick_retries,
+                    tick_retention_settings,
+                    schedule_debug_crash_flags,
+                    log_verbose_checks=log_verbose_checks,
+                    submit_threadpool_executor=None,
+                ):
+                    if result:
+                        schedule_queue.schedule_next_evaluation(
+                            external_schedule, end_timestamp, retry=True
+                        )
+                    yield result
+        except Exception:
+            error_info = serializable_error_info_from_exc_info(sys.exc_info())
+            logger.exception(f"Scheduler caught an error for schedule {external_schedule.name}")
+            schedule_queue.schedule_next_evaluation(external_schedule, end_timestamp, retry=True)
+        yield error_info
+
+
+def _reload_schedule_queue(
+    instance: DagsterInstance,
+    logger: logging.Logger,
+    schedule_queue: ScheduleEvaluationQueue,
+    workspace_snapshot: Mapping[str, CodeLocationEntry],
+    workspace_key: AbstractSet[Tuple[str, float, int]],
+    end_datetime_utc: "DateTime",
+    log_verbose_checks: bool,
+) -> None:
+    end_timestamp = end_datetime_utc.timestamp()
+    all_schedule_states = {
+        schedule_state.selector_id: schedule_state
+        for schedule_state in instance.all_instigator_state(instigator_type=InstigatorType.SCHEDULE)
+    }
+    schedule_queue.set_reloaded(end_timestamp)
+
+    if not schedule_queue.is_stale(workspace_key, all_schedule_states):
+        return
+
+    schedules = _get_running_schedules(
+        instance, logger, workspace_snapshot, all_schedule_states, log_verbose_checks
+    )
+    for selector_id, external_schedule in schedules.items():
+        if selector_id not in all_schedule_states:
+            all_schedule_states[selector_id] = _add_automatically_running_schedule_state(
+                instance, external_schedule, end_datetime_utc
+            )
+    # read back the states, since automatically running states may also have been removed
+    schedule_queue.update(
+        workspace_key,
+        schedules,
+        {
+            schedule_state.selector_id: schedule_state
+            for schedule_state in instance.all_instigator_state(
+                instigator_type=InstigatorType.SCHEDULE
+            )
+        },
+        end_timestamp,
+    )
+
+    if not schedules:
+        logger.debug("Not checking for any runs since no schedules have been started.")
+
+
 def launch_scheduled_runs(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
@@ -221,6 +626,93 @@ def launch_scheduled_runs(
 
     tick_retention_settings = instance.get_tick_retention_settings(InstigatorType.SCHEDULE)
 
+    schedules = _get_running_schedules(
+        instance, logger, workspace_snapshot, all_schedule_states, log_verbose_checks
+    )
+
+    if not schedules:
+        logger.debug("Not checking for any runs since no schedules have been started.")
+        yield
+        return
+
+    if log_verbose_checks:
+        schedule_names = ", ".join([schedule.name for schedule in schedules.values()])
+        logger.info(f"Checking for new runs for the following schedules: {schedule_names}")
+
+    for external_schedule in schedules.values():
+        error_info = None
+        try:
+            schedule_state = all_schedule_states.get(external_schedule.selector_id)
+            if not schedule_state:
+                schedule_state = _add_automatically_running_schedule_state(
+                    instance, external_schedule, end_datetime_utc
+                )
+
+            schedule_debug_crash_flags = (
+                debug_crash_flags.get(schedule_state.instigator_name) if debug_crash_flags else None
+            )
+
+            if threadpool_executor:
+                if scheduler_run_futures is None:
+                    check.failed(
+                        "scheduler_run_futures dict must be passed with threadpool_executor"
+                    )
+
+                # only allow one tick per schedule to be in flight
+                if (
+                    external_schedule.selector_id in scheduler_run_futures
+                    and not scheduler_run_futures[external_schedule.selector_id].done()
+                ):
+                    continue
+
+                future = threadpool_executor.submit(
+                    launch_scheduled_runs_for_schedule,
+                    workspace_process_context,
+                    logger,
+                    external_schedule,
+                    schedule_state,
+                    schedule_state_lock,
+                    end_datetime_utc,
+                    max_catchup_runs,
+                    max_tick_retries,
+                    tick_retention_settings,
+                    schedule_debug_crash_flags,
+                    log_verbose_checks=log_verbose_checks,
+                    submit_threadpool_executor=submit_threadpool_executor,
+                )
+                scheduler_run_futures[external_schedule.selector_id] = future
+                yield
+
+            else:
+                # evaluate the schedules in a loop, synchronously, yielding to allow the schedule daemon to
+                # heartbeat
+                yield from launch_scheduled_runs_for_schedule_iterator(
+                    workspace_process_context,
+                    logger,
+                    external_schedule,
+                    schedule_state,
+                    schedule_state_lock,
+                    end_datetime_utc,
+                    max_catchup_runs,
+                    max_tick_retries,
+                    tick_retention_settings,
+                    schedule_debug_crash_flags,
+                    log_verbose_checks=log_verbose_checks,
+                    submit_threadpool_executor=None,
+                )
+        except Exception:
+            error_info = serializable_error_info_from_exc_info(sys.exc_info())
+            logger.exception(f"Scheduler caught an error for schedule {external_schedule.name}")
+        yield error_info
+
+
+def _get_running_schedules(
+    instance: DagsterInstance,
+    logger: logging.Logger,
+    workspace_snapshot: Mapping[str, CodeLocationEntry],
+    all_schedule_states: Mapping[str, InstigatorState],
+    log_verbose_checks: bool,
+) -> Dict[str, ExternalSchedule]:
     schedules: Dict[str, ExternalSchedule] = {}
     error_locations = set()
 
@@ -300,88 +792,26 @@ def launch_scheduled_runs(
                     " from the Status tab.",
                 )
 
-    if not schedules:
-        logger.debug("Not checking for any runs since no schedules have been started.")
-        yield
-        return
-
-    if log_verbose_checks:
-        schedule_names = ", ".join([schedule.name for schedule in schedules.values()])
-        logger.info(f"Checking for new runs for the following schedules: {schedule_names}")
-
-    for external_schedule in schedules.values():
-        error_info = None
-        try:
-            schedule_state = all_schedule_states.get(external_schedule.selector_id)
-            if not schedule_state:
-                assert external_schedule.default_status == DefaultScheduleStatus.RUNNING
-                schedule_state = InstigatorState(
-                    external_schedule.get_external_origin(),
-                    InstigatorType.SCHEDULE,
-                    InstigatorStatus.AUTOMATICALLY_RUNNING,
-                    ScheduleInstigatorData(
-                        external_schedule.cron_schedule,
-                        end_datetime_utc.timestamp(),
-                    ),
-                )
-                instance.add_instigator_state(schedule_state)
-
-            schedule_debug_crash_flags = (
-                debug_crash_flags.get(schedule_state.instigator_name) if debug_crash_flags else None
-            )
-
-            if threadpool_executor:
-                if scheduler_run_futures is None:
-                    check.failed(
-                        "scheduler_run_futures dict must be passed with threadpool_executor"
-                    )
+    return schedules
 
-                # only allow one tick per schedule to be in flight
-                if (
-                    external_schedule.selector_id in scheduler_run_futures
-                    and not scheduler_run_futures[external_schedule.selector_id].done()
-                ):
-                    continue
 
-                future = threadpool_executor.submit(
-                    launch_scheduled_runs_for_schedule,
-                    workspace_process_context,
-                    logger,
-                    external_schedule,
-                    schedule_state,
-                    schedule_state_lock,
-                    end_datetime_utc,
-                    max_catchup_runs,
-                    max_tick_retries,
-                    tick_retention_settings,
-                    schedule_debug_crash_flags,
-                    log_verbose_checks=log_verbose_checks,
-                    submit_threadpool_executor=submit_threadpool_executor,
-                )
-                scheduler_run_futures[external_schedule.selector_id] = future
-                yield
-
-            else:
-                # evaluate the schedules in a loop, synchronously, yielding to allow the schedule daemon to
-                # heartbeat
-                yield from launch_scheduled_runs_for_schedule_iterator(
-                    workspace_process_context,
-                    logger,
-                    external_schedule,
-                    schedule_state,
-                    schedule_state_lock,
-                    end_datetime_utc,
-                    max_catchup_runs,
-                    max_tick_retries,
-                    tick_retention_settings,
-                    schedule_debug_crash_flags,
-                    log_verbose_checks=log_verbose_checks,
-                    submit_threadpool_executor=None,
-                )
-        except Exception:
-            error_info = serializable_error_info_from_exc_info(sys.exc_info())
-            logger.exception(f"Scheduler caught an error for schedule {external_schedule.name}")
-        yield error_info
+def _add_automatically_running_schedule_state(
+    instance: DagsterInstance,
+    external_schedule: ExternalSchedule,
+    end_datetime_utc: "DateTime",
+) -> InstigatorState:
+    assert external_schedule.default_status == DefaultScheduleStatus.RUNNING
+    schedule_state = InstigatorState(
+        external_schedule.get_external_origin(),
+        InstigatorType.SCHEDULE,
+        InstigatorStatus.AUTOMATICALLY_RUNNING,
+        ScheduleInstigatorData(
+            external_schedule.cron_schedule,
+            end_datetime_utc.timestamp(),
+        ),
+    )
+    instance.add_instigator_state(schedule_state)
+    return schedule_state
 
 
 def launch_scheduled_runs_for_schedule(
@@ -397,10 +827,10 @@ def launch_scheduled_runs_for_schedule(
     schedule_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     log_verbose_checks: bool,
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
-) -> None:
+) -> Sequence[Optional[SerializableErrorInfo]]:
     # evaluate the tick immediately, but from within a thread.  The main thread should be able to
     # heartbeat to keep the daemon alive
-    list(
+    return list(
         launch_scheduled_runs_for_schedule_iterator(
             workspace_process_context,
             logger,
@@ -627,6 +1057,11 @@ def _submit_run_request(
     logger,
     debug_crash_flags,
 ) -> SubmitRunRequestResult:
+    # Unlike asset daemon and asset backfill runs, which are created in bulk with
+    # DagsterInstance.create_runs, each run request is created and submitted on its own. Run
+    # requests are submitted in parallel with num_submit_workers, and each run is deduplicated by
+    # its run key and recorded on the tick as soon as it is submitted, so that a crash or an error
+    # in one submission doesn't affect the rest of the tick.
     instance = workspace_process_context.instance
     schedule_origin = external_schedule.get_external_origin()
 
@@ -788,6 +1223,20 @@ def _schedule_runs_at_time(
             tick_context.add_run_info(run_id=run.run_id, run_key=run_request_result.run_key)
             _check_for_debug_crash(debug_crash_flags, "RUN_ADDED")
 
+    if run_requests:
+        # how long after its scheduled execution time the tick finished submitting its runs
+        launch_lag = pendulum.now("UTC").timestamp() - schedule_time.timestamp()
+        # the lag is also attached to the log record as structured fields, so that log handlers
+        # can export it as a metric
+        logger.info(
+            f"Submitted {len(run_requests)} run(s) for {external_schedule.name} at"
+            f" {schedule_time.isoformat()}, {launch_lag:.2f} seconds after the scheduled time",
+            extra={
+                SCHEDULE_NAME_LOG_FIELD: external_schedule.name,
+                SCHEDULE_LAUNCH_LAG_LOG_FIELD: launch_lag,
+            },
+        )
+
     _check_for_debug_crash(debug_crash_flags, "TICK_SUCCESS")
     tick_context.update_state(TickStatus.SUCCESS)
 
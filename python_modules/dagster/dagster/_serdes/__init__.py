@@ -10,6 +10,8 @@
     deserialize_value as deserialize_value,
     pack_value as pack_value,
     serialize_value as serialize_value,
+    serialize_value_to_binary_str as serialize_value_to_binary_str,
+    serialize_value_to_bytes as serialize_value_to_bytes,
     unpack_value as unpack_value,
     whitelist_for_serdes as whitelist_for_serdes,
 )
@@ -12,7 +12,9 @@
 * This isn't meant to replace pickle in the conditions that pickle is reasonable to use
   (in memory, not human readable, etc) just handle the json case effectively.
 """
+import base64
 import collections.abc
+import os
 from abc import ABC, abstractmethod
 from enum import Enum
 from functools import partial
@@ -186,6 +188,11 @@ def create() -> "WhitelistMap":
 
 _WHITELIST_MAP: Final[WhitelistMap] = WhitelistMap.create()
 
+# When enabled, each whitelisted NamedTuple is packed and unpacked by a function specialized to its
+# class, with field layout, storage names and field serializers resolved once. The generic path
+# below is kept as the reference implementation, and is used to report errors with descent paths.
+_COMPILED_SERDES_ENABLED: bool = os.getenv("DAGSTER_DISABLE_COMPILED_SERDES") is None
+
 T = TypeVar("T")
 U = TypeVar("U")
 T_Type = TypeVar("T_Type", bound=Type[object])
@@ -438,6 +445,8 @@ def __init__(
         self.old_fields = old_fields or {}
         self.skip_when_empty_fields = skip_when_empty_fields or set()
         self.field_serializers = field_serializers or {}
+        self._compiled_packers: Dict[type, "CompiledPacker"] = {}
+        self._compiled_unpacker: Optional["CompiledUnpacker"] = None
 
     def unpack(
         self,
@@ -544,6 +553,128 @@ def constructor_param_names(self) -> Sequence[str]:
     def get_storage_name(self) -> str:
         return self.storage_name or self.klass.__name__
 
+    def get_compiled_packer(self, klass: Type[T_NamedTuple]) -> "CompiledPacker":
+        """Returns a function equivalent to `pack` for instances of `klass`, without descent path
+        bookkeeping. Packers are compiled on first use and cached per class.
+        """
+        packer = self._compiled_packers.get(klass)
+        if packer is None:
+            packer = self._compile_packer(klass)
+            self._compiled_packers[klass] = packer
+        return packer
+
+    def get_compiled_unpacker(self) -> "CompiledUnpacker":
+        """Returns a function equivalent to `unpack`, compiled on first use."""
+        if self._compiled_unpacker is None:
+            self._compiled_unpacker = self._compile_unpacker()
+        return self._compiled_unpacker
+
+    def _compile_packer(self, klass: Type[T_NamedTuple]) -> "CompiledPacker":
+        if type(self).pack is not NamedTupleSerializer.pack:
+            return lambda value, whitelist_map: self.pack(value, whitelist_map, _root(value))
+
+        storage_name = self.get_storage_name()
+        # (index, field name, storage name, field serializer, skip when empty)
+        fields = [
+            (
+                index,
+                key,
+                self.storage_field_names.get(key, key),
+                self.field_serializers.get(key),
+                key in self.skip_when_empty_fields,
+            )
+            for index, key in enumerate(klass._fields)
+        ]
+        old_fields = dict(self.old_fields)
+        after_pack = (
+            self.after_pack
+            if type(self).after_pack is not NamedTupleSerializer.after_pack
+            else None
+        )
+
+        def _packer(
+            value: T_NamedTuple, whitelist_map: WhitelistMap
+        ) -> Dict[str, JsonSerializableValue]:
+            packed: Dict[str, JsonSerializableValue] = {"__class__": storage_name}
+            for index, key, storage_key, custom, skip_when_empty in fields:
+                inner_value = value[index]
+                if skip_when_empty and inner_value in EMPTY_VALUES_TO_SKIP:
+                    continue
+                if custom:
+                    packed[storage_key] = custom.pack(
+                        inner_value, whitelist_map=whitelist_map, descent_path=key
+                    )
+                else:
+                    packed[storage_key] = _pack_value_compiled(inner_value, whitelist_map)
+            if old_fields:
+                packed.update(old_fields)
+            if after_pack:
+                packed = after_pack(**packed)
+            return packed
+
+        return _packer
+
+    def _compile_unpacker(self) -> "CompiledUnpacker":
+        if type(self).unpack is not NamedTupleSerializer.unpack:
+            return self.unpack
+
+        # Maps each storage key that is accepted by the constructor to its loaded name and field
+        # serializer. Any other key is ignored, as in `unpack`.
+        param_names = set(self.constructor_param_names)
+        fields: Dict[str, Tuple[str, Optional[FieldSerializer]]] = {}
+        for storage_key, loaded_name in self.loaded_field_names.items():
+            if loaded_name in param_names:
+                fields[storage_key] = (loaded_name, self.field_serializers.get(loaded_name))
+        for name in param_names:
+            if name not in self.loaded_field_names:
+                fields[name] = (name, self.field_serializers.get(name))
+
+        klass = self.klass
+        before_unpack = (
+            self.before_unpack
+            if type(self).before_unpack is not NamedTupleSerializer.before_unpack
+            else None
+        )
+
+        def _unpacker(
+            unpacked_dict: Dict[str, UnpackedValue],
+            whitelist_map: WhitelistMap,
+            context: UnpackContext,
+        ) -> T_NamedTuple:
+            try:
+                if before_unpack:
+                    unpacked_dict = before_unpack(context, unpacked_dict)
+                unpacked: Dict[str, PackableValue] = {}
+                for key, value in unpacked_dict.items():
+                    field = fields.get(key)
+                    if field is None:
+                        context.clear_ignored_unknown_values(value)
+                        continue
+                    loaded_name, custom = field
+                    if custom:
+                        unpacked[loaded_name] = custom.unpack(
+                            value,
+                            whitelist_map=whitelist_map,
+                            context=context,
+                        )
+                    elif context.observed_unknown_serdes_values:
+                        unpacked[loaded_name] = context.assert_no_unknown_values(value)
+                    else:
+                        unpacked[loaded_name] = cast(PackableValue, value)
+                return klass(**unpacked)  # type: ignore  # (see `unpack`)
+            except Exception as exc:
+                value = self.handle_unpack_error(exc, context, unpacked_dict)
+                if isinstance(context, UnpackContext):
+                    context.assert_no_unknown_values(value)
+                    context.clear_ignored_unknown_values(unpacked_dict)
+                return value
+
+        return _unpacker
+
+
+CompiledPacker: TypeAlias = Callable[[Any, WhitelistMap], Dict[str, JsonSerializableValue]]
+CompiledUnpacker: TypeAlias = Callable[[Dict[str, UnpackedValue], WhitelistMap, UnpackContext], Any]
+
 
 class FieldSerializer(Serializer):
     _instance = None
@@ -652,6 +783,14 @@ def pack_value(
         * set
         * frozenset
     """
+    if _COMPILED_SERDES_ENABLED:
+        try:
+            return _pack_value_compiled(val, whitelist_map)
+        except SerializationError:
+            # The compiled path does not track descent paths, so fall back to the generic path,
+            # which raises the same error annotated with the location of the offending value.
+            # Any other error is raised as is.
+            pass
     descent_path = _root(val) if descent_path is None else descent_path
     return _pack_value(val, whitelist_map=whitelist_map, descent_path=descent_path)
 
@@ -730,6 +869,151 @@ def _pack_value(
     return val
 
 
+def _pack_value_compiled(val: PackableValue, whitelist_map: WhitelistMap) -> JsonSerializableValue:
+    # Mirrors `_pack_value`, dispatching whitelisted NamedTuples to their compiled packers.
+    tval = type(val)
+    if tval in (int, float, str, bool) or val is None:
+        return cast(JsonSerializableValue, val)
+    if tval is list:
+        return [_pack_value_compiled(item, whitelist_map) for item in cast(list, val)]
+    if tval is dict:
+        return {
+            key: _pack_value_compiled(value, whitelist_map)
+            for key, value in cast(dict, val).items()
+        }
+
+    if isinstance(val, tuple) and hasattr(val, "_fields"):
+        serializer = whitelist_map.tuple_serializers.get(tval.__name__)
+        if serializer is None:
+            raise SerializationError(f"Can only serialize whitelisted namedtuples, received {val}.")
+        return serializer.get_compiled_packer(tval)(val, whitelist_map)
+    if isinstance(val, Enum):
+        enum_serializer = whitelist_map.enums.get(tval.__name__)
+        if enum_serializer is None:
+            raise SerializationError(
+                f"Can only serialize whitelisted Enums, received {tval.__name__}."
+            )
+        return {"__enum__": enum_serializer.pack(val, whitelist_map, _root(val))}
+    if isinstance(val, set):
+        return {
+            "__set__": [
+                _pack_value_compiled(item, whitelist_map) for item in sorted(list(val), key=str)
+            ]
+        }
+    if isinstance(val, frozenset):
+        return {
+            "__frozenset__": [
+                _pack_value_compiled(item, whitelist_map) for item in sorted(list(val), key=str)
+            ]
+        }
+
+    # custom string subclasses
+    if isinstance(val, str):
+        return val
+
+    if isinstance(val, collections.abc.Mapping):
+        return {key: _pack_value_compiled(value, whitelist_map) for key, value in val.items()}
+    if isinstance(val, collections.abc.Sequence):
+        return [_pack_value_compiled(item, whitelist_map) for item in val]
+
+    return val
+
+
+###################################################################################################
+# Binary encoding
+###################################################################################################
+
+# The binary encoding is the msgpack encoding of the packed value (see `pack_value`), behind a magic
+# prefix and a version byte. JSON text never starts with a null byte, so the prefix allows values
+# in either encoding to be read by `deserialize_value`.
+BINARY_SERDES_MAGIC: Final = b"\x00dgs"
+BINARY_SERDES_VERSION: Final = 1
+_BINARY_SERDES_HEADER: Final = BINARY_SERDES_MAGIC + bytes([BINARY_SERDES_VERSION])
+
+# Text-safe form of the binary encoding (base64), for columns and messages that only hold strings.
+# JSON text never starts with a letter.
+BINARY_SERDES_TEXT_PREFIX: Final = f"dgs{BINARY_SERDES_VERSION}:"
+
+
+def is_binary_serdes_available() -> bool:
+    """Whether the optional `msgpack` dependency for the binary serdes encoding is installed."""
+    try:
+        import msgpack  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def serialize_value_to_bytes(
+    val: PackableValue,
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+) -> bytes:
+    """Serialize an object with the versioned binary encoding.
+
+    Values that can not be represented in msgpack (e.g. integers wider than 64 bits) are encoded as
+    UTF-8 JSON instead. `deserialize_value` accepts either.
+    """
+    msgpack = _import_msgpack()
+    packed_value = pack_value(val, whitelist_map=whitelist_map)
+    try:
+        return _BINARY_SERDES_HEADER + msgpack.packb(packed_value, use_bin_type=True)
+    except OverflowError:
+        return seven.json.dumps(packed_value).encode("utf-8")
+
+
+def serialize_value_to_binary_str(
+    val: PackableValue,
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+) -> str:
+    """Serialize an object with the text-safe form of the binary encoding."""
+    serialized = serialize_value_to_bytes(val, whitelist_map=whitelist_map)
+    if not serialized.startswith(_BINARY_SERDES_HEADER):
+        # fell back to JSON
+        return serialized.decode("utf-8")
+
+    return BINARY_SERDES_TEXT_PREFIX + base64.b64encode(
+        serialized[len(_BINARY_SERDES_HEADER) :]
+    ).decode("ascii")
+
+
+def _import_msgpack() -> Any:
+    try:
+        import msgpack
+    except ImportError as exc:
+        raise SerdesUsageError(
+            "The binary serdes encoding requires the msgpack package. Install it with `pip"
+            " install dagster[msgpack]`."
+        ) from exc
+    return msgpack
+
+
+def _loads_binary(val: bytes, object_hook: Callable[[dict], Any]) -> Any:
+    try:
+        msgpack = _import_msgpack()
+    except SerdesUsageError as exc:
+        raise DeserializationError(str(exc)) from exc
+
+    return msgpack.unpackb(val, raw=False, strict_map_key=False, object_hook=object_hook)
+
+
+def _loads(val: Union[str, bytes], object_hook: Callable[[dict], Any]) -> Any:
+    if isinstance(val, bytes):
+        if val.startswith(BINARY_SERDES_MAGIC):
+            if not val.startswith(_BINARY_SERDES_HEADER):
+                version = val[len(BINARY_SERDES_MAGIC) : len(_BINARY_SERDES_HEADER)]
+                raise DeserializationError(
+                    f"Unsupported binary serdes encoding version {version!r}. This error can occur"
+                    " due to version skew, verify processes are running expected versions."
+                )
+            return _loads_binary(val[len(_BINARY_SERDES_HEADER) :], object_hook)
+        return seven.json.loads(val.decode("utf-8"), object_hook=object_hook)
+
+    if val.startswith(BINARY_SERDES_TEXT_PREFIX):
+        return _loads_binary(base64.b64decode(val[len(BINARY_SERDES_TEXT_PREFIX) :]), object_hook)
+
+    return seven.json.loads(val, object_hook=object_hook)
+
+
 ###################################################################################################
 # Deserialize / Unpack
 ###################################################################################################
@@ -740,7 +1024,7 @@ def _pack_value(
 
 @overload
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: Tuple[Type[T_PackableValue], Type[U_PackableValue]],
     whitelist_map: WhitelistMap = ...,
 ) -> Union[T_PackableValue, U_PackableValue]:
@@ -749,7 +1033,7 @@ def deserialize_value(
 
 @overload
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: Type[T_PackableValue],
     whitelist_map: WhitelistMap = ...,
 ) -> T_PackableValue:
@@ -758,7 +1042,7 @@ def deserialize_value(
 
 @overload
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: None = ...,
     whitelist_map: WhitelistMap = ...,
 ) -> PackableValue:
@@ -766,7 +1050,7 @@ def deserialize_value(
 
 
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: Optional[
         Union[Type[T_PackableValue], Tuple[Type[T_PackableValue], Type[U_PackableValue]]]
     ] = None,
@@ -774,6 +1058,9 @@ def deserialize_value(
 ) -> Union[PackableValue, T_PackableValue, Union[T_PackableValue, U_PackableValue]]:
     """Deserialize a json encoded string to a Python object.
 
+    Strings and bytes produced by the binary encoding (see `serialize_value_to_bytes`) are detected
+    by their prefix, and accepted as well.
+
     Three steps:
 
     - Parse the input string as JSON.
@@ -781,12 +1068,12 @@ def deserialize_value(
       Python objects (e.g. dagster-specific `NamedTuple` objects).
     - Optionally, check that the resulting object is of the expected type.
     """
-    check.str_param(val, "val")
+    check.inst_param(val, "val", (str, bytes))
 
     # Never issue warnings when deserializing deprecated objects.
     with disable_dagster_warnings():
         context = UnpackContext()
-        unpacked_value = seven.json.loads(
+        unpacked_value = _loads(
             val, object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context)
         )
         unpacked_value = context.finalize_unpack(unpacked_value)
@@ -821,6 +1108,8 @@ def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContex
 
         val.pop("__class__")
         deserializer = whitelist_map.get_tuple_deserializer(klass_name)
+        if _COMPILED_SERDES_ENABLED:
+            return deserializer.get_compiled_unpacker()(val, whitelist_map, context)
         return deserializer.unpack(val, whitelist_map, context)
 
     if "__enum__" in val:
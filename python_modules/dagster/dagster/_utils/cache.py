@@ -0,0 +1,57 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """A thread-safe mapping that holds at most `max_size` entries, evicting the least recently
+    used entry when a new one is added to a full cache.
+
+    Used for caches that live as long as the process, so that they stay bounded in long-running
+    processes like code servers and daemons.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[K, V]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        with self._lock:
+            self._set(key, value)
+
+    def get_or_create(self, key: K, create_fn: Callable[[], V]) -> V:
+        """Returns the value for the key, creating it with `create_fn` if it is not cached. The
+        value is created while holding the cache's lock, so `create_fn` should be cheap.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                value = create_fn()
+                self._set(key, value)
+            else:
+                self._entries.move_to_end(key)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _set(self, key: K, value: V) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
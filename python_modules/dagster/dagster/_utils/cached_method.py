@@ -1,5 +1,6 @@
 from functools import wraps
-from typing import AbstractSet, Callable, Dict, Hashable, Mapping, Tuple, Type, TypeVar
+from threading import Lock
+from typing import AbstractSet, Callable, Dict, Hashable, Mapping, Optional, Tuple, Type, TypeVar
 
 from typing_extensions import Concatenate, ParamSpec
 
@@ -15,6 +16,9 @@
 
 CACHED_METHOD_FIELD_SUFFIX = "_cached__internal__"
 
+# guards the creation of the per-instance caches, which may happen concurrently from several threads
+_CACHE_CREATION_LOCK = Lock()
+
 
 def cached_method(method: Callable[Concatenate[S, P], T]) -> Callable[Concatenate[S, P], T]:
     """Caches the results of a method call.
@@ -50,22 +54,29 @@ def a_method(self, arg1, arg2):
 
     With this decorator, the first two would point to the same cache entry, and non-kwarg arguments
     are not allowed.
+
+    Cached methods may be called concurrently from several threads. The method may then be
+    evaluated more than once for the same arguments, but the first result stored is the one that
+    every caller gets back.
     """
     cache_attr_name = method.__name__ + CACHED_METHOD_FIELD_SUFFIX
 
     @wraps(method)
     def _cached_method_wrapper(self: S, *args: P.args, **kwargs: P.kwargs) -> T:
-        if not hasattr(self, cache_attr_name):
-            cache: Dict[Hashable, T] = {}
-            setattr(self, cache_attr_name, cache)
-        else:
-            cache = getattr(self, cache_attr_name)
+        cache: Optional[Dict[Hashable, T]] = getattr(self, cache_attr_name, None)
+        if cache is None:
+            with _CACHE_CREATION_LOCK:
+                cache = getattr(self, cache_attr_name, None)
+                if cache is None:
+                    cache = {}
+                    setattr(self, cache_attr_name, cache)
 
         key = _make_key(args, kwargs)
-        if key not in cache:
-            result = method(self, *args, **kwargs)
-            cache[key] = result
-        return cache[key]
+        if key in cache:
+            return cache[key]
+        # entries are never removed, and setdefault is atomic, so concurrent callers that both
+        # missed the cache agree on the stored result
+        return cache.setdefault(key, method(self, *args, **kwargs))
 
     return _cached_method_wrapper
 
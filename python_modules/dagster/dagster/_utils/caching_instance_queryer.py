@@ -27,7 +27,12 @@
     extract_data_version_from_entry,
 )
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
-from dagster._core.definitions.partition import DynamicPartitionsDefinition, PartitionsSubset
+from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsDefinition
+from dagster._core.definitions.partition import (
+    DynamicPartitionsDefinition,
+    PartitionsDefinition,
+    PartitionsSubset,
+)
 from dagster._core.definitions.time_window_partitions import (
     TimeWindowPartitionsDefinition,
     get_time_partition_key,
@@ -38,6 +43,7 @@
 from dagster._core.storage.dagster_run import (
     DagsterRun,
     RunRecord,
+    RunsFilter,
 )
 from dagster._core.storage.tags import PARTITION_NAME_TAG
 from dagster._utils.cached_method import cached_method
@@ -52,6 +58,10 @@ class CachingInstanceQueryer(DynamicPartitionsStore):
     instance which will attempt to limit redundant expensive calls. Intended for use within the
     scope of a single "request" (e.g. GQL request, sensor tick).
 
+    Methods may be called concurrently from several threads. Cache entries are only ever added, and
+    are stored with ``setdefault`` so that threads which miss the cache at the same time agree on
+    the cached value.
+
     Args:
         instance (DagsterInstance): The instance to query.
     """
@@ -73,6 +83,8 @@ def __init__(
             AssetKeyPartitionKey, int
         ] = {}
 
+        self._run_record_cache: Dict[str, Optional[RunRecord]] = {}
+
         self._dynamic_partitions_cache: Dict[str, Sequence[str]] = {}
 
         self._evaluation_time = evaluation_time if evaluation_time else pendulum.now("UTC")
@@ -118,6 +130,54 @@ def prefetch_asset_records(self, asset_keys: Iterable[AssetKey]):
             if key not in self._asset_record_cache:
                 self._asset_record_cache[key] = None
 
+    def prefetch_latest_storage_ids_by_partition(self, asset_keys: Iterable[AssetKey]):
+        """For performance, fetches the latest storage id of each partition of the selected assets
+        in advance. Assets that have never been materialized are skipped, as they have no
+        partitions to fetch.
+        """
+        for asset_key in asset_keys:
+            asset_record = self.get_asset_record(asset_key)
+            if asset_record is None or asset_record.asset_entry.last_materialization_record is None:
+                continue
+            self._get_latest_materialization_or_observation_storage_ids_by_asset_partition(
+                asset_key=asset_key
+            )
+
+    def prefetch_run_records(self, run_ids: Iterable[str]):
+        """For performance, batches together queries for selected runs."""
+        run_ids_to_fetch = set(run_ids) - set(self._run_record_cache.keys())
+        if len(run_ids_to_fetch) == 0:
+            return
+        for run_record in self.instance.get_run_records(
+            filters=RunsFilter(run_ids=list(run_ids_to_fetch))
+        ):
+            self._run_record_cache[run_record.dagster_run.run_id] = run_record
+        for run_id in run_ids_to_fetch:
+            if run_id not in self._run_record_cache:
+                self._run_record_cache[run_id] = None
+
+    def cache_run_records(self, run_records: Iterable[RunRecord]):
+        """Adds run records that were fetched by some other query to the cache, so that later
+        lookups of those runs do not need to query the instance.
+        """
+        for run_record in run_records:
+            self._run_record_cache[run_record.dagster_run.run_id] = run_record
+
+    def prefetch_dynamic_partitions(
+        self, partitions_defs: Iterable[Optional[PartitionsDefinition]]
+    ):
+        """For performance, fetches the partitions of every named dynamic partitions definition
+        among the selected partitions definitions (including the dimensions of multi-partitions
+        definitions) in advance.
+        """
+        for partitions_def in partitions_defs:
+            if isinstance(partitions_def, MultiPartitionsDefinition):
+                self.prefetch_dynamic_partitions(
+                    dimension.partitions_def for dimension in partitions_def.partitions_defs
+                )
+            elif isinstance(partitions_def, DynamicPartitionsDefinition) and partitions_def.name:
+                self.get_dynamic_partitions(partitions_def.name)
+
     ####################
     # ASSET STATUS CACHE
     ####################
@@ -155,11 +215,11 @@ def has_cached_asset_record(self, asset_key: AssetKey) -> bool:
         return asset_key in self._asset_record_cache
 
     def get_asset_record(self, asset_key: AssetKey) -> Optional["AssetRecord"]:
-        if asset_key not in self._asset_record_cache:
-            self._asset_record_cache[asset_key] = next(
-                iter(self.instance.get_asset_records([asset_key])), None
-            )
-        return self._asset_record_cache[asset_key]
+        if asset_key in self._asset_record_cache:
+            return self._asset_record_cache[asset_key]
+        return self._asset_record_cache.setdefault(
+            asset_key, next(iter(self.instance.get_asset_records([asset_key])), None)
+        )
 
     def _event_type_for_key(self, asset_key: AssetKey) -> DagsterEventType:
         if self.asset_graph.is_source(asset_key):
@@ -296,6 +356,42 @@ def asset_partition_has_materialization_or_observation(
             after_cursor or 0
         )
 
+    def get_asset_keys_updated_after_cursor(
+        self, after_cursor: int, limit: int
+    ) -> Optional[AbstractSet[AssetKey]]:
+        """Returns the keys of the assets that have been materialized, and of the source assets
+        that have been observed, after the given cursor. Reads the events stored after the cursor
+        instead of the asset record of every asset, so the cost grows with the number of events
+        rather than with the number of assets.
+
+        Args:
+            after_cursor (int): Only consider events with a storage_id greater than this value.
+            limit (int): The maximum number of events of each type to read. Returns None if there
+                are more events than this after the cursor.
+        """
+        from dagster._core.event_api import EventRecordsFilter
+
+        asset_keys: Set[AssetKey] = set()
+        for event_type in (
+            DagsterEventType.ASSET_MATERIALIZATION,
+            DagsterEventType.ASSET_OBSERVATION,
+        ):
+            records = self.instance.get_event_records(
+                event_records_filter=EventRecordsFilter(
+                    event_type=event_type, after_cursor=after_cursor
+                ),
+                limit=limit,
+            )
+            if len(records) >= limit:
+                return None
+            asset_keys.update(
+                record.asset_key
+                for record in records
+                if record.asset_key is not None
+                and self._event_type_for_key(record.asset_key) == event_type
+            )
+        return asset_keys
+
     def get_latest_materialization_or_observation_record(
         self,
         asset_partition: AssetKeyPartitionKey,
@@ -368,9 +464,10 @@ def next_version_record(
     # RUNS
     ####################
 
-    @cached_method
     def _get_run_record_by_id(self, *, run_id: str) -> Optional[RunRecord]:
-        return self.instance.get_run_record_by_id(run_id)
+        if run_id in self._run_record_cache:
+            return self._run_record_cache[run_id]
+        return self._run_record_cache.setdefault(run_id, self.instance.get_run_record_by_id(run_id))
 
     def _get_run_by_id(self, run_id: str) -> Optional[DagsterRun]:
         run_record = self._get_run_record_by_id(run_id=run_id)
@@ -490,16 +587,34 @@ def get_materialized_partition_counts(
             after_cursor (Optional[int]): The cursor after which to look for materializations. If
                 not provided, will look at all materializations.
         """
-        if (
-            after_cursor not in self._asset_partition_count_cache
-            or asset_key not in self._asset_partition_count_cache[after_cursor]
+        counts_by_asset_key = self._asset_partition_count_cache[after_cursor]
+        if asset_key in counts_by_asset_key:
+            return counts_by_asset_key[asset_key]
+        if after_cursor is not None and not self._may_have_materialization_after_cursor(
+            asset_key, after_cursor
         ):
-            self._asset_partition_count_cache[after_cursor][asset_key] = (
-                self.instance.get_materialization_count_by_partition(
-                    asset_keys=[asset_key], after_cursor=after_cursor
-                )[asset_key]
-            )
-        return self._asset_partition_count_cache[after_cursor][asset_key]
+            # avoid querying for the counts if the asset has not been materialized since the
+            # cursor
+            return counts_by_asset_key.setdefault(asset_key, {})
+        return counts_by_asset_key.setdefault(
+            asset_key,
+            self.instance.get_materialization_count_by_partition(
+                asset_keys=[asset_key], after_cursor=after_cursor
+            )[asset_key],
+        )
+
+    def _may_have_materialization_after_cursor(
+        self, asset_key: AssetKey, after_cursor: int
+    ) -> bool:
+        # asset records of source assets are not fetched, so assume they may have been materialized
+        if self.asset_graph.is_source(asset_key):
+            return True
+        asset_record = self.get_asset_record(asset_key)
+        return (
+            asset_record is not None
+            and asset_record.asset_entry.last_materialization_record is not None
+            and asset_record.asset_entry.last_materialization_record.storage_id > after_cursor
+        )
 
     def get_materialized_partitions(
         self, asset_key: AssetKey, after_cursor: Optional[int] = None
@@ -525,11 +640,11 @@ def get_materialized_partitions(
 
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         """Returns a list of partitions for a partitions definition."""
-        if partitions_def_name not in self._dynamic_partitions_cache:
-            self._dynamic_partitions_cache[partitions_def_name] = (
-                self.instance.get_dynamic_partitions(partitions_def_name)
-            )
-        return self._dynamic_partitions_cache[partitions_def_name]
+        if partitions_def_name in self._dynamic_partitions_cache:
+            return self._dynamic_partitions_cache[partitions_def_name]
+        return self._dynamic_partitions_cache.setdefault(
+            partitions_def_name, self.instance.get_dynamic_partitions(partitions_def_name)
+        )
 
     def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> bool:
         return partition_key in self.get_dynamic_partitions(partitions_def_name)
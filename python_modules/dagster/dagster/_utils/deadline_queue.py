@@ -0,0 +1,62 @@
+import heapq
+import itertools
+from typing import AbstractSet, Dict, Generic, Hashable, List, Optional, Sequence, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class DeadlineQueue(Generic[K]):
+    """Priority queue of keys, ordered by the timestamp at which each key is next due.
+
+    Entries are invalidated lazily, so the timestamp of a key can be updated by pushing it again,
+    and a key can be removed without searching the heap.
+    """
+
+    def __init__(self):
+        # the counter breaks ties between equal timestamps, so that keys never need to be compared
+        self._heap: List[Tuple[float, int, K]] = []
+        self._counter = itertools.count()
+        self._timestamps: Dict[K, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._timestamps
+
+    def get_timestamp(self, key: K) -> Optional[float]:
+        return self._timestamps.get(key)
+
+    def push(self, key: K, timestamp: float) -> None:
+        """Schedules the key at the given timestamp, replacing any timestamp it already had."""
+        self._timestamps[key] = timestamp
+        heapq.heappush(self._heap, (timestamp, next(self._counter), key))
+
+    def remove(self, key: K) -> None:
+        self._timestamps.pop(key, None)
+
+    def retain(self, keys: AbstractSet[K]) -> None:
+        """Removes every key that is not in the given set."""
+        for key in list(self._timestamps.keys()):
+            if key not in keys:
+                del self._timestamps[key]
+
+    def _is_current(self, timestamp: float, key: K) -> bool:
+        return self._timestamps.get(key) == timestamp
+
+    @property
+    def next_timestamp(self) -> Optional[float]:
+        """The earliest timestamp at which a key is due, if any key is scheduled."""
+        while self._heap and not self._is_current(self._heap[0][0], self._heap[0][2]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float) -> Sequence[K]:
+        """Removes and returns the keys that are due at the given timestamp, earliest first."""
+        due_keys: List[K] = []
+        while self._heap and self._heap[0][0] <= now:
+            timestamp, _, key = heapq.heappop(self._heap)
+            if self._is_current(timestamp, key):
+                del self._timestamps[key]
+                due_keys.append(key)
+        return due_keys
@@ -1,6 +1,6 @@
 import datetime
 import functools
-from typing import Iterator, Optional, Sequence, Union
+from typing import Iterator, NamedTuple, Optional, Sequence, Union
 
 import pendulum
 import pytz
@@ -48,6 +48,78 @@ def is_valid_cron_schedule(cron_schedule: Union[str, Sequence[str]]) -> bool:
     )
 
 
+# Unit of schedule periods that are a fixed number of seconds, regardless of the timezone
+ABSOLUTE_PERIOD_UNIT = "seconds"
+
+
+class SchedulePeriod(NamedTuple):
+    """The fixed period between consecutive ticks of a cron schedule.
+
+    unit is either ABSOLUTE_PERIOD_UNIT, in which case ticks are exactly `length` seconds apart, or
+    one of "days", "weeks" or "months", in which case ticks are `length` calendar units apart at the
+    same wall time (`hour`:`minute`) in the schedule's timezone.
+    """
+
+    unit: str
+    length: int
+    minute: Optional[int] = None
+    hour: Optional[int] = None
+
+
+def _is_fixed_offset_timezone(timezone_str: str) -> bool:
+    return not isinstance(pytz.timezone(timezone_str), pytz.tzinfo.DstTzInfo)
+
+
+def get_schedule_period(
+    cron_string: str, execution_timezone: Optional[str]
+) -> Optional[SchedulePeriod]:
+    """Returns the fixed period between ticks of the given cron string, or None if the ticks are not
+    evenly spaced. The returned periods match the way cron_string_iterator steps through schedules,
+    including across DST transitions.
+    """
+    timezone_str = execution_timezone if execution_timezone else "UTC"
+
+    # Croniter < 1.4 returns 2 items
+    # Croniter >= 1.4 returns 3 items
+    cron_parts, nth_weekday_of_month, *_ = CroniterShim.expand(cron_string)
+    if nth_weekday_of_month:
+        return None
+
+    is_numeric = [len(part) == 1 and part[0] != "*" for part in cron_parts]
+    is_wildcard = [len(part) == 1 and part[0] == "*" for part in cron_parts]
+
+    if all(is_wildcard[1:]):
+        if is_numeric[0]:
+            # hourly, which cron_string_iterator steps through in absolute time
+            return SchedulePeriod(ABSOLUTE_PERIOD_UNIT, 60 * 60)
+
+        # every N minutes. In timezones with DST transitions, croniter does not step through
+        # these in absolute time, so only handle fixed offset timezones.
+        minutes = list(range(60)) if is_wildcard[0] else cron_parts[0]
+        step = 60 // len(minutes)
+        if (
+            60 % step == 0
+            and minutes == list(range(minutes[0], 60, step))
+            and minutes[0] < step
+            and _is_fixed_offset_timezone(timezone_str)
+        ):
+            return SchedulePeriod(ABSOLUTE_PERIOD_UNIT, 60 * step)
+        return None
+
+    if not all(is_numeric[0:2]):
+        return None
+
+    minute, hour = cron_parts[0][0], cron_parts[1][0]
+    if all(is_wildcard[2:]):
+        return SchedulePeriod("days", 1, minute=minute, hour=hour)
+    elif is_numeric[4] and all(is_wildcard[2:4]):
+        return SchedulePeriod("weeks", 1, minute=minute, hour=hour)
+    elif is_numeric[2] and all(is_wildcard[3:]) and cron_parts[2][0] <= 28:
+        # days past the 28th are clamped to the end of shorter months
+        return SchedulePeriod("months", 1, minute=minute, hour=hour)
+    return None
+
+
 def cron_string_iterator(
     start_timestamp: float,
     cron_string: str,
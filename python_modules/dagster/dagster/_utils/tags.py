@@ -1,11 +1,17 @@
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Sequence, Tuple, Union
+from typing import Any, Dict, Mapping, Sequence, Tuple
+
+from typing_extensions import Protocol
 
 from dagster import _check as check
 
-if TYPE_CHECKING:
-    from dagster._core.execution.plan.step import ExecutionStep
-    from dagster._core.storage.dagster_run import DagsterRun
+
+class TaggedItem(Protocol):
+    """An item whose tags count towards tag concurrency limits, like a run or an execution step."""
+
+    @property
+    def tags(self) -> Mapping[str, str]:
+        ...
 
 
 class TagConcurrencyLimitsCounter:
@@ -21,7 +27,7 @@ class TagConcurrencyLimitsCounter:
     def __init__(
         self,
         tag_concurrency_limits: Sequence[Mapping[str, Any]],
-        in_progress_tagged_items: Sequence[Union["DagsterRun", "ExecutionStep"]],
+        in_progress_tagged_items: Sequence[TaggedItem],
     ):
         check.opt_list_param(tag_concurrency_limits, "tag_concurrency_limits", of_type=dict)
         check.list_param(in_progress_tagged_items, "in_progress_tagged_items")
@@ -50,7 +56,7 @@ def __init__(
         for item in in_progress_tagged_items:
             self.update_counters_with_launched_item(item)
 
-    def is_blocked(self, item: Union["DagsterRun", "ExecutionStep"]) -> bool:
+    def is_blocked(self, item: TaggedItem) -> bool:
         """True if there are in progress item which are blocking this item based on tag limits."""
         for key, value in item.tags.items():
             if key in self._key_limits and self._key_counts[key] >= self._key_limits[key]:
@@ -71,9 +77,7 @@ def is_blocked(self, item: Union["DagsterRun", "ExecutionStep"]) -> bool:
 
         return False
 
-    def update_counters_with_launched_item(
-        self, item: Union["DagsterRun", "ExecutionStep"]
-    ) -> None:
+    def update_counters_with_launched_item(self, item: TaggedItem) -> None:
         """Add a new in progress item to the counters."""
         for key, value in item.tags.items():
             if key in self._key_limits:
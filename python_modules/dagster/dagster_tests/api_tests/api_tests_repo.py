@@ -174,6 +174,12 @@ def sensor_raises_dagster_error(_):
     raise DagsterError("Dagster error")
 
 
+@sensor(job_name="foo")
+def sensor_slow(_):
+    time.sleep(5)
+    yield RunRequest(run_key=None, run_config={"foo": "FOO"})
+
+
 @repository(metadata={"string": "foo", "integer": 123})
 def bar_repo():
     return {
@@ -192,6 +198,7 @@ def bar_repo():
             "sensor_foo": sensor_foo,
             "sensor_error": lambda: sensor_error,
             "sensor_raises_dagster_error": lambda: sensor_raises_dagster_error,
+            "sensor_slow": lambda: sensor_slow,
         },
     }
 
@@ -2,7 +2,16 @@
 from contextlib import contextmanager
 
 import pytest
-from dagster import IntMetadataValue, TextMetadataValue, job, op, repository
+from dagster import (
+    AssetKey,
+    IntMetadataValue,
+    TextMetadataValue,
+    asset,
+    define_asset_job,
+    job,
+    op,
+    repository,
+)
 from dagster._api.snapshot_repository import (
     sync_get_streaming_external_repositories_data_grpc,
 )
@@ -11,14 +20,21 @@
     ExternalRepositoryData,
     ManagedGrpcPythonEnvCodeLocationOrigin,
 )
+from dagster._core.host_representation.deferred_external_data import (
+    DeferredExternalRepositoryData,
+    can_defer_external_repository_data,
+)
 from dagster._core.host_representation.external import ExternalRepository
-from dagster._core.host_representation.external_data import ExternalJobData
+from dagster._core.host_representation.external_data import (
+    ExternalJobData,
+    external_repository_data_from_def,
+)
 from dagster._core.host_representation.handle import RepositoryHandle
 from dagster._core.host_representation.origin import ExternalRepositoryOrigin
 from dagster._core.instance import DagsterInstance
 from dagster._core.test_utils import instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
-from dagster._serdes.serdes import deserialize_value
+from dagster._serdes.serdes import deserialize_value, serialize_value
 
 from .utils import get_bar_repo_code_location
 
@@ -33,9 +49,9 @@ def test_streaming_external_repositories_api_grpc(instance):
 
         external_repository_data = external_repo_datas["bar_repo"]
 
-        assert isinstance(external_repository_data, ExternalRepositoryData)
+        assert isinstance(external_repository_data, DeferredExternalRepositoryData)
         assert external_repository_data.name == "bar_repo"
-        assert external_repository_data.metadata == {
+        assert external_repository_data.base_data.metadata == {
             "string": TextMetadataValue("foo"),
             "integer": IntMetadataValue(123),
         }
@@ -53,6 +69,87 @@ def test_streaming_external_repositories_error(instance):
             sync_get_streaming_external_repositories_data_grpc(code_location.client, code_location)
 
 
+def test_deferred_external_repository_data(instance: DagsterInstance):
+    from .api_tests_repo import bar_repo
+
+    external_repository_data = external_repository_data_from_def(bar_repo)
+    deferred_data = DeferredExternalRepositoryData(serialize_value(external_repository_data))
+
+    with get_bar_repo_code_location(instance) as code_location:
+        repo = ExternalRepository(
+            deferred_data,
+            RepositoryHandle(repository_name="bar_repo", code_location=code_location),
+        )
+
+        assert repo.name == "bar_repo"
+        assert {job.name for job in repo.get_all_external_jobs()} == {
+            job_data.name for job_data in external_repository_data.get_external_job_datas()
+        }
+        assert len(repo.get_external_schedules()) == len(
+            external_repository_data.external_schedule_datas
+        )
+        assert len(repo.get_external_sensors()) == len(
+            external_repository_data.external_sensor_datas
+        )
+
+        # asset nodes are unpacked individually, and only once
+        asset_node = external_repository_data.external_asset_graph_data[0]
+        assert repo.get_external_asset_node(asset_node.asset_key) == asset_node
+        assert repo.get_external_asset_node(asset_node.asset_key) is repo.get_external_asset_node(
+            asset_node.asset_key
+        )
+        assert repo.get_external_asset_nodes("dynamic_job") == [
+            node
+            for node in external_repository_data.external_asset_graph_data
+            if "dynamic_job" in node.job_names
+        ]
+
+        job = repo.get_full_external_job("foo")
+        assert job.job_snapshot == external_repository_data.get_job_snapshot("foo")
+
+        # the fully unpacked data is identical to the original
+        assert repo.external_repository_data == external_repository_data
+
+
+def test_deferred_external_repository_data_with_markers_in_strings():
+    tricky = '], "external_schedule_datas": {"__class__": "ExternalAssetNode", "job_names": ["x"]}'
+
+    @asset(metadata={"tricky": tricky}, description=tricky)
+    def upstream():
+        ...
+
+    @asset(description=tricky)
+    def downstream(upstream):
+        ...
+
+    @repository(metadata={"tricky": tricky})
+    def tricky_repo():
+        return [upstream, downstream, define_asset_job("tricky_job", description=tricky)]
+
+    external_repository_data = external_repository_data_from_def(tricky_repo)
+    deferred_data = DeferredExternalRepositoryData(serialize_value(external_repository_data))
+
+    assert set(deferred_data.job_names) == {
+        job_data.name for job_data in external_repository_data.get_external_job_datas()
+    }
+    assert set(deferred_data.get_asset_keys_for_job("tricky_job")) == {
+        AssetKey("upstream"),
+        AssetKey("downstream"),
+    }
+    assert deferred_data.materialize() == external_repository_data
+
+
+
+def test_deferred_external_repository_data_json_formatting():
+    from .api_tests_repo import bar_repo
+
+    external_repository_data = external_repository_data_from_def(bar_repo)
+    for json_kwargs in [{"sort_keys": False}, {"separators": (",", ":")}, {"indent": 2}]:
+        serialized = serialize_value(external_repository_data, **json_kwargs)
+        assert can_defer_external_repository_data(serialized)
+        deferred_data = DeferredExternalRepositoryData(serialized)
+        assert deferred_data.materialize() == external_repository_data
+
 @op
 def do_something():
     return 1
@@ -101,7 +198,7 @@ def test_giant_external_repository_streaming_grpc():
 
             external_repository_data = external_repos_data["giant_repo"]
 
-            assert isinstance(external_repository_data, ExternalRepositoryData)
+            assert isinstance(external_repository_data, DeferredExternalRepositoryData)
             assert external_repository_data.name == "giant_repo"
 
 
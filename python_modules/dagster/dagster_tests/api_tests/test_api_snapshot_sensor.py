@@ -1,11 +1,20 @@
+import sys
+import time
+
 import pytest
-from dagster._api.snapshot_sensor import sync_get_external_sensor_execution_data_ephemeral_grpc
+from dagster._api.snapshot_sensor import (
+    sync_get_external_sensor_execution_data_batch_grpc,
+    sync_get_external_sensor_execution_data_ephemeral_grpc,
+)
 from dagster._core.definitions.sensor_definition import SensorExecutionData
 from dagster._core.errors import DagsterUserCodeProcessError, DagsterUserCodeUnreachableError
 from dagster._core.host_representation.external_data import ExternalSensorExecutionErrorData
+from dagster._core.host_representation.origin import InProcessCodeLocationOrigin
+from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._grpc.client import ephemeral_grpc_api_client
 from dagster._grpc.types import SensorExecutionArgs
 from dagster._serdes import deserialize_value
+from dagster._utils import file_relative_path
 
 from .utils import get_bar_repo_handle
 
@@ -71,3 +80,113 @@ def test_external_sensor_timeout(instance):
             sync_get_external_sensor_execution_data_ephemeral_grpc(
                 instance, repository_handle, "sensor_foo", None, None, None, timeout=0
             )
+
+
+def test_external_sensor_batch_grpc(instance):
+    with get_bar_repo_handle(instance) as repository_handle:
+        origin = repository_handle.get_external_origin()
+        with ephemeral_grpc_api_client(
+            origin.code_location_origin.loadable_target_origin
+        ) as api_client:
+            results = list(
+                sync_get_external_sensor_execution_data_batch_grpc(
+                    api_client,
+                    [
+                        SensorExecutionArgs(
+                            repository_origin=origin,
+                            instance_ref=instance.get_ref(),
+                            sensor_name=sensor_name,
+                            last_completion_time=None,
+                            last_run_key=None,
+                            cursor=None,
+                        )
+                        for sensor_name in ["sensor_foo", "sensor_error", "sensor_foo"]
+                    ],
+                )
+            )
+
+    # results are returned in request order, with errors isolated to their own sensor
+    assert len(results) == 3
+    assert isinstance(results[0], SensorExecutionData)
+    assert len(results[0].run_requests) == 2
+    assert isinstance(results[1], ExternalSensorExecutionErrorData)
+    assert "womp womp" in results[1].error.to_string()
+    assert isinstance(results[2], SensorExecutionData)
+    assert results[2].run_requests == results[0].run_requests
+
+
+def test_external_sensor_batch_timeout(instance):
+    with get_bar_repo_handle(instance) as repository_handle:
+        origin = repository_handle.get_external_origin()
+        with ephemeral_grpc_api_client(
+            origin.code_location_origin.loadable_target_origin
+        ) as api_client:
+            start_time = time.time()
+            results = list(
+                sync_get_external_sensor_execution_data_batch_grpc(
+                    api_client,
+                    [
+                        SensorExecutionArgs(
+                            repository_origin=origin,
+                            instance_ref=instance.get_ref(),
+                            sensor_name=sensor_name,
+                            last_completion_time=None,
+                            last_run_key=None,
+                            cursor=None,
+                        )
+                        for sensor_name in ["sensor_slow", "sensor_foo", "sensor_slow"]
+                    ],
+                    timeout=1,
+                )
+            )
+            elapsed = time.time() - start_time
+
+    # the sensors are evaluated concurrently, and the timeout applies to each of the slow sensors
+    # rather than failing the whole batch
+    assert elapsed < 4
+    assert len(results) == 3
+    assert isinstance(results[0], ExternalSensorExecutionErrorData)
+    assert "timed out due to taking longer than 1 seconds" in results[0].error.message
+    assert isinstance(results[1], SensorExecutionData)
+    assert len(results[1].run_requests) == 2
+    assert isinstance(results[2], ExternalSensorExecutionErrorData)
+
+
+def test_in_process_sensor_batch_errors(instance):
+    with InProcessCodeLocationOrigin(
+        LoadableTargetOrigin(
+            executable_path=sys.executable,
+            python_file=file_relative_path(__file__, "api_tests_repo.py"),
+            attribute="bar_repo",
+        )
+    ).create_location() as code_location:
+        origin = code_location.get_repository("bar_repo").handle.get_external_origin()
+        results = list(
+            code_location.get_external_sensor_execution_data_batch(
+                instance,
+                [
+                    SensorExecutionArgs(
+                        repository_origin=repository_origin,
+                        instance_ref=instance.get_ref(),
+                        sensor_name=sensor_name,
+                        last_completion_time=None,
+                        last_run_key=None,
+                        cursor=None,
+                    )
+                    for repository_origin, sensor_name in [
+                        (origin, "sensor_error"),
+                        (origin._replace(repository_name="not_a_repo"), "sensor_foo"),
+                        (origin, "sensor_foo"),
+                    ]
+                ],
+            )
+        )
+
+    # an error in one sensor doesn't stop the rest of the batch from being evaluated
+    assert len(results) == 3
+    assert isinstance(results[0], ExternalSensorExecutionErrorData)
+    assert "womp womp" in results[0].error.to_string()
+    assert isinstance(results[1], ExternalSensorExecutionErrorData)
+    assert "not_a_repo" in results[1].error.to_string()
+    assert isinstance(results[2], SensorExecutionData)
+    assert len(results[2].run_requests) == 2
@@ -79,6 +79,14 @@ def assert_stuff(asset_graph):
         assert not asset_graph.have_same_partitioning(asset1.key, asset3.key)
         assert asset_graph.get_children(asset0.key) == {asset1.key, asset2.key}
         assert asset_graph.get_parents(asset3.key) == {asset1.key, asset2.key}
+        assert asset_graph.get_ancestors(asset3.key) == {asset0.key, asset1.key, asset2.key}
+        assert asset_graph.get_ancestors(asset3.key, include_self=True) == {
+            asset0.key,
+            asset1.key,
+            asset2.key,
+            asset3.key,
+        }
+        assert asset_graph.get_ancestors(asset0.key) == set()
         for asset_def in assets:
             assert asset_graph.get_required_multi_asset_keys(asset_def.key) == set()
         assert asset_graph.get_code_version(asset0.key) == "1"
@@ -559,3 +567,105 @@ def include_all(asset_key, partitions_subset):
         )
         == expected_asset_graph_subset
     )
+
+
+def test_toposort_filter_subsets():
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+    hourly_partitions_def = HourlyPartitionsDefinition(start_date="2022-01-01-00:00")
+
+    @asset(partitions_def=daily_partitions_def)
+    def asset0():
+        ...
+
+    @asset(partitions_def=daily_partitions_def)
+    def asset1(asset0):
+        ...
+
+    @asset(partitions_def=daily_partitions_def)
+    def asset2(asset1):
+        ...
+
+    @asset(partitions_def=daily_partitions_def)
+    def asset3(asset0, asset2):
+        ...
+
+    @asset(partitions_def=hourly_partitions_def)
+    def asset4(asset3):
+        ...
+
+    @asset
+    def asset5(asset4):
+        ...
+
+    asset_graph = AssetGraph.from_assets([asset0, asset1, asset2, asset3, asset4, asset5])
+    assert asset_graph.can_map_partitions_subsets(asset_graph.all_asset_keys)
+
+    excluded = AssetKeyPartitionKey(asset1.key, "2022-01-03")
+
+    def exclude_partition(candidates, _):
+        return candidates - AssetGraphSubset.from_asset_partition_set({excluded}, asset_graph)
+
+    current_time = create_pendulum_time(2022, 1, 10)
+    initial_asset_partitions = {
+        AssetKeyPartitionKey(asset0.key, "2022-01-02"),
+        AssetKeyPartitionKey(asset0.key, "2022-01-03"),
+    }
+    result = asset_graph.toposort_filter_subsets(
+        dynamic_partitions_store=MagicMock(),
+        filter_fn=exclude_partition,
+        initial_subset=AssetGraphSubset.from_asset_partition_set(
+            initial_asset_partitions, asset_graph
+        ),
+        current_time=current_time,
+    )
+
+    # asset3 is visited after both of its parents, and depends on asset0 for 2022-01-03
+    assert result.get_partitions_subset(asset3.key).get_partition_keys() == [
+        "2022-01-02",
+        "2022-01-03",
+    ]
+    assert len(result.get_partitions_subset(asset4.key)) == 48
+    assert asset5.key in result.non_partitioned_asset_keys
+
+    # matches visiting the asset partitions one at a time
+    assert result == AssetGraphSubset.from_asset_partition_set(
+        asset_graph.bfs_filter_asset_partitions(
+            MagicMock(),
+            lambda asset_partitions, _: excluded not in asset_partitions,
+            initial_asset_partitions,
+            evaluation_time=current_time,
+        ),
+        asset_graph,
+    )
+
+
+def test_can_map_partitions_subsets():
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+    @asset(partitions_def=daily_partitions_def)
+    def upstream():
+        ...
+
+    @asset(
+        partitions_def=daily_partitions_def,
+        ins={
+            "upstream": AssetIn(
+                partition_mapping=TimeWindowPartitionMapping(start_offset=-1, end_offset=-1)
+            )
+        },
+    )
+    def shifted(upstream):
+        ...
+
+    @asset(ins={"upstream": AssetIn(partition_mapping=LastPartitionMapping())})
+    def last(upstream):
+        ...
+
+    @asset
+    def unpartitioned(upstream):
+        ...
+
+    asset_graph = AssetGraph.from_assets([upstream, shifted, last, unpartitioned])
+    assert asset_graph.can_map_partitions_subsets({upstream.key, unpartitioned.key})
+    assert not asset_graph.can_map_partitions_subsets({upstream.key, shifted.key})
+    assert not asset_graph.can_map_partitions_subsets({last.key})
@@ -156,6 +156,21 @@ def test_get_repository_handle():
     assert repo_handle2.repository_python_origin.code_pointer.fn_name == "defs2"
 
 
+def test_asset_graph_cached_by_workspace_snapshot():
+    context = make_context(["defs1", "defs2"])
+    asset_graph = ExternalAssetGraph.from_workspace(context)
+    assert ExternalAssetGraph.from_workspace(context) is asset_graph
+
+    # a reloaded location gets a new entry, so the graph is rebuilt
+    reloaded_context = make_context(["defs1", "downstream_defs"])
+    reloaded_asset_graph = ExternalAssetGraph.from_workspace(reloaded_context)
+    assert reloaded_asset_graph is not asset_graph
+    assert reloaded_asset_graph.get_children(asset1.key) == {AssetKey("downstream")}
+
+    ExternalAssetGraph.clear_cache()
+    assert ExternalAssetGraph.from_workspace(context) is not asset_graph
+
+
 def test_cross_repo_dep_with_source_asset():
     asset_graph = ExternalAssetGraph.from_workspace(make_context(["defs1", "downstream_defs"]))
     assert len(asset_graph.source_asset_keys) == 0
@@ -1,5 +1,14 @@
+import json
+
 import pytest
-from dagster import DailyPartitionsDefinition, MultiPartitionsDefinition, StaticPartitionsDefinition
+from dagster import (
+    DailyPartitionsDefinition,
+    DynamicPartitionsDefinition,
+    MultiPartitionsDefinition,
+    PartitionKeyRange,
+    StaticPartitionsDefinition,
+)
+from dagster._core.definitions import partition as partition_module
 from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsSubset
 from dagster._core.definitions.partition import DefaultPartitionsSubset
 from dagster._core.definitions.time_window_partitions import (
@@ -23,9 +32,16 @@ def test_default_subset_cannot_deserialize_invalid_version():
     class NewSerializationVersionSubset(DefaultPartitionsSubset):
         SERIALIZATION_VERSION = -1
 
-    with pytest.raises(DagsterInvalidDeserializationVersionError, match="version -1"):
+    with pytest.raises(
+        DagsterInvalidDeserializationVersionError, match="version 1, but only versions -1, 2 are"
+    ):
         NewSerializationVersionSubset.from_serialized(static_partitions_def, serialized_subset)
 
+    with pytest.raises(DagsterInvalidDeserializationVersionError, match="only versions 1, 2 are"):
+        DefaultPartitionsSubset.from_serialized(
+            static_partitions_def, json.dumps({"version": 3, "subset": ["a"]})
+        )
+
 
 def test_static_partitions_subset_backwards_compat():
     partitions = StaticPartitionsDefinition(["foo", "bar", "baz", "qux"])
@@ -78,3 +94,72 @@ def test_empty_subsets():
     assert type(composite.empty_subset()) is MultiPartitionsSubset
     assert type(static_partitions.empty_subset()) is DefaultPartitionsSubset
     assert type(time_window_partitions.empty_subset()) is TimeWindowPartitionsSubset
+
+
+def test_default_subset_set_operations():
+    partitions_def = StaticPartitionsDefinition([str(i) for i in range(1000)])
+    evens = partitions_def.subset_with_partition_keys([str(i) for i in range(0, 1000, 2)])
+    low = partitions_def.subset_with_partition_keys([str(i) for i in range(100)])
+
+    assert len(evens) == 500
+    assert "2" in evens and "3" not in evens and "not_a_key" not in evens
+    assert (evens | low).get_partition_keys() == evens.get_partition_keys() | {
+        str(i) for i in range(100)
+    }
+    assert (evens & low).get_partition_keys() == {str(i) for i in range(0, 100, 2)}
+    assert (low - evens).get_partition_keys() == {str(i) for i in range(1, 100, 2)}
+    assert set(low.get_partition_keys_not_in_subset()) == {str(i) for i in range(100, 1000)}
+    assert low.get_partition_key_ranges() == [PartitionKeyRange("0", "99")]
+
+    # subsets built from different instances of the same definition are interchangeable
+    other_low = StaticPartitionsDefinition(
+        [str(i) for i in range(1000)]
+    ).subset_with_partition_keys([str(i) for i in range(100)])
+    assert other_low == low
+    assert (evens & other_low) == (evens & low)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_dynamic_subset_serialization(monkeypatch, compress: bool):
+    monkeypatch.setattr(partition_module, "_COMPRESS_SERIALIZED_SUBSETS", compress)
+    partitions_def = DynamicPartitionsDefinition(name="fruits")
+    keys = [f"fruit_{i}" for i in range(5000)]
+    subset = partitions_def.empty_subset().with_partition_keys(keys)
+
+    serialized = subset.serialize()
+    if compress:
+        assert json.loads(serialized)["version"] == 2
+        assert len(serialized) < len(json.dumps(keys))
+    else:
+        # readable by releases that predate the compressed format
+        assert json.loads(serialized) == {"version": 1, "subset": keys}
+
+    # a different instance of the definition shares the same key index
+    deserialized = DynamicPartitionsDefinition(name="fruits").deserialize_subset(serialized)
+    assert deserialized == subset
+    assert deserialized.get_partition_keys() == set(keys)
+    assert partitions_def.can_deserialize_subset(
+        serialized,
+        serialized_partitions_def_unique_id=None,
+        serialized_partitions_def_class_name=None,
+    )
+
+
+def test_dynamic_partition_key_indexes_bounded(monkeypatch):
+    monkeypatch.setattr(partition_module, "_DYNAMIC_PARTITION_KEY_INDEX_MAX_KEYS", 10)
+    partitions_def = DynamicPartitionsDefinition(name="bounded")
+    subset = partitions_def.empty_subset().with_partition_keys([str(i) for i in range(20)])
+
+    # the index grew past its maximum size, so new subsets use a new index, but can still be
+    # combined with subsets of the old one
+    other_subset = partitions_def.empty_subset().with_partition_keys(["0", "20"])
+    assert not other_subset.has_same_index(subset)
+    assert (subset & other_subset).get_partition_keys() == {"0"}
+    assert len(subset | other_subset) == 21
+
+    for i in range(partition_module._DYNAMIC_PARTITION_KEY_INDEXES_MAX_SIZE + 1):  # noqa: SLF001
+        DynamicPartitionsDefinition(name=f"def_{i}").empty_subset()
+    assert (
+        len(partition_module._dynamic_partition_key_indexes)  # noqa: SLF001
+        == partition_module._DYNAMIC_PARTITION_KEY_INDEXES_MAX_SIZE  # noqa: SLF001
+    )
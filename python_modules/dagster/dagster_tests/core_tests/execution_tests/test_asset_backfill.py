@@ -285,6 +285,56 @@ def test_scenario_to_completion(scenario: AssetBackfillScenario, failures: str,
             )
 
 
+@pytest.mark.parametrize("some_or_all", ["all", "some"])
+@pytest.mark.parametrize("scenario", list(scenarios.values()), ids=list(scenarios.keys()))
+def test_plan_with_partitions_subsets(scenario: AssetBackfillScenario, some_or_all: str):
+    with instance_for_test() as instance:
+        instance.add_dynamic_partitions("foo", ["a", "b"])
+
+        with pendulum.test(scenario.evaluation_time):
+            assets_by_repo_name = scenario.assets_by_repo_name
+            asset_graph = get_asset_graph(assets_by_repo_name)
+            backfill_data = make_backfill_data(
+                some_or_all, asset_graph, instance, scenario.evaluation_time
+            )
+
+            # each iteration requests the same runs as when visiting asset partitions one at a time
+            while not backfill_data.is_complete():
+                with patch(
+                    "dagster._core.execution.asset_backfill._can_plan_with_partitions_subsets",
+                    return_value=False,
+                ):
+                    expected_result = execute_asset_backfill_iteration_consume_generator(
+                        "backfillid_x", backfill_data, asset_graph, instance
+                    )
+                result = execute_asset_backfill_iteration_consume_generator(
+                    "backfillid_x", backfill_data, asset_graph, instance
+                )
+                assert result.backfill_data == expected_result.backfill_data
+                assert sorted(
+                    (tuple(run_request.asset_selection or []), run_request.partition_key or "")
+                    for run_request in result.run_requests
+                ) == sorted(
+                    (tuple(run_request.asset_selection or []), run_request.partition_key or "")
+                    for run_request in expected_result.run_requests
+                )
+
+                backfill_data = result.backfill_data
+                for run_request in result.run_requests:
+                    asset_keys = run_request.asset_selection
+                    assert asset_keys is not None
+                    do_run(
+                        all_assets=assets_by_repo_name[
+                            asset_graph.get_repository_handle(asset_keys[0]).repository_name
+                        ],
+                        asset_keys=asset_keys,
+                        partition_key=run_request.partition_key,
+                        instance=instance,
+                        failed_asset_keys=[],
+                        tags=run_request.tags,
+                    )
+
+
 def test_materializations_outside_of_backfill():
     assets_by_repo_name = {"repo": one_asset_one_partition}
     asset_graph = get_asset_graph(assets_by_repo_name)
@@ -1,6 +1,7 @@
 import os
 import re
 import tempfile
+import zlib
 from typing import Any, Mapping, Optional
 from unittest.mock import MagicMock, patch
 
@@ -26,6 +27,7 @@
     DagsterInvalidConfigError,
     DagsterInvariantViolationError,
 )
+from dagster._core.events import DagsterEventType
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.instance.config import DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
@@ -40,6 +42,8 @@
     AssetPartitionStatus,
     AssetStatusCacheValue,
 )
+from dagster._core.storage.runs.schema import SnapshotsTable
+from dagster._core.storage.sqlalchemy_compat import db_select
 from dagster._core.storage.sqlite_storage import (
     _event_logs_directory,
     _runs_directory,
@@ -59,6 +63,7 @@
 from dagster._daemon.asset_daemon import AssetDaemon
 from dagster._serdes import ConfigurableClass
 from dagster._serdes.config_class import ConfigurableClassData
+from dagster._serdes.serdes import BINARY_SERDES_MAGIC, BINARY_SERDES_TEXT_PREFIX
 from typing_extensions import Self
 
 from dagster_tests.api_tests.utils import get_bar_workspace
@@ -315,6 +320,77 @@ def test_submit_run():
             assert instance.run_coordinator.queue()[0].run_id == "foo-bar"
 
 
+def test_create_and_submit_runs():
+    with instance_for_test(
+        overrides={
+            "run_coordinator": {
+                "module": "dagster._core.test_utils",
+                "class": "MockedRunCoordinator",
+            }
+        }
+    ) as instance:
+        with get_bar_workspace(instance) as workspace:
+            external_job = (
+                workspace.get_code_location("bar_code_location")
+                .get_repository("bar_repo")
+                .get_full_external_job("foo")
+            )
+
+            execution_plan = create_execution_plan(noop_asset_job)
+            job_snapshot = noop_asset_job.get_job_snapshot()
+            ep_snapshot = snapshot_from_execution_plan(
+                execution_plan, noop_asset_job.get_job_snapshot_id()
+            )
+
+            runs = instance.create_runs(
+                [
+                    dict(
+                        job_name="noop_asset_job",
+                        run_id=f"run-{i}",
+                        run_config=None,
+                        status=None,
+                        tags={"foo": str(i)},
+                        root_run_id=None,
+                        parent_run_id=None,
+                        step_keys_to_execute=None,
+                        execution_plan_snapshot=ep_snapshot,
+                        job_snapshot=job_snapshot,
+                        parent_job_snapshot=None,
+                        asset_selection=None,
+                        resolved_op_selection=None,
+                        op_selection=None,
+                        external_job_origin=external_job.get_external_origin(),
+                        job_code_origin=external_job.get_python_origin(),
+                    )
+                    for i in range(3)
+                ]
+            )
+
+            assert [run.run_id for run in runs] == ["run-0", "run-1", "run-2"]
+            for i, run in enumerate(runs):
+                stored_run = instance.get_run_by_id(run.run_id)
+                assert stored_run.tags["foo"] == str(i)
+                assert stored_run.job_snapshot_id == create_job_snapshot_id(job_snapshot)
+                assert stored_run.execution_plan_snapshot_id == create_execution_plan_snapshot_id(
+                    ep_snapshot
+                )
+                assert (
+                    len(
+                        instance.get_records_for_run(
+                            run.run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED
+                        ).records
+                    )
+                    == 1
+                )
+
+            submitted_runs = instance.submit_runs(["run-2", "run-0"], workspace)
+            assert [run.run_id for run in submitted_runs] == ["run-2", "run-0"]
+            assert [run.run_id for run in instance.run_coordinator.queue()] == ["run-2", "run-0"]
+
+            with pytest.raises(DagsterInvariantViolationError, match="Could not load run"):
+                instance.submit_runs(["run-1", "does-not-exist"], workspace)
+
+
 def test_create_run_with_asset_partitions():
     with instance_for_test() as instance:
         execution_plan = create_execution_plan(noop_asset_job)
@@ -453,6 +529,13 @@ def test_grpc_override_settings():
         assert instance.code_server_process_startup_timeout == 60
 
 
+def test_backfills_settings():
+    with instance_for_test(
+        overrides={"backfills": {"use_threads": True, "num_submit_workers": 4}}
+    ) as instance:
+        assert instance.get_settings("backfills") == {"use_threads": True, "num_submit_workers": 4}
+
+
 def test_run_monitoring(capsys):
     with instance_for_test(
         overrides={
@@ -514,6 +597,94 @@ def test_cancellation_thread():
         assert instance.cancellation_thread_poll_interval_seconds == 10
 
 
+def test_event_log_batching():
+    @op
+    def chatty_op(context):
+        for i in range(12):
+            context.log.info(f"message {i}")
+
+    @job
+    def chatty_job():
+        chatty_op()
+
+    with instance_for_test(
+        overrides={
+            "event_log_batching": {
+                "enabled": True,
+                "flush_size": 5,
+                "flush_interval_seconds": 300.0,
+            },
+        }
+    ) as instance:
+        assert instance.event_log_batching_enabled
+        assert instance.event_log_batching_flush_size == 5
+
+        with patch.object(
+            instance.event_log_storage,
+            "store_events",
+            wraps=instance.event_log_storage.store_events,
+        ) as store_events_mock:
+            result = chatty_job.execute_in_process(instance=instance)
+            assert result.success
+
+        assert store_events_mock.call_count >= 2
+        assert all(len(call.args[0]) <= 6 for call in store_events_mock.call_args_list)
+
+        messages = [
+            event.user_message
+            for event in instance.all_logs(result.run_id)
+            if not event.is_dagster_event
+        ]
+        assert [message for message in messages if message.startswith("message")] == [
+            f"message {i}" for i in range(12)
+        ]
+
+    with instance_for_test() as instance:
+        assert not instance.event_log_batching_enabled
+
+
+def test_binary_serdes():
+    @op
+    def noop_op():
+        pass
+
+    @job
+    def noop_job():
+        noop_op()
+
+    with instance_for_test(
+        overrides={"binary_serdes": {"event_log": True, "snapshots": True}}
+    ) as instance:
+        assert instance.binary_serdes_event_log_enabled
+        assert instance.binary_serdes_snapshots_enabled
+
+        result = noop_job.execute_in_process(instance=instance)
+        assert result.success
+
+        records = instance.get_records_for_run(result.run_id).records
+        assert records
+        table_data = instance.event_log_storage.get_event_log_table_data(
+            result.run_id, records[0].storage_id
+        )
+        assert table_data.event.startswith(BINARY_SERDES_TEXT_PREFIX)
+        assert records[0].event_log_entry.run_id == result.run_id
+
+        run = instance.get_run_by_id(result.run_id)
+        with instance.run_storage.connect() as conn:
+            snapshot_body = conn.execute(
+                db_select([SnapshotsTable.c.snapshot_body]).where(
+                    SnapshotsTable.c.snapshot_id == run.job_snapshot_id
+                )
+            ).scalar()
+        assert zlib.decompress(snapshot_body).startswith(BINARY_SERDES_MAGIC)
+        assert instance.get_job_snapshot(run.job_snapshot_id).name == "noop_job"
+        assert instance.get_execution_plan_snapshot(run.execution_plan_snapshot_id)
+
+    with instance_for_test() as instance:
+        assert not instance.binary_serdes_event_log_enabled
+        assert not instance.binary_serdes_snapshots_enabled
+
+
 def test_dagster_home_not_set():
     with environ({"DAGSTER_HOME": ""}):
         with pytest.raises(
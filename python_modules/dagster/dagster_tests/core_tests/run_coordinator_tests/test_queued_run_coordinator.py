@@ -165,6 +165,34 @@ def test_submit_run_checks_status(self, instance, coordinator, workspace, extern
             == 0
         )
 
+    def test_submit_runs(self, instance, coordinator, workspace, external_pipeline):
+        runs = [
+            self.create_run_for_test(
+                instance, external_pipeline, run_id="foo-1", status=DagsterRunStatus.NOT_STARTED
+            ),
+            self.create_run_for_test(
+                instance, external_pipeline, run_id="foo-2", status=DagsterRunStatus.QUEUED
+            ),
+            self.create_run_for_test(
+                instance, external_pipeline, run_id="foo-3", status=DagsterRunStatus.NOT_STARTED
+            ),
+        ]
+        returned_runs = coordinator.submit_runs([SubmitRunContext(run, workspace) for run in runs])
+        assert [run.run_id for run in returned_runs] == ["foo-1", "foo-2", "foo-3"]
+        assert all(run.status == DagsterRunStatus.QUEUED for run in returned_runs)
+
+        assert len(instance.run_launcher.queue()) == 0
+        for run_id, num_enqueued_events in [("foo-1", 1), ("foo-2", 0), ("foo-3", 1)]:
+            assert instance.get_run_by_id(run_id).status == DagsterRunStatus.QUEUED
+            assert (
+                len(
+                    instance.get_records_for_run(
+                        run_id, of_type=DagsterEventType.PIPELINE_ENQUEUED
+                    ).records
+                )
+                == num_enqueued_events
+            )
+
     def test_cancel_run(self, instance, coordinator, workspace, external_pipeline):
         run = self.create_run_for_test(
             instance, external_pipeline, run_id="foo-1", status=DagsterRunStatus.NOT_STARTED
@@ -13,13 +13,14 @@
     DagsterEventType,
     DagsterInstance,
     Output,
+    _check as check,
     asset,
     multi_asset,
     repository,
 )
 from dagster._core.definitions.asset_graph import AssetGraph
 from dagster._core.definitions.asset_layer import build_asset_selection_job
-from dagster._core.definitions.data_time import CachingDataTimeResolver
+from dagster._core.definitions.data_time import CachingDataTimeResolver, DataTimeCache
 from dagster._core.definitions.data_version import DataVersion
 from dagster._core.definitions.decorators.source_asset_decorator import observable_source_asset
 from dagster._core.definitions.events import AssetKeyPartitionKey
@@ -31,6 +32,7 @@
 from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
 
+@pytest.mark.parametrize("use_data_time_cache", [True, False])
 @pytest.mark.parametrize("ignore_asset_tags", [True, False])
 @pytest.mark.parametrize(
     ["runs_to_expected_data_times_index"],
@@ -67,7 +69,9 @@
         ),
     ],
 )
-def test_calculate_data_time_unpartitioned(ignore_asset_tags, runs_to_expected_data_times_index):
+def test_calculate_data_time_unpartitioned(
+    ignore_asset_tags, use_data_time_cache, runs_to_expected_data_times_index
+):
     r"""A = B = D = F
      \\  //
        C = E
@@ -107,6 +111,8 @@ def f():
     all_assets = [a, bcd, e, f]
 
     asset_graph = AssetGraph.from_assets(all_assets)
+    # shared between the resolvers built after each run
+    data_time_cache = DataTimeCache() if use_data_time_cache else None
 
     with DagsterInstance.ephemeral() as instance:
         # mapping from asset key to a mapping of materialization timestamp to run index
@@ -129,7 +135,8 @@ def f():
 
             # rebuild the data time queryer after each run
             data_time_queryer = CachingDataTimeResolver(
-                instance_queryer=CachingInstanceQueryer(instance, asset_graph)
+                instance_queryer=CachingInstanceQueryer(instance, asset_graph),
+                data_time_cache=data_time_cache,
             )
 
             # build mapping of expected timestamps
@@ -163,6 +170,63 @@ def f():
                         AssetKey(k): materialization_times_index[AssetKey(k)][v]
                         for k, v in expected_data_times.items()
                     }
+                    if data_time_cache is not None:
+                        assert (
+                            data_time_cache.get(
+                                asset_graph, AssetKey(ak), latest_asset_record.storage_id
+                            )
+                            == upstream_data_times
+                        )
+
+
+def test_data_time_cache():
+    @asset
+    def a():
+        return 1
+
+    @asset(deps=[a])
+    def b():
+        return 1
+
+    @asset(deps=[b])
+    def c():
+        return 1
+
+    asset_graph = AssetGraph.from_assets([a, b, c])
+    data_time_cache = DataTimeCache(max_size=2)
+
+    with DagsterInstance.ephemeral() as instance:
+        assert materialize_to_memory([a, b, c], instance=instance).success
+
+        resolver = CachingDataTimeResolver(
+            CachingInstanceQueryer(instance, asset_graph), data_time_cache=data_time_cache
+        )
+        resolver.prefetch_current_data_times([AssetKey("c")], current_time=pendulum.now("UTC"))
+
+        record_ids = {
+            key: check.not_none(
+                resolver.instance_queryer.get_latest_materialization_or_observation_record(
+                    AssetKeyPartitionKey(key)
+                )
+            ).storage_id
+            for key in [AssetKey("a"), AssetKey("b"), AssetKey("c")]
+        }
+        # the least recently resolved record was evicted
+        assert data_time_cache.get(asset_graph, AssetKey("a"), record_ids[AssetKey("a")]) is None
+        assert data_time_cache.get(asset_graph, AssetKey("b"), record_ids[AssetKey("b")])
+        assert data_time_cache.get(asset_graph, AssetKey("c"), record_ids[AssetKey("c")]) == {
+            AssetKey("a"): resolver.get_current_data_time(
+                AssetKey("a"), current_time=pendulum.now("UTC")
+            )
+        }
+
+        # a new asset graph invalidates the cache
+        new_asset_graph = AssetGraph.from_assets([a, b, c])
+        assert (
+            data_time_cache.get(new_asset_graph, AssetKey("c"), record_ids[AssetKey("c")]) is None
+        )
+        data_time_cache.set(new_asset_graph, AssetKey("a"), record_ids[AssetKey("a")], {})
+        assert data_time_cache.get(asset_graph, AssetKey("c"), record_ids[AssetKey("c")]) is None
 
 
 @asset(partitions_def=DailyPartitionsDefinition(start_date="2023-01-01"))
@@ -6,6 +6,7 @@
 from typing import Any
 from unittest import mock
 
+import grpc
 import pendulum
 import pytest
 from dagster import (
@@ -43,8 +44,10 @@
 from dagster._core.definitions.run_request import InstigatorType, SensorResult
 from dagster._core.definitions.run_status_sensor_definition import run_status_sensor
 from dagster._core.definitions.sensor_definition import DefaultSensorStatus, RunRequest, SkipReason
+from dagster._core.errors import DagsterUserCodeUnreachableError
 from dagster._core.events import DagsterEventType
 from dagster._core.host_representation import ExternalInstigatorOrigin, ExternalRepositoryOrigin
+from dagster._core.host_representation.code_location import GrpcServerCodeLocation
 from dagster._core.host_representation.external import ExternalRepository
 from dagster._core.host_representation.origin import (
     ManagedGrpcPythonEnvCodeLocationOrigin,
@@ -66,7 +69,13 @@
 )
 from dagster._core.workspace.context import WorkspaceProcessContext
 from dagster._daemon import get_default_daemon_logger
-from dagster._daemon.sensor import execute_sensor_iteration, execute_sensor_iteration_loop
+from dagster._daemon.sensor import (
+    SensorEvaluationQueue,
+    execute_batched_sensor_iteration,
+    execute_sensor_iteration,
+    execute_sensor_iteration_loop,
+)
+from dagster._grpc.client import DagsterGrpcClient
 from dagster._seven.compat.pendulum import create_pendulum_time, to_timezone
 
 from .conftest import create_workspace_load_target
@@ -882,6 +891,25 @@ def evaluate_sensors(workspace_context, executor, submit_executor=None, timeout=
     wait_for_futures(futures, timeout=timeout)
 
 
+def evaluate_batched_sensors(
+    workspace_context, executor, sensor_queue, refresh_sensors=True, timeout=FUTURES_TIMEOUT
+):
+    logger = get_default_daemon_logger("SensorDaemon")
+    futures = {}
+    list(
+        execute_batched_sensor_iteration(
+            workspace_context,
+            logger,
+            sensor_queue,
+            threadpool_executor=executor,
+            sensor_tick_futures=futures,
+            refresh_sensors=refresh_sensors,
+        )
+    )
+
+    wait_for_futures(futures, timeout=timeout)
+
+
 def validate_tick(
     tick,
     external_sensor,
@@ -1193,6 +1221,181 @@ def test_error_sensor(caplog, executor, instance, workspace_context, external_re
         assert state.instigator_data.last_tick_timestamp == freeze_datetime.timestamp()
 
 
+def test_batched_sensor_evaluation(executor, instance, workspace_context, external_repo):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, hour=23, minute=59, second=59, tz="UTC"),
+        "US/Central",
+    )
+    sensor_names = ["simple_sensor", "error_sensor", "custom_interval_sensor"]
+    external_sensors = {name: external_repo.get_external_sensor(name) for name in sensor_names}
+
+    def _get_ticks(name):
+        external_sensor = external_sensors[name]
+        return instance.get_ticks(
+            external_sensor.get_external_origin_id(), external_sensor.selector_id
+        )
+
+    sensor_queue = SensorEvaluationQueue()
+
+    # every due sensor in the code location is evaluated in a single batched request
+    with mock.patch.object(
+        GrpcServerCodeLocation,
+        "get_external_sensor_execution_data",
+        side_effect=Exception("Sensor should have been evaluated as part of a batch"),
+    ):
+        with pendulum.test(freeze_datetime):
+            for external_sensor in external_sensors.values():
+                instance.add_instigator_state(
+                    InstigatorState(
+                        external_sensor.get_external_origin(),
+                        InstigatorType.SENSOR,
+                        InstigatorStatus.RUNNING,
+                    )
+                )
+
+            evaluate_batched_sensors(workspace_context, executor, sensor_queue)
+
+            assert instance.get_runs_count() == 0
+            for name in sensor_names:
+                assert len(_get_ticks(name)) == 1
+            validate_tick(
+                _get_ticks("simple_sensor")[0],
+                external_sensors["simple_sensor"],
+                freeze_datetime,
+                TickStatus.SKIPPED,
+            )
+            validate_tick(
+                _get_ticks("error_sensor")[0],
+                external_sensors["error_sensor"],
+                freeze_datetime,
+                TickStatus.FAILURE,
+                [],
+                "Error occurred during the execution of evaluation_fn for sensor error_sensor",
+            )
+            validate_tick(
+                _get_ticks("custom_interval_sensor")[0],
+                external_sensors["custom_interval_sensor"],
+                freeze_datetime,
+                TickStatus.SKIPPED,
+            )
+
+            # the next sensors are due once the default min interval has elapsed
+            assert sensor_queue.next_evaluation_timestamp == freeze_datetime.timestamp() + 30
+
+        freeze_datetime = freeze_datetime.add(seconds=30)
+
+        with pendulum.test(freeze_datetime):
+            # sensors come due from the queue without reloading the running sensors
+            evaluate_batched_sensors(
+                workspace_context, executor, sensor_queue, refresh_sensors=False
+            )
+            wait_for_all_runs_to_start(instance)
+
+            assert instance.get_runs_count() == 1
+            assert len(_get_ticks("simple_sensor")) == 2
+            assert _get_ticks("simple_sensor")[0].status == TickStatus.SUCCESS
+            assert len(_get_ticks("error_sensor")) == 2
+            assert len(_get_ticks("custom_interval_sensor")) == 1
+
+        freeze_datetime = freeze_datetime.add(seconds=30)
+
+        with pendulum.test(freeze_datetime):
+            instance.stop_sensor(
+                external_sensors["error_sensor"].get_external_origin_id(),
+                external_sensors["error_sensor"].selector_id,
+                external_sensors["error_sensor"],
+            )
+            evaluate_batched_sensors(workspace_context, executor, sensor_queue)
+
+            assert len(_get_ticks("simple_sensor")) == 3
+            assert len(_get_ticks("error_sensor")) == 2
+            assert len(_get_ticks("custom_interval_sensor")) == 2
+
+
+class _UnimplementedRpcError(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.UNIMPLEMENTED
+
+
+def _raise_unimplemented(*_args, **_kwargs):
+    raise DagsterUserCodeUnreachableError(
+        "Could not reach user code server. gRPC Error code: UNIMPLEMENTED"
+    ) from _UnimplementedRpcError()
+
+
+def test_batched_sensor_evaluation_failure(executor, instance, workspace_context, external_repo):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, hour=23, minute=59, second=59, tz="UTC"),
+        "US/Central",
+    )
+    external_sensors = [
+        external_repo.get_external_sensor(name) for name in ["simple_sensor", "error_sensor"]
+    ]
+
+    # a failed batch request fails the tick of every sensor in the batch
+    with mock.patch.object(
+        GrpcServerCodeLocation,
+        "get_external_sensor_execution_data_batch",
+        side_effect=Exception("The batch request failed"),
+    ):
+        with pendulum.test(freeze_datetime):
+            for external_sensor in external_sensors:
+                instance.add_instigator_state(
+                    InstigatorState(
+                        external_sensor.get_external_origin(),
+                        InstigatorType.SENSOR,
+                        InstigatorStatus.RUNNING,
+                    )
+                )
+
+            evaluate_batched_sensors(workspace_context, executor, SensorEvaluationQueue())
+
+            for external_sensor in external_sensors:
+                ticks = instance.get_ticks(
+                    external_sensor.get_external_origin_id(), external_sensor.selector_id
+                )
+                assert len(ticks) == 1
+                validate_tick(
+                    ticks[0],
+                    external_sensor,
+                    freeze_datetime,
+                    TickStatus.FAILURE,
+                    [],
+                    "The batch request failed",
+                )
+
+
+def test_batched_sensor_evaluation_unimplemented(
+    executor, instance, workspace_context, external_repo
+):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, hour=23, minute=59, second=59, tz="UTC"),
+        "US/Central",
+    )
+    external_sensor = external_repo.get_external_sensor("simple_sensor")
+
+    # servers without the batch API evaluate each sensor with its own request instead
+    with mock.patch.object(
+        DagsterGrpcClient, "external_sensor_execution_batch", side_effect=_raise_unimplemented
+    ):
+        with pendulum.test(freeze_datetime):
+            instance.add_instigator_state(
+                InstigatorState(
+                    external_sensor.get_external_origin(),
+                    InstigatorType.SENSOR,
+                    InstigatorStatus.RUNNING,
+                )
+            )
+
+            evaluate_batched_sensors(workspace_context, executor, SensorEvaluationQueue())
+
+            ticks = instance.get_ticks(
+                external_sensor.get_external_origin_id(), external_sensor.selector_id
+            )
+            assert len(ticks) == 1
+            validate_tick(ticks[0], external_sensor, freeze_datetime, TickStatus.SKIPPED)
+
+
 def test_wrong_config_sensor(caplog, executor, instance, workspace_context, external_repo):
     freeze_datetime = to_timezone(
         create_pendulum_time(
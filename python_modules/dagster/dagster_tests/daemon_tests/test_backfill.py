@@ -3,6 +3,7 @@
 import string
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pendulum
 import pytest
@@ -40,6 +41,8 @@
 from dagster._core.storage.dagster_run import DagsterRunStatus, RunsFilter
 from dagster._core.storage.tags import BACKFILL_ID_TAG, PARTITION_NAME_TAG
 from dagster._core.test_utils import (
+    create_test_daemon_workspace_context,
+    instance_for_test,
     step_did_not_run,
     step_failed,
     step_succeeded,
@@ -52,6 +55,8 @@
 from dagster._utils import touch_file
 from dagster._utils.error import SerializableErrorInfo
 
+from .conftest import workspace_load_target
+
 default_resource_defs = resource_defs = {"io_manager": fs_io_manager}
 
 
@@ -348,6 +353,70 @@ def test_simple_backfill(
     assert three.tags[PARTITION_NAME_TAG] == "three"
 
 
+def test_threaded_chunked_backfill():
+    # submitting runs on worker threads needs a launcher that doesn't execute the runs in process
+    with instance_for_test(
+        overrides={
+            "run_launcher": {
+                "module": "dagster._core.test_utils",
+                "class": "MockedRunLauncher",
+            }
+        }
+    ) as instance:
+        with create_test_daemon_workspace_context(
+            workspace_load_target=workspace_load_target(), instance=instance
+        ) as workspace_context:
+            external_repo = (
+                workspace_context.create_request_context()
+                .get_code_location("test_location")
+                .get_repository("the_repo")
+            )
+            external_partition_set = external_repo.get_external_partition_set(
+                "the_job_partition_set"
+            )
+            backfill = PartitionBackfill(
+                backfill_id="threaded",
+                partition_set_origin=external_partition_set.get_external_origin(),
+                status=BulkActionStatus.REQUESTED,
+                partition_names=["one", "two", "three"],
+                from_failure=False,
+                reexecution_steps=None,
+                tags=None,
+                backfill_timestamp=pendulum.now().timestamp(),
+            )
+            instance.add_backfill(backfill)
+
+            with ThreadPoolExecutor(max_workers=2) as submit_executor:
+                list(
+                    execute_backfill_iteration(
+                        workspace_context,
+                        get_default_daemon_logger("BackfillDaemon"),
+                        submit_threadpool_executor=submit_executor,
+                        job_backfill_chunk_size=2,
+                    )
+                )
+
+                assert instance.get_runs_count() == 3
+                runs = instance.get_runs()
+                assert {run.tags[PARTITION_NAME_TAG] for run in runs} == {"one", "two", "three"}
+                assert all(run.tags[BACKFILL_ID_TAG] == "threaded" for run in runs)
+                assert len(instance.run_launcher.queue()) == 3
+                assert instance.get_backfill("threaded").status == BulkActionStatus.COMPLETED
+
+                # restarting the backfill from the beginning skips partitions that already have runs
+                instance.update_backfill(backfill)
+                list(
+                    execute_backfill_iteration(
+                        workspace_context,
+                        get_default_daemon_logger("BackfillDaemon"),
+                        submit_threadpool_executor=submit_executor,
+                        job_backfill_chunk_size=2,
+                    )
+                )
+                assert instance.get_runs_count() == 3
+                assert instance.get_backfill("threaded").status == BulkActionStatus.COMPLETED
+
+
 def test_canceled_backfill(
     instance: DagsterInstance,
     workspace_context: WorkspaceProcessContext,
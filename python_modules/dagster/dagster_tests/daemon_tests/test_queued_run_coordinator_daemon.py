@@ -302,6 +302,27 @@ def test_tag_limits(use_threads, workspace_context, job_handle, daemon):
         assert set(get_run_ids(instance.run_launcher.queue())) == {"tiny-1", "large-1"}
 
 
+
+def test_tag_limits_with_tags_added_to_in_progress_run(workspace_context, job_handle, daemon):
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=10,
+        tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+    ) as instance:
+        bounded_ctx = workspace_context.copy_for_test_instance(instance)
+
+        create_run(instance, job_handle, run_id="started-1", status=DagsterRunStatus.STARTED)
+        list(daemon.run_iteration(bounded_ctx))
+
+        # the tags of the in-progress run change after the daemon has read them
+        instance.add_run_tags("started-1", {"database": "tiny"})
+        create_queued_run(instance, job_handle, run_id="tiny-1", tags={"database": "tiny"})
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == []
+
+        instance.report_run_failed(instance.get_run_by_id("started-1"))
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-1"]
+
 @pytest.mark.parametrize(
     "use_threads",
     [False, True],
@@ -834,3 +855,50 @@ def test_key_limit_with_extra_tags(use_threads, workspace_context, daemon, job_h
 
         list(daemon.run_iteration(bounded_ctx))
         assert get_run_ids(instance.run_launcher.queue()) == ["run-1"]
+
+
+def wait_for_launched_runs(instance, num_runs, timeout=30):
+    start_time = time.time()
+    while len(instance.run_launcher.queue()) < num_runs:
+        if time.time() - start_time > timeout:
+            raise Exception(f"Timed out waiting for {num_runs} runs to launch")
+        time.sleep(0.1)
+
+
+def test_pipelined_launches(workspace_context, daemon, job_handle):
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=2,
+        tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+        dequeue_use_threads=True,
+        dequeue_pipeline_launches=True,
+    ) as instance:
+        bounded_ctx = workspace_context.copy_for_test_instance(instance)
+
+        for run_id, database in [
+            ("tiny-1", "tiny"),
+            ("tiny-2", "tiny"),
+            ("large-1", "large"),
+            ("large-2", "large"),
+        ]:
+            create_queued_run(instance, job_handle, run_id=run_id, tags={"database": database})
+
+        # the iteration returns without waiting for the launches to finish
+        list(daemon.run_iteration(bounded_ctx))
+        wait_for_launched_runs(instance, 2)
+        assert set(get_run_ids(instance.run_launcher.queue())) == {"tiny-1", "large-1"}
+
+        # both launched runs are still in progress
+        list(daemon.run_iteration(bounded_ctx))
+        time.sleep(1)
+        assert len(instance.run_launcher.queue()) == 2
+
+        # finishing a run frees up its slot, and its tag concurrency limit
+        instance.report_run_failed(instance.get_run_by_id("tiny-1"))
+        list(daemon.run_iteration(bounded_ctx))
+        wait_for_launched_runs(instance, 3)
+        assert set(get_run_ids(instance.run_launcher.queue())) == {"tiny-1", "large-1", "tiny-2"}
+
+        list(daemon.run_iteration(bounded_ctx))
+        time.sleep(1)
+        assert len(instance.run_launcher.queue()) == 3
+        assert instance.get_run_by_id("large-2").status == DagsterRunStatus.QUEUED
@@ -121,6 +121,8 @@ def do_sensor_scenario(
         scenario_name=None,
         with_external_asset_graph=False,
         respect_materialization_data_versions=False,
+        evaluate_incrementally=False,
+        threadpool_executor=None,
     ):
         if (
             self.requires_respect_materialization_data_versions
@@ -202,6 +204,8 @@ def prior_repo():
                     instance,
                     scenario_name=scenario_name,
                     with_external_asset_graph=with_external_asset_graph,
+                    evaluate_incrementally=evaluate_incrementally,
+                    threadpool_executor=threadpool_executor,
                 )
                 for run_request in run_requests:
                     instance.create_run_for_job(
@@ -279,6 +283,8 @@ def test_time_fn():
                 cursor=cursor,
                 auto_observe=True,
                 respect_materialization_data_versions=respect_materialization_data_versions,
+                evaluate_incrementally=evaluate_incrementally,
+                threadpool_executor=threadpool_executor,
             ).evaluate()
 
         for run_request in run_requests:
@@ -3,6 +3,7 @@
 from dagster._core.instance_for_test import instance_for_test
 from dagster._core.storage.dagster_run import DagsterRunStatus
 from dagster._core.storage.tags import PARTITION_NAME_TAG
+from dagster._daemon import asset_daemon
 from dagster._daemon.asset_daemon import set_auto_materialize_paused
 
 from .scenarios.auto_materialize_policy_scenarios import auto_materialize_policy_scenarios
@@ -188,7 +189,11 @@ def test_daemon_paused():
         )
 
 
-def test_run_ids():
+@pytest.mark.parametrize("submit_one_run_per_chunk", [False, True])
+def test_run_ids(monkeypatch, submit_one_run_per_chunk: bool):
+    if submit_one_run_per_chunk:
+        monkeypatch.setattr(asset_daemon, "RUN_SUBMISSION_CHUNK_SIZE", 1)
+
     scenario_name = "auto_materialize_policy_eager_with_freshness_policies"
     scenario = auto_materialize_policy_scenarios[scenario_name]
 
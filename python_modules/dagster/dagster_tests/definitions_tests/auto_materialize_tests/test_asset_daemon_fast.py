@@ -1,14 +1,24 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Sequence
 
 import pytest
 from dagster import (
     AssetMaterialization,
     AssetSelection,
+    AutoMaterializePolicy,
     DagsterInstance,
+    FreshnessPolicy,
     job,
+    materialize,
     op,
 )
-from dagster._core.definitions.asset_daemon_context import build_auto_materialize_asset_evaluations
+from dagster._core.definitions import asset_daemon_context
+from dagster._core.definitions.asset_daemon_context import (
+    AssetDaemonContext,
+    IncrementalEvaluationState,
+    build_auto_materialize_asset_evaluations,
+)
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
 from dagster._core.definitions.asset_graph import AssetGraph
 from dagster._core.definitions.auto_materialize_condition import AutoMaterializeAssetEvaluation
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
@@ -29,6 +39,10 @@
 # Run the auto materialize scenarios, but use an InternalAssetGraph instead of External to speed things up.
 
 
+@pytest.mark.parametrize(
+    "evaluate_incrementally",
+    [True, False],
+)
 @pytest.mark.parametrize(
     "respect_materialization_data_versions",
     [True, False],
@@ -38,10 +52,12 @@
     list(ASSET_RECONCILIATION_SCENARIOS.values()),
     ids=list(ASSET_RECONCILIATION_SCENARIOS.keys()),
 )
-def test_reconciliation(scenario, respect_materialization_data_versions):
+def test_reconciliation(scenario, respect_materialization_data_versions, evaluate_incrementally):
     instance = DagsterInstance.ephemeral()
     run_requests, _, evaluations = scenario.do_sensor_scenario(
-        instance, respect_materialization_data_versions=respect_materialization_data_versions
+        instance,
+        respect_materialization_data_versions=respect_materialization_data_versions,
+        evaluate_incrementally=evaluate_incrementally,
     )
 
     def _sorted_evaluations(
@@ -117,6 +133,36 @@ def sort_run_request_key_fn(run_request):
         assert run_request.partition_key == expected_run_request.partition_key
 
 
+@pytest.mark.parametrize(
+    "scenario",
+    list(ASSET_RECONCILIATION_SCENARIOS.values()),
+    ids=list(ASSET_RECONCILIATION_SCENARIOS.keys()),
+)
+def test_reconciliation_with_threads(scenario):
+    instance = DagsterInstance.ephemeral()
+
+    with ThreadPoolExecutor(max_workers=4) as threadpool_executor:
+        run_requests, _, _ = scenario.do_sensor_scenario(
+            instance,
+            respect_materialization_data_versions=scenario.requires_respect_materialization_data_versions,
+            threadpool_executor=threadpool_executor,
+        )
+
+    assert len(run_requests) == len(scenario.expected_run_requests)
+
+    def sort_run_request_key_fn(run_request):
+        return (min(run_request.asset_selection), run_request.partition_key)
+
+    sorted_run_requests = sorted(run_requests, key=sort_run_request_key_fn)
+    sorted_expected_run_requests = sorted(
+        scenario.expected_run_requests, key=sort_run_request_key_fn
+    )
+
+    for run_request, expected_run_request in zip(sorted_run_requests, sorted_expected_run_requests):
+        assert set(run_request.asset_selection) == set(expected_run_request.asset_selection)
+        assert run_request.partition_key == expected_run_request.partition_key
+
+
 def test_bad_partition_key():
     hourly_partitions_def = HourlyPartitionsDefinition("2013-01-05-00:00")
     assets = [
@@ -141,3 +187,172 @@ def materialization_job():
     )
     run_requests, _, _ = scenario.do_sensor_scenario(instance)
     assert len(run_requests) == 0
+
+
+def test_incremental_evaluation_skips_unchanged_assets():
+    policy = AutoMaterializePolicy.eager()
+    assets = [
+        asset_def("a", auto_materialize_policy=policy),
+        asset_def("b", ["a"], auto_materialize_policy=policy),
+        asset_def("c", auto_materialize_policy=policy),
+        asset_def("d", ["c"], auto_materialize_policy=policy),
+    ]
+    asset_graph = AssetGraph.from_assets(assets)
+
+    instance = DagsterInstance.ephemeral()
+    materialize(assets, instance=instance)
+    latest_storage_id = instance.event_log_storage.get_maximum_record_id()
+    cursor = AssetDaemonCursor(
+        latest_storage_id=latest_storage_id,
+        handled_root_asset_keys={AssetKey("a"), AssetKey("c")},
+        handled_root_partitions_by_asset_key={},
+        evaluation_id=1,
+        last_observe_request_timestamp_by_asset_key={},
+    )
+    materialize([assets[0]], instance=instance)
+
+    def _context(evaluate_incrementally):
+        return AssetDaemonContext(
+            instance=instance,
+            asset_graph=asset_graph,
+            cursor=cursor,
+            materialize_run_tags=None,
+            observe_run_tags=None,
+            auto_observe=False,
+            target_asset_keys=None,
+            respect_materialization_data_versions=False,
+            evaluate_incrementally=evaluate_incrementally,
+        )
+
+    incremental_context = _context(evaluate_incrementally=True)
+    assert incremental_context.get_asset_keys_to_evaluate() == {AssetKey("a"), AssetKey("b")}
+    assert _context(evaluate_incrementally=False).get_asset_keys_to_evaluate() == {
+        AssetKey(key) for key in "abcd"
+    }
+
+    run_requests, _, _ = incremental_context.evaluate()
+    assert [set(run_request.asset_selection) for run_request in run_requests] == [{AssetKey("b")}]
+
+
+@pytest.mark.parametrize("updated_asset_keys_event_limit", [1000, 1])
+def test_incremental_evaluation_state_shared_across_ticks(
+    monkeypatch, updated_asset_keys_event_limit
+):
+    # with a limit of 1, the updated assets are found by checking every asset record instead
+    monkeypatch.setattr(
+        asset_daemon_context, "UPDATED_ASSET_KEYS_EVENT_LIMIT", updated_asset_keys_event_limit
+    )
+    policy = AutoMaterializePolicy.eager()
+    assets = [
+        asset_def("a", auto_materialize_policy=policy),
+        asset_def("b", ["a"], auto_materialize_policy=policy),
+        asset_def("c", auto_materialize_policy=policy),
+        asset_def("d", ["c"], auto_materialize_policy=policy),
+        asset_def(
+            "e",
+            ["c"],
+            freshness_policy=FreshnessPolicy(maximum_lag_minutes=60),
+            auto_materialize_policy=AutoMaterializePolicy.lazy(),
+        ),
+    ]
+    asset_graph = AssetGraph.from_assets(assets)
+    state = IncrementalEvaluationState()
+
+    instance = DagsterInstance.ephemeral()
+    materialize(assets, instance=instance)
+
+    def _tick(cursor):
+        context = AssetDaemonContext(
+            instance=instance,
+            asset_graph=asset_graph,
+            cursor=cursor,
+            materialize_run_tags=None,
+            observe_run_tags=None,
+            auto_observe=False,
+            target_asset_keys=None,
+            respect_materialization_data_versions=False,
+            evaluate_incrementally=True,
+            incremental_evaluation_state=state,
+        )
+        asset_keys_to_evaluate = context.get_asset_keys_to_evaluate()
+        _, new_cursor, _ = context.evaluate()
+        return asset_keys_to_evaluate, new_cursor
+
+    cursor = AssetDaemonCursor(
+        latest_storage_id=instance.event_log_storage.get_maximum_record_id(),
+        handled_root_asset_keys={AssetKey("a"), AssetKey("c")},
+        handled_root_partitions_by_asset_key={},
+        evaluation_id=1,
+        last_observe_request_timestamp_by_asset_key={},
+    )
+    # "c" and "e" may be materialized to satisfy the freshness policy of "e", so they are evaluated
+    # on every tick
+    asset_keys_to_evaluate, cursor = _tick(cursor)
+    assert asset_keys_to_evaluate == {AssetKey("c"), AssetKey("e")}
+
+    materialize([assets[2]], instance=instance)
+    asset_keys_to_evaluate, cursor = _tick(cursor)
+    assert asset_keys_to_evaluate == {AssetKey(key) for key in "cde"}
+    assert state.get_target_asset_keys_and_parents(
+        asset_graph, asset_graph.materializable_asset_keys
+    ) == {AssetKey(key) for key in "abcde"}
+
+    asset_keys_to_evaluate, _ = _tick(cursor)
+    assert asset_keys_to_evaluate == {AssetKey("c"), AssetKey("e")}
+
+
+def test_incremental_evaluation_reevaluates_skipped_assets():
+    policy = AutoMaterializePolicy.eager()
+    assets = [
+        asset_def("a", auto_materialize_policy=policy),
+        asset_def("b", ["a"], auto_materialize_policy=policy),
+        asset_def("c", ["b"], auto_materialize_policy=policy),
+    ]
+    asset_graph = AssetGraph.from_assets(assets)
+    state = IncrementalEvaluationState()
+
+    instance = DagsterInstance.ephemeral()
+    materialize(assets, instance=instance)
+
+    def _tick(cursor):
+        context = AssetDaemonContext(
+            instance=instance,
+            asset_graph=asset_graph,
+            cursor=cursor,
+            materialize_run_tags=None,
+            observe_run_tags=None,
+            auto_observe=False,
+            # "b" is not targeted, so it stays outdated
+            target_asset_keys={AssetKey("c")},
+            respect_materialization_data_versions=False,
+            evaluate_incrementally=True,
+            incremental_evaluation_state=state,
+        )
+        asset_keys_to_evaluate = context.get_asset_keys_to_evaluate()
+        run_requests, new_cursor, _ = context.evaluate()
+        return asset_keys_to_evaluate, run_requests, new_cursor
+
+    cursor = AssetDaemonCursor(
+        latest_storage_id=instance.event_log_storage.get_maximum_record_id(),
+        handled_root_asset_keys={AssetKey("a")},
+        handled_root_partitions_by_asset_key={},
+        evaluation_id=1,
+        last_observe_request_timestamp_by_asset_key={},
+    )
+    materialize([assets[0]], instance=instance)
+    materialize(assets[:2], instance=instance, selection=[AssetKey("b")])
+    materialize([assets[0]], instance=instance)
+
+    # "c" is skipped because its parent "b" is outdated
+    asset_keys_to_evaluate, run_requests, cursor = _tick(cursor)
+    assert asset_keys_to_evaluate == {AssetKey("c")}
+    assert run_requests == []
+    assert state.get_skipped_asset_keys() == {AssetKey("c")}
+
+    # nothing has been updated, but "c" is evaluated again because it was skipped
+    asset_keys_to_evaluate, run_requests, cursor = _tick(cursor)
+    assert asset_keys_to_evaluate == {AssetKey("c")}
+    assert state.get_skipped_asset_keys() == set()
+
+    asset_keys_to_evaluate, _, _ = _tick(cursor)
+    assert asset_keys_to_evaluate == set()
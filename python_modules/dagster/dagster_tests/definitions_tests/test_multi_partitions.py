@@ -23,7 +23,11 @@
 from dagster._core.definitions.asset_graph import AssetGraph
 from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsDefinition
 from dagster._core.definitions.time_window_partitions import TimeWindow, get_time_partitions_def
-from dagster._core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
+from dagster._core.errors import (
+    DagsterInvalidDefinitionError,
+    DagsterInvalidInvocationError,
+    DagsterInvariantViolationError,
+)
 from dagster._core.storage.tags import get_multidimensional_partition_tag
 from dagster._core.test_utils import instance_for_test
 
@@ -216,6 +220,15 @@ def test_multipartitions_subset_serialization():
     ).get_partition_keys() == set(partition_keys)
 
 
+def test_multipartitions_subset_invalid_keys():
+    partitions1 = StaticPartitionsDefinition(["a", "b", "c"])
+    partitions2 = StaticPartitionsDefinition(["x", "y", "z"])
+    composite = MultiPartitionsDefinition({"abc": partitions1, "xyz": partitions2})
+
+    with pytest.raises(DagsterInvalidInvocationError, match="not a multi-partition key"):
+        composite.empty_subset().with_partition_keys(["a|x", "a"])
+
+
 def test_multipartitions_subset_equality():
     assert multipartitions_def.empty_subset().with_partition_keys(
         [
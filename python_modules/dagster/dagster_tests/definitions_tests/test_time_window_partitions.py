@@ -901,6 +901,68 @@ def test_partition_subset_with_partition_keys(initial: str, added: str):
     assert len(updated_subset) == updated_subset_str.count("+")
 
 
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ("+++++", "-----"),
+        ("+++++", "+++++"),
+        ("++---", "---++"),
+        ("+++--", "--+++"),
+        ("+-+-+", "-+-+-"),
+        ("-+++-", "+-+-+"),
+        ("--+++---+++--", "++---+++---++"),
+        ("+++++++++++++", "-++-+++-++--+"),
+    ],
+)
+def test_time_window_partitions_subset_set_operations(first: str, second: str):
+    partitions_def = DailyPartitionsDefinition(start_date="2015-01-01")
+    keys = partitions_def.get_partition_keys(current_time=datetime(year=2015, month=1, day=30))[
+        : len(first)
+    ]
+
+    def subset_for(pattern):
+        # build from time windows, rather than from the set of keys the subset was created with
+        subset = partitions_def.empty_subset().with_partition_keys(
+            key for key, char in zip(keys, pattern) if char == "+"
+        )
+        return TimeWindowPartitionsSubset(
+            partitions_def, len(subset), included_time_windows=subset.included_time_windows
+        )
+
+    first_subset = subset_for(first)
+    second_subset = subset_for(second)
+    first_keys = set(first_subset.get_partition_keys())
+    second_keys = set(second_subset.get_partition_keys())
+
+    for result, expected_keys in [
+        (first_subset | second_subset, first_keys | second_keys),
+        (first_subset & second_subset, first_keys & second_keys),
+        (first_subset - second_subset, first_keys - second_keys),
+        (second_subset - first_subset, second_keys - first_keys),
+    ]:
+        assert isinstance(result, TimeWindowPartitionsSubset)
+        assert set(result.get_partition_keys()) == expected_keys
+        assert len(result) == len(expected_keys)
+        assert result == partitions_def.empty_subset().with_partition_keys(expected_keys)
+
+
+def test_subset_with_all_partitions():
+    partitions_def = HourlyPartitionsDefinition(start_date="2015-01-01-00:00")
+    current_time = datetime(year=2018, month=1, day=1)
+    all_keys = partitions_def.get_partition_keys(current_time=current_time)
+
+    subset = cast(
+        TimeWindowPartitionsSubset,
+        partitions_def.subset_with_all_partitions(current_time=current_time),
+    )
+    assert len(subset.included_time_windows) == 1
+    assert len(subset) == len(all_keys)
+    assert subset == partitions_def.empty_subset().with_partition_keys(all_keys)
+    assert len(subset - partitions_def.empty_subset().with_partition_keys(all_keys[:10])) == (
+        len(all_keys) - 10
+    )
+
+
 def test_weekly_time_window_partitions_subset():
     weekly_partitions_def = WeeklyPartitionsDefinition(start_date="2022-01-01")
 
@@ -1188,3 +1250,78 @@ def test_has_partition_key():
     )
     assert partitions_def.has_partition_key("2020-01-01")
     assert partitions_def.has_partition_key("2020-03-15")
+
+
+@pytest.mark.parametrize(
+    "cron_schedule,start,current_time",
+    [
+        ("0 * * * *", "2021-03-13-00:00", "2021-11-08T03:17:00"),
+        ("30 * * * *", "2021-03-13-00:00", "2021-11-08T03:17:00"),
+        ("30 2 * * *", "2020-03-01-00:00", "2022-11-07T03:17:00"),
+        ("0 2 * * 3", "2020-03-01-00:00", "2022-11-07T03:17:00"),
+        ("30 2 5 * *", "2020-03-01-00:00", "2022-11-07T03:17:00"),
+        ("*/15 * * * *", "2021-03-13-20:00", "2021-03-15T04:03:00"),
+        ("* * * * *", "2021-03-13-20:00", "2021-03-14T04:03:00"),
+        ("0 0 * * 1-5", "2020-03-01-00:00", "2022-11-07T03:17:00"),
+    ],
+)
+@pytest.mark.parametrize(
+    "timezone", ["UTC", "America/Chicago", "Australia/Lord_Howe", "Asia/Kolkata", "Etc/GMT+5"]
+)
+@pytest.mark.parametrize("end_offset", [0, 2, -2])
+def test_fixed_period_schedules_match_cron_iteration(
+    cron_schedule: str, start: str, current_time: str, timezone: str, end_offset: int
+):
+    partitions_def = TimeWindowPartitionsDefinition(
+        start=start,
+        fmt="%Y-%m-%d-%H:%M",
+        cron_schedule=cron_schedule,
+        timezone=timezone,
+        end_offset=end_offset,
+    )
+    current_time_dt = pendulum.parse(current_time, tz=timezone)
+
+    # walk the cron schedule to get the expected partitions
+    expected_windows = []
+    num_past_current_time = 0
+    for window in partitions_def._iterate_time_windows(partitions_def.start):  # noqa: SLF001
+        if window.end > current_time_dt:
+            if num_past_current_time >= end_offset:
+                break
+            num_past_current_time += 1
+        expected_windows.append(window)
+    if end_offset < 0:
+        expected_windows = expected_windows[:end_offset]
+    expected_keys = [window.start.strftime(partitions_def.fmt) for window in expected_windows]
+
+    assert partitions_def.get_partition_keys(current_time=current_time_dt) == expected_keys
+    assert partitions_def.get_num_partitions(current_time=current_time_dt) == len(expected_keys)
+    last_window = partitions_def.get_last_partition_window(current_time=current_time_dt)
+    assert last_window == expected_windows[-1]
+    keys_between_indexes = partitions_def.get_partition_keys_between_indexes(
+        3, 10, current_time=current_time_dt
+    )
+    assert keys_between_indexes == expected_keys[3:10]
+    time_windows = partitions_def.time_windows_for_partition_keys(
+        expected_keys[::7], validate=False
+    )
+    assert time_windows == expected_windows[::7]
+    keys_in_time_window = partitions_def.get_partition_keys_in_time_window(
+        TimeWindow(expected_windows[5].start, expected_windows[-5].end)
+    )
+    assert keys_in_time_window == expected_keys[5:-4]
+
+
+def test_get_partition_keys_between_indexes_with_end():
+    partitions_def = TimeWindowPartitionsDefinition(
+        start="2021-05-05",
+        end="2021-05-10",
+        fmt=DATE_FORMAT,
+        cron_schedule="0 0 * * *",
+    )
+    current_time = datetime.strptime("2021-06-01", DATE_FORMAT)
+    assert partitions_def.get_partition_keys_between_indexes(2, 20, current_time=current_time) == [
+        "2021-05-07",
+        "2021-05-08",
+        "2021-05-09",
+    ]
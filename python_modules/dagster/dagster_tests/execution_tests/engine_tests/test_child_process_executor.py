@@ -1,6 +1,7 @@
 import multiprocessing
 import os
 import time
+from contextlib import contextmanager
 
 import pytest
 from dagster._core.executor.child_process_executor import (
@@ -8,8 +9,11 @@
     ChildProcessCrashException,
     ChildProcessDoneEvent,
     ChildProcessEvent,
+    ChildProcessEventSelector,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerCommand,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster._utils import segfault
@@ -50,6 +54,31 @@ def execute(self):
         yield 1
 
 
+class DoubleAStringWorkerCommand(ChildProcessWorkerCommand):
+    def __init__(self):
+        self.loaded_pid = None
+
+    @contextmanager
+    def worker_scope(self):
+        self.loaded_pid = os.getpid()
+        yield
+
+    def execute_task(self, task):
+        if task == "crash":
+            os._exit(1)  # noqa: SLF001
+        if task == "error":
+            raise AnError("Oh noes!")
+        if task == "hang":
+            yield (self.loaded_pid, task)
+            while True:
+                try:
+                    time.sleep(1)
+                except BaseException:
+                    # ignore interrupts, so that the worker has to be terminated
+                    pass
+        yield (self.loaded_pid, task + task)
+
+
 def test_basic_child_process_command():
     events = list(
         filter(
@@ -102,6 +131,133 @@ def test_child_process_segfault():
     assert exc.value.exit_code == -11
 
 
+def test_child_process_event_selector():
+    results = []
+    with ChildProcessEventSelector() as event_selector:
+        active_iters = {
+            a_str: execute_child_process_command(
+                multiprocessing, DoubleAStringChildProcessCommand(a_str), event_selector
+            )
+            for a_str in ["aa", "bb", "cc"]
+        }
+        while active_iters:
+            received_events = False
+            for a_str, step_iter in list(active_iters.items()):
+                try:
+                    event = next(step_iter)
+                except StopIteration:
+                    del active_iters[a_str]
+                    continue
+                if event is not None:
+                    received_events = True
+                    if not isinstance(event, ChildProcessEvent):
+                        results.append(event)
+            if active_iters and not received_events:
+                event_selector.wait()
+
+    assert sorted(results) == ["aaaa", "bbbb", "cccc"]
+
+
+def test_child_process_event_selector_crashy_process():
+    with ChildProcessEventSelector() as event_selector:
+        step_iter = execute_child_process_command(multiprocessing, CrashyCommand(), event_selector)
+        with pytest.raises(ChildProcessCrashException) as exc:
+            for event in step_iter:
+                if event is None:
+                    event_selector.wait()
+    assert exc.value.exit_code == 1
+
+
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing, LongRunningCommand()))
+
+
+def _execute_task_in_pool(pool, task):
+    return [
+        event
+        for event in pool.get_available_worker().execute_task(task)
+        if event and not isinstance(event, ChildProcessEvent)
+    ]
+
+
+def test_child_process_worker_pool_reuses_worker():
+    with ChildProcessWorkerPool(multiprocessing, DoubleAStringWorkerCommand()) as pool:
+        [(first_pid, first_result)] = _execute_task_in_pool(pool, "aa")
+        [(second_pid, second_result)] = _execute_task_in_pool(pool, "bb")
+
+    assert first_pid != os.getpid()
+    assert first_pid == second_pid
+    assert (first_result, second_result) == ("aaaa", "bbbb")
+
+
+def test_child_process_worker_pool_concurrent_workers():
+    with ChildProcessWorkerPool(multiprocessing, DoubleAStringWorkerCommand()) as pool:
+        first_worker = pool.get_available_worker()
+        first_iter = first_worker.execute_task("aa")
+        next(first_iter)
+        second_worker = pool.get_available_worker()
+        assert second_worker is not first_worker
+        assert second_worker.pid != first_worker.pid
+        list(first_iter)
+        list(second_worker.execute_task("bb"))
+        assert pool.get_available_worker() is first_worker
+
+
+def test_child_process_worker_pool_replaces_crashed_worker():
+    with ChildProcessWorkerPool(multiprocessing, DoubleAStringWorkerCommand()) as pool:
+        worker = pool.get_available_worker()
+        with pytest.raises(ChildProcessCrashException) as exc:
+            list(worker.execute_task("crash"))
+        assert exc.value.exit_code == 1
+        assert not worker.is_available
+
+        [(pid, result)] = _execute_task_in_pool(pool, "aa")
+        assert pid != worker.pid
+        assert result == "aaaa"
+
+
+def test_child_process_worker_pool_retires_worker_after_error():
+    with ChildProcessWorkerPool(multiprocessing, DoubleAStringWorkerCommand()) as pool:
+        worker = pool.get_available_worker()
+        errors = [
+            event
+            for event in worker.execute_task("error")
+            if isinstance(event, ChildProcessSystemErrorEvent)
+        ]
+        assert len(errors) == 1
+        assert "AnError" in str(errors[0].error_info.message)
+        assert not worker.is_available
+        assert pool.get_available_worker() is not worker
+
+
+def test_child_process_worker_pool_reaps_defunct_workers():
+    with ChildProcessWorkerPool(multiprocessing, DoubleAStringWorkerCommand()) as pool:
+        crashed_worker = pool.get_available_worker()
+        with pytest.raises(ChildProcessCrashException):
+            list(crashed_worker.execute_task("crash"))
+        assert crashed_worker.is_defunct
+
+        retired_worker = pool.get_available_worker()
+        list(retired_worker.execute_task("error"))
+        assert retired_worker.is_defunct
+
+        worker = pool.get_available_worker()
+        assert worker not in (crashed_worker, retired_worker)
+        assert pool._workers == [worker]  # noqa: SLF001
+        # the processes of the defunct workers have been joined
+        assert crashed_worker._process.exitcode is not None  # noqa: SLF001
+        assert retired_worker._process.exitcode is not None  # noqa: SLF001
+
+
+def test_child_process_worker_shutdown_terminates_busy_worker():
+    with ChildProcessWorkerPool(multiprocessing, DoubleAStringWorkerCommand()) as pool:
+        worker = pool.get_available_worker()
+        task_iter = worker.execute_task("hang")
+        while not isinstance(next(task_iter), tuple):
+            pass
+
+        start_time = time.time()
+        worker.shutdown(timeout=0.5)
+        assert time.time() - start_time < 5
+        assert worker._process.exitcode is not None  # noqa: SLF001
@@ -515,3 +515,75 @@ def get_dynamic_op_failure_job():
 )
 def test_dynamic_failure_retry(job_fn, config_fn):
     assert_expected_failure_behavior(job_fn, config_fn)
+
+
+REUSE_WORKERS_RUN_CONFIG = {
+    "execution": {"config": {"multiprocess": {"max_concurrent": 2, "reuse_workers": True}}},
+}
+
+
+def _step_worker_pids(result: execution_result.ExecutionResult):
+    return [
+        event.event_specific_data.metadata["pid"].value
+        for event in result.all_events
+        if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+    ]
+
+
+def test_reuse_workers():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(define_diamond_job),
+            run_config=REUSE_WORKERS_RUN_CONFIG,
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+            pids = _step_worker_pids(result)
+            assert len(pids) == 4
+            assert len(set(pids)) <= 2
+            assert str(os.getpid()) not in pids
+
+
+def test_reuse_workers_failure():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(define_error_job),
+            run_config=REUSE_WORKERS_RUN_CONFIG,
+            instance=instance,
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            assert result.is_node_failed("throw_error")
+            assert not result.is_node_success("should_never_execute")
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_reuse_workers_crash():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(sys_exit_job),
+            run_config=REUSE_WORKERS_RUN_CONFIG,
+            instance=instance,
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            failure_data = result.failure_data_for_node("sys_exit")
+            assert failure_data
+            assert failure_data.error.cls_name == "ChildProcessCrashException"
+
+
+reuse_workers_executor = multiprocess_executor.configured({"reuse_workers": True})
+
+
+def get_dynamic_op_failure_job_reusing_workers():
+    return get_dynamic_job_op_failure(reuse_workers_executor)[0]
+
+
+def test_reuse_workers_dynamic_failure_retry():
+    # workers rebuild their execution plan as dynamic outputs are resolved
+    assert_expected_failure_behavior(
+        get_dynamic_op_failure_job_reusing_workers,
+        get_dynamic_job_op_failure(reuse_workers_executor)[1],
+    )
@@ -1,5 +1,6 @@
 import subprocess
 import time
+from unittest import mock
 
 import pytest
 from dagster import (
@@ -49,6 +50,7 @@ class TestStepHandler(StepHandler):
     check_step_health_count = 0
     terminate_step_count = 0
     verify_step_count = 0
+    launch_times = {}
 
     @property
     def name(self):
@@ -62,6 +64,9 @@ def launch_step(self, step_handler_context):
             assert step_handler_context.step_tags["baz_op"] == {"foo": "bar"}
 
         TestStepHandler.launch_step_count += 1
+        TestStepHandler.launch_times[
+            step_handler_context.execute_step_args.step_keys_to_execute[0]
+        ] = time.time()
         print("TestStepHandler Launching Step!")  # noqa: T201
         TestStepHandler.processes.append(
             subprocess.Popen(step_handler_context.execute_step_args.get_command_args())
@@ -83,6 +88,7 @@ def reset(cls):
         cls.check_step_health_count = 0
         cls.terminate_step_count = 0
         cls.verify_step_count = 0
+        cls.launch_times = {}
 
     @classmethod
     def wait_for_processes(cls):
@@ -226,6 +232,82 @@ def test_execute_intervals():
     # assert TestStepHandler.check_step_health_count >= 3
 
 
+def test_execute_wakes_up_on_new_events():
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        start_time = time.time()
+        result = execute_job(
+            reconstructable(foo_job),
+            instance=instance,
+            run_config={
+                "execution": {
+                    "config": {"sleep_seconds": 60.0, "event_poll_fallback_seconds": 60.0}
+                }
+            },
+        )
+        TestStepHandler.wait_for_processes()
+
+    assert result.success
+    # the executor wakes up when step events are stored, instead of sleeping between steps
+    assert time.time() - start_time < 60
+    assert not any("Could not watch the event log" in event.message for event in result.all_events)
+
+
+def test_execute_without_event_watch():
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        with mock.patch.object(
+            DagsterInstance, "watch_event_logs", side_effect=NotImplementedError
+        ):
+            result = execute_job(
+                reconstructable(foo_job),
+                instance=instance,
+                run_config={"execution": {"config": {"sleep_seconds": 0.1}}},
+            )
+        TestStepHandler.wait_for_processes()
+
+    assert result.success
+    assert any("Could not watch the event log" in event.message for event in result.all_events)
+
+
+def test_execute_latency_with_polling_event_log_storage(tmp_path):
+    TestStepHandler.reset()
+    with instance_for_test(
+        overrides={
+            "event_log_storage": {
+                "module": "dagster_tests.storage_tests.test_polling_event_watcher",
+                "class": "ConsolidatedSqlitePollingEventLogStorage",
+                "config": {"base_dir": str(tmp_path)},
+            }
+        }
+    ) as instance:
+        assert not instance.event_log_storage.supports_push_event_watch
+        result = execute_job(
+            reconstructable(foo_job),
+            instance=instance,
+            run_config={
+                "execution": {
+                    "config": {"sleep_seconds": 0.1, "event_poll_fallback_seconds": 60.0}
+                }
+            },
+        )
+        TestStepHandler.wait_for_processes()
+
+        assert result.success
+        bar_success_time = next(
+            entry.timestamp
+            for entry in instance.all_logs(
+                result.run_id, of_type=DagsterEventType.STEP_SUCCESS
+            )
+            if entry.step_key == "bar_op"
+        )
+
+    # the executor reads new events every sleep_seconds, rather than waiting for the polling
+    # watcher to back off or for the fallback poll
+    assert TestStepHandler.launch_times["baz_op"] - bar_success_time < 2
+    assert not any("Could not watch the event log" in event.message for event in result.all_events)
+
+
 @op(tags={"database": "tiny"})
 def slow_op(_):
     time.sleep(2)
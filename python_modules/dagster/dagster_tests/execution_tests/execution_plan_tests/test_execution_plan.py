@@ -1,3 +1,5 @@
+import time
+
 import pytest
 from dagster import (
     DagsterInstance,
@@ -287,6 +289,39 @@ def test_retries_deferred_active_execution():
         assert active_execution.is_complete
 
 
+def test_retries_at_time_active_execution():
+    job_def = define_diamond_job()
+    plan = create_execution_plan(job_def)
+
+    with pytest.raises(DagsterInvariantViolationError, match="Steps waiting to retry"):
+        with plan.start(retry_mode=(RetryMode.ENABLED)) as active_execution:
+            step_1 = active_execution.get_steps_to_execute()[0]
+            active_execution.mark_success(step_1.key)
+            active_execution.mark_step_produced_output(StepOutputHandle(step_1.key, "result"))
+
+            steps = active_execution.get_steps_to_execute()
+            assert [step.key for step in steps] == ["add_three", "mult_three"]
+
+            now = time.time()
+            active_execution.mark_up_for_retry("add_three", at_time=now + 1000)
+            active_execution.mark_up_for_retry("mult_three", at_time=now - 1)
+
+            steps = active_execution.get_steps_to_execute()
+            assert [step.key for step in steps] == ["mult_three"]
+            assert 0 < active_execution.sleep_interval() <= 1000
+
+            steps = active_execution.get_steps_to_execute()
+            assert len(steps) == 0  # cant progress, waiting to retry
+
+            # adder is abandoned without waiting for the retry of add_three
+            active_execution.mark_failed("mult_three")
+            steps = active_execution.get_steps_to_abandon()
+            assert [step.key for step in steps] == ["adder"]
+            active_execution.mark_abandoned("adder")
+
+            assert not active_execution.is_complete
+
+
 def test_priorities():
     @op(tags={"priority": 5})
     def pri_5(_):
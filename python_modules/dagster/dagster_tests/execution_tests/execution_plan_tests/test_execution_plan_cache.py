@@ -0,0 +1,170 @@
+from dagster import DynamicOut, DynamicOutput, job, op
+from dagster._core.execution.api import (
+    clear_execution_plan_snapshot_cache,
+    create_execution_plan,
+    create_execution_plan_snapshot,
+)
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.state import KnownExecutionState
+from dagster._core.snap.execution_plan_snapshot import snapshot_from_execution_plan
+
+
+def define_configured_job():
+    @op(config_schema={"num": int})
+    def emit(context):
+        return context.op_config["num"]
+
+    @op
+    def add_one(num):
+        return num + 1
+
+    @op
+    def add_two(num):
+        return num + 2
+
+    @job
+    def configured_job():
+        add_two(add_one(emit()))
+
+    return configured_job
+
+
+def define_dynamic_job():
+    @op(out=DynamicOut())
+    def fan_out():
+        for i in range(2):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def echo(x):
+        return x
+
+    @op
+    def total(xs):
+        return sum(xs)
+
+    @job
+    def dynamic_job():
+        total(fan_out().map(echo).collect())
+
+    return dynamic_job
+
+
+def run_config(num):
+    return {"ops": {"emit": {"config": {"num": num}}}}
+
+
+def test_plan_cache():
+    ExecutionPlan.clear_cache()
+    configured_job = define_configured_job()
+    snapshot_id = configured_job.get_job_snapshot_id()
+
+    plan = create_execution_plan(configured_job, run_config(1), job_snapshot_id=snapshot_id)
+    cached_plan = create_execution_plan(configured_job, run_config(1), job_snapshot_id=snapshot_id)
+    assert cached_plan.step_keys_to_execute == plan.step_keys_to_execute
+    assert cached_plan.get_step_by_key("add_one") is plan.get_step_by_key("add_one")
+    assert cached_plan.step_dict is not plan.step_dict
+
+    other_plan = create_execution_plan(configured_job, run_config(2), job_snapshot_id=snapshot_id)
+    assert other_plan.get_step_by_key("add_one") is not plan.get_step_by_key("add_one")
+
+    uncached_plan = create_execution_plan(configured_job, run_config(1))
+    assert uncached_plan.get_step_by_key("add_one") is not plan.get_step_by_key("add_one")
+
+
+def test_subset_plan_from_cache():
+    ExecutionPlan.clear_cache()
+    configured_job = define_configured_job()
+    snapshot_id = configured_job.get_job_snapshot_id()
+
+    plan = create_execution_plan(configured_job, run_config(1), job_snapshot_id=snapshot_id)
+    subset_plan = create_execution_plan(
+        configured_job,
+        run_config(1),
+        step_keys_to_execute=["add_two"],
+        known_state=KnownExecutionState(previous_retry_attempts={"add_two": 1}),
+        job_snapshot_id=snapshot_id,
+    )
+    assert subset_plan.step_keys_to_execute == ["add_two"]
+    assert subset_plan.get_step_by_key("add_two") is plan.get_step_by_key("add_two")
+    assert subset_plan.known_state.previous_retry_attempts == {"add_two": 1}
+    assert plan.known_state.previous_retry_attempts == {}
+
+    assert snapshot_from_execution_plan(subset_plan, snapshot_id) == snapshot_from_execution_plan(
+        create_execution_plan(
+            configured_job,
+            run_config(1),
+            step_keys_to_execute=["add_two"],
+            known_state=KnownExecutionState(previous_retry_attempts={"add_two": 1}),
+        ),
+        snapshot_id,
+    )
+
+
+def test_resolving_cached_plan():
+    ExecutionPlan.clear_cache()
+    dynamic_job = define_dynamic_job()
+    snapshot_id = dynamic_job.get_job_snapshot_id()
+
+    plan = create_execution_plan(dynamic_job, job_snapshot_id=snapshot_id)
+    plan.resolve({"fan_out": {"result": ["0", "1"]}})
+    assert "echo[0]" in plan.step_dict_by_key
+
+    cached_plan = create_execution_plan(dynamic_job, job_snapshot_id=snapshot_id)
+    assert "echo[0]" not in cached_plan.step_dict_by_key
+    assert "echo[?]" in cached_plan.step_dict_by_key
+
+    resolved_plan = create_execution_plan(
+        dynamic_job,
+        step_keys_to_execute=["echo[0]", "echo[1]"],
+        known_state=KnownExecutionState(dynamic_mappings={"fan_out": {"result": ["0", "1"]}}),
+        job_snapshot_id=snapshot_id,
+    )
+    assert sorted(resolved_plan.step_keys_to_execute) == ["echo[0]", "echo[1]"]
+    assert (
+        "echo[0]"
+        not in create_execution_plan(dynamic_job, job_snapshot_id=snapshot_id).step_dict_by_key
+    )
+
+
+def test_execution_plan_snapshot_cache():
+    clear_execution_plan_snapshot_cache()
+    configured_job = define_configured_job()
+    snapshot_id = configured_job.get_job_snapshot_id()
+
+    snapshot = create_execution_plan_snapshot(
+        configured_job, snapshot_id, run_config=run_config(1), step_keys_to_execute=["add_one"]
+    )
+    assert snapshot == snapshot_from_execution_plan(
+        create_execution_plan(configured_job, run_config(1), step_keys_to_execute=["add_one"]),
+        snapshot_id,
+    )
+
+    known_state = KnownExecutionState(previous_retry_attempts={"add_one": 2})
+    cached_snapshot = create_execution_plan_snapshot(
+        configured_job,
+        snapshot_id,
+        run_config=run_config(1),
+        step_keys_to_execute=["add_one"],
+        known_state=known_state,
+    )
+    assert cached_snapshot.steps is snapshot.steps
+    assert cached_snapshot.initial_known_state == known_state
+
+    other_snapshot = create_execution_plan_snapshot(
+        configured_job, snapshot_id, run_config=run_config(1), step_keys_to_execute=["add_two"]
+    )
+    assert other_snapshot.step_keys_to_execute == ["add_two"]
+
+
+def test_clear_execution_plan_snapshot_cache():
+    configured_job = define_configured_job()
+    snapshot_id = configured_job.get_job_snapshot_id()
+
+    snapshot = create_execution_plan_snapshot(configured_job, snapshot_id, run_config=run_config(1))
+    clear_execution_plan_snapshot_cache()
+    rebuilt_snapshot = create_execution_plan_snapshot(
+        configured_job, snapshot_id, run_config=run_config(1)
+    )
+    assert rebuilt_snapshot == snapshot
+    assert rebuilt_snapshot.steps is not snapshot.steps
@@ -1166,6 +1166,33 @@ def test_add_primary_keys():
             assert daemon_heartbeats_id_count == daemon_heartbeats_row_count
 
 
+def test_add_run_stats_and_asset_partition_events_tables():
+    src_dir = file_relative_path(__file__, "snapshot_1_1_22_pre_primary_key/sqlite")
+
+    with copy_directory(src_dir) as test_dir:
+        db_path = os.path.join(test_dir, "history", "runs", "index.db")
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            tables = get_sqlite3_tables(db_path)
+            assert "run_stats" not in tables
+            assert "step_stats" not in tables
+            assert "asset_partition_events" not in tables
+
+            instance.upgrade()
+
+            tables = get_sqlite3_tables(db_path)
+            assert "run_stats" in tables
+            assert "step_stats" in tables
+            assert "asset_partition_events" in tables
+            assert {"run_id", "step_key", "version", "stats"} <= set(
+                get_sqlite3_columns(db_path, "step_stats")
+            )
+            assert "idx_step_stats" in get_sqlite3_indexes(db_path, "step_stats")
+            assert "idx_asset_partition_events" in get_sqlite3_indexes(
+                db_path, "asset_partition_events"
+            )
+
+
 # Prior to 0.10.0, it was possible to have `Materialization` events with no asset key.
 # `AssetMaterialization` is _supposed_ to runtime-check for null `AssetKey`, but it doesn't, so we
 # can deserialize a `Materialization` with a null asset key directly to an `AssetMaterialization`.
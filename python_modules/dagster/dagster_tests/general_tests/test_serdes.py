@@ -8,6 +8,8 @@
 from dagster._check import ParameterCheckError, inst_param, set_param
 from dagster._serdes.errors import DeserializationError, SerdesUsageError, SerializationError
 from dagster._serdes.serdes import (
+    BINARY_SERDES_MAGIC,
+    BINARY_SERDES_TEXT_PREFIX,
     EnumSerializer,
     FieldSerializer,
     NamedTupleSerializer,
@@ -18,6 +20,8 @@
     deserialize_value,
     pack_value,
     serialize_value,
+    serialize_value_to_binary_str,
+    serialize_value_to_bytes,
     unpack_value,
 )
 from dagster._serdes.utils import hash_str
@@ -727,3 +731,123 @@ class Foo(Enum):
     assert serialized == '{"__enum__": "Foo.BLUE"}'
     deserialized = deserialize_value(serialized, whitelist_map=test_env)
     assert deserialized == Foo.RED
+
+
+def test_compiled_serdes_matches_generic(monkeypatch) -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Color(Enum):
+        RED = "red"
+
+    class BarSerializer(NamedTupleSerializer):
+        def after_pack(self, **packed_dict: Any) -> Dict[str, Any]:
+            packed_dict["extra"] = "packed"
+            return packed_dict
+
+        def before_unpack(self, context, unpacked_dict: Dict[str, Any]) -> Dict[str, Any]:
+            unpacked_dict.pop("extra")
+            return unpacked_dict
+
+    @_whitelist_for_serdes(test_env, serializer=BarSerializer)
+    class Bar(NamedTuple):
+        value: int
+
+    @_whitelist_for_serdes(
+        test_env,
+        storage_name="StorageFoo",
+        storage_field_names={"color": "colour"},
+        old_fields={"removed": None},
+        skip_when_empty_fields={"empty"},
+        field_serializers={"tags": SetToSequenceFieldSerializer},
+    )
+    class Foo(NamedTuple):
+        color: Color
+        bars: Sequence[Bar]
+        mapping: Mapping[str, Any]
+        tags: AbstractSet[str]
+        empty: Sequence[int] = []
+
+    class Unregistered(NamedTuple):
+        value: int
+
+    value = [
+        Foo(
+            color=Color.RED,
+            bars=(Bar(1), Bar(2)),
+            mapping={"a": {1, 2}, "b": frozenset({"x"}), "c": [None, 1.5, True]},
+            tags={"b", "a"},
+            empty=[],
+        ),
+        Foo(color=Color.RED, bars=[], mapping={}, tags=set(), empty=[3]),
+    ]
+
+    monkeypatch.setattr("dagster._serdes.serdes._COMPILED_SERDES_ENABLED", False)
+    generic_serialized = serialize_value(value, whitelist_map=test_env)
+    generic_deserialized = deserialize_value(generic_serialized, whitelist_map=test_env)
+
+    monkeypatch.setattr("dagster._serdes.serdes._COMPILED_SERDES_ENABLED", True)
+    compiled_serialized = serialize_value(value, whitelist_map=test_env)
+    assert compiled_serialized == generic_serialized
+    assert '"__class__": "StorageFoo"' in compiled_serialized
+    assert '"colour": {"__enum__": "Color.RED"}' in compiled_serialized
+    assert '"extra": "packed"' in compiled_serialized
+    assert deserialize_value(compiled_serialized, whitelist_map=test_env) == generic_deserialized
+
+    # errors raised by the compiled path still report where the bad value is
+    with pytest.raises(SerializationError, match=re.escape("Descent path: <root:list>[0].bars[1]")):
+        serialize_value(
+            [Foo(Color.RED, [Bar(1), Unregistered(2)], {}, set(), [])], whitelist_map=test_env
+        )
+
+
+
+def test_compiled_serdes_raises_other_errors(monkeypatch) -> None:
+    monkeypatch.setattr("dagster._serdes.serdes._COMPILED_SERDES_ENABLED", True)
+    test_env = WhitelistMap.create()
+    pack_calls = []
+
+    class FailingSerializer(NamedTupleSerializer):
+        def after_pack(self, **packed_dict: Any) -> Dict[str, Any]:
+            pack_calls.append(packed_dict)
+            raise ValueError("bad value")
+
+    @_whitelist_for_serdes(test_env, serializer=FailingSerializer)
+    class Foo(NamedTuple):
+        value: int
+
+    # errors that are not serialization errors are raised from the compiled path as is, rather
+    # than being retried on the generic path
+    with pytest.raises(ValueError, match="bad value"):
+        serialize_value(Foo(1), whitelist_map=test_env)
+    assert len(pack_calls) == 1
+
+def test_binary_encoding() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Foo(NamedTuple):
+        color: str
+        tags: AbstractSet[str]
+        values: Sequence[float]
+
+    value = [Foo("red", {"a", "b"}, [1.5, 2.0]), {"nested": frozenset([1])}, None]
+
+    serialized_bytes = serialize_value_to_bytes(value, whitelist_map=test_env)
+    assert serialized_bytes.startswith(BINARY_SERDES_MAGIC)
+    assert deserialize_value(serialized_bytes, whitelist_map=test_env) == value
+
+    serialized_str = serialize_value_to_binary_str(value, whitelist_map=test_env)
+    assert serialized_str.startswith(BINARY_SERDES_TEXT_PREFIX)
+    assert deserialize_value(serialized_str, whitelist_map=test_env) == value
+
+    # JSON, as str or bytes, is still accepted
+    json_str = serialize_value(value, whitelist_map=test_env)
+    assert deserialize_value(json_str, whitelist_map=test_env) == value
+    assert deserialize_value(json_str.encode("utf-8"), whitelist_map=test_env) == value
+
+    # values that msgpack can not represent fall back to JSON
+    assert serialize_value_to_binary_str(2**70) == "1180591620717411303424"
+
+    with pytest.raises(DeserializationError, match="Unsupported binary serdes encoding version"):
+        deserialize_value(BINARY_SERDES_MAGIC + b"\xff" + serialized_bytes[5:])
@@ -1,6 +1,8 @@
 # mypy: disable-error-code=annotation-unchecked
 
 import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import NamedTuple
 
 import objgraph
@@ -96,3 +98,22 @@ def stuff(self, a=None, b=None):
     assert a1 != b1
     assert a1 != a2
     assert b1 != b2
+
+
+def test_concurrent_calls():
+    barrier = threading.Barrier(8)
+
+    class MyClass:
+        @cached_method
+        def my_method(self, arg1):
+            # every thread misses the cache before any of them stores a result
+            barrier.wait()
+            return [arg1]
+
+    obj = MyClass()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: obj.my_method(arg1="a"), range(8)))
+
+    # all callers get back the same stored result
+    assert all(result is results[0] for result in results)
+    assert obj.my_method(arg1="a") is results[0]
@@ -0,0 +1,37 @@
+from dagster._utils.deadline_queue import DeadlineQueue
+
+
+def test_deadline_queue():
+    queue: DeadlineQueue[str] = DeadlineQueue()
+    assert queue.next_timestamp is None
+    assert queue.pop_due(100) == []
+
+    queue.push("a", 10)
+    queue.push("b", 5)
+    queue.push("c", 5)
+    assert len(queue) == 3
+    assert queue.next_timestamp == 5
+    assert queue.pop_due(4) == []
+    assert queue.pop_due(5) == ["b", "c"]
+    assert "b" not in queue
+    assert queue.next_timestamp == 10
+
+
+def test_deadline_queue_invalidation():
+    queue: DeadlineQueue[str] = DeadlineQueue()
+    queue.push("a", 10)
+    queue.push("b", 20)
+    queue.push("c", 30)
+
+    # pushing a key again replaces its timestamp
+    queue.push("a", 25)
+    assert queue.get_timestamp("a") == 25
+    assert queue.next_timestamp == 20
+
+    queue.remove("b")
+    assert queue.next_timestamp == 25
+
+    queue.retain({"c"})
+    assert len(queue) == 1
+    assert queue.pop_due(100) == ["c"]
+    assert len(queue) == 0
@@ -58,7 +58,12 @@
 from dagster._daemon import get_default_daemon_logger
 from dagster._grpc.client import DagsterGrpcClient
 from dagster._grpc.server import open_server_process
-from dagster._scheduler.scheduler import launch_scheduled_runs
+from dagster._scheduler.scheduler import (
+    LAST_RECORDED_ITERATION_INTERVAL_SECONDS,
+    ScheduleEvaluationQueue,
+    launch_due_scheduled_runs,
+    launch_scheduled_runs,
+)
 from dagster._seven import wait_for_process
 from dagster._seven.compat.pendulum import create_pendulum_time, to_timezone
 from dagster._utils import DebugCrashFlags, find_free_port
@@ -132,6 +137,29 @@ def evaluate_schedules(
     wait_for_futures(futures, timeout=timeout)
 
 
+def evaluate_due_schedules(
+    workspace_context: WorkspaceProcessContext,
+    executor: Optional[ThreadPoolExecutor],
+    schedule_queue: ScheduleEvaluationQueue,
+    end_datetime_utc: "DateTime",
+    timeout: int = FUTURES_TIMEOUT,
+):
+    logger = get_default_daemon_logger("SchedulerDaemon")
+    futures = {}
+    list(
+        launch_due_scheduled_runs(
+            workspace_context,
+            logger,
+            schedule_queue,
+            end_datetime_utc,
+            threadpool_executor=executor,
+            scheduler_run_futures=futures,
+        )
+    )
+
+    wait_for_futures(futures, timeout=timeout)
+
+
 @op(config_schema={"time": str})
 def the_op(context):
     return "Ran at this time: {}".format(context.op_config["time"])
@@ -720,6 +748,90 @@ def test_simple_schedule(
         assert len(ticks) == 2
 
 
+@pytest.mark.parametrize("executor", get_schedule_executors())
+def test_schedule_deadline_queue(
+    instance: DagsterInstance,
+    workspace_context: WorkspaceProcessContext,
+    external_repo: ExternalRepository,
+    executor: ThreadPoolExecutor,
+    caplog,
+):
+    schedule_queue = ScheduleEvaluationQueue()
+    freeze_datetime = feb_27_2019_one_second_to_midnight()
+    with pendulum.test(freeze_datetime):
+        external_schedule = external_repo.get_external_schedule("simple_schedule")
+        schedule_origin = external_schedule.get_external_origin()
+
+        evaluate_due_schedules(workspace_context, executor, schedule_queue, pendulum.now("UTC"))
+        assert len(schedule_queue) == 0
+        assert schedule_queue.next_evaluation_timestamp is None
+
+        # the schedule states are only reloaded once a minute
+        instance.start_schedule(external_schedule)
+        evaluate_due_schedules(workspace_context, executor, schedule_queue, pendulum.now("UTC"))
+        assert len(schedule_queue) == 0
+        assert instance.get_runs_count() == 0
+
+    freeze_datetime = freeze_datetime.add(seconds=2)
+    with pendulum.test(freeze_datetime):
+        # a newly started schedule is due right away
+        evaluate_due_schedules(workspace_context, executor, schedule_queue, pendulum.now("UTC"))
+        assert len(schedule_queue) == 1
+        assert instance.get_runs_count() == 1
+        ticks = instance.get_ticks(schedule_origin.get_id(), external_schedule.selector_id)
+        assert len(ticks) == 1
+        validate_tick(
+            ticks[0],
+            external_schedule,
+            create_pendulum_time(year=2019, month=2, day=28),
+            TickStatus.SUCCESS,
+            [run.run_id for run in instance.get_runs()],
+        )
+
+        # the launch lag is attached to the log record as a structured field
+        launch_lag_records = [
+            record for record in caplog.records if hasattr(record, "schedule_launch_lag_seconds")
+        ]
+        assert len(launch_lag_records) == 1
+        assert launch_lag_records[0].schedule_name == "simple_schedule"
+        assert launch_lag_records[0].schedule_launch_lag_seconds == 1
+
+        # the next execution time is a day away, so the schedule is next evaluated to record its
+        # iteration timestamp
+        next_evaluation_timestamp = (
+            freeze_datetime.timestamp() + LAST_RECORDED_ITERATION_INTERVAL_SECONDS
+        )
+        assert schedule_queue.next_evaluation_timestamp == next_evaluation_timestamp
+
+    freeze_datetime = freeze_datetime.add(minutes=1)
+    with pendulum.test(freeze_datetime):
+        # the state written by the tick does not make the schedule due again
+        evaluate_due_schedules(workspace_context, executor, schedule_queue, pendulum.now("UTC"))
+        assert instance.get_runs_count() == 1
+        assert schedule_queue.next_evaluation_timestamp == next_evaluation_timestamp
+
+    freeze_datetime = freeze_datetime.add(days=1)
+    with pendulum.test(freeze_datetime):
+        evaluate_due_schedules(workspace_context, executor, schedule_queue, pendulum.now("UTC"))
+        assert instance.get_runs_count() == 2
+        ticks = instance.get_ticks(schedule_origin.get_id(), external_schedule.selector_id)
+        assert len(ticks) == 2
+
+        # stopping the schedule removes it from the queue once the states are reloaded
+        instance.stop_schedule(
+            external_schedule.get_external_origin_id(),
+            external_schedule.selector_id,
+            external_schedule,
+        )
+
+    freeze_datetime = freeze_datetime.add(minutes=1)
+    with pendulum.test(freeze_datetime):
+        evaluate_due_schedules(workspace_context, executor, schedule_queue, pendulum.now("UTC"))
+        assert len(schedule_queue) == 0
+        assert schedule_queue.next_evaluation_timestamp is None
+        assert instance.get_runs_count() == 2
+
+
 # Verify that the scheduler uses selector and not origin to dedupe schedules
 @pytest.mark.parametrize("executor", get_schedule_executors())
 def test_schedule_with_different_origin(
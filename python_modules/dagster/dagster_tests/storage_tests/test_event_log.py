@@ -2,11 +2,13 @@
 import os
 import sys
 import tempfile
+import time
 import traceback
 
 import pytest
 import sqlalchemy
 from dagster._core.errors import DagsterEventLogInvalidForRun
+from dagster._core.events import DagsterEventType
 from dagster._core.storage.event_log import (
     ConsolidatedSqliteEventLogStorage,
     InMemoryEventLogStorage,
@@ -17,8 +19,9 @@
 from dagster._core.storage.legacy_storage import LegacyEventLogStorage
 from dagster._core.storage.sql import create_engine
 from dagster._core.storage.sqlite_storage import DagsterSqliteStorage
+from dagster._core.utils import make_new_run_id
 
-from .utils.event_log_storage import TestEventLogStorage
+from .utils.event_log_storage import TestEventLogStorage, _event_record
 
 
 class TestInMemoryEventLogStorage(TestEventLogStorage):
@@ -145,3 +148,36 @@ def event_log_storage(self):
 
     def is_sqlite(self, storage):
         return True
+
+
+def test_run_stats_tables_after_migration():
+    with tempfile.TemporaryDirectory(dir=os.getcwd()) as tmpdir_path:
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+        # roll the database back to before the tables were added
+        with storage.index_connection() as conn:
+            for table_name in ["run_stats", "step_stats", "asset_partition_events"]:
+                conn.execute(sqlalchemy.text(f"DROP TABLE {table_name}"))
+            conn.execute(sqlalchemy.text("UPDATE alembic_version SET version_num = '5771160a95ad'"))
+        storage.dispose()
+
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+        try:
+            assert not storage._has_run_stats_tables  # noqa: SLF001
+            assert not storage._has_asset_partition_events_table  # noqa: SLF001
+
+            # an upgrade in the same process makes the storage use the new tables right away
+            storage.upgrade()
+            assert storage._has_run_stats_tables  # noqa: SLF001
+            assert storage._has_asset_partition_events_table  # noqa: SLF001
+
+            run_id = make_new_run_id()
+            storage.store_event(
+                _event_record(run_id, "A", time.time(), DagsterEventType.STEP_START)
+            )
+            with storage.index_connection() as conn:
+                assert conn.execute(
+                    sqlalchemy.text("SELECT step_key FROM step_stats WHERE run_id = :run_id"),
+                    {"run_id": run_id},
+                ).fetchall() == [("A",)]
+        finally:
+            storage.dispose()
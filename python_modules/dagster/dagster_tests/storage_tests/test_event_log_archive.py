@@ -0,0 +1,352 @@
+import os
+import tempfile
+from datetime import timedelta
+
+import pendulum
+import pytest
+from click.testing import CliRunner
+from dagster import AssetKey, DagsterEventType, Output, asset, define_asset_job, job, op
+from dagster._cli.instance import archive_event_logs_command
+from dagster._core.definitions.definitions_class import Definitions
+from dagster._core.event_api import EventRecordsFilter
+from dagster._core.storage.event_log import SqlEventLogStorageTable, archive
+from dagster._core.storage.event_log.archive import (
+    ARCHIVE_WATERMARK_KEY,
+    EVENT_LOGS_ARCHIVED_TAG,
+    ArchivedEventLogRow,
+    ParquetEventLogArchive,
+    archive_event_logs,
+)
+from dagster._core.storage.runs.schema import RunsTable
+from dagster._core.storage.sqlalchemy_compat import db_select
+from dagster._core.test_utils import create_run_for_test, instance_for_test
+
+
+@op
+def emit_logs(context):
+    for i in range(20):
+        context.log.info(f"log {i}")
+    return Output(1)
+
+
+@job
+def logging_job():
+    emit_logs()
+
+
+@asset
+def my_asset():
+    return 1
+
+
+@pytest.fixture
+def archive_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield os.path.join(tmpdir, "archive")
+
+
+@pytest.fixture
+def instance(archive_dir):
+    with instance_for_test(
+        overrides={
+            "event_log_archive": {
+                "module": "dagster._core.storage.event_log.archive",
+                "class": "ParquetEventLogArchive",
+                "config": {"base_dir": archive_dir},
+            }
+        }
+    ) as instance:
+        yield instance
+
+
+def _archive_all(instance):
+    return archive_event_logs(instance, updated_before=pendulum.now("UTC").add(days=1))
+
+
+def _storage_ids(connection):
+    return [record.storage_id for record in connection.records]
+
+
+def test_instance_event_log_archive(instance, archive_dir):
+    assert isinstance(instance.event_log_archive, ParquetEventLogArchive)
+
+    with instance_for_test() as unconfigured_instance:
+        assert unconfigured_instance.event_log_archive is None
+
+
+def test_archive_event_logs(instance, archive_dir):
+    result = logging_job.execute_in_process(instance=instance)
+    run_id = result.run_id
+    storage = instance.event_log_storage
+
+    before = storage.get_records_for_run(run_id)
+    assert len(before.records) > 20
+
+    assert _archive_all(instance) == [run_id]
+    assert os.path.exists(os.path.join(archive_dir, f"{run_id}.parquet"))
+    assert instance.get_run_by_id(run_id).tags[EVENT_LOGS_ARCHIVED_TAG] == "true"
+
+    # only the run status events are kept in the event log storage
+    with storage.run_connection(run_id) as conn:
+        kept_event_types = {
+            row[0]
+            for row in conn.execute(
+                db_select([SqlEventLogStorageTable.c.dagster_event_type]).where(
+                    SqlEventLogStorageTable.c.run_id == run_id
+                )
+            )
+        }
+    assert kept_event_types == {
+        DagsterEventType.RUN_START.value,
+        DagsterEventType.RUN_SUCCESS.value,
+    }
+
+    # reads merge the archived events back in
+    after = storage.get_records_for_run(run_id)
+    assert after.records == before.records
+    assert after.cursor == before.cursor
+    assert [entry.message for entry in instance.all_logs(run_id)] == [
+        record.event_log_entry.message for record in before.records
+    ]
+
+    # cursors, limits, ordering and event type filters apply to the merged events
+    page = storage.get_records_for_run(run_id, limit=5)
+    assert page.records == before.records[:5]
+    assert page.has_more
+    next_page = storage.get_records_for_run(run_id, cursor=page.cursor, limit=5)
+    assert next_page.records == before.records[5:10]
+    assert storage.get_records_for_run(run_id, ascending=False).records == list(
+        reversed(before.records)
+    )
+    assert _storage_ids(
+        storage.get_records_for_run(
+            run_id, of_type={DagsterEventType.STEP_SUCCESS, DagsterEventType.RUN_SUCCESS}
+        )
+    ) == [
+        record.storage_id
+        for record in before.records
+        if record.event_log_entry.dagster_event_type
+        in {DagsterEventType.STEP_SUCCESS, DagsterEventType.RUN_SUCCESS}
+    ]
+
+    # archived runs are skipped
+    assert _archive_all(instance) == []
+
+    instance.delete_run(run_id)
+    assert not os.path.exists(os.path.join(archive_dir, f"{run_id}.parquet"))
+
+
+def test_parquet_archive_reads_row_groups(archive_dir, monkeypatch):
+    import pyarrow.parquet as pq
+
+    archive = ParquetEventLogArchive(archive_dir, row_group_size=3)
+    rows = [
+        ArchivedEventLogRow(
+            storage_id,
+            DagsterEventType.STEP_SUCCESS.value if storage_id % 2 else None,
+            f"event {storage_id}",
+        )
+        for storage_id in range(1, 11)
+    ]
+    archive.write_events_for_run("run", rows)
+
+    read_row_groups = []
+    read_row_group = pq.ParquetFile.read_row_group
+
+    def _read_row_group(self, i, *args, **kwargs):
+        read_row_groups.append(i)
+        return read_row_group(self, i, *args, **kwargs)
+
+    monkeypatch.setattr(pq.ParquetFile, "read_row_group", _read_row_group)
+
+    assert archive.read_events_for_run("run") == rows
+    assert read_row_groups == [0, 1, 2, 3]
+
+    read_row_groups.clear()
+    assert archive.read_events_for_run("run", after_storage_id=4, limit=2) == rows[4:6]
+    assert read_row_groups == [1]
+
+    read_row_groups.clear()
+    assert archive.read_events_for_run(
+        "run", before_storage_id=8, limit=4, ascending=False
+    ) == list(reversed(rows[3:7]))
+    assert read_row_groups == [2, 1]
+
+    assert archive.read_events_for_run(
+        "run", {DagsterEventType.STEP_SUCCESS.value}, after_storage_id=2, before_storage_id=9
+    ) == [row for row in rows[2:8] if row.dagster_event_type]
+    assert archive.read_events_for_run("other") == []
+
+
+def _assert_same_run_stats(stats, expected_stats):
+    # timestamps aggregated in the database and read from events can differ in precision
+    assert stats._replace(start_time=None, end_time=None) == expected_stats._replace(
+        start_time=None, end_time=None
+    )
+    assert stats.start_time == pytest.approx(expected_stats.start_time)
+    assert stats.end_time == pytest.approx(expected_stats.end_time)
+
+
+def test_archived_run_stats(instance):
+    # the sqlite storage derives stats from the event log rather than the run stats tables, which
+    # are not archived
+    storage = instance.event_log_storage
+    run_id = logging_job.execute_in_process(instance=instance).run_id
+    stats = storage.get_stats_for_run(run_id)
+    step_stats = storage.get_step_stats_for_run(run_id)
+    assert stats.steps_succeeded == 1
+    assert len(step_stats) == 1
+
+    assert _archive_all(instance) == [run_id]
+
+    _assert_same_run_stats(storage.get_stats_for_run(run_id), stats)
+    assert storage.get_step_stats_for_run(run_id) == step_stats
+    assert storage.get_step_stats_for_run(run_id, step_keys=["emit_logs"]) == step_stats
+    assert storage.get_step_stats_for_run(run_id, step_keys=["other"]) == []
+
+
+def test_archived_run_lookups(instance, monkeypatch):
+    storage = instance.event_log_storage
+    run_id = logging_job.execute_in_process(instance=instance).run_id
+
+    looked_up_run_ids = []
+    get_run_by_id = instance.get_run_by_id
+
+    def _get_run_by_id(run_id):
+        looked_up_run_ids.append(run_id)
+        return get_run_by_id(run_id)
+
+    monkeypatch.setattr(instance, "get_run_by_id", _get_run_by_id)
+
+    # the rows in the database show that the run has not been archived
+    before = storage.get_records_for_run(run_id)
+    assert storage.get_records_for_run(run_id, limit=5).records == before.records[:5]
+    # run status events are never archived
+    storage.get_records_for_run(run_id, of_type=DagsterEventType.RUN_SUCCESS)
+    assert looked_up_run_ids == []
+
+    assert _archive_all(instance) == [run_id]
+    looked_up_run_ids.clear()
+    assert storage.get_records_for_run(run_id).records == before.records
+    assert looked_up_run_ids == [run_id]
+
+
+def test_archive_keeps_asset_events(instance):
+    defs = Definitions(assets=[my_asset], jobs=[define_asset_job("assets_job")])
+    result = defs.get_job_def("assets_job").execute_in_process(instance=instance)
+    run_id = result.run_id
+    before = instance.event_log_storage.get_records_for_run(run_id).records
+
+    assert _archive_all(instance) == [run_id]
+
+    materializations = instance.get_event_records(
+        EventRecordsFilter(DagsterEventType.ASSET_MATERIALIZATION, asset_key=AssetKey("my_asset"))
+    )
+    assert len(materializations) == 1
+    assert instance.get_latest_materialization_event(AssetKey("my_asset"))
+    assert instance.event_log_storage.get_records_for_run(run_id).records == before
+
+
+def test_archive_event_logs_by_age(instance):
+    result = logging_job.execute_in_process(instance=instance)
+
+    assert archive_event_logs(instance, updated_before=pendulum.now("UTC").subtract(days=1)) == []
+    assert _archive_all(instance) == [result.run_id]
+
+
+def test_archive_event_logs_limit(instance):
+    run_ids = {logging_job.execute_in_process(instance=instance).run_id for _ in range(3)}
+
+    archived = archive_event_logs(instance, updated_before=pendulum.now("UTC").add(days=1), limit=2)
+    assert len(archived) == 2
+    assert set(archived) | set(_archive_all(instance)) == run_ids
+
+
+def test_archive_event_logs_command(instance):
+    # the instance fixture sets $DAGSTER_HOME, which the command loads the instance from
+    run_id = logging_job.execute_in_process(instance=instance).run_id
+
+    runner = CliRunner()
+    result = runner.invoke(archive_event_logs_command, ["--older-than-days", "1"])
+    assert result.exit_code == 0, result.output
+    assert "Archived event logs for 0 runs." in result.output
+
+    with pendulum.test(pendulum.now("UTC") + timedelta(days=2)):
+        result = runner.invoke(archive_event_logs_command, ["--older-than-days", "1"])
+    assert result.exit_code == 0, result.output
+    assert f"Archived event logs for run {run_id}." in result.output
+    assert "Archived event logs for 1 runs." in result.output
+
+    with instance_for_test():
+        result = runner.invoke(archive_event_logs_command, ["--older-than-days", "1"])
+    assert result.exit_code == 1
+    assert "No event log archive is configured" in result.output
+
+
+def test_archive_event_logs_watermark(instance, monkeypatch):
+    run_id = logging_job.execute_in_process(instance=instance).run_id
+    assert _archive_all(instance) == [run_id]
+    assert instance.daemon_cursor_storage.get_cursor_values({ARCHIVE_WATERMARK_KEY})
+    # tagging the archived run updated it, so the next pass considers it once more
+    assert _archive_all(instance) == []
+
+    scanned_run_ids = []
+    get_run_records = instance.get_run_records
+
+    def _get_run_records(*args, **kwargs):
+        records = get_run_records(*args, **kwargs)
+        scanned_run_ids.extend(record.dagster_run.run_id for record in records)
+        return records
+
+    monkeypatch.setattr(instance, "get_run_records", _get_run_records)
+
+    # runs that were considered by an earlier pass are not scanned again
+    assert _archive_all(instance) == []
+    assert scanned_run_ids == []
+
+    new_run_id = logging_job.execute_in_process(instance=instance).run_id
+    assert _archive_all(instance) == [new_run_id]
+    assert scanned_run_ids == [new_run_id]
+
+
+def test_archive_event_logs_runs_updated_at_same_time(instance, monkeypatch):
+    monkeypatch.setattr(archive, "_RUN_BATCH_SIZE", 2)
+    run_ids = {logging_job.execute_in_process(instance=instance).run_id for _ in range(5)}
+
+    # more runs share an update timestamp than fit in a batch
+    with instance.run_storage.connect() as conn:
+        conn.execute(RunsTable.update().values(update_timestamp=pendulum.now("UTC").naive()))
+
+    assert set(_archive_all(instance)) == run_ids
+
+
+def test_read_run_in_progress_looks_up_run_once(instance, monkeypatch):
+    run = create_run_for_test(instance)
+    instance.report_engine_event("started", run)
+
+    looked_up_run_ids = []
+    get_run_by_id = instance.get_run_by_id
+
+    def _get_run_by_id(run_id):
+        looked_up_run_ids.append(run_id)
+        return get_run_by_id(run_id)
+
+    monkeypatch.setattr(instance, "get_run_by_id", _get_run_by_id)
+
+    storage = instance.event_log_storage
+    cursor = storage.get_records_for_run(run.run_id).cursor
+    # polling a run that has not finished only looks up the run the first time
+    for _ in range(3):
+        assert storage.get_records_for_run(run.run_id, cursor=cursor).records == []
+    assert looked_up_run_ids == [run.run_id]
+
+    # once the run finishes, the run is looked up again, since it may be archived
+    instance.report_run_failed(run)
+    looked_up_run_ids.clear()
+    connection = storage.get_records_for_run(run.run_id, cursor=cursor)
+    assert connection.records
+    assert storage.get_records_for_run(run.run_id, cursor=connection.cursor).records == []
+    assert looked_up_run_ids == [run.run_id, run.run_id]
+
+    _archive_all(instance)
+    assert len(storage.get_records_for_run(run.run_id).records) == 2
@@ -1,13 +1,22 @@
 import tempfile
+import threading
 import time
 from contextlib import contextmanager
-from typing import Any, Callable, Mapping, Union
+from typing import Any, Callable, Mapping, Optional, Union
+from unittest import mock
 
 import dagster._check as check
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
+from dagster._core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqliteEventLogStorage,
+    SqlPollingEventWatcher,
+    SqlPollingMultiRunEventWatcher,
+)
 from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.polling_event_watcher import MAX_RECORDS_PER_POLL
+from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
 from dagster._serdes.config_class import ConfigurableClassData
 from typing_extensions import Self
 
@@ -53,6 +62,38 @@ def dispose(self):
             self._watcher.close()
 
 
+class ConsolidatedSqlitePollingEventLogStorage(ConsolidatedSqliteEventLogStorage):
+    """Consolidated SQLite-backed event log storage that uses SqlPollingMultiRunEventWatcher for
+    watching runs, polling all watched runs from a single thread.
+    """
+
+    def __init__(self, *args, max_records_per_poll: int = MAX_RECORDS_PER_POLL, **kwargs):
+        super(ConsolidatedSqlitePollingEventLogStorage, self).__init__(*args, **kwargs)
+        self._watcher = SqlPollingMultiRunEventWatcher(
+            self, max_records_per_poll=max_records_per_poll
+        )
+        self._disposed = False
+
+    @classmethod
+    def from_config_value(cls, inst_data, config_value):
+        return cls(inst_data=inst_data, **config_value)
+
+    def watch(self, run_id: str, cursor: Optional[str], callback: Callable[..., None]):
+        self._watcher.watch_run(run_id, cursor, callback)
+
+    @property
+    def supports_push_event_watch(self) -> bool:
+        return False
+
+    def end_watch(self, run_id: str, handler: Callable[..., None]):
+        self._watcher.unwatch_run(run_id, handler)
+
+    def dispose(self):
+        if not self._disposed:
+            self._disposed = True
+            self._watcher.close()
+
+
 RUN_ID = "foo"
 
 
@@ -138,3 +179,152 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+def _append_to(events):
+    def _callback(event, _cursor):
+        events.append(event)
+
+    return _callback
+
+
+def _wait_for(condition_fn):
+    attempts = 20
+    while not condition_fn() and attempts > 0:
+        time.sleep(0.1)
+        attempts -= 1
+
+
+def test_multi_run_watcher():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqlitePollingEventLogStorage(tmpdir_path)
+        try:
+            watched = {"foo": [], "bar": [], "baz": []}
+            callbacks = {run_id: _append_to(events) for run_id, events in watched.items()}
+
+            storage.store_event(create_event(1, run_id="foo"))
+            storage.store_event(create_event(2, run_id="bar"))
+
+            # catches up from the start of the run
+            storage.watch("foo", None, callbacks["foo"])
+            # catches up from the given cursor
+            storage.watch("bar", str(EventLogCursor.from_storage_id(2)), callbacks["bar"])
+
+            storage.store_event(create_event(3, run_id="foo"))
+            storage.store_event(create_event(4, run_id="bar"))
+            storage.store_event(create_event(5, run_id="baz"))
+
+            _wait_for(lambda: len(watched["foo"]) == 2 and len(watched["bar"]) == 1)
+
+            # a run that starts being watched later is caught up, then polled with the others
+            storage.watch("baz", None, callbacks["baz"])
+            _wait_for(lambda: len(watched["baz"]) == 1)
+            storage.store_event(create_event(6, run_id="baz"))
+            storage.store_event(create_event(7, run_id="foo"))
+            _wait_for(lambda: len(watched["baz"]) == 2 and len(watched["foo"]) == 3)
+
+            assert [int(evt.message) for evt in watched["foo"]] == [1, 3, 7]
+            assert [int(evt.message) for evt in watched["bar"]] == [4]
+            assert [int(evt.message) for evt in watched["baz"]] == [5, 6]
+
+            # a single thread polls for all of the watched runs
+            watcher_threads = [
+                thread
+                for thread in threading.enumerate()
+                if thread.name.startswith("sql-event-watch")
+            ]
+            assert len(watcher_threads) == 1
+
+            storage.end_watch("foo", callbacks["foo"])
+            storage.store_event(create_event(8, run_id="foo"))
+            storage.store_event(create_event(9, run_id="bar"))
+            _wait_for(lambda: len(watched["bar"]) == 2)
+
+            assert [int(evt.message) for evt in watched["foo"]] == [1, 3, 7]
+            assert [int(evt.message) for evt in watched["bar"]] == [4, 9]
+        finally:
+            storage.dispose()
+
+
+def test_multi_run_watcher_pages_catch_up():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqlitePollingEventLogStorage(tmpdir_path, max_records_per_poll=2)
+        try:
+            for i in range(5):
+                storage.store_event(create_event(i, run_id="foo"))
+
+            watched = []
+            with mock.patch.object(
+                storage, "get_records_for_run", wraps=storage.get_records_for_run
+            ) as get_records_for_run:
+                storage.watch("foo", None, _append_to(watched))
+                _wait_for(lambda: len(watched) == 5)
+
+                # the catch up query is paged like the cross-run query
+                assert get_records_for_run.call_count == 3
+                assert all(call.kwargs["limit"] == 2 for call in get_records_for_run.call_args_list)
+
+            assert [int(evt.message) for evt in watched] == [0, 1, 2, 3, 4]
+        finally:
+            storage.dispose()
+
+
+def test_multi_run_watcher_picks_up_late_commits():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqlitePollingEventLogStorage(tmpdir_path)
+        try:
+            for i in range(3):
+                storage.store_event(create_event(i, run_id="foo"))
+            # leave a gap in the storage ids, as an insert that is not committed yet does
+            gap_storage_id = storage.get_records_for_run("foo").records[1].storage_id
+            with storage.index_connection() as conn:
+                conn.execute(
+                    SqlEventLogStorageTable.delete().where(
+                        SqlEventLogStorageTable.c.id == gap_storage_id
+                    )
+                )
+
+            watched = {"foo": [], "bar": []}
+            storage.watch("foo", None, _append_to(watched["foo"]))
+            storage.watch("bar", None, _append_to(watched["bar"]))
+            _wait_for(lambda: len(watched["foo"]) == 2)
+
+            # the record of another run is committed after records with greater storage ids
+            insert_values = storage._get_event_insert_values(  # noqa: SLF001
+                create_event(3, run_id="bar")
+            )
+            with storage.index_connection() as conn:
+                conn.execute(
+                    SqlEventLogStorageTable.insert().values(dict(insert_values, id=gap_storage_id))
+                )
+            _wait_for(lambda: len(watched["bar"]) == 1)
+
+            assert [int(evt.message) for evt in watched["foo"]] == [0, 2]
+            assert [int(evt.message) for evt in watched["bar"]] == [3]
+        finally:
+            storage.dispose()
+
+
+def test_multi_run_watcher_callbacks_change_watches():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqlitePollingEventLogStorage(tmpdir_path)
+        try:
+            watched = {"foo": [], "bar": []}
+            watch_bar = _append_to(watched["bar"])
+
+            def watch_foo(event, cursor):
+                watched["foo"].append(event)
+                # callbacks are called without holding the watcher's lock
+                storage.end_watch("foo", watch_foo)
+                storage.watch("bar", None, watch_bar)
+
+            storage.watch("foo", None, watch_foo)
+            storage.store_event(create_event(1, run_id="foo"))
+            storage.store_event(create_event(2, run_id="foo"))
+            storage.store_event(create_event(3, run_id="bar"))
+            _wait_for(lambda: len(watched["bar"]) == 1)
+
+            assert [int(evt.message) for evt in watched["foo"]] == [1]
+            assert [int(evt.message) for evt in watched["bar"]] == [3]
+        finally:
+            storage.dispose()
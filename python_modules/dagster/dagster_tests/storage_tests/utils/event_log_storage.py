@@ -55,7 +55,7 @@
 from dagster._core.execution.job_execution_result import JobExecutionResult
 from dagster._core.execution.plan.handle import StepHandle
 from dagster._core.execution.plan.objects import StepFailureData, StepSuccessData
-from dagster._core.execution.stats import StepEventStatus
+from dagster._core.execution.stats import StepEventStatus, build_run_step_stats_from_events
 from dagster._core.host_representation.origin import (
     ExternalJobOrigin,
     ExternalRepositoryOrigin,
@@ -64,7 +64,9 @@
 from dagster._core.storage.event_log import InMemoryEventLogStorage, SqlEventLogStorage
 from dagster._core.storage.event_log.base import EventLogStorage
 from dagster._core.storage.event_log.migration import (
+    ASSET_PARTITION_EVENTS_INDEX,
     EVENT_LOG_DATA_MIGRATIONS,
+    RUN_STATS_INDEX,
     migrate_asset_key_data,
 )
 from dagster._core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
@@ -3041,6 +3043,343 @@ def my_op():
                 {"dagster/partition/country": "US", "dagster/partition/date": "2022-10-13"}
             ]
 
+    def test_store_events_batch(self, storage, instance):
+        key = AssetKey("hello")
+
+        @op
+        def my_op():
+            yield AssetMaterialization(asset_key=key, partition="a", tags={"dagster/foo": "bar"})
+            yield AssetObservation(asset_key=key, partition="b")
+            yield AssetMaterialization(asset_key=key, partition="c", tags={"dagster/foo": "baz"})
+            yield AssetMaterialization(asset_key=AssetKey("other_key"))
+            yield Output(5)
+
+        run_id = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id]):
+            events, _ = _synthesize_events(lambda: my_op(), run_id)
+            storage.store_events(events)
+
+            stored = storage.get_logs_for_run(run_id)
+            assert [event.message for event in stored] == [event.message for event in events]
+
+            records = storage.get_records_for_run(run_id).records
+            storage_ids = [record.storage_id for record in records]
+            assert storage_ids == sorted(storage_ids)
+
+            materializations = storage.get_event_records(
+                EventRecordsFilter(DagsterEventType.ASSET_MATERIALIZATION, asset_key=key)
+            )
+            assert [record.partition_key for record in materializations] == ["c", "a"]
+
+            assert set(storage.all_asset_keys()) == {key, AssetKey("other_key")}
+            [asset_record] = storage.get_asset_records([key])
+            assert asset_record.asset_entry.last_materialization_record
+            assert (
+                asset_record.asset_entry.last_materialization_record.storage_id
+                == materializations[0].storage_id
+            )
+            assert asset_record.asset_entry.last_run_id == run_id
+
+            tags = storage.get_event_tags_for_asset(key)
+            assert sorted(tags, key=lambda t: t["dagster/foo"]) == [
+                {"dagster/foo": "bar"},
+                {"dagster/foo": "baz"},
+            ]
+
+    def test_get_records_for_runs(self, storage, instance):
+        if not storage.supports_multi_run_records:
+            pytest.skip("storage does not support cross-run queries by storage id")
+
+        run_ids = [make_new_run_id() for _ in range(3)]
+        with create_and_delete_test_runs(instance, run_ids):
+            for i in range(6):
+                storage.store_event(create_test_event_log_record(str(i), run_ids[i % 3]))
+
+            records = storage.get_records_for_runs(run_ids[:2])
+            assert [record.event_log_entry.user_message for record in records] == [
+                "0",
+                "1",
+                "3",
+                "4",
+            ]
+
+            after_storage_id = records[1].storage_id
+            records = storage.get_records_for_runs(run_ids[:2], after_storage_id=after_storage_id)
+            assert [record.event_log_entry.user_message for record in records] == ["3", "4"]
+
+            records = storage.get_records_for_runs(run_ids, limit=2)
+            assert [record.event_log_entry.user_message for record in records] == ["0", "1"]
+
+            # each run may have a storage id of its own
+            records = storage.get_records_for_runs(
+                run_ids,
+                after_storage_id_by_run_id={run_ids[0]: records[0].storage_id},
+            )
+            assert [record.event_log_entry.user_message for record in records] == [
+                "1",
+                "2",
+                "3",
+                "4",
+                "5",
+            ]
+
+            assert storage.get_records_for_runs([]) == []
+
+    def test_run_stats_tables(self, storage, test_run_id):
+        if (
+            not isinstance(storage, SqlEventLogStorage)
+            or storage.is_run_sharded
+            or not storage.has_secondary_index(RUN_STATS_INDEX)
+        ):
+            pytest.skip("storage does not maintain run stats tables")
+
+        import math
+
+        def _run_event(timestamp, event_type):
+            return EventLogEntry(
+                error_info=None,
+                level="debug",
+                user_message="",
+                run_id=test_run_id,
+                timestamp=timestamp,
+                dagster_event=DagsterEvent(event_type.value, "nonce"),
+            )
+
+        records = _stats_records(run_id=test_run_id)
+        start_time = records[0].timestamp - 10
+        end_time = records[-1].timestamp + 10
+
+        storage.store_event(_run_event(start_time, DagsterEventType.PIPELINE_START))
+        for record in records[:5]:
+            storage.store_event(record)
+        storage.store_events(
+            [*records[5:], _run_event(end_time, DagsterEventType.PIPELINE_SUCCESS)]
+        )
+
+        def _assert_stats():
+            stats = storage.get_stats_for_run(test_run_id)
+            assert stats.steps_succeeded == 2
+            assert stats.steps_failed == 1
+            assert stats.materializations == 3
+            assert stats.expectations == 2
+            assert math.isclose(stats.start_time, start_time)
+            assert math.isclose(stats.end_time, end_time)
+
+            step_stats = storage.get_step_stats_for_run(test_run_id)
+            assert [stats.step_key for stats in step_stats] == ["A", "B", "C", "D"]
+            assert [stats.status.value for stats in step_stats] == [
+                "SUCCESS",
+                "FAILURE",
+                "SKIPPED",
+                "SUCCESS",
+            ]
+            d_stats = step_stats[3]
+            assert d_stats.end_time - d_stats.start_time == 150
+            assert len(d_stats.materialization_events) == 3
+            assert len(d_stats.expectation_results) == 2
+
+            assert [
+                stats.step_key for stats in storage.get_step_stats_for_run(test_run_id, ["B", "D"])
+            ] == ["B", "D"]
+
+            # the stats folded into the table match the stats built from the event log
+            assert step_stats == build_run_step_stats_from_events(
+                test_run_id, storage.get_logs_for_run(test_run_id)
+            )
+
+        _assert_stats()
+
+        # rebuilding from the event log produces the same stats
+        storage.rebuild_run_stats(test_run_id)
+        _assert_stats()
+
+        storage.delete_events(test_run_id)
+        stats = storage.get_stats_for_run(test_run_id)
+        assert stats.steps_succeeded == 0
+        assert stats.start_time is None
+        assert storage.get_step_stats_for_run(test_run_id) == []
+
+    def test_run_stats_tables_long_step_keys(self, storage, test_run_id):
+        if (
+            not isinstance(storage, SqlEventLogStorage)
+            or storage.is_run_sharded
+            or not storage.has_secondary_index(RUN_STATS_INDEX)
+        ):
+            pytest.skip("storage does not maintain run stats tables")
+
+        # step keys that only differ past the length of a MySQL index prefix
+        prefix = "a_very_long_step_key_prefix_shared_by_steps_" * 4
+        step_keys = [f"{prefix}first", f"{prefix}second"]
+        now = time.time()
+        for step_key in step_keys:
+            storage.store_event(
+                _event_record(test_run_id, step_key, now, DagsterEventType.STEP_START)
+            )
+            storage.store_event(
+                _event_record(
+                    test_run_id,
+                    step_key,
+                    now + 1,
+                    DagsterEventType.STEP_SUCCESS,
+                    StepSuccessData(duration_ms=1000.0),
+                )
+            )
+
+        step_stats = storage.get_step_stats_for_run(test_run_id)
+        assert [stats.step_key for stats in step_stats] == step_keys
+        assert [stats.status.value for stats in step_stats] == ["SUCCESS", "SUCCESS"]
+
+    def test_asset_partition_events_table(self, storage):
+        if not isinstance(storage, SqlEventLogStorage) or not storage.has_secondary_index(
+            ASSET_PARTITION_EVENTS_INDEX
+        ):
+            pytest.skip("storage does not maintain the asset partition events table")
+
+        a = AssetKey(["a"])
+        run_id_1 = make_new_run_id()
+        run_id_2 = make_new_run_id()
+
+        def _asset_event(run_id, event_type, partition):
+            if event_type == DagsterEventType.ASSET_MATERIALIZATION:
+                event_specific_data = StepMaterializationData(
+                    AssetMaterialization(
+                        asset_key=a, partition=partition, tags={"dagster/tag": run_id}
+                    )
+                )
+            elif event_type == DagsterEventType.ASSET_OBSERVATION:
+                event_specific_data = AssetObservationData(
+                    AssetObservation(asset_key=a, partition=partition)
+                )
+            else:
+                event_specific_data = AssetMaterializationPlannedData(a, partition)
+            return EventLogEntry(
+                error_info=None,
+                level="debug",
+                user_message="",
+                run_id=run_id,
+                timestamp=time.time(),
+                dagster_event=DagsterEvent(
+                    event_type.value, "nonce", event_specific_data=event_specific_data
+                ),
+            )
+
+        def _latest_storage_ids(event_type):
+            return {
+                record.partition_key: record.storage_id
+                for record in reversed(
+                    storage.get_event_records(EventRecordsFilter(event_type, asset_key=a))
+                )
+            }
+
+        def _assert_matches_event_log():
+            counts = storage.get_materialization_count_by_partition([a])
+            # a falsy cursor reads the counts from the event log
+            assert counts == storage.get_materialization_count_by_partition([a], after_cursor=0)
+            latest_ids = _latest_storage_ids(DagsterEventType.ASSET_MATERIALIZATION)
+            assert counts[a].keys() == latest_ids.keys()
+            for event_type in [
+                DagsterEventType.ASSET_MATERIALIZATION,
+                DagsterEventType.ASSET_OBSERVATION,
+                DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+            ]:
+                assert storage.get_latest_storage_id_by_partition(
+                    a, event_type
+                ) == _latest_storage_ids(event_type)
+            # a before cursor reads the latest events from the event log
+            assert storage.get_latest_tags_by_partition(
+                a, DagsterEventType.ASSET_MATERIALIZATION, ["dagster/tag"]
+            ) == storage.get_latest_tags_by_partition(
+                a, DagsterEventType.ASSET_MATERIALIZATION, ["dagster/tag"], before_cursor=2**62
+            )
+            return counts[a]
+
+        storage.store_event(_asset_event(run_id_1, DagsterEventType.ASSET_MATERIALIZATION, "x"))
+        storage.store_event(_asset_event(run_id_1, DagsterEventType.ASSET_MATERIALIZATION, "y"))
+        storage.store_events(
+            [
+                _asset_event(run_id_2, DagsterEventType.ASSET_MATERIALIZATION_PLANNED, "x"),
+                _asset_event(run_id_2, DagsterEventType.ASSET_MATERIALIZATION, "x"),
+                _asset_event(run_id_2, DagsterEventType.ASSET_OBSERVATION, "x"),
+                _asset_event(run_id_2, DagsterEventType.ASSET_MATERIALIZATION_PLANNED, "z"),
+            ]
+        )
+
+        assert _assert_matches_event_log() == {"x": 2, "y": 1}
+        assert storage.get_latest_tags_by_partition(
+            a, DagsterEventType.ASSET_MATERIALIZATION, ["dagster/tag"]
+        ) == {"x": {"dagster/tag": run_id_2}, "y": {"dagster/tag": run_id_1}}
+        assert storage.get_latest_asset_partition_materialization_attempts_without_materializations(
+            a
+        ) == {
+            "z": (
+                run_id_2,
+                _latest_storage_ids(DagsterEventType.ASSET_MATERIALIZATION_PLANNED)["z"],
+            )
+        }
+
+        # rebuilding from the event log produces the same rows
+        storage.rebuild_asset_partition_events(a)
+        assert _assert_matches_event_log() == {"x": 2, "y": 1}
+
+        storage.delete_events(run_id_2)
+        assert _assert_matches_event_log() == {"x": 1, "y": 1}
+        assert (
+            storage.get_latest_asset_partition_materialization_attempts_without_materializations(a)
+            == {}
+        )
+
+        if self.can_wipe():
+            storage.wipe_asset(a)
+            assert storage.get_materialization_count_by_partition([a]) == {a: {}}
+            assert (
+                storage.get_latest_storage_id_by_partition(
+                    a, DagsterEventType.ASSET_MATERIALIZATION
+                )
+                == {}
+            )
+
+            storage.store_event(_asset_event(run_id_1, DagsterEventType.ASSET_MATERIALIZATION, "y"))
+            assert _assert_matches_event_log() == {"y": 1}
+
+    def test_asset_partition_events_table_long_partitions(self, storage):
+        if not isinstance(storage, SqlEventLogStorage) or not storage.has_secondary_index(
+            ASSET_PARTITION_EVENTS_INDEX
+        ):
+            pytest.skip("storage does not maintain the asset partition events table")
+
+        # asset keys and partitions that only differ past the length of a MySQL index prefix
+        prefix = "a_long_prefix_shared_by_asset_keys_and_partitions_" * 6
+        asset_keys = [AssetKey([f"{prefix}first"]), AssetKey([f"{prefix}second"])]
+        partitions = [f"{prefix}first", f"{prefix}second"]
+        run_id = make_new_run_id()
+
+        for asset_key in asset_keys:
+            for partition in partitions:
+                storage.store_event(
+                    EventLogEntry(
+                        error_info=None,
+                        level="debug",
+                        user_message="",
+                        run_id=run_id,
+                        timestamp=time.time(),
+                        dagster_event=DagsterEvent(
+                            DagsterEventType.ASSET_MATERIALIZATION.value,
+                            "nonce",
+                            event_specific_data=StepMaterializationData(
+                                AssetMaterialization(asset_key=asset_key, partition=partition)
+                            ),
+                        ),
+                    )
+                )
+
+        assert storage.get_materialization_count_by_partition(asset_keys) == {
+            asset_key: {partition: 1 for partition in partitions} for asset_key in asset_keys
+        }
+        for asset_key in asset_keys:
+            assert storage.get_latest_storage_id_by_partition(
+                asset_key, DagsterEventType.ASSET_MATERIALIZATION
+            ).keys() == set(partitions)
+
     def test_add_asset_event_tags(self, storage, instance):
         if not storage.supports_add_asset_event_tags():
             pytest.skip("storage does not support adding asset event tags")
@@ -148,6 +148,45 @@ def test_basic_storage(self, storage):
         assert fetched_run.run_id == run_id
         assert fetched_run.job_name == "some_pipeline"
 
+    def test_add_runs(self, storage):
+        assert storage
+        run_ids = [make_new_run_id() for _ in range(3)]
+        added = storage.add_runs(
+            [
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    job_name="some_pipeline",
+                    tags={"foo": "bar", PARTITION_NAME_TAG: str(i)},
+                )
+                for i, run_id in enumerate(run_ids)
+            ]
+        )
+        assert [run.run_id for run in added] == run_ids
+        assert len(storage.get_runs()) == 3
+        assert len(storage.get_runs(RunsFilter(tags={"foo": "bar"}))) == 3
+        assert [
+            run.run_id for run in storage.get_runs(RunsFilter(tags={PARTITION_NAME_TAG: "1"}))
+        ] == [run_ids[1]]
+
+        with pytest.raises(DagsterRunAlreadyExists):
+            storage.add_runs(
+                [TestRunStorage.build_run(run_id=run_ids[0], job_name="some_pipeline")]
+            )
+
+        # none of the runs in a batch are added if one of them can't be
+        new_run_id = make_new_run_id()
+        with pytest.raises(DagsterRunAlreadyExists):
+            storage.add_runs(
+                [
+                    TestRunStorage.build_run(
+                        run_id=new_run_id, job_name="some_pipeline", tags={"foo": "baz"}
+                    ),
+                    TestRunStorage.build_run(run_id=run_ids[0], job_name="some_pipeline"),
+                ]
+            )
+        assert not storage.has_run(new_run_id)
+        assert storage.get_runs(RunsFilter(tags={"foo": "baz"})) == []
+
     def test_clear(self, storage):
         if not self.can_delete_runs():
             pytest.skip("storage cannot delete")
@@ -371,6 +410,21 @@ def test_get_run_tags(self, storage):
             ("tag2", {"val2"}),
         ]
 
+    def test_get_tags_for_runs(self, storage):
+        one = make_new_run_id()
+        two = make_new_run_id()
+        three = make_new_run_id()
+        storage.add_run(TestRunStorage.build_run(run_id=one, job_name="foo", tags={"tag1": "val1"}))
+        storage.add_run(TestRunStorage.build_run(run_id=two, job_name="foo"))
+        storage.add_run_tags(one, {"tag2": "val2"})
+
+        assert storage.get_tags_for_runs([one, two, three]) == {
+            one: {"tag1": "val1", "tag2": "val2"},
+            two: {},
+            three: {},
+        }
+        assert storage.get_tags_for_runs([]) == {}
+
     def test_fetch_by_filter(self, storage):
         assert storage
         one = make_new_run_id()
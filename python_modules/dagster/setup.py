@@ -107,12 +107,16 @@ def get_version() -> str:
     ],
     extras_require={
         "docker": ["docker"],
+        "msgpack": ["msgpack>=1.0"],
+        "pyarrow": ["pyarrow"],
         "test": [
             "buildkite-test-collector ; python_version>='3.8'",
             "docker",
             f"grpcio-tools>={GRPC_VERSION_FLOOR}",
             "mock==3.0.5",
+            "msgpack>=1.0",
             "objgraph",
+            "pyarrow",
             "pytest-cov==2.10.1",
             "pytest-dependency==0.5.1",
             "pytest-mock==3.3.1",
@@ -1,4 +1,4 @@
-from typing import ContextManager, Optional, cast
+from typing import Any, ContextManager, Mapping, Optional, cast
 
 import dagster._check as check
 import sqlalchemy as db
@@ -13,7 +13,7 @@
     AssetKeyTable,
     SqlEventLogStorage,
     SqlEventLogStorageMetadata,
-    SqlPollingEventWatcher,
+    SqlPollingMultiRunEventWatcher,
 )
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
@@ -63,7 +63,7 @@ def __init__(self, mysql_url: str, inst_data: Optional[ConfigurableClassData] =
         self.mysql_url = check.str_param(mysql_url, "mysql_url")
         self._disposed = False
 
-        self._event_watcher = SqlPollingEventWatcher(self)
+        self._event_watcher = SqlPollingMultiRunEventWatcher(self)
 
         # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
         self._engine = create_engine(
@@ -105,6 +105,7 @@ def upgrade(self) -> None:
         alembic_config = mysql_alembic_config(__file__)
         with self._connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
+        self._clear_table_existence_cache()
 
     @property
     def inst_data(self) -> Optional[ConfigurableClassData]:
@@ -154,26 +155,37 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
             event, event_id, self.has_secondary_index(ASSET_KEY_INDEX_COLS)
         )
         with self.index_connection() as conn:
-            if values:
+            self._upsert_asset_entry(
+                conn,
+                event.dagster_event.asset_key.to_string(),  # type: ignore  # (possible none)
+                values,
+            )
+
+        self.store_asset_partition_events([(event, event_id)])
+
+    def _upsert_asset_entry(
+        self, conn: Connection, asset_key_str: str, values: Mapping[str, Any]
+    ) -> None:
+        if values:
+            conn.execute(
+                db_dialects.mysql.insert(AssetKeyTable)
+                .values(
+                    asset_key=asset_key_str,
+                    **values,
+                )
+                .on_duplicate_key_update(
+                    **values,
+                )
+            )
+        else:
+            try:
                 conn.execute(
-                    db_dialects.mysql.insert(AssetKeyTable)
-                    .values(
-                        asset_key=event.dagster_event.asset_key.to_string(),  # type: ignore  # (possible none)
-                        **values,
-                    )
-                    .on_duplicate_key_update(
-                        **values,
+                    db_dialects.mysql.insert(AssetKeyTable).values(
+                        asset_key=asset_key_str,
                     )
                 )
-            else:
-                try:
-                    conn.execute(
-                        db_dialects.mysql.insert(AssetKeyTable).values(
-                            asset_key=event.dagster_event.asset_key.to_string(),  # type: ignore  # (possible none)
-                        )
-                    )
-                except db_exc.IntegrityError:
-                    pass
+            except db_exc.IntegrityError:
+                pass
 
     def _connect(self) -> ContextManager[Connection]:
         return create_mysql_connection(self._engine, __file__, "event log")
@@ -215,7 +227,7 @@ def supports_intersect(self) -> bool:
         )
 
     @property
-    def event_watcher(self) -> SqlPollingEventWatcher:
+    def event_watcher(self) -> SqlPollingMultiRunEventWatcher:
         return self._event_watcher
 
     def __del__(self) -> None:
@@ -1,4 +1,4 @@
-from typing import Any, ContextManager, Mapping, Optional, Sequence
+from typing import Any, ContextManager, List, Mapping, Optional, Sequence
 
 import dagster._check as check
 import sqlalchemy as db
@@ -19,7 +19,8 @@
 )
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
-from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
+from dagster._core.storage.event_log.polling_event_watcher import SqlPollingMultiRunEventWatcher
+from dagster._core.storage.event_log.sql_event_log import MAX_EVENT_INSERT_BATCH_SIZE
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -91,7 +92,7 @@ def __init__(
             self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
         )
 
-        self._event_watcher = SqlPollingEventWatcher(self)
+        self._event_watcher = SqlPollingMultiRunEventWatcher(self)
 
         self._secondary_index_cache = {}
 
@@ -132,6 +133,7 @@ def upgrade(self) -> None:
         alembic_config = pg_alembic_config(__file__)
         with self._connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
+        self._clear_table_existence_cache()
 
     @property
     def inst_data(self) -> Optional[ConfigurableClassData]:
@@ -203,6 +205,72 @@ def store_event(self, event: EventLogEntry) -> None:
 
             self.store_asset_event_tags(event, event_id)
 
+        self.store_run_stats([event])
+
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events with a single multi-row insert, using the returned storage ids
+        to index any asset events in bulk.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if not events:
+            return
+
+        event_ids: List[int] = []
+        with self._connect() as conn:
+            for start in range(0, len(events), MAX_EVENT_INSERT_BATCH_SIZE):
+                chunk = events[start : start + MAX_EVENT_INSERT_BATCH_SIZE]
+                # Postgres does not guarantee the row order of INSERT ... RETURNING, so the ids are
+                # reserved from the sequence first and inserted explicitly, in the order of the
+                # batch
+                chunk_event_ids = self._reserve_event_ids(conn, len(chunk))
+                conn.execute(
+                    SqlEventLogStorageTable.insert().values(
+                        [
+                            dict(self._get_event_insert_values(event), id=event_id)
+                            for event, event_id in zip(chunk, chunk_event_ids)
+                        ]
+                    )
+                )
+                event_ids.extend(chunk_event_ids)
+
+            # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support version
+            # skew. A single notification per run is enough for legacy watchers, which fetch all
+            # events after their cursor.
+            last_event_id_by_run_id = {
+                event.run_id: event_id for event, event_id in zip(events, event_ids)
+            }
+            for run_id, event_id in last_event_id_by_run_id.items():
+                conn.execute(
+                    db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
+                    {"notify_id": run_id + "_" + str(event_id)},
+                )
+
+        self.store_asset_events(
+            [
+                (event, event_id)
+                for event, event_id in zip(events, event_ids)
+                if event.is_dagster_event
+                and event.dagster_event_type in ASSET_EVENTS
+                and event.dagster_event.asset_key  # type: ignore
+            ]
+        )
+        self.store_run_stats(events)
+
+    def _reserve_event_ids(self, conn: Connection, count: int) -> List[int]:
+        result = conn.execute(
+            db.text(
+                "SELECT nextval(pg_get_serial_sequence('event_logs', 'id')) FROM"
+                " generate_series(1, :count)"
+            ),
+            {"count": count},
+        )
+        event_ids = sorted(int(row[0]) for row in result.fetchall())
+        result.close()
+        return event_ids
+
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         if not (event.dagster_event and event.dagster_event.asset_key):
@@ -242,18 +310,25 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
             event, event_id, self.has_secondary_index(ASSET_KEY_INDEX_COLS)
         )
         with self.index_connection() as conn:
-            query = db_dialects.postgresql.insert(AssetKeyTable).values(
-                asset_key=event.dagster_event.asset_key.to_string(),
-                **values,
+            self._upsert_asset_entry(conn, event.dagster_event.asset_key.to_string(), values)
+
+        self.store_asset_partition_events([(event, event_id)])
+
+    def _upsert_asset_entry(
+        self, conn: Connection, asset_key_str: str, values: Mapping[str, Any]
+    ) -> None:
+        query = db_dialects.postgresql.insert(AssetKeyTable).values(
+            asset_key=asset_key_str,
+            **values,
+        )
+        if values:
+            query = query.on_conflict_do_update(
+                index_elements=[AssetKeyTable.c.asset_key],
+                set_=dict(**values),
             )
-            if values:
-                query = query.on_conflict_do_update(
-                    index_elements=[AssetKeyTable.c.asset_key],
-                    set_=dict(**values),
-                )
-            else:
-                query = query.on_conflict_do_nothing()
-            conn.execute(query)
+        else:
+            query = query.on_conflict_do_nothing()
+        conn.execute(query)
 
     def add_dynamic_partitions(
         self, partitions_def_name: str, partition_keys: Sequence[str]
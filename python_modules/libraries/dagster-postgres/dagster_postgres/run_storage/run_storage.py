@@ -1,5 +1,6 @@
 import zlib
-from typing import ContextManager, Mapping, Optional
+from contextlib import contextmanager
+from typing import ContextManager, Iterator, Mapping, Optional
 
 import dagster._check as check
 import sqlalchemy as db
@@ -156,6 +157,14 @@ def create_clean_storage(
     def connect(self) -> ContextManager[Connection]:
         return create_pg_connection(self._engine)
 
+    @contextmanager
+    def _transaction(self, conn: Connection) -> Iterator[Connection]:
+        # the engine autocommits every statement, so the connection has to be switched to a
+        # transactional isolation level for the duration of the transaction
+        txn_conn = conn.execution_options(isolation_level="READ COMMITTED")
+        with txn_conn.begin():
+            yield txn_conn
+
     def upgrade(self) -> None:
         with self.connect() as conn:
             run_alembic_upgrade(pg_alembic_config(__file__), conn)